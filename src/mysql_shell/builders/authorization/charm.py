@@ -1,14 +1,39 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import re
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from ...models.statement import StatementResult
 from ..quoting import StringQueryQuoter
 from .base import BaseAuthorizationQueryBuilder
 
+_GRANT_PATTERN = re.compile(r"^GRANT (?P<privileges>.+?) ON (?P<database>\S+)\.\* TO ")
+
+
+@dataclass
+class _RoleSpec:
+    """Role within a roles hierarchy."""
+
+    rolename: str
+    parents: list[str] = field(default_factory=list)
+    grants: list[tuple[str, list[str]]] = field(default_factory=list)
+
 
 class CharmAuthorizationQueryBuilder(BaseAuthorizationQueryBuilder):
     """Charm authorization query builder."""
 
     ROLE_CREATION_QUERY = "CREATE ROLE {rolename}"
+    ROLE_CREATION_IF_MISSING_QUERY = "CREATE ROLE IF NOT EXISTS {rolename}"
+    ROLE_EXISTENCE_QUERY = (
+        "SELECT User AS rolename FROM mysql.user WHERE Host = '%' AND User IN ({rolenames})"
+    )
+    ROLE_EDGES_QUERY = (
+        "SELECT TO_USER AS rolename, FROM_USER AS parent FROM mysql.role_edges "
+        "WHERE TO_HOST = '%' AND TO_USER IN ({rolenames})"
+    )
+    ROLE_GRANTS_QUERY = "SHOW GRANTS FOR {rolename}"
     ROLE_GRANTING_QUERY = "GRANT {parents} TO {rolename}"
     PRIV_GRANTING_QUERY = "GRANT {privileges} ON {database}.* TO {rolename}"
 
@@ -44,127 +69,174 @@ class CharmAuthorizationQueryBuilder(BaseAuthorizationQueryBuilder):
     ):
         """Initialize the query builder."""
         self._quoter = StringQueryQuoter()
-        self._role_admin = self._quoter.quote_value(role_admin)
-        self._role_backup = self._quoter.quote_value(role_backup)
-        self._role_ddl = self._quoter.quote_value(role_ddl)
-        self._role_stats = self._quoter.quote_value(role_stats)
-        self._role_reader = self._quoter.quote_value(role_reader)
-        self._role_writer = self._quoter.quote_value(role_writer)
-
-    def _build_instance_admin_role_queries(self) -> list[str]:
-        """Builds the instance admin role creation queries."""
-        return [
-            self.ROLE_CREATION_QUERY.format(
-                rolename=self._role_admin,
-            ),
-            self.ROLE_GRANTING_QUERY.format(
-                parents=", ".join([
-                    self._role_backup,
-                    self._role_ddl,
-                    self._role_stats,
-                    self._role_writer,
-                ]),
-                rolename=self._role_admin,
-            ),
-            self.PRIV_GRANTING_QUERY.format(
-                privileges=", ".join([
-                    *self._DATA_PRIVILEGES,
-                    "EVENT",
-                    "SHUTDOWN",
-                    "AUDIT_ADMIN",
-                    "CONNECTION_ADMIN",
-                    "SYSTEM_VARIABLES_ADMIN",
-                ]),
-                rolename=self._role_admin,
-                database="*",
-            ),
-        ]
+        self._role_admin = role_admin
+        self._role_backup = role_backup
+        self._role_ddl = role_ddl
+        self._role_stats = role_stats
+        self._role_reader = role_reader
+        self._role_writer = role_writer
 
-    def _build_instance_backup_role_queries(self) -> list[str]:
-        """Builds the instance backups role creation queries."""
+    def _get_instance_roles(self) -> list[_RoleSpec]:
+        """Gets the instance roles hierarchy, with every role after its parents."""
         return [
-            self.ROLE_CREATION_QUERY.format(
-                rolename=self._role_backup,
+            _RoleSpec(
+                rolename=self._role_reader,
             ),
-            self.ROLE_GRANTING_QUERY.format(
-                parents=", ".join([self._role_stats]),
-                rolename=self._role_backup,
+            _RoleSpec(
+                rolename=self._role_writer,
             ),
-            self.PRIV_GRANTING_QUERY.format(
-                privileges=", ".join([
-                    "EXECUTE",
-                    "LOCK TABLES",
-                    "PROCESS",
-                    "RELOAD",
-                    "BACKUP_ADMIN",
-                    "CONNECTION_ADMIN",
-                ]),
-                rolename=self._role_backup,
-                database="*",
+            _RoleSpec(
+                rolename=self._role_stats,
+                grants=[
+                    ("performance_schema", ["SELECT"]),
+                    ("*", ["PROCESS", "RELOAD", "REPLICATION CLIENT"]),
+                ],
             ),
-        ]
-
-    def _build_instance_ddl_role_queries(self) -> list[str]:
-        """Builds the instance backups role creation queries."""
-        return [
-            self.ROLE_CREATION_QUERY.format(
+            _RoleSpec(
                 rolename=self._role_ddl,
+                parents=[self._role_writer],
+                grants=[
+                    ("*", [*self._SCHEMA_PRIVILEGES, "SHOW_ROUTINE", "SHOW VIEW"]),
+                ],
             ),
-            self.ROLE_GRANTING_QUERY.format(
-                parents=", ".join([self._role_writer]),
-                rolename=self._role_ddl,
+            _RoleSpec(
+                rolename=self._role_backup,
+                parents=[self._role_stats],
+                grants=[
+                    (
+                        "*",
+                        [
+                            "EXECUTE",
+                            "LOCK TABLES",
+                            "PROCESS",
+                            "RELOAD",
+                            "BACKUP_ADMIN",
+                            "CONNECTION_ADMIN",
+                        ],
+                    ),
+                ],
             ),
-            self.PRIV_GRANTING_QUERY.format(
-                privileges=", ".join([*self._SCHEMA_PRIVILEGES, "SHOW_ROUTINE", "SHOW VIEW"]),
-                rolename=self._role_ddl,
-                database="*",
+            _RoleSpec(
+                rolename=self._role_admin,
+                parents=[self._role_backup, self._role_ddl, self._role_stats, self._role_writer],
+                grants=[
+                    (
+                        "*",
+                        [
+                            *self._DATA_PRIVILEGES,
+                            "EVENT",
+                            "SHUTDOWN",
+                            "AUDIT_ADMIN",
+                            "CONNECTION_ADMIN",
+                            "SYSTEM_VARIABLES_ADMIN",
+                        ],
+                    ),
+                ],
             ),
         ]
 
-    def _build_instance_stats_role_queries(self) -> list[str]:
-        """Builds the instance stats role creation queries."""
-        return [
-            self.ROLE_CREATION_QUERY.format(
-                rolename=self._role_stats,
-            ),
-            self.PRIV_GRANTING_QUERY.format(
-                privileges=", ".join(["SELECT"]),
-                rolename=self._role_stats,
-                database="performance_schema",
-            ),
-            self.PRIV_GRANTING_QUERY.format(
-                privileges=", ".join(["PROCESS", "RELOAD", "REPLICATION CLIENT"]),
-                rolename=self._role_stats,
-                database="*",
-            ),
-        ]
+    def _build_role_queries(
+        self,
+        creation_query: str,
+        rolename: str,
+        parents: list[str],
+        grants: list[tuple[str, list[str]]],
+    ) -> list[str]:
+        """Builds the queries creating a role, granting its parents and privileges."""
+        queries = []
 
-    def _build_instance_reader_role_queries(self) -> list[str]:
-        """Builds the instance reader role creation queries."""
-        return [
-            self.ROLE_CREATION_QUERY.format(
-                rolename=self._role_reader,
-            ),
-        ]
+        if creation_query:
+            queries.append(
+                creation_query.format(
+                    rolename=self._quoter.quote_value(rolename),
+                )
+            )
+        if parents:
+            queries.append(
+                self.ROLE_GRANTING_QUERY.format(
+                    parents=", ".join(self._quoter.quote_value(p) for p in parents),
+                    rolename=self._quoter.quote_value(rolename),
+                )
+            )
+        for database, privileges in grants:
+            if not privileges:
+                continue
+            queries.append(
+                self.PRIV_GRANTING_QUERY.format(
+                    privileges=", ".join(privileges),
+                    rolename=self._quoter.quote_value(rolename),
+                    database=database,
+                )
+            )
+
+        return queries
+
+    def build_instance_auth_roles_query(self) -> str:
+        """Builds the instance roles creation query."""
+        queries = []
+        for role in self._get_instance_roles():
+            queries += self._build_role_queries(
+                self.ROLE_CREATION_QUERY, role.rolename, role.parents, role.grants
+            )
+
+        return ";".join(queries)
+
+    def build_instance_auth_roles_state_queries(self) -> list[str]:
+        """Builds the queries reading the existing instance roles, parents and privileges.
+
+        They must be run as a forced batch, as showing the grants of a missing role fails.
+        """
+        rolenames = ", ".join(
+            self._quoter.quote_value(role.rolename) for role in self._get_instance_roles()
+        )
 
-    def _build_instance_writer_role_queries(self) -> list[str]:
-        """Builds the instance writer role creation queries."""
         return [
-            self.ROLE_CREATION_QUERY.format(
-                rolename=self._role_writer,
+            self.ROLE_EXISTENCE_QUERY.format(rolenames=rolenames),
+            self.ROLE_EDGES_QUERY.format(rolenames=rolenames),
+            *(
+                self.ROLE_GRANTS_QUERY.format(rolename=self._quoter.quote_value(role.rolename))
+                for role in self._get_instance_roles()
             ),
         ]
 
-    def build_instance_auth_roles_query(self) -> str:
-        """Builds the instance roles creation query."""
-        return ";".join([
-            *self._build_instance_reader_role_queries(),
-            *self._build_instance_writer_role_queries(),
-            *self._build_instance_stats_role_queries(),
-            *self._build_instance_ddl_role_queries(),
-            *self._build_instance_backup_role_queries(),
-            *self._build_instance_admin_role_queries(),
-        ])
+    def build_instance_auth_roles_delta_query(self, results: Sequence[StatementResult]) -> str:
+        """Builds the query creating only the missing instance roles, parents and privileges.
+
+        Arguments:
+            results: Results of the instance roles state queries batch
+
+        Returns:
+            Query to run, empty if the instance roles are up to date
+        """
+        roles = self._get_instance_roles()
+        existing = {row["rolename"] for row in results[0].rows}
+        edges = {(row["rolename"], row["parent"]) for row in results[1].rows}
+        privileges = set()
+
+        for role, result in zip(roles, results[2:]):
+            for grant in (value for row in result.rows for value in row.values()):
+                match = _GRANT_PATTERN.match(grant)
+                if not match:
+                    continue
+
+                database = match.group("database").strip("`")
+                for privilege in match.group("privileges").split(","):
+                    privileges.add((role.rolename, database, privilege.strip().upper()))
+
+        queries = []
+        for role in roles:
+            parents = [p for p in role.parents if (role.rolename, p) not in edges]
+            grants = [
+                (database, [p for p in privs if (role.rolename, database, p) not in privileges])
+                for database, privs in role.grants
+                if (role.rolename, database, "ALL PRIVILEGES") not in privileges
+            ]
+            creation_query = (
+                self.ROLE_CREATION_IF_MISSING_QUERY if role.rolename not in existing else ""
+            )
+            queries += self._build_role_queries(creation_query, role.rolename, parents, grants)
+
+        return ";".join(queries)
 
     def build_instance_router_role_query(self, rolename: str) -> str:
         """Builds the instance router role creation query."""
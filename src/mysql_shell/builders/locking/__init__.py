@@ -3,3 +3,4 @@
 
 from .base import BaseLockingQueryBuilder
 from .charm import CharmLockingQueryBuilder
+from .named import NamedLockingQueryBuilder
@@ -1,12 +1,19 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from typing import Sequence
+
 from ..quoting import StringQueryQuoter
 from .base import BaseLockingQueryBuilder
 
 
 class CharmLockingQueryBuilder(BaseLockingQueryBuilder):
-    """Charm locking query builder."""
+    """Charm locking query builder.
+
+    When built with a lease duration, acquired locks expire unless renewed before that
+    many seconds, so that locks held by crashed instances get taken over by the next
+    acquiring instance. Lease timestamps are computed by the server, in UTC.
+    """
 
     INSTANCE_ADDITION_TASK = "unit-add"
     INSTANCE_REMOVAL_TASK = "unit-teardown"
@@ -16,43 +23,120 @@ class CharmLockingQueryBuilder(BaseLockingQueryBuilder):
         INSTANCE_REMOVAL_TASK,
     ]
 
-    def __init__(self, table_schema: str, table_name: str):
-        """Initialize the query builder."""
+    # Locking table task column length
+    _MAX_TASK_LENGTH = 20
+
+    def __init__(
+        self,
+        table_schema: str,
+        table_name: str,
+        lease_duration: int | None = None,
+        tasks: Sequence[str] | None = None,
+    ):
+        """Initialize the query builder.
+
+        Arguments:
+            table_schema: Schema of the locking table
+            table_name: Name of the locking table
+            lease_duration: Optional seconds after which non-renewed locks expire
+            tasks: Optional names of the lockable tasks, defaults to TASKS
+        """
+        if lease_duration is not None and lease_duration <= 0:
+            raise ValueError("Lease duration must be positive")
+
+        tasks = list(self.TASKS if tasks is None else tasks)
+        if not tasks or any(not 0 < len(task) <= self._MAX_TASK_LENGTH for task in tasks):
+            raise ValueError(f"Tasks must be between 1 and {self._MAX_TASK_LENGTH} characters")
+
         self._quoter = StringQueryQuoter()
+        self._table_schema = table_schema
+        self._table_name = table_name
+        self._lease_duration = lease_duration
+        self._tasks = tasks
         self._table = "{table_schema}.{table_name}".format(
             table_schema=self._quoter.quote_identifier(table_schema),
             table_name=self._quoter.quote_identifier(table_name),
         )
 
+    @property
+    def tasks(self) -> list[str]:
+        """Return the names of the lockable tasks."""
+        return list(self._tasks)
+
+    def _build_expiry(self) -> str:
+        """Builds the lease expiry expression of the acquired locks."""
+        if self._lease_duration is None:
+            return "NULL"
+
+        return f"UTC_TIMESTAMP(6) + INTERVAL {int(self._lease_duration)} SECOND"
+
+    def _check_task(self, task: str) -> None:
+        """Checks whether a task is supported."""
+        if task not in self._tasks:
+            raise ValueError("Task not supported")
+
     def build_table_creation_query(self) -> str:
-        """Builds the locking table creation query."""
+        """Builds the locking table creation query.
+
+        Tables created by previous versions get the lease expiry column added.
+        """
         create_query = (
             "CREATE TABLE IF NOT EXISTS {table} ( "
             "    task VARCHAR(20), "
             "    executor VARCHAR(20), "
             "    status VARCHAR(20), "
+            "    expires_at DATETIME(6) NULL, "
             "    PRIMARY KEY(task) "
             ")"
         )
+        migrate_queries = (
+            "SET @locking_migration = IF(("
+            "    SELECT COUNT(*) "
+            "    FROM information_schema.columns "
+            "    WHERE table_schema = {schema} AND table_name = {name} "
+            "    AND column_name = 'expires_at'"
+            ") = 0, {alter}, 'DO 0')",
+            "PREPARE locking_migration FROM @locking_migration",
+            "EXECUTE locking_migration",
+            "DEALLOCATE PREPARE locking_migration",
+        )
         insert_query = (
-            "INSERT INTO {table} (task, executor, status) "
-            "VALUES ('{task}', '', 'not-started') "
+            "INSERT INTO {table} (task, executor, status, expires_at) "
+            "VALUES ({task}, '', 'not-started', NULL) "
             "ON DUPLICATE KEY UPDATE "
             "    executor = '', "
-            "    status = 'not-started'"
+            "    status = 'not-started', "
+            "    expires_at = NULL"
         )
 
+        alter_query = f"ALTER TABLE {self._table} ADD COLUMN expires_at DATETIME(6) NULL"
         create_queries = [create_query.format(table=self._table)]
-        insert_queries = [insert_query.format(table=self._table, task=task) for task in self.TASKS]
+        migrate_queries = [
+            query.format(
+                schema=self._quoter.quote_value(self._table_schema),
+                name=self._quoter.quote_value(self._table_name),
+                alter=self._quoter.quote_value(alter_query),
+            )
+            for query in migrate_queries
+        ]
+        insert_queries = [
+            insert_query.format(table=self._table, task=self._quoter.quote_value(task))
+            for task in self._tasks
+        ]
 
         return ";".join((
             *create_queries,
+            *migrate_queries,
             *insert_queries,
         ))
 
     def build_fetch_acquired_query(self, task: str) -> str:
-        """Builds the acquired lock fetch query."""
-        query = "SELECT executor FROM {table} WHERE task = {task} AND status = {status}"
+        """Builds the acquired lock fetch query, skipping expired leases."""
+        query = (
+            "SELECT executor FROM {table} "
+            "WHERE task = {task} AND status = {status} "
+            "AND (expires_at IS NULL OR expires_at > UTC_TIMESTAMP(6))"
+        )
 
         return query.format(
             table=self._table,
@@ -61,14 +145,41 @@ class CharmLockingQueryBuilder(BaseLockingQueryBuilder):
         )
 
     def build_acquire_query(self, task: str, instance: str) -> str:
-        """Builds the lock acquiring query."""
-        if task not in self.TASKS:
-            raise ValueError("Task not supported")
+        """Builds the lock acquiring query, taking over expired leases atomically."""
+        self._check_task(task)
+
+        query = (
+            "UPDATE {table} "
+            "SET status = {status}, executor = {instance}, expires_at = {expiry} "
+            "WHERE task = {task} AND ("
+            "    executor = '' OR "
+            "    (expires_at IS NOT NULL AND expires_at <= UTC_TIMESTAMP(6))"
+            ")"
+        )
+
+        return query.format(
+            table=self._table,
+            task=self._quoter.quote_value(task),
+            instance=self._quoter.quote_value(instance),
+            status=self._quoter.quote_value("in-progress"),
+            expiry=self._build_expiry(),
+        )
+
+    def build_renew_query(self, task: str, instance: str) -> str:
+        """Builds the lock lease renewal query, to be run periodically by the lock holder.
+
+        The lease is only renewed while the lock is held by the instance,
+        so the acquired lock fetch query tells whether it was taken over meanwhile.
+        """
+        self._check_task(task)
+
+        if self._lease_duration is None:
+            raise ValueError("Lease duration not configured")
 
         query = (
             "UPDATE {table} "
-            "SET status = {status}, executor = {instance} "
-            "WHERE task = {task} AND executor = ''"
+            "SET expires_at = {expiry} "
+            "WHERE task = {task} AND executor = {instance} AND status = {status}"
         )
 
         return query.format(
@@ -76,16 +187,16 @@ class CharmLockingQueryBuilder(BaseLockingQueryBuilder):
             task=self._quoter.quote_value(task),
             instance=self._quoter.quote_value(instance),
             status=self._quoter.quote_value("in-progress"),
+            expiry=self._build_expiry(),
         )
 
     def build_release_query(self, task: str, instance: str) -> str:
         """Builds the lock releasing query."""
-        if task not in self.TASKS:
-            raise ValueError(f"Task not supported")
+        self._check_task(task)
 
         query = (
             "UPDATE {table} "
-            "SET status = {status}, executor = '' "
+            "SET status = {status}, executor = '', expires_at = NULL "
             "WHERE task = {task} AND executor = {instance}"
         )
 
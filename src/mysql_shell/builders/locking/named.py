@@ -0,0 +1,122 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from typing import Sequence
+
+from ..quoting import StringQueryQuoter
+from .base import BaseLockingQueryBuilder
+from .charm import CharmLockingQueryBuilder
+
+
+class NamedLockingQueryBuilder(BaseLockingQueryBuilder):
+    """Named locking query builder, based on the MySQL user-level locks.
+
+    Acquiring a lock waits server-side (using GET_LOCK) until the lock is free,
+    or the timeout expires, instead of polling a locking table from the client.
+    The lock holder is tracked by a second lock, named after the holding instance.
+
+    User-level locks belong to the server session, and are released as soon as it ends,
+    so the queries must be run through an executor reusing the same session across calls.
+    They are not replicated either, so every instance must acquire them on the same server.
+    https://dev.mysql.com/doc/refman/8.0/en/locking-functions.html
+    """
+
+    INSTANCE_ADDITION_TASK = CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK
+    INSTANCE_REMOVAL_TASK = CharmLockingQueryBuilder.INSTANCE_REMOVAL_TASK
+
+    TASKS = [
+        INSTANCE_ADDITION_TASK,
+        INSTANCE_REMOVAL_TASK,
+    ]
+
+    # MySQL user-level lock names length limit
+    _MAX_NAME_LENGTH = 64
+
+    def __init__(self, prefix: str, tasks: Sequence[str] | None = None):
+        """Initialize the query builder.
+
+        Arguments:
+            prefix: Prefix of the lock names, namespacing them within the server
+            tasks: Optional names of the lockable tasks, defaults to TASKS
+        """
+        self._quoter = StringQueryQuoter()
+        self._prefix = prefix
+        self._tasks = list(self.TASKS if tasks is None else tasks)
+
+    def _build_lock_name(self, task: str) -> str:
+        """Builds the name of a task lock."""
+        if task not in self._tasks:
+            raise ValueError("Task not supported")
+
+        return self._check_name(f"{self._prefix}.{task}")
+
+    def _build_holder_name(self, task: str, instance: str) -> str:
+        """Builds the name of the lock tracking the holder of a task lock."""
+        return self._check_name(f"{self._build_lock_name(task)}.{instance}")
+
+    def _check_name(self, name: str) -> str:
+        """Checks the length of a lock name."""
+        if len(name) > self._MAX_NAME_LENGTH:
+            raise ValueError(f"Lock name {name} longer than {self._MAX_NAME_LENGTH} characters")
+
+        return name
+
+    def build_table_creation_query(self) -> str:
+        """Builds the locking table creation query, a no-op as named locks need no table."""
+        return "DO 0"
+
+    def build_fetch_acquired_query(self, task: str) -> str:
+        """Builds the acquired lock fetch query."""
+        query = (
+            "SELECT SUBSTRING(object_name, {offset}) AS executor "
+            "FROM performance_schema.metadata_locks "
+            "WHERE object_type = 'USER LEVEL LOCK' "
+            "AND lock_status = 'GRANTED' "
+            "AND object_name LIKE {pattern}"
+        )
+        lock_name = self._build_lock_name(task)
+        pattern = lock_name.replace("\\", "\\\\").replace("_", "\\_").replace("%", "\\%")
+
+        return query.format(
+            offset=len(lock_name) + 2,
+            pattern=self._quoter.quote_value(f"{pattern}.%"),
+        )
+
+    def build_acquire_query(self, task: str, instance: str, timeout: float | None = 0) -> str:
+        """Builds the lock acquiring query, waiting for the lock up to the timeout seconds.
+
+        The query returns an acquired column, being 1 if the lock got acquired,
+        0 if the timeout expired, or NULL on errors. A None timeout waits forever.
+        """
+        query = "SELECT IF(GET_LOCK({lock}, {timeout}) = 1, GET_LOCK({holder}, 0), 0) AS acquired"
+
+        return query.format(
+            lock=self._quoter.quote_value(self._build_lock_name(task)),
+            holder=self._quoter.quote_value(self._build_holder_name(task, instance)),
+            timeout=-1 if timeout is None else timeout,
+        )
+
+    def build_release_query(self, task: str, instance: str) -> str:
+        """Builds the lock releasing query.
+
+        The query returns a released column, being 1 if the lock got released,
+        and 0 or NULL if the lock was not held by the same session.
+        """
+        query = "SELECT IF(RELEASE_LOCK({holder}) = 1, RELEASE_LOCK({lock}), 0) AS released"
+
+        return query.format(
+            lock=self._quoter.quote_value(self._build_lock_name(task)),
+            holder=self._quoter.quote_value(self._build_holder_name(task, instance)),
+        )
+
+    def build_held_query(self, task: str, instance: str) -> str:
+        """Builds the lock holding check query.
+
+        The query returns a held column, being 1 only if the lock is held by the same session,
+        so that a lock silently lost along with its session (i.e. on reconnection) is detected.
+        """
+        query = "SELECT COALESCE(IS_USED_LOCK({holder}) = CONNECTION_ID(), 0) AS held"
+
+        return query.format(
+            holder=self._quoter.quote_value(self._build_holder_name(task, instance)),
+        )
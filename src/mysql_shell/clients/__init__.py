@@ -1,5 +1,12 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from .cache import *
 from .cluster import *
+from .cluster_async import *
 from .instance import *
+from .instance_async import *
+from .locking import *
+from .multi import *
+from .operation import *
+from .watcher import *
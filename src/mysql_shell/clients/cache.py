@@ -0,0 +1,393 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import copy
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Mapping
+
+from ..executors.errors import ExecutionError
+
+logger = logging.getLogger()
+
+
+@dataclass
+class ResultCacheStats:
+    """Result cache usage statistics."""
+
+    max_entries: int
+    entries: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the ratio of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """Thread-safe cache of client read results, with per-key TTL and LRU eviction.
+
+    Entries are keyed by client method name and arguments. Their TTL is taken
+    from the per-method overrides, falling back to the default one,
+    where a non-positive TTL disables the caching of that method.
+    Once full, the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = 256,
+    ):
+        """Initialize the cache.
+
+        Arguments:
+            ttl: Default seconds an entry is served for
+            ttls: Optional seconds an entry is served for, by client method name
+            max_entries: Maximum number of entries held at once
+        """
+        if max_entries < 1:
+            raise ValueError("Cache max entries must be positive")
+
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def ttl(self, method: str) -> float:
+        """Return the seconds the entries of a client method are served for."""
+        return self._ttls.get(method, self._ttl)
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return whether a fresh entry exists for the key, and a copy of its value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[1]
+
+        return True, copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store a copy of a value under the key, for the provided seconds."""
+        if ttl <= 0:
+            return
+
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> ResultCacheStats:
+        """Return the cache usage statistics."""
+        with self._lock:
+            return ResultCacheStats(
+                max_entries=self._max_entries,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+# Group view and member states, changing whenever a member joins, leaves or changes its state.
+# Routers are fingerprinted by their metadata instead, ignoring their periodic check-ins
+_METADATA_PROBE_COLUMNS = (
+    "(SELECT view_id "
+    "   FROM performance_schema.replication_group_member_stats "
+    "   WHERE member_id = @@server_uuid) AS view_id",
+    "(SELECT GROUP_CONCAT(member_id, ':', member_state, ':', member_role ORDER BY member_id) "
+    "   FROM performance_schema.replication_group_members) AS members",
+)
+_METADATA_PROBE_ROUTERS_COLUMNS = (
+    "(SELECT CONCAT(COUNT(*), ':', COALESCE(SUM(CRC32(CONCAT_WS("
+    "   ',', router_id, router_name, address, version, cluster_id, attributes"
+    "))), 0)) "
+    "   FROM mysql_innodb_cluster_metadata.routers) AS routers",
+)
+
+
+class MetadataCache:
+    """Thread-safe cache of costly cluster reads, validated by a probe query.
+
+    Every read runs a cheap SQL probe query first, fingerprinting the group view
+    and member states, or the routers metadata. Entries are only served while
+    the fingerprint is unchanged, and no TTL applies. Only reads costing far more
+    than the probe (i.e. the AdminAPI status) are meant to be cached this way.
+    Entries are keyed by the instance the client is connected to,
+    so the cache can be shared across clients. Once full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the cache.
+
+        Arguments:
+            max_entries: Maximum number of entries held at once
+        """
+        if max_entries < 1:
+            raise ValueError("Cache max entries must be positive")
+
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def build_probe_query(routers: bool = False) -> str:
+        """Build the query fingerprinting the group view and member states.
+
+        Arguments:
+            routers: Whether to fingerprint the routers metadata instead
+        """
+        columns = _METADATA_PROBE_ROUTERS_COLUMNS if routers else _METADATA_PROBE_COLUMNS
+        return "SELECT " + ", ".join(columns)
+
+    @staticmethod
+    def fingerprint(rows: list[dict]) -> Hashable:
+        """Return the fingerprint out of the probe query rows."""
+        return tuple(sorted(rows[0].items())) if rows else ()
+
+    def get(self, key: Hashable, fingerprint: Hashable) -> tuple[bool, Any]:
+        """Return whether a valid entry exists for the key, and a copy of its value."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                self._entries.pop(key, None)
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[1]
+
+        return True, copy.deepcopy(value)
+
+    def put(self, key: Hashable, value: Any, fingerprint: Hashable) -> None:
+        """Store a copy of a value under the key, valid while the fingerprint is unchanged."""
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (fingerprint, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def stats(self) -> ResultCacheStats:
+        """Return the cache usage statistics."""
+        with self._lock:
+            return ResultCacheStats(
+                max_entries=self._max_entries,
+                entries=len(self._entries),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+            )
+
+
+def cached(func=None, *, skip: Callable[..., bool] | None = None):
+    """Serve a client read method from the client cache, when one is configured.
+
+    Arguments:
+        func: Client read method, when used without arguments
+        skip: Optional predicate of the method arguments, bypassing the cache when true
+    """
+    if func is None:
+        return functools.partial(cached, skip=skip)
+
+    name = func.__name__
+
+    def lookup(self, args: tuple, kwargs: dict) -> tuple[Hashable, float, bool, Any]:
+        key = (name, repr(args), repr(sorted(kwargs.items())))
+        ttl = self._cache.ttl(name)
+        hit, value = self._cache.get(key) if ttl > 0 else (False, None)
+        return key, ttl, hit, value
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self._cache is None or (skip and skip(*args, **kwargs)):
+                return await func(self, *args, **kwargs)
+
+            key, ttl, hit, value = lookup(self, args, kwargs)
+            if hit:
+                return value
+
+            value = await func(self, *args, **kwargs)
+            self._cache.put(key, value, ttl)
+            return value
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self._cache is None or (skip and skip(*args, **kwargs)):
+                return func(self, *args, **kwargs)
+
+            key, ttl, hit, value = lookup(self, args, kwargs)
+            if hit:
+                return value
+
+            value = func(self, *args, **kwargs)
+            self._cache.put(key, value, ttl)
+            return value
+
+    return wrapper
+
+
+def invalidating(func):
+    """Invalidate the client cache once a client write method runs, even if it fails."""
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                if self._cache is not None:
+                    self._cache.invalidate()
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                if self._cache is not None:
+                    self._cache.invalidate()
+
+    return wrapper
+
+
+def _metadata_key(client: Any, func, args: tuple, kwargs: dict) -> Hashable:
+    """Build the metadata cache key of a client read, including the instance it reads from.
+
+    The arguments are bound to the method signature, so that equivalent calls share their key.
+    """
+    conn_details = client._executor.connection_details
+    address = (conn_details.host, conn_details.port, conn_details.socket)
+    arguments = inspect.signature(func).bind(client, *args, **kwargs)
+    arguments.apply_defaults()
+    return func.__name__, address, repr(list(arguments.arguments.items())[1:])
+
+
+def _metadata_cached_async(func, probe_query: str):
+    """Serve an asynchronous client read method from the client metadata cache."""
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        cache = self._metadata_cache
+        if cache is None:
+            return await func(self, *args, **kwargs)
+
+        try:
+            rows = await self._executor.execute_sql(probe_query)
+        except ExecutionError:
+            logger.warning("Failed to probe cluster state, skipping cache")
+            return await func(self, *args, **kwargs)
+
+        key = _metadata_key(self, func, args, kwargs)
+        fingerprint = cache.fingerprint(rows)
+        hit, value = cache.get(key, fingerprint)
+        if hit:
+            return value
+
+        value = await func(self, *args, **kwargs)
+        cache.put(key, value, fingerprint)
+        return value
+
+    return wrapper
+
+
+def _metadata_cached_sync(func, probe_query: str):
+    """Serve a client read method from the client metadata cache."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cache = self._metadata_cache
+        if cache is None:
+            return func(self, *args, **kwargs)
+
+        try:
+            rows = self._executor.execute_sql(probe_query)
+        except ExecutionError:
+            logger.warning("Failed to probe cluster state, skipping cache")
+            return func(self, *args, **kwargs)
+
+        key = _metadata_key(self, func, args, kwargs)
+        fingerprint = cache.fingerprint(rows)
+        hit, value = cache.get(key, fingerprint)
+        if hit:
+            return value
+
+        value = func(self, *args, **kwargs)
+        cache.put(key, value, fingerprint)
+        return value
+
+    return wrapper
+
+
+def metadata_cached(func=None, *, routers: bool = False):
+    """Serve a costly client read method from the client metadata cache, when one is configured.
+
+    The read runs uncached whenever the probe query fails (i.e. on instances out of a cluster).
+    It must not be combined with the TTL cache, which would skip the probe validation.
+
+    Arguments:
+        func: Client read method, when used without arguments
+        routers: Whether the read depends on the routers metadata, instead of the group view
+    """
+    if func is None:
+        return functools.partial(metadata_cached, routers=routers)
+
+    probe_query = MetadataCache.build_probe_query(routers)
+
+    if inspect.iscoroutinefunction(func):
+        return _metadata_cached_async(func, probe_query)
+
+    return _metadata_cached_sync(func, probe_query)
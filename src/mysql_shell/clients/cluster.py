@@ -3,26 +3,388 @@
 
 import json
 import logging
-from typing import Mapping
+from typing import Mapping, Sequence
 
+from ..builders import StringQueryQuoter
 from ..executors import BaseExecutor
 from ..executors.errors import ExecutionError
+from ..executors.metrics import instrumented
+from ..models.cluster import InstanceAttachment
+from ..models.topology import ClusterTopology
+from .cache import MetadataCache, metadata_cached
+from .instance import MySQLInstanceClient
+from .operation import ClusterOperation
 
 logger = logging.getLogger()
 
 _Options = Mapping[str, str] | None
 
+# Metadata and Group Replication state of every cluster member, as seen by the queried member
+_FAST_STATUS_QUERY = (
+    "SELECT "
+    "c.cluster_name AS cluster_name, "
+    "c.primary_mode AS primary_mode, "
+    "i.instance_name AS label, "
+    "i.address AS address, "
+    "m.member_state AS member_state, "
+    "m.member_role AS member_role, "
+    "m.member_version AS member_version, "
+    "m.member_id = @@server_uuid AS is_local, "
+    "s.count_transactions_in_queue AS certifier_queue, "
+    "s.count_transactions_remote_in_applier_queue AS applier_queue "
+    "FROM mysql_innodb_cluster_metadata.instances i "
+    "JOIN mysql_innodb_cluster_metadata.clusters c ON c.cluster_id = i.cluster_id "
+    "LEFT JOIN performance_schema.replication_group_members m "
+    "ON m.member_id = i.mysql_server_uuid "
+    "LEFT JOIN performance_schema.replication_group_member_stats s "
+    "ON s.member_id = i.mysql_server_uuid "
+    "WHERE c.cluster_name = {cluster_name} "
+    "ORDER BY i.instance_name"
+)
+
+
+def _build_fast_status_member(row: Mapping) -> dict:
+    """Build a member entry of the cluster status, out of a fast status row."""
+    state = row["member_state"] or "(MISSING)"
+    role = row["member_role"]
+    member = {
+        "address": row["address"],
+        "memberRole": role or "SECONDARY",
+        "mode": "n/a",
+        "status": state,
+        "version": row["member_version"],
+    }
+
+    if state == "ONLINE":
+        writable = role == "PRIMARY" or row["primary_mode"] == "mm"
+        member["mode"] = "R/W" if writable else "R/O"
+    if row["certifier_queue"] is not None:
+        member["queueSizes"] = {
+            "certifier": row["certifier_queue"],
+            "applier": row["applier_queue"],
+        }
+
+    return member
+
+
+def _build_fast_status(cluster_name: str, rows: list[dict]) -> dict:
+    """Build a cluster status, shaped as the AdminAPI one, out of the fast status rows.
+
+    The status is computed as the AdminAPI does, but only from the point of view
+    of the queried member, so it is UNKNOWN whenever that member is not online.
+    """
+    topology = {row["label"]: _build_fast_status_member(row) for row in rows}
+    states = [member["status"] for member in topology.values()]
+    local = [row for row in rows if row["is_local"]]
+    single_primary = not rows or rows[0]["primary_mode"] != "mm"
+
+    online = states.count("ONLINE")
+    group_size = online + states.count("RECOVERING") + states.count("UNREACHABLE")
+    reachable = online + states.count("RECOVERING")
+    tolerance = (online - 1) // 2 if online else 0
+    inactive = len(states) - online
+
+    if not local or local[0]["member_state"] != "ONLINE":
+        status, text = "UNKNOWN", "Cluster status cannot be determined by this member."
+    elif 2 * reachable <= group_size:
+        status, text = "NO_QUORUM", "Cluster has no quorum as visible from this member."
+    elif tolerance:
+        status, text = "OK", f"Cluster is ONLINE and can tolerate up to {tolerance} failure(s)."
+    else:
+        status, text = "OK_NO_TOLERANCE", "Cluster is NOT tolerant to any failures."
+
+    if status.startswith("OK") and inactive:
+        status += "_PARTIAL"
+        text += f" {inactive} member(s) not active."
+
+    replica_set = {
+        "name": "default",
+        "status": status,
+        "statusText": text,
+        "topology": topology,
+        "topologyMode": "Single-Primary" if single_primary else "Multi-Primary",
+    }
+
+    primaries = [m["address"] for m in topology.values() if m["memberRole"] == "PRIMARY"]
+    if single_primary and primaries:
+        replica_set["primary"] = primaries[0]
+
+    return {
+        "clusterName": cluster_name,
+        "defaultReplicaSet": replica_set,
+    }
+
+
+def _build_instance_attachments(output: str) -> dict[str, InstanceAttachment]:
+    """Build the instance attachment outcomes, out of the instances addition script output."""
+    attachments = {
+        address: InstanceAttachment(address, **outcome)
+        for address, outcome in json.loads(output).items()
+    }
+    for attachment in attachments.values():
+        if attachment.error:
+            logger.error(f"Failed to attach instance {attachment.address}: {attachment.error}")
+
+    return attachments
+
+
+class _ClusterScriptBuilder:
+    """Builder of the cluster scripts, shared by the synchronous and asynchronous clients."""
+
+    @staticmethod
+    def build_cluster_creation_script(cluster_name: str, options: _Options = None) -> str:
+        """Builds the script to create a cluster."""
+        return f"dba.create_cluster('{cluster_name}', {options})"
+
+    @staticmethod
+    def build_cluster_dissolution_script(cluster_name: str, options: _Options = None) -> str:
+        """Builds the script to destroy a cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.dissolve({options})",
+        ))
+
+    @staticmethod
+    def build_cluster_status_script(cluster_name: str, extended: bool = False) -> str:
+        """Builds the script to print a cluster status."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"status = cluster.status({{'extended': {extended}}})",
+            f"print(status)",
+        ))
+
+    @staticmethod
+    def build_cluster_routers_script(cluster_name: str) -> str:
+        """Builds the script to print a cluster routers."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"routers = cluster.list_routers()",
+            f"print(routers)",
+        ))
+
+    @staticmethod
+    def build_cluster_rescan_script(cluster_name: str, options: _Options = None) -> str:
+        """Builds the script to rescan a cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.rescan({options})",
+        ))
+
+    @staticmethod
+    def build_cluster_reboot_script(cluster_name: str, options: _Options = None) -> str:
+        """Builds the script to reboot a cluster."""
+        return f"dba.reboot_cluster_from_complete_outage('{cluster_name}', {options})"
+
+    @staticmethod
+    def build_cluster_set_creation_script(cluster_name: str, cluster_set_name: str) -> str:
+        """Builds the script to create a cluster set."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.create_cluster_set('{cluster_set_name}')",
+        ))
+
+    @staticmethod
+    def build_cluster_set_status_script(extended: bool = False) -> str:
+        """Builds the script to print a cluster set status."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"status = cluster_set.status({{'extended': {extended}}})",
+            f"print(status)",
+        ))
+
+    @staticmethod
+    def build_cluster_set_routers_script() -> str:
+        """Builds the script to print a cluster set routers."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"routers = cluster_set.list_routers()",
+            f"print(routers)",
+        ))
+
+    @staticmethod
+    def build_replica_creation_script(
+        cluster_name: str, address: str, options: _Options = None
+    ) -> str:
+        """Builds the script to create a replica cluster into the cluster set."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"cluster_set.create_replica_cluster('{address}', '{cluster_name}', {options})",
+        ))
+
+    @staticmethod
+    def build_replica_promotion_script(cluster_name: str, force: bool = False) -> str:
+        """Builds the script to promote a replica cluster within the cluster set."""
+        method_name = "force_primary_cluster" if force else "set_primary_cluster"
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"cluster_set.{method_name}('{cluster_name}')",
+        ))
+
+    @staticmethod
+    def build_replica_removal_script(cluster_name: str, options: _Options = None) -> str:
+        """Builds the script to remove a replica cluster from the cluster set."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"cluster_set.remove_cluster('{cluster_name}', {options})",
+        ))
+
+    @staticmethod
+    def build_cluster_rejoin_script(cluster_name: str) -> str:
+        """Builds the script to rejoin a cluster back to its cluster set."""
+        return "\n".join((
+            f"shell.connect_to_primary()",
+            f"cluster_set = dba.get_cluster_set()",
+            f"cluster_set.rejoin_cluster('{cluster_name}')",
+        ))
 
+    @staticmethod
+    def build_instance_addition_script(
+        cluster_name: str, address: str, options: _Options = None
+    ) -> str:
+        """Builds the script to add an instance into a cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.add_instance('{address}', {options})",
+        ))
+
+    @staticmethod
+    def build_instances_addition_script(
+        cluster_name: str,
+        addresses: list[str],
+        options: _Options = None,
+        stop_on_error: bool = False,
+    ) -> str:
+        """Builds the script to add several instances into a cluster, printing their outcomes."""
+        return "\n".join((
+            f"import json, time",
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"results = {{}}",
+            f"failed = False",
+            f"for address in {addresses}:",
+            f"    result = results[address] = {{'attached': False, 'error': None, 'seconds': 0}}",
+            f"    if failed and {stop_on_error}:",
+            f"        continue",
+            f"    start = time.monotonic()",
+            f"    try:",
+            f"        cluster.add_instance(address, {options})",
+            f"        result['attached'] = True",
+            f"    except Exception as e:",
+            f"        result['error'] = str(e)",
+            f"        failed = True",
+            f"    result['seconds'] = time.monotonic() - start",
+            f"print(json.dumps(results))",
+        ))
+
+    @staticmethod
+    def build_instance_removal_script(
+        cluster_name: str, address: str, options: _Options = None
+    ) -> str:
+        """Builds the script to remove an instance from a cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.remove_instance('{address}', {options})",
+        ))
+
+    @staticmethod
+    def build_quorum_forcing_script(cluster_name: str, address: str) -> str:
+        """Builds the script to force a cluster quorum using the partition of an instance."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.force_quorum_using_partition_of('{address}')",
+        ))
+
+    @staticmethod
+    def build_instance_rejoin_script(
+        cluster_name: str, address: str, options: _Options = None
+    ) -> str:
+        """Builds the script to rejoin an instance back into its cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.rejoin_instance('{address}', {options})",
+        ))
+
+    @staticmethod
+    def build_instance_check_script(options: _Options = None) -> str:
+        """Builds the script to print an instance configuration check."""
+        return "\n".join((
+            f"result = dba.check_instance_configuration(options={options})",
+            f"print(result)",
+        ))
+
+    @staticmethod
+    def build_instance_setup_script(options: _Options = None) -> str:
+        """Builds the script to configure an instance."""
+        return f"dba.configure_instance(options={options})"
+
+    @staticmethod
+    def build_instance_promotion_script(
+        cluster_name: str, address: str, force: bool = False
+    ) -> str:
+        """Builds the script to promote an instance within a cluster."""
+        method_name = "force_primary_instance" if force else "set_primary_instance"
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.{method_name}('{address}')",
+        ))
+
+    @staticmethod
+    def build_instance_update_script(cluster_name: str, address: str, options: _Options) -> str:
+        """Builds the script to update some instance options within a cluster."""
+        command = [
+            f"cluster = dba.get_cluster('{cluster_name}')",
+        ]
+
+        for key, val in options.items():
+            val = f"'{val}'" if isinstance(val, str) else val
+            cmd = f"cluster.set_instance_option('{address}', '{key}', {val})"
+            command.append(cmd)
+
+        return "\n".join(command)
+
+    @staticmethod
+    def build_router_removal_script(cluster_name: str, router_name: str, router_mode: str) -> str:
+        """Builds the script to remove a router from a cluster."""
+        return "\n".join((
+            f"cluster = dba.get_cluster('{cluster_name}')",
+            f"cluster.remove_router_metadata('{router_name}::{router_mode}')",
+        ))
+
+
+@instrumented
 class MySQLClusterClient:
     """Class to encapsulate all cluster operations using MySQL Shell."""
 
-    def __init__(self, executor: BaseExecutor):
-        """Initialize the class."""
+    def __init__(self, executor: BaseExecutor, metadata_cache: MetadataCache | None = None):
+        """Initialize the class.
+
+        Arguments:
+            executor: Executor to run the scripts with
+            metadata_cache: Optional cache of the status and routers reads, validated by a probe
+        """
         self._executor = executor
+        self._scripts = _ClusterScriptBuilder()
+        self._metadata_cache = metadata_cache
+
+    def _start_operation(
+        self,
+        command: str,
+        name: str,
+        progress_client: MySQLInstanceClient | None,
+    ) -> ClusterOperation:
+        """Starts a cluster operation in the background, returning its handle."""
+        logger.debug(f"Starting operation to {name}")
+        execution = self._executor.start_py(command)
+        return ClusterOperation(name, execution, progress_client)
 
     def create_cluster(self, cluster_name: str, options: _Options = None) -> None:
         """Creates an InnoDB cluster."""
-        command = f"dba.create_cluster('{cluster_name}', {options})"
+        command = self._scripts.build_cluster_creation_script(cluster_name, options)
 
         try:
             logger.debug(f"Creating InnoDB cluster {cluster_name}")
@@ -33,10 +395,7 @@ class MySQLClusterClient:
 
     def destroy_cluster(self, cluster_name: str, options: _Options = None) -> None:
         """Destroys an InnoDB cluster."""
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.dissolve({options})",
-        ))
+        command = self._scripts.build_cluster_dissolution_script(cluster_name, options)
 
         try:
             logger.debug(f"Destroying InnoDB cluster {cluster_name}")
@@ -45,13 +404,14 @@ class MySQLClusterClient:
             logger.error(f"Failed to destroy cluster {cluster_name}")
             raise
 
+    @metadata_cached
     def fetch_cluster_status(self, cluster_name: str, extended: bool = False) -> dict:
-        """Fetches an InnoDB cluster status."""
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"status = cluster.status({{'extended': {extended}}})",
-            f"print(status)",
-        ))
+        """Fetches an InnoDB cluster status.
+
+        When a metadata cache is configured, the status is served from it
+        for as long as the group view and member states are unchanged.
+        """
+        command = self._scripts.build_cluster_status_script(cluster_name, extended)
 
         try:
             result = self._executor.execute_py(command, timeout=30)
@@ -61,13 +421,52 @@ class MySQLClusterClient:
         else:
             return json.loads(result)
 
+    def fetch_cluster_fast_status(self, cluster_name: str) -> dict:
+        """Fetches an InnoDB cluster status, using a single SQL read from the connected member.
+
+        The status is shaped as the AdminAPI one, with the member roles, states and queue sizes,
+        but without connecting to every member, so it is meant for frequent monitoring only.
+        """
+        query = _FAST_STATUS_QUERY.format(
+            cluster_name=StringQueryQuoter().quote_value(cluster_name),
+        )
+
+        try:
+            rows = self._executor.execute_sql(query, timeout=10)
+        except ExecutionError:
+            logger.error("Failed to fetch cluster fast status")
+            raise
+
+        if not rows:
+            logger.error(f"Cluster {cluster_name} not found within the metadata")
+            raise ExecutionError(f"Cluster {cluster_name} not found")
+
+        return _build_fast_status(cluster_name, rows)
+
+    def fetch_cluster_topology(
+        self,
+        cluster_name: str,
+        extended: bool = False,
+        fast: bool = False,
+    ) -> ClusterTopology:
+        """Fetches an InnoDB cluster topology, indexed by member.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            extended: Whether to fetch the extended status sections, ignored when fast
+            fast: Whether to use the fast status, instead of the AdminAPI one
+        """
+        if fast:
+            status = self.fetch_cluster_fast_status(cluster_name)
+        else:
+            status = self.fetch_cluster_status(cluster_name, extended)
+
+        return ClusterTopology.from_status(status)
+
+    @metadata_cached(routers=True)
     def list_cluster_routers(self, cluster_name: str) -> dict:
         """Lists an InnoDB cluster connected MySQL Routers."""
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"routers = cluster.list_routers()",
-            f"print(routers)",
-        ))
+        command = self._scripts.build_cluster_routers_script(cluster_name)
 
         try:
             result = self._executor.execute_py(command)
@@ -79,10 +478,7 @@ class MySQLClusterClient:
 
     def rescan_cluster(self, cluster_name: str, options: _Options = None) -> None:
         """Rescans an InnoDB cluster."""
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.rescan({options})",
-        ))
+        command = self._scripts.build_cluster_rescan_script(cluster_name, options)
 
         try:
             logger.debug(f"Re-scanning InnoDB cluster {cluster_name}")
@@ -93,7 +489,7 @@ class MySQLClusterClient:
 
     def reboot_cluster(self, cluster_name: str, options: _Options = None) -> None:
         """Reboots an InnoDB cluster."""
-        command = f"dba.reboot_cluster_from_complete_outage('{cluster_name}', {options})"
+        command = self._scripts.build_cluster_reboot_script(cluster_name, options)
 
         try:
             logger.debug(f"Re-booting InnoDB cluster {cluster_name}")
@@ -102,13 +498,25 @@ class MySQLClusterClient:
             logger.error(f"Failed to re-boot cluster {cluster_name}")
             raise
 
+    def start_reboot_cluster(
+        self,
+        cluster_name: str,
+        options: _Options = None,
+        progress_client: MySQLInstanceClient | None = None,
+    ) -> ClusterOperation:
+        """Starts rebooting an InnoDB cluster in the background.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            options: Optional reboot options
+            progress_client: Optional client to the instance whose recovery is reported
+        """
+        command = self._scripts.build_cluster_reboot_script(cluster_name, options)
+        return self._start_operation(command, f"re-boot cluster {cluster_name}", progress_client)
+
     def create_cluster_set(self, cluster_name: str, cluster_set_name: str) -> None:
         """Creates an InnoDB cluster set from the provided cluster."""
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.create_cluster_set('{cluster_set_name}')",
-        ))
+        command = self._scripts.build_cluster_set_creation_script(cluster_name, cluster_set_name)
 
         try:
             logger.debug(f"Creating InnoDB cluster set {cluster_set_name}")
@@ -119,12 +527,7 @@ class MySQLClusterClient:
 
     def fetch_cluster_set_status(self, extended: bool = False) -> dict:
         """Fetches an InnoDB cluster set status."""
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"status = cluster_set.status({{'extended': {extended}}})",
-            f"print(status)",
-        ))
+        command = self._scripts.build_cluster_set_status_script(extended)
 
         try:
             result = self._executor.execute_py(command, timeout=120)
@@ -136,12 +539,7 @@ class MySQLClusterClient:
 
     def list_cluster_set_routers(self) -> dict:
         """Lists an InnoDB cluster set connected MySQL Routers."""
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"routers = cluster_set.list_routers()",
-            f"print(routers)",
-        ))
+        command = self._scripts.build_cluster_set_routers_script()
 
         try:
             result = self._executor.execute_py(command)
@@ -160,11 +558,7 @@ class MySQLClusterClient:
     ) -> None:
         """Creates an InnoDB replica cluster into the cluster set."""
         address = f"{source_host}:{source_port}"
-        command = f"\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"cluster_set.create_replica_cluster('{address}', '{cluster_name}', {options})",
-        ))
+        command = self._scripts.build_replica_creation_script(cluster_name, address, options)
 
         try:
             logger.debug(f"Creating InnoDB cluster set replica {cluster_name}")
@@ -173,20 +567,37 @@ class MySQLClusterClient:
             logger.error(f"Failed to create cluster set replica {cluster_name}")
             raise
 
+    def start_create_cluster_set_replica(
+        self,
+        cluster_name: str,
+        source_host: str,
+        source_port: str,
+        options: _Options = None,
+        progress_client: MySQLInstanceClient | None = None,
+    ) -> ClusterOperation:
+        """Starts creating an InnoDB replica cluster into the cluster set in the background.
+
+        Arguments:
+            cluster_name: Name of the replica cluster
+            source_host: Host of the instance seeding the replica cluster
+            source_port: Port of the instance seeding the replica cluster
+            options: Optional replica cluster creation options
+            progress_client: Optional client to the seeding instance, to report its recovery
+        """
+        address = f"{source_host}:{source_port}"
+        command = self._scripts.build_replica_creation_script(cluster_name, address, options)
+
+        name = f"create cluster set replica {cluster_name}"
+        return self._start_operation(command, name, progress_client)
+
     def promote_cluster_set_replica(self, cluster_name: str, force: bool = False) -> None:
         """Promotes an InnoDB replica cluster within the cluster set."""
         if force:
             logger.warning(f"Forcing cluster {cluster_name} to become primary")
-            method_name = "force_primary_cluster"
         else:
             logger.debug(f"Setting cluster {cluster_name} to become primary")
-            method_name = "set_primary_cluster"
 
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"cluster_set.{method_name}('{cluster_name}')",
-        ))
+        command = self._scripts.build_replica_promotion_script(cluster_name, force)
 
         try:
             self._executor.execute_py(command)
@@ -196,11 +607,7 @@ class MySQLClusterClient:
 
     def remove_cluster_set_replica(self, cluster_name: str, options: _Options = None) -> None:
         """Removes an InnoDB replica cluster from the cluster set."""
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"cluster_set.remove_cluster('{cluster_name}', {options})",
-        ))
+        command = self._scripts.build_replica_removal_script(cluster_name, options)
 
         try:
             logger.debug(f"Removing InnoDB cluster set replica {cluster_name}")
@@ -211,11 +618,7 @@ class MySQLClusterClient:
 
     def rejoin_cluster_set_cluster(self, cluster_name: str) -> None:
         """Rejoins an InnoDB cluster back to its cluster set."""
-        command = "\n".join((
-            f"shell.connect_to_primary()",
-            f"cluster_set = dba.get_cluster_set()",
-            f"cluster_set.rejoin_cluster('{cluster_name}')",
-        ))
+        command = self._scripts.build_cluster_rejoin_script(cluster_name)
 
         try:
             logger.debug(f"Rejoining cluster {cluster_name}")
@@ -233,10 +636,7 @@ class MySQLClusterClient:
     ) -> None:
         """Attached an instance into an InnoDB cluster."""
         address = f"{instance_host}:{instance_port}"
-        command = f"\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.add_instance('{address}', {options})",
-        ))
+        command = self._scripts.build_instance_addition_script(cluster_name, address, options)
 
         try:
             logger.debug(f"Attaching instance {address} to cluster {cluster_name}")
@@ -245,6 +645,65 @@ class MySQLClusterClient:
             logger.error(f"Failed to attach instance {address} to cluster {cluster_name}")
             raise
 
+    def start_attach_instance_into_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+        progress_client: MySQLInstanceClient | None = None,
+    ) -> ClusterOperation:
+        """Starts attaching an instance into an InnoDB cluster in the background.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            instance_host: Host of the instance to attach
+            instance_port: Port of the instance to attach
+            options: Optional add_instance options
+            progress_client: Optional client to the attached instance, to report its recovery
+        """
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_addition_script(cluster_name, address, options)
+
+        name = f"attach instance {address} to cluster {cluster_name}"
+        return self._start_operation(command, name, progress_client)
+
+    def attach_instances_into_cluster(
+        self,
+        cluster_name: str,
+        instances: Sequence[tuple[str, str]],
+        options: _Options = None,
+        stop_on_error: bool = False,
+    ) -> dict[str, InstanceAttachment]:
+        """Attaches several instances into an InnoDB cluster, within a single session.
+
+        The cluster handle is fetched once, and reused for every instance. Instances are
+        attached one by one, as each addition waits for its recovery to finish,
+        so that no more than one clone recovery ever runs against the donors at once.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            instances: Host and port pairs of the instances to attach, in order
+            options: Optional add_instance options, shared by every instance
+            stop_on_error: Whether to skip the remaining instances after a failure
+
+        Returns:
+            Dictionary of attachment outcomes, by instance address
+        """
+        addresses = [f"{host}:{port}" for host, port in instances]
+        command = self._scripts.build_instances_addition_script(
+            cluster_name, addresses, options, stop_on_error
+        )
+
+        try:
+            logger.debug(f"Attaching instances {addresses} to cluster {cluster_name}")
+            result = self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to attach instances {addresses} to cluster {cluster_name}")
+            raise
+
+        return _build_instance_attachments(result)
+
     def detach_instance_from_cluster(
         self,
         cluster_name: str,
@@ -254,10 +713,7 @@ class MySQLClusterClient:
     ) -> None:
         """Detaches an instance from an InnoDB cluster."""
         address = f"{instance_host}:{instance_port}"
-        command = f"\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.remove_instance('{address}', {options})",
-        ))
+        command = self._scripts.build_instance_removal_script(cluster_name, address, options)
 
         try:
             logger.debug(f"Detaching instance {address} from cluster {cluster_name}")
@@ -274,10 +730,7 @@ class MySQLClusterClient:
     ) -> None:
         """Forces and instance quorum into an InnoDB cluster."""
         address = f"{instance_host}:{instance_port}"
-        command = f"\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.force_quorum_using_partition_of('{address}')",
-        ))
+        command = self._scripts.build_quorum_forcing_script(cluster_name, address)
 
         try:
             logger.debug(f"Forcing quorum into cluster {cluster_name}")
@@ -295,10 +748,7 @@ class MySQLClusterClient:
     ) -> None:
         """Rejoins an instance back into its InnoDB cluster."""
         address = f"{instance_host}:{instance_port}"
-        command = f"\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.rejoin_instance('{address}', {options})",
-        ))
+        command = self._scripts.build_instance_rejoin_script(cluster_name, address, options)
 
         try:
             logger.debug(f"Rejoining instance {address} into cluster {cluster_name}")
@@ -309,10 +759,7 @@ class MySQLClusterClient:
 
     def check_instance_before_cluster(self, options: _Options = None) -> dict:
         """Checks for an instance configuration before joining an InnoDB cluster."""
-        command = "\n".join((
-            f"result = dba.check_instance_configuration(options={options})",
-            f"print(result)",
-        ))
+        command = self._scripts.build_instance_check_script(options)
 
         host = self._executor.connection_details.host
         port = self._executor.connection_details.port
@@ -328,7 +775,7 @@ class MySQLClusterClient:
 
     def setup_instance_before_cluster(self, options: _Options = None) -> None:
         """Sets up an instance configuration before joining an InnoDB cluster."""
-        command = f"dba.configure_instance(options={options})"
+        command = self._scripts.build_instance_setup_script(options)
         host = self._executor.connection_details.host
         port = self._executor.connection_details.port
 
@@ -351,15 +798,10 @@ class MySQLClusterClient:
 
         if force:
             logger.warning(f"Forcing instance {address} to become primary")
-            method_name = "force_primary_instance"
         else:
             logger.debug(f"Setting instance {address} to become primary")
-            method_name = "set_primary_instance"
 
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.{method_name}('{address}')",
-        ))
+        command = self._scripts.build_instance_promotion_script(cluster_name, address, force)
 
         try:
             self._executor.execute_py(command)
@@ -376,16 +818,7 @@ class MySQLClusterClient:
     ) -> None:
         """Updates an instance within an InnoDB cluster."""
         address = f"{instance_host}:{instance_port}"
-        command = [
-            f"cluster = dba.get_cluster('{cluster_name}')",
-        ]
-
-        for key, val in options.items():
-            val = f"'{val}'" if isinstance(val, str) else val
-            cmd = f"cluster.set_instance_option('{address}', '{key}', {val})"
-            command.append(cmd)
-
-        command = "\n".join(command)
+        command = self._scripts.build_instance_update_script(cluster_name, address, options)
 
         try:
             logger.debug(f"Updating instance {address} within cluster {cluster_name}")
@@ -401,10 +834,7 @@ class MySQLClusterClient:
         router_mode: str,
     ) -> None:
         """Removes a router from an InnoDB cluster."""
-        command = "\n".join((
-            f"cluster = dba.get_cluster('{cluster_name}')",
-            f"cluster.remove_router_metadata('{router_name}::{router_mode}')",
-        ))
+        command = self._scripts.build_router_removal_script(cluster_name, router_name, router_mode)
 
         try:
             logger.debug(f"Removing router from cluster {cluster_name}")
@@ -0,0 +1,517 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import json
+import logging
+from typing import Mapping, Sequence
+
+from ..builders import StringQueryQuoter
+from ..executors import AsyncBaseExecutor
+from ..executors.errors import ExecutionError
+from ..executors.metrics import instrumented
+from ..models.cluster import InstanceAttachment
+from ..models.topology import ClusterTopology
+from .cache import MetadataCache, metadata_cached
+from .cluster import (
+    _FAST_STATUS_QUERY,
+    _build_fast_status,
+    _build_instance_attachments,
+    _ClusterScriptBuilder,
+)
+from .instance_async import AsyncMySQLInstanceClient
+from .operation import AsyncClusterOperation
+
+logger = logging.getLogger()
+
+_Options = Mapping[str, str] | None
+
+
+@instrumented
+class AsyncMySQLClusterClient:
+    """Class to encapsulate all asynchronous cluster operations using MySQL Shell."""
+
+    def __init__(self, executor: AsyncBaseExecutor, metadata_cache: MetadataCache | None = None):
+        """Initialize the class.
+
+        Arguments:
+            executor: Executor to run the scripts with
+            metadata_cache: Optional cache of the status and routers reads, validated by a probe
+        """
+        self._executor = executor
+        self._scripts = _ClusterScriptBuilder()
+        self._metadata_cache = metadata_cache
+
+    def _start_operation(
+        self,
+        command: str,
+        name: str,
+        progress_client: AsyncMySQLInstanceClient | None,
+    ) -> AsyncClusterOperation:
+        """Starts a cluster operation in the background, returning its handle."""
+        logger.debug(f"Starting operation to {name}")
+        task = asyncio.ensure_future(self._executor.execute_py(command))
+        return AsyncClusterOperation(name, task, progress_client)
+
+    async def create_cluster(self, cluster_name: str, options: _Options = None) -> None:
+        """Creates an InnoDB cluster."""
+        command = self._scripts.build_cluster_creation_script(cluster_name, options)
+
+        try:
+            logger.debug(f"Creating InnoDB cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to create cluster {cluster_name}")
+            raise
+
+    async def destroy_cluster(self, cluster_name: str, options: _Options = None) -> None:
+        """Destroys an InnoDB cluster."""
+        command = self._scripts.build_cluster_dissolution_script(cluster_name, options)
+
+        try:
+            logger.debug(f"Destroying InnoDB cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to destroy cluster {cluster_name}")
+            raise
+
+    @metadata_cached
+    async def fetch_cluster_status(self, cluster_name: str, extended: bool = False) -> dict:
+        """Fetches an InnoDB cluster status.
+
+        When a metadata cache is configured, the status is served from it
+        for as long as the group view and member states are unchanged.
+        """
+        command = self._scripts.build_cluster_status_script(cluster_name, extended)
+
+        try:
+            result = await self._executor.execute_py(command, timeout=30)
+        except ExecutionError:
+            logger.error("Failed to fetch cluster status")
+            raise
+        else:
+            return json.loads(result)
+
+    async def fetch_cluster_fast_status(self, cluster_name: str) -> dict:
+        """Fetches an InnoDB cluster status, using a single SQL read from the connected member.
+
+        The status is shaped as the AdminAPI one, with the member roles, states and queue sizes,
+        but without connecting to every member, so it is meant for frequent monitoring only.
+        """
+        query = _FAST_STATUS_QUERY.format(
+            cluster_name=StringQueryQuoter().quote_value(cluster_name),
+        )
+
+        try:
+            rows = await self._executor.execute_sql(query, timeout=10)
+        except ExecutionError:
+            logger.error("Failed to fetch cluster fast status")
+            raise
+
+        if not rows:
+            logger.error(f"Cluster {cluster_name} not found within the metadata")
+            raise ExecutionError(f"Cluster {cluster_name} not found")
+
+        return _build_fast_status(cluster_name, rows)
+
+    async def fetch_cluster_topology(
+        self,
+        cluster_name: str,
+        extended: bool = False,
+        fast: bool = False,
+    ) -> ClusterTopology:
+        """Fetches an InnoDB cluster topology, indexed by member.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            extended: Whether to fetch the extended status sections, ignored when fast
+            fast: Whether to use the fast status, instead of the AdminAPI one
+        """
+        if fast:
+            status = await self.fetch_cluster_fast_status(cluster_name)
+        else:
+            status = await self.fetch_cluster_status(cluster_name, extended)
+
+        return ClusterTopology.from_status(status)
+
+    @metadata_cached(routers=True)
+    async def list_cluster_routers(self, cluster_name: str) -> dict:
+        """Lists an InnoDB cluster connected MySQL Routers."""
+        command = self._scripts.build_cluster_routers_script(cluster_name)
+
+        try:
+            result = await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error("Failed to list cluster routers")
+            raise
+        else:
+            return json.loads(result)
+
+    async def rescan_cluster(self, cluster_name: str, options: _Options = None) -> None:
+        """Rescans an InnoDB cluster."""
+        command = self._scripts.build_cluster_rescan_script(cluster_name, options)
+
+        try:
+            logger.debug(f"Re-scanning InnoDB cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to re-scan cluster {cluster_name}")
+            raise
+
+    async def reboot_cluster(self, cluster_name: str, options: _Options = None) -> None:
+        """Reboots an InnoDB cluster."""
+        command = self._scripts.build_cluster_reboot_script(cluster_name, options)
+
+        try:
+            logger.debug(f"Re-booting InnoDB cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to re-boot cluster {cluster_name}")
+            raise
+
+    async def start_reboot_cluster(
+        self,
+        cluster_name: str,
+        options: _Options = None,
+        progress_client: AsyncMySQLInstanceClient | None = None,
+    ) -> AsyncClusterOperation:
+        """Starts rebooting an InnoDB cluster in the background.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            options: Optional reboot options
+            progress_client: Optional client to the instance whose recovery is reported
+        """
+        command = self._scripts.build_cluster_reboot_script(cluster_name, options)
+        return self._start_operation(command, f"re-boot cluster {cluster_name}", progress_client)
+
+    async def create_cluster_set(self, cluster_name: str, cluster_set_name: str) -> None:
+        """Creates an InnoDB cluster set from the provided cluster."""
+        command = self._scripts.build_cluster_set_creation_script(cluster_name, cluster_set_name)
+
+        try:
+            logger.debug(f"Creating InnoDB cluster set {cluster_set_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to create cluster set {cluster_set_name}")
+            raise
+
+    async def fetch_cluster_set_status(self, extended: bool = False) -> dict:
+        """Fetches an InnoDB cluster set status."""
+        command = self._scripts.build_cluster_set_status_script(extended)
+
+        try:
+            result = await self._executor.execute_py(command, timeout=120)
+        except ExecutionError:
+            logger.error("Failed to fetch cluster set status")
+            raise
+        else:
+            return json.loads(result)
+
+    async def list_cluster_set_routers(self) -> dict:
+        """Lists an InnoDB cluster set connected MySQL Routers."""
+        command = self._scripts.build_cluster_set_routers_script()
+
+        try:
+            result = await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error("Failed to list cluster set routers")
+            raise
+        else:
+            return json.loads(result)
+
+    async def create_cluster_set_replica(
+        self,
+        cluster_name: str,
+        source_host: str,
+        source_port: str,
+        options: _Options = None,
+    ) -> None:
+        """Creates an InnoDB replica cluster into the cluster set."""
+        address = f"{source_host}:{source_port}"
+        command = self._scripts.build_replica_creation_script(cluster_name, address, options)
+
+        try:
+            logger.debug(f"Creating InnoDB cluster set replica {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to create cluster set replica {cluster_name}")
+            raise
+
+    async def start_create_cluster_set_replica(
+        self,
+        cluster_name: str,
+        source_host: str,
+        source_port: str,
+        options: _Options = None,
+        progress_client: AsyncMySQLInstanceClient | None = None,
+    ) -> AsyncClusterOperation:
+        """Starts creating an InnoDB replica cluster into the cluster set in the background.
+
+        Arguments:
+            cluster_name: Name of the replica cluster
+            source_host: Host of the instance seeding the replica cluster
+            source_port: Port of the instance seeding the replica cluster
+            options: Optional replica cluster creation options
+            progress_client: Optional client to the seeding instance, to report its recovery
+        """
+        address = f"{source_host}:{source_port}"
+        command = self._scripts.build_replica_creation_script(cluster_name, address, options)
+
+        name = f"create cluster set replica {cluster_name}"
+        return self._start_operation(command, name, progress_client)
+
+    async def promote_cluster_set_replica(self, cluster_name: str, force: bool = False) -> None:
+        """Promotes an InnoDB replica cluster within the cluster set."""
+        if force:
+            logger.warning(f"Forcing cluster {cluster_name} to become primary")
+        else:
+            logger.debug(f"Setting cluster {cluster_name} to become primary")
+
+        command = self._scripts.build_replica_promotion_script(cluster_name, force)
+
+        try:
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to make cluster {cluster_name} the primary")
+            raise
+
+    async def remove_cluster_set_replica(
+        self, cluster_name: str, options: _Options = None
+    ) -> None:
+        """Removes an InnoDB replica cluster from the cluster set."""
+        command = self._scripts.build_replica_removal_script(cluster_name, options)
+
+        try:
+            logger.debug(f"Removing InnoDB cluster set replica {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to remove cluster set replica {cluster_name}")
+            raise
+
+    async def rejoin_cluster_set_cluster(self, cluster_name: str) -> None:
+        """Rejoins an InnoDB cluster back to its cluster set."""
+        command = self._scripts.build_cluster_rejoin_script(cluster_name)
+
+        try:
+            logger.debug(f"Rejoining cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to rejoin cluster {cluster_name}")
+            raise
+
+    async def attach_instance_into_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+    ) -> None:
+        """Attached an instance into an InnoDB cluster."""
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_addition_script(cluster_name, address, options)
+
+        try:
+            logger.debug(f"Attaching instance {address} to cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to attach instance {address} to cluster {cluster_name}")
+            raise
+
+    async def start_attach_instance_into_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+        progress_client: AsyncMySQLInstanceClient | None = None,
+    ) -> AsyncClusterOperation:
+        """Starts attaching an instance into an InnoDB cluster in the background.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            instance_host: Host of the instance to attach
+            instance_port: Port of the instance to attach
+            options: Optional add_instance options
+            progress_client: Optional client to the attached instance, to report its recovery
+        """
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_addition_script(cluster_name, address, options)
+
+        name = f"attach instance {address} to cluster {cluster_name}"
+        return self._start_operation(command, name, progress_client)
+
+    async def attach_instances_into_cluster(
+        self,
+        cluster_name: str,
+        instances: Sequence[tuple[str, str]],
+        options: _Options = None,
+        stop_on_error: bool = False,
+    ) -> dict[str, InstanceAttachment]:
+        """Attaches several instances into an InnoDB cluster, within a single session.
+
+        The cluster handle is fetched once, and reused for every instance. Instances are
+        attached one by one, as each addition waits for its recovery to finish,
+        so that no more than one clone recovery ever runs against the donors at once.
+
+        Arguments:
+            cluster_name: Name of the cluster
+            instances: Host and port pairs of the instances to attach, in order
+            options: Optional add_instance options, shared by every instance
+            stop_on_error: Whether to skip the remaining instances after a failure
+
+        Returns:
+            Dictionary of attachment outcomes, by instance address
+        """
+        addresses = [f"{host}:{port}" for host, port in instances]
+        command = self._scripts.build_instances_addition_script(
+            cluster_name, addresses, options, stop_on_error
+        )
+
+        try:
+            logger.debug(f"Attaching instances {addresses} to cluster {cluster_name}")
+            result = await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to attach instances {addresses} to cluster {cluster_name}")
+            raise
+
+        return _build_instance_attachments(result)
+
+    async def detach_instance_from_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+    ) -> None:
+        """Detaches an instance from an InnoDB cluster."""
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_removal_script(cluster_name, address, options)
+
+        try:
+            logger.debug(f"Detaching instance {address} from cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to detach instance {address} from cluster {cluster_name}")
+            raise
+
+    async def force_instance_quorum_into_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+    ) -> None:
+        """Forces and instance quorum into an InnoDB cluster."""
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_quorum_forcing_script(cluster_name, address)
+
+        try:
+            logger.debug(f"Forcing quorum into cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to force quorum into cluster {cluster_name}")
+            raise
+
+    async def rejoin_instance_into_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+    ) -> None:
+        """Rejoins an instance back into its InnoDB cluster."""
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_rejoin_script(cluster_name, address, options)
+
+        try:
+            logger.debug(f"Rejoining instance {address} into cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to rejoin instance {address} into cluster {cluster_name}")
+            raise
+
+    async def check_instance_before_cluster(self, options: _Options = None) -> dict:
+        """Checks for an instance configuration before joining an InnoDB cluster."""
+        command = self._scripts.build_instance_check_script(options)
+
+        host = self._executor.connection_details.host
+        port = self._executor.connection_details.port
+
+        try:
+            logger.debug(f"Checking for instance {host}:{port} config")
+            result = await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to check for instance {host}:{port} config")
+            raise
+        else:
+            return json.loads(result)
+
+    async def setup_instance_before_cluster(self, options: _Options = None) -> None:
+        """Sets up an instance configuration before joining an InnoDB cluster."""
+        command = self._scripts.build_instance_setup_script(options)
+        host = self._executor.connection_details.host
+        port = self._executor.connection_details.port
+
+        try:
+            logger.debug(f"Setting up instance {host}:{port} config")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to setup instance {host}:{port} config")
+            raise
+
+    async def promote_instance_within_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        force: bool = False,
+    ) -> None:
+        """Promotes an InnoDB cluster replica within the cluster."""
+        address = f"{instance_host}:{instance_port}"
+
+        if force:
+            logger.warning(f"Forcing instance {address} to become primary")
+        else:
+            logger.debug(f"Setting instance {address} to become primary")
+
+        command = self._scripts.build_instance_promotion_script(cluster_name, address, force)
+
+        try:
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to make instance {address} the primary")
+            raise
+
+    async def update_instance_within_cluster(
+        self,
+        cluster_name: str,
+        instance_host: str,
+        instance_port: str,
+        options: _Options = None,
+    ) -> None:
+        """Updates an instance within an InnoDB cluster."""
+        address = f"{instance_host}:{instance_port}"
+        command = self._scripts.build_instance_update_script(cluster_name, address, options)
+
+        try:
+            logger.debug(f"Updating instance {address} within cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to update instance {address} within cluster {cluster_name}")
+            raise
+
+    async def remove_router_from_cluster(
+        self,
+        cluster_name: str,
+        router_name: str,
+        router_mode: str,
+    ) -> None:
+        """Removes a router from an InnoDB cluster."""
+        command = self._scripts.build_router_removal_script(cluster_name, router_name, router_mode)
+
+        try:
+            logger.debug(f"Removing router from cluster {cluster_name}")
+            await self._executor.execute_py(command)
+        except ExecutionError:
+            logger.error(f"Failed to remove router from cluster {cluster_name}")
+            raise
@@ -3,38 +3,479 @@
 
 import json
 import logging
+import re
 from typing import Any, Mapping, Sequence
 
 from ..builders import StringQueryQuoter
 from ..executors import BaseExecutor
 from ..executors.errors import ExecutionError
-from ..models.account import Role, User
-from ..models.instance import InstanceRole, InstanceState
+from ..executors.metrics import instrumented
+from ..models import StatementResult
+from ..models.account import Role, User, UserReconciliation
+from ..models.instance import InstanceHealth, InstanceRole, InstanceState, RecoveryProgress
 from ..models.statement import LogType, VariableScope
+from .cache import ResultCache, cached, invalidating
 
 logger = logging.getLogger()
 
 _Attrs = Mapping[str, str] | None
 
+_INSTANCE_LABEL_QUERY = (
+    "SELECT instance_name "
+    "FROM mysql_innodb_cluster_metadata.instances "
+    "WHERE mysql_server_uuid = @@server_uuid"
+)
+_CLUSTER_LABELS_QUERY = "SELECT cluster_name FROM mysql_innodb_cluster_metadata.clusters"
+_MEMBER_STATE_QUERY = (
+    "SELECT member_state "
+    "FROM performance_schema.replication_group_members "
+    "WHERE member_id = @@server_uuid"
+)
+_MEMBER_ROLE_QUERY = (
+    "SELECT member_role "
+    "FROM performance_schema.replication_group_members "
+    "WHERE member_id = @@server_uuid"
+)
+_WORK_QUERY = (
+    "SELECT work_completed, work_estimated "
+    "FROM performance_schema.events_stages_current "
+    "WHERE event_name LIKE {name_pattern}"
+)
+
+# Server identity, group membership and cluster label of the instance, then its ongoing work
+_HEALTH_QUERIES = (
+    "SELECT "
+    "@@server_uuid AS server_uuid, "
+    "@@version AS version, "
+    "@@super_read_only AS super_read_only, "
+    "@@gtid_executed AS gtid_executed",
+    "SELECT member_state, member_role "
+    "FROM performance_schema.replication_group_members "
+    "WHERE member_id = @@server_uuid",
+    _INSTANCE_LABEL_QUERY,
+)
+
+# Group membership, recovery channel and clone state of the instance
+_RECOVERY_PROGRESS_QUERIES = (
+    _MEMBER_STATE_QUERY,
+    "SELECT service_state "
+    "FROM performance_schema.replication_connection_status "
+    "WHERE channel_name = 'group_replication_recovery'",
+    "SELECT state FROM performance_schema.clone_status",
+    "SELECT stage, state, data, estimate FROM performance_schema.clone_progress ORDER BY id",
+)
+
+
+def _like_regex(pattern: str) -> re.Pattern:
+    """Translate a SQL LIKE pattern into a regular expression."""
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char) for char in pattern
+    )
+    return re.compile(regex, re.DOTALL)
+
+
+def _check_desired_users(desired: Sequence[User], name_pattern: str) -> None:
+    """Check that every desired user is under reconciliation, by matching the name pattern."""
+    regex = _like_regex(name_pattern)
+
+    for user in desired:
+        if not regex.fullmatch(user.username):
+            raise ValueError(f"User {user.username} does not match {name_pattern=}")
+
+
+def _is_work_ongoing(rows: list[dict]) -> bool:
+    """Return whether any of the stage rows has work left."""
+    return any(row["work_completed"] < row["work_estimated"] for row in rows)
+
+
+def _build_instance_health(
+    results: list[StatementResult], work_pattern: str | None
+) -> InstanceHealth:
+    """Build an instance health snapshot, out of the health queries results."""
+    server, member, label = results[0].rows[0], results[1].rows, results[2].rows
+    health = InstanceHealth(
+        server_uuid=server["server_uuid"],
+        version=server["version"].split("-")[0],
+        super_read_only=bool(server["super_read_only"]),
+        gtid_executed=server["gtid_executed"].replace("\n", ""),
+    )
+
+    if member and member[0]["member_state"]:
+        health.state = InstanceState(member[0]["member_state"])
+    if member and member[0]["member_role"]:
+        health.role = InstanceRole(member[0]["member_role"])
+    if label:
+        health.label = label[0]["instance_name"]
+    if work_pattern and results[3].ok:
+        health.work_ongoing = _is_work_ongoing(results[3].rows)
+
+    return health
+
+
+def _build_recovery_progress(results: list[StatementResult]) -> RecoveryProgress:
+    """Build an instance recovery progress, out of the recovery progress queries results."""
+    member, channel, clone_status, clone_progress = (result.rows for result in results)
+    progress = RecoveryProgress()
+
+    if member and member[0]["member_state"]:
+        progress.state = InstanceState(member[0]["member_state"])
+    if channel:
+        progress.channel_state = channel[0]["service_state"]
+    if clone_status:
+        progress.clone_state = clone_status[0]["state"]
+    if clone_progress:
+        stages = [row["stage"] for row in clone_progress if row["state"] == "In Progress"]
+        progress.clone_stage = stages[0] if stages else None
+        progress.clone_data = sum(row["data"] or 0 for row in clone_progress)
+        progress.clone_estimate = sum(row["estimate"] or 0 for row in clone_progress)
+
+    return progress
+
+
+def _is_session_scope(scope: VariableScope, name: str) -> bool:
+    """Return whether a variable read is scoped to the session, hence not cacheable."""
+    return scope == VariableScope.SESSION
+
+
+def _merge_user_attrs(user: User, existing: User) -> dict:
+    """Merge the attributes to replace those of an existing user."""
+    # Attributes are merged into the existing ones, so removed keys must be nulled
+    attrs = dict.fromkeys(existing.attributes or {})
+    attrs.update(user.attributes or {})
+    return attrs
+
+
+class _InstanceQueryBuilder:
+    """Builder of the instance queries, shared by the synchronous and asynchronous clients."""
+
+    def __init__(self, quoter: StringQueryQuoter):
+        """Initialize the query builder.
+
+        Arguments:
+            quoter: Quoter of the query values and identifiers
+        """
+        self._quoter = quoter
+
+    def build_work_query(self, name_pattern: str) -> str:
+        """Builds the query to fetch the progress of the stages matching a name pattern."""
+        return _WORK_QUERY.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_granting_query(self, name: str, host: str, roles: list[str]) -> str:
+        """Builds the query to grant roles to an account."""
+        query = "GRANT {roles} TO {name}@{host}"
+        return query.format(
+            name=self._quoter.quote_value(name),
+            host=self._quoter.quote_value(host),
+            roles=", ".join(self._quoter.quote_value(r) for r in roles),
+        )
+
+    def build_role_creation_query(self, role: Role, roles: list[str] | None = None) -> str:
+        """Builds the query to create a role, granted with other roles."""
+        query = "CREATE ROLE {rolename}@{hostname}"
+        query = query.format(
+            rolename=self._quoter.quote_value(role.rolename),
+            hostname=self._quoter.quote_value(role.hostname),
+        )
+
+        if not roles:
+            return query
+
+        return ";".join((query, self.build_granting_query(role.rolename, role.hostname, roles)))
+
+    def build_user_creation_query(
+        self, user: User, password: str, roles: list[str] | None = None
+    ) -> str:
+        """Builds the query to create a user, granted with some roles."""
+        query = "CREATE USER {username}@{hostname} IDENTIFIED BY {password} ATTRIBUTE {attrs}"
+        query = query.format(
+            username=self._quoter.quote_value(user.username),
+            hostname=self._quoter.quote_value(user.hostname),
+            password=self._quoter.quote_value(password),
+            attrs=self._quoter.quote_value(user.serialize_attrs()),
+        )
+
+        if not roles:
+            return query
+
+        return ";".join((query, self.build_granting_query(user.username, user.hostname, roles)))
+
+    def build_user_deletion_query(self, user: User) -> str:
+        """Builds the query to delete a user."""
+        query = "DROP USER IF EXISTS {username}@{hostname}"
+        return query.format(
+            username=self._quoter.quote_value(user.username),
+            hostname=self._quoter.quote_value(user.hostname),
+        )
+
+    def build_user_update_query(
+        self, user: User, password: str | None = None, attrs: _Attrs = None
+    ) -> str:
+        """Builds the query to update a user password and / or attributes."""
+        query = "ALTER USER {username}@{hostname}"
+        query = query.format(
+            username=self._quoter.quote_value(user.username),
+            hostname=self._quoter.quote_value(user.hostname),
+        )
+
+        if password:
+            query += f" IDENTIFIED BY {self._quoter.quote_value(password)}"
+        if attrs:
+            query += f" ATTRIBUTE {self._quoter.quote_value(json.dumps(attrs))}"
+
+        return query
+
+    def build_user_attributes_query(self, name_pattern: str) -> str:
+        """Builds the query to fetch every user matching a name pattern, with its attributes."""
+        query = (
+            "SELECT user, host, attribute "
+            "FROM information_schema.user_attributes "
+            "WHERE user LIKE {name_pattern}"
+        )
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_user_reconciliation(
+        self,
+        desired: Sequence[User],
+        rows: list[dict],
+        passwords: Mapping[str, str],
+    ) -> tuple[UserReconciliation, list[str]]:
+        """Builds the users reconciliation, and the queries applying it.
+
+        Arguments:
+            desired: Users that must exist, with their attributes
+            rows: Rows of the user attributes query, with the current users
+            passwords: Passwords of the users to create, by user name
+        """
+        current = [User.from_row(row["USER"], row["HOST"], row["ATTRIBUTE"]) for row in rows]
+        current = {(user.username, user.hostname): user for user in current}
+        wanted = {(user.username, user.hostname): user for user in desired}
+
+        result = UserReconciliation()
+        result.deleted = [user for key, user in current.items() if key not in wanted]
+        result.created = [user for key, user in wanted.items() if key not in current]
+        result.updated = [
+            user
+            for key, user in wanted.items()
+            if key in current and (user.attributes or {}) != (current[key].attributes or {})
+        ]
+
+        for user in result.created:
+            if user.username not in passwords:
+                raise ValueError(f"Missing password to create user {user.username}")
+
+        queries = [self.build_user_deletion_query(user) for user in result.deleted]
+        queries += [
+            self.build_user_creation_query(user, passwords[user.username])
+            for user in result.created
+        ]
+        queries += [
+            self.build_user_update_query(
+                user,
+                attrs=_merge_user_attrs(user, current[(user.username, user.hostname)]),
+            )
+            for user in result.updated
+        ]
+
+        return result, queries
+
+    @staticmethod
+    def build_logs_flushing_query(logs: list[LogType]) -> str:
+        """Builds the query to flush some instance logs."""
+        query = "FLUSH {log} LOGS"
+        return ";".join(query.format(log=log.value) for log in logs)
+
+    def build_cluster_instance_labels_query(self, cluster_name: str) -> str:
+        """Builds the query to fetch the instance labels within a cluster."""
+        query = (
+            "SELECT instance_name "
+            "FROM mysql_innodb_cluster_metadata.instances "
+            "WHERE cluster_id IN ( "
+            "   SELECT cluster_id "
+            "   FROM mysql_innodb_cluster_metadata.clusters "
+            "   WHERE cluster_name = {cluster_name} "
+            ")"
+        )
+        return query.format(
+            cluster_name=self._quoter.quote_value(cluster_name),
+        )
 
+    def build_health_queries(self, work_pattern: str | None = None) -> list[str]:
+        """Builds the queries to take an instance health snapshot."""
+        queries = list(_HEALTH_QUERIES)
+        if work_pattern:
+            queries.append(self.build_work_query(work_pattern))
+
+        return queries
+
+    def build_variable_query(self, scope: VariableScope, name: str) -> str:
+        """Builds the query to fetch an instance variable, aliased by its name."""
+        if scope in (VariableScope.PERSIST, VariableScope.PERSIST_ONLY):
+            raise ValueError("Invalid scope")
+
+        quoted_name = self._quoter.quote_identifier(name)
+
+        query = "SELECT @@{scope}.{name} AS {alias}"
+        return query.format(
+            scope=scope.value,
+            name=quoted_name,
+            alias=quoted_name,
+        )
+
+    def build_variable_update_query(self, scope: VariableScope, name: str, value: Any) -> str:
+        """Builds the query to set an instance variable."""
+        quoted_name = self._quoter.quote_identifier(name)
+        quoted_value = self._quoter.quote_value(value) if isinstance(value, str) else value
+
+        query = "SET @@{scope}.{name} = {value}"
+        return query.format(
+            scope=scope.value,
+            name=quoted_name,
+            value=quoted_value,
+        )
+
+    def build_plugin_installation_query(self, name: str, path: str) -> str:
+        """Builds the query to install an instance plugin."""
+        query = "INSTALL PLUGIN {plugin_name} SONAME {plugin_path}"
+        return query.format(
+            plugin_name=self._quoter.quote_identifier(name),
+            plugin_path=self._quoter.quote_value(path),
+        )
+
+    def build_plugin_uninstallation_query(self, name: str) -> str:
+        """Builds the query to uninstall an instance plugin."""
+        query = "UNINSTALL PLUGIN {plugin_name}"
+        return query.format(
+            plugin_name=self._quoter.quote_identifier(name),
+        )
+
+    def build_members_search_query(
+        self,
+        roles: Sequence[InstanceRole] | None = None,
+        states: Sequence[InstanceState] | None = None,
+    ) -> str:
+        """Builds the query to search the replication member IDs by role and/or state."""
+        if not roles:
+            roles = list(InstanceRole)
+        if not states:
+            states = list(InstanceState)
+
+        query = (
+            "SELECT member_id "
+            "FROM performance_schema.replication_group_members "
+            "WHERE member_role IN ({roles}) AND member_state IN ({states})"
+        )
+        return query.format(
+            roles=", ".join([self._quoter.quote_value(role) for role in roles]),
+            states=", ".join([self._quoter.quote_value(state) for state in states]),
+        )
+
+    def build_processes_search_query(self, name_pattern: str) -> str:
+        """Builds the query to search the connection process IDs by name pattern."""
+        query = (
+            "SELECT processlist_id "
+            "FROM performance_schema.threads "
+            "WHERE "
+            "   processlist_id != CONNECTION_ID() AND "
+            "   connection_type IS NOT NULL AND "
+            "   name LIKE {name_pattern}"
+        )
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_databases_search_query(self, name_pattern: str) -> str:
+        """Builds the query to search the databases by name pattern."""
+        query = (
+            "SELECT schema_name "
+            "FROM information_schema.schemata "
+            "WHERE schema_name LIKE {name_pattern}"
+        )
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_plugins_search_query(self, name_pattern: str) -> str:
+        """Builds the query to search the plugins by name pattern."""
+        # fmt: off
+        query = (
+            "SELECT name "
+            "FROM mysql.plugin "
+            "WHERE name LIKE {name_pattern}"
+        )
+        # fmt: on
+
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_roles_search_query(self, name_pattern: str) -> str:
+        """Builds the query to search the roles by name pattern."""
+        query = (
+            "SELECT user, host "
+            "FROM mysql.user "
+            "WHERE user LIKE {name_pattern} AND authentication_string=''"
+        )
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+        )
+
+    def build_users_search_query(self, name_pattern: str, attrs: _Attrs = None) -> str:
+        """Builds the query to search the users by name pattern and attributes."""
+        attr_filter = "attribute LIKE {string}"
+        attr_substr = '%"{key}": "{val}"%'
+
+        if not attrs:
+            strings = ["%"]
+            filters = [attr_filter.format(string=self._quoter.quote_value(s)) for s in strings]
+        else:
+            strings = [attr_substr.format(key=key, val=val) for key, val in attrs.items()]
+            filters = [attr_filter.format(string=self._quoter.quote_value(s)) for s in strings]
+
+        query = (
+            "SELECT user, host, attribute "
+            "FROM information_schema.user_attributes "
+            "WHERE user LIKE {name_pattern} AND {attr_filters}"
+        )
+        return query.format(
+            name_pattern=self._quoter.quote_value(name_pattern),
+            attr_filters=" AND ".join(filters),
+        )
+
+    def build_processes_kill_query(self, process_ids: Sequence[int]) -> str:
+        """Builds the query to kill some processes by ID."""
+        query = "KILL CONNECTION {id}"
+        return ";".join(query.format(id=self._quoter.quote_value(pid)) for pid in process_ids)
+
+
+@instrumented
 class MySQLInstanceClient:
     """Class to encapsulate all instance operations using MySQL Shell."""
 
-    def __init__(self, executor: BaseExecutor, quoter: StringQueryQuoter):
-        """Initialize the class."""
+    def __init__(
+        self,
+        executor: BaseExecutor,
+        quoter: StringQueryQuoter,
+        cache: ResultCache | None = None,
+    ):
+        """Initialize the class.
+
+        Arguments:
+            executor: Executor to run the scripts with
+            quoter: Quoter of the query values and identifiers
+            cache: Optional cache of the read results, invalidated by every write
+        """
         self._executor = executor
         self._quoter = quoter
+        self._queries = _InstanceQueryBuilder(quoter)
+        self._cache = cache
 
     def check_work_ongoing(self, name_pattern: str) -> bool:
         """Checks whether an instance work is ongoing."""
-        query = (
-            "SELECT work_completed, work_estimated "
-            "FROM performance_schema.events_stages_current "
-            "WHERE event_name LIKE {name_pattern}"
-        )
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-        )
+        query = self._queries.build_work_query(name_pattern)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -42,30 +483,12 @@ class MySQLInstanceClient:
             logger.error(f"Failed to check work for events with {name_pattern=}")
             raise
         else:
-            return any(row["work_completed"] < row["work_estimated"] for row in rows)
+            return _is_work_ongoing(rows)
 
+    @invalidating
     def create_instance_role(self, role: Role, roles: list[str] = None) -> None:
         """Creates a new instance role."""
-        if not roles:
-            granting_query = ""
-        else:
-            granting_query = "GRANT {roles} TO {rolename}@{hostname}"
-            granting_query = granting_query.format(
-                rolename=self._quoter.quote_value(role.rolename),
-                hostname=self._quoter.quote_value(role.hostname),
-                roles=", ".join(self._quoter.quote_value(r) for r in roles),
-            )
-
-        creation_query = "CREATE ROLE {rolename}@{hostname}"
-        creation_query = creation_query.format(
-            rolename=self._quoter.quote_value(role.rolename),
-            hostname=self._quoter.quote_value(role.hostname),
-        )
-
-        queries = ";".join((
-            creation_query,
-            granting_query,
-        ))
+        queries = self._queries.build_role_creation_query(role, roles)
 
         try:
             self._executor.execute_sql(queries)
@@ -73,32 +496,10 @@ class MySQLInstanceClient:
             logger.error(f"Failed to create instance role {role.rolename}.{role.hostname}")
             raise
 
+    @invalidating
     def create_instance_user(self, user: User, password: str, roles: list[str] = None) -> None:
         """Creates an instance user with the provided attributes."""
-        if not roles:
-            granting_query = ""
-        else:
-            granting_query = "GRANT {roles} TO {username}@{hostname}"
-            granting_query = granting_query.format(
-                username=self._quoter.quote_value(user.username),
-                hostname=self._quoter.quote_value(user.hostname),
-                roles=", ".join(self._quoter.quote_value(r) for r in roles),
-            )
-
-        creation_query = (
-            "CREATE USER {username}@{hostname} IDENTIFIED BY {password} ATTRIBUTE {attrs}"
-        )
-        creation_query = creation_query.format(
-            username=self._quoter.quote_value(user.username),
-            hostname=self._quoter.quote_value(user.hostname),
-            password=self._quoter.quote_value(password),
-            attrs=self._quoter.quote_value(user.serialize_attrs()),
-        )
-
-        queries = ";".join((
-            creation_query,
-            granting_query,
-        ))
+        queries = self._queries.build_user_creation_query(user, password, roles)
 
         try:
             self._executor.execute_sql(queries)
@@ -106,13 +507,10 @@ class MySQLInstanceClient:
             logger.error(f"Failed to create instance user {user.username}.{user.hostname}")
             raise
 
+    @invalidating
     def delete_instance_user(self, user: User) -> None:
         """Deletes an instance user if it exists."""
-        query = "DROP USER IF EXISTS {username}@{hostname}"
-        query = query.format(
-            username=self._quoter.quote_value(user.username),
-            hostname=self._quoter.quote_value(user.hostname),
-        )
+        query = self._queries.build_user_deletion_query(user)
 
         try:
             self._executor.execute_sql(query)
@@ -120,20 +518,10 @@ class MySQLInstanceClient:
             logger.error(f"Failed to delete instance user {user.username}.{user.hostname}")
             raise
 
+    @invalidating
     def delete_instance_users(self, users: list[User]) -> None:
         """Deletes the instance users provided."""
-        query = "DROP USER IF EXISTS {username}@{hostname}"
-        queries = []
-
-        for user in users:
-            queries.append(
-                query.format(
-                    username=self._quoter.quote_value(user.username),
-                    hostname=self._quoter.quote_value(user.hostname),
-                )
-            )
-
-        queries = ";".join(queries)
+        queries = ";".join(self._queries.build_user_deletion_query(user) for user in users)
 
         try:
             self._executor.execute_sql(queries)
@@ -141,21 +529,13 @@ class MySQLInstanceClient:
             logger.error("Failed to delete instance users")
             raise
 
+    @invalidating
     def update_instance_user(self, user: User, password: str = None, attrs: _Attrs = None) -> None:
         """Updates an instance user with the provided password and / or attributes."""
         if not password and not attrs:
             raise ValueError("Either password or attrs must be provided")
 
-        query = "ALTER USER {username}@{hostname}"
-        query = query.format(
-            username=self._quoter.quote_value(user.username),
-            hostname=self._quoter.quote_value(user.hostname),
-        )
-
-        if password:
-            query += f" IDENTIFIED BY {self._quoter.quote_value(password)}"
-        if attrs:
-            query += f" ATTRIBUTE {self._quoter.quote_value(json.dumps(attrs))}"
+        query = self._queries.build_user_update_query(user, password, attrs)
 
         try:
             self._executor.execute_sql(query)
@@ -163,6 +543,7 @@ class MySQLInstanceClient:
             logger.error(f"Failed to update instance user {user.username}.{user.hostname}")
             raise
 
+    @invalidating
     def flush_instance_logs(self, logs: list[LogType]) -> None:
         """Flushes the instance logs."""
         if not logs:
@@ -172,28 +553,18 @@ class MySQLInstanceClient:
 
         try:
             self.set_instance_variable(VariableScope.SESSION, "sql_log_bin", "OFF")
-
-            query = "FLUSH {log} LOGS"
-            queries = [query.format(log=log.value) for log in logs]
-            queries = ";".join(queries)
-
-            self._executor.execute_sql(queries)
+            self._executor.execute_sql(self._queries.build_logs_flushing_query(logs))
         except ExecutionError:
             logger.error("Failed to flush instance logs")
             raise
         finally:
             self.set_instance_variable(VariableScope.SESSION, "sql_log_bin", bin_logging)
 
+    @cached
     def get_cluster_instance_label(self) -> str | None:
         """Gets the instance label within the cluster."""
-        query = (
-            "SELECT instance_name "
-            "FROM mysql_innodb_cluster_metadata.instances "
-            "WHERE mysql_server_uuid = @@server_uuid"
-        )
-
         try:
-            rows = self._executor.execute_sql(query)
+            rows = self._executor.execute_sql(_INSTANCE_LABEL_QUERY)
         except ExecutionError:
             logger.error("Failed to get cluster instance label")
             raise
@@ -203,20 +574,10 @@ class MySQLInstanceClient:
 
         return rows[0]["instance_name"]
 
+    @cached
     def get_cluster_instance_labels(self, cluster_name: str) -> list[str]:
         """Gets the instance labels within the cluster."""
-        query = (
-            "SELECT instance_name "
-            "FROM mysql_innodb_cluster_metadata.instances "
-            "WHERE cluster_id IN ( "
-            "   SELECT cluster_id "
-            "   FROM mysql_innodb_cluster_metadata.clusters "
-            "   WHERE cluster_name = {cluster_name} "
-            ")"
-        )
-        query = query.format(
-            cluster_name=self._quoter.quote_value(cluster_name),
-        )
+        query = self._queries.build_cluster_instance_labels_query(cluster_name)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -226,28 +587,49 @@ class MySQLInstanceClient:
         else:
             return [row["instance_name"] for row in rows]
 
+    @cached
     def get_cluster_labels(self) -> list[str]:
         """Gets the cluster labels."""
-        query = "SELECT cluster_name FROM mysql_innodb_cluster_metadata.clusters"
-
         try:
-            rows = self._executor.execute_sql(query)
+            rows = self._executor.execute_sql(_CLUSTER_LABELS_QUERY)
         except ExecutionError:
             logger.error("Failed to get cluster labels")
             raise
         else:
             return [row["cluster_name"] for row in rows]
 
+    def get_instance_health(self, work_pattern: str | None = None) -> InstanceHealth:
+        """Gets an instance health snapshot, using a single MySQL Shell call."""
+        queries = self._queries.build_health_queries(work_pattern)
+
+        try:
+            results = self._executor.execute_sql_batch(queries, force=True)
+            if not results[0].ok:
+                raise ExecutionError(results[0].error)
+        except ExecutionError:
+            logger.error("Failed to get instance health")
+            raise
+
+        return _build_instance_health(results, work_pattern)
+
+    def get_instance_recovery_progress(self) -> RecoveryProgress:
+        """Gets the instance recovery progress (distributed recovery and clone)."""
+        queries = list(_RECOVERY_PROGRESS_QUERIES)
+
+        try:
+            results = self._executor.execute_sql_batch(queries, force=True)
+            if not results[0].ok:
+                raise ExecutionError(results[0].error)
+        except ExecutionError:
+            logger.error("Failed to get instance recovery progress")
+            raise
+
+        return _build_recovery_progress(results)
+
     def get_instance_replication_state(self) -> InstanceState | None:
         """Gets the instance replication state."""
-        query = (
-            "SELECT member_state "
-            "FROM performance_schema.replication_group_members "
-            "WHERE member_id = @@server_uuid"
-        )
-
         try:
-            rows = self._executor.execute_sql(query)
+            rows = self._executor.execute_sql(_MEMBER_STATE_QUERY)
         except ExecutionError:
             logger.error("Failed to get instance replication state")
             raise
@@ -261,14 +643,8 @@ class MySQLInstanceClient:
 
     def get_instance_replication_role(self) -> InstanceRole | None:
         """Gets the instance replication role."""
-        query = (
-            "SELECT member_role "
-            "FROM performance_schema.replication_group_members "
-            "WHERE member_id = @@server_uuid"
-        )
-
         try:
-            rows = self._executor.execute_sql(query)
+            rows = self._executor.execute_sql(_MEMBER_ROLE_QUERY)
         except ExecutionError:
             logger.error("Failed to get instance replication role")
             raise
@@ -280,19 +656,10 @@ class MySQLInstanceClient:
         role = InstanceRole(role) if role else None
         return role
 
+    @cached(skip=_is_session_scope)
     def get_instance_variable(self, scope: VariableScope, name: str) -> Any | None:
         """Gets an instance variable by scope and name."""
-        if scope in (VariableScope.PERSIST, VariableScope.PERSIST_ONLY):
-            raise ValueError("Invalid scope")
-
-        quoted_name = self._quoter.quote_identifier(name)
-
-        query = "SELECT @@{scope}.{name} AS {alias}"
-        query = query.format(
-            scope=scope.value,
-            name=quoted_name,
-            alias=quoted_name,
-        )
+        query = self._queries.build_variable_query(scope, name)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -305,17 +672,10 @@ class MySQLInstanceClient:
 
         return rows[0][name]
 
+    @invalidating
     def set_instance_variable(self, scope: VariableScope, name: str, value: Any) -> None:
         """Sets an instance variable by scope and name."""
-        quoted_name = self._quoter.quote_identifier(name)
-        quoted_value = self._quoter.quote_value(value) if isinstance(value, str) else value
-
-        query = "SET @@{scope}.{name} = {value}"
-        query = query.format(
-            scope=scope.value,
-            name=quoted_name,
-            value=quoted_value,
-        )
+        query = self._queries.build_variable_update_query(scope, name, value)
 
         try:
             self._executor.execute_sql(query)
@@ -323,6 +683,7 @@ class MySQLInstanceClient:
             logger.error(f"Failed to set instance variable {scope}.{name}")
             raise
 
+    @cached
     def get_instance_version(self) -> str | None:
         """Gets the instance version value."""
         version = self.get_instance_variable(VariableScope.GLOBAL, "version")
@@ -331,13 +692,10 @@ class MySQLInstanceClient:
 
         return version.split("-")[0]
 
+    @invalidating
     def install_instance_plugin(self, name: str, path: str) -> None:
         """Installs an instance plugin by name and path."""
-        query = "INSTALL PLUGIN {plugin_name} SONAME {plugin_path}"
-        query = query.format(
-            plugin_name=self._quoter.quote_identifier(name),
-            plugin_path=self._quoter.quote_value(path),
-        )
+        query = self._queries.build_plugin_installation_query(name, path)
 
         try:
             self._executor.execute_sql(query)
@@ -345,12 +703,10 @@ class MySQLInstanceClient:
             logger.error(f"Failed to install instance plugin with {name=} and {path=}")
             raise
 
+    @invalidating
     def uninstall_instance_plugin(self, name: str) -> None:
         """Uninstalls an instance plugin by name."""
-        query = "UNINSTALL PLUGIN {plugin_name}"
-        query = query.format(
-            plugin_name=self._quoter.quote_identifier(name),
-        )
+        query = self._queries.build_plugin_uninstallation_query(name)
 
         try:
             self._executor.execute_sql(query)
@@ -358,6 +714,61 @@ class MySQLInstanceClient:
             logger.error(f"Failed to uninstall instance plugin with {name=}")
             raise
 
+    @invalidating
+    def reconcile_instance_users(
+        self,
+        desired: Sequence[User],
+        name_pattern: str,
+        passwords: Mapping[str, str] | None = None,
+        dry_run: bool = False,
+        batch_size: int = 500,
+    ) -> UserReconciliation:
+        """Reconciles the instance users matching a name pattern with a desired set of users.
+
+        Missing users are created, users with different attributes are updated,
+        and users not desired are deleted. Only the changes are applied,
+        using one MySQL Shell call per batch of statements.
+
+        Arguments:
+            desired: Users that must exist, with their attributes
+            name_pattern: SQL LIKE pattern of the user names under reconciliation
+            passwords: Passwords of the users to create, by user name
+            dry_run: Whether to only compute the changes, without applying them
+            batch_size: Maximum number of statements applied per call
+
+        Returns:
+            Users created, updated and deleted
+        """
+        _check_desired_users(desired, name_pattern)
+
+        # Users without attributes are not returned by search_instance_users,
+        # and the search results may be cached, so the users are fetched directly
+        query = self._queries.build_user_attributes_query(name_pattern)
+
+        try:
+            rows = self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to fetch instance users with {name_pattern=}")
+            raise
+
+        result, queries = self._queries.build_user_reconciliation(desired, rows, passwords or {})
+
+        if dry_run:
+            return result
+
+        for i in range(0, len(queries), batch_size):
+            try:
+                results = self._executor.execute_sql_batch(queries[i : i + batch_size])
+                failed = next((r for r in results if r.error), None)
+                if failed:
+                    raise ExecutionError(failed.error)
+            except ExecutionError:
+                logger.error(f"Failed to reconcile instance users with {name_pattern=}")
+                raise
+
+        return result
+
+    @invalidating
     def reload_instance_certs(self) -> None:
         """Reloads TLS certificates."""
         query = "ALTER INSTANCE RELOAD TLS"
@@ -374,20 +785,7 @@ class MySQLInstanceClient:
         states: Sequence[InstanceState] | None = None,
     ) -> list[str]:
         """Searches the instance replication member IDs by role and/or state."""
-        if not roles:
-            roles = list(InstanceRole)
-        if not states:
-            states = list(InstanceState)
-
-        query = (
-            "SELECT member_id "
-            "FROM performance_schema.replication_group_members "
-            "WHERE member_role IN ({roles}) AND member_state IN ({states})"
-        )
-        query = query.format(
-            roles=", ".join([self._quoter.quote_value(role) for role in roles]),
-            states=", ".join([self._quoter.quote_value(state) for state in states]),
-        )
+        query = self._queries.build_members_search_query(roles, states)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -399,17 +797,7 @@ class MySQLInstanceClient:
 
     def search_instance_connection_processes(self, name_pattern: str) -> list[int]:
         """Searches the instance connection process IDs by name pattern."""
-        query = (
-            "SELECT processlist_id "
-            "FROM performance_schema.threads "
-            "WHERE "
-            "   processlist_id != CONNECTION_ID() AND "
-            "   connection_type IS NOT NULL AND "
-            "   name LIKE {name_pattern}"
-        )
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-        )
+        query = self._queries.build_processes_search_query(name_pattern)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -419,16 +807,10 @@ class MySQLInstanceClient:
         else:
             return [row["processlist_id"] for row in rows]
 
+    @cached
     def search_instance_databases(self, name_pattern: str) -> list[str]:
         """Searches the instance databases by name pattern."""
-        query = (
-            "SELECT schema_name "
-            "FROM information_schema.schemata "
-            "WHERE schema_name LIKE {name_pattern}"
-        )
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-        )
+        query = self._queries.build_databases_search_query(name_pattern)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -438,19 +820,10 @@ class MySQLInstanceClient:
         else:
             return [row["SCHEMA_NAME"] for row in rows]
 
+    @cached
     def search_instance_plugins(self, name_pattern: str) -> list[str]:
         """Searches the instance plugins by name pattern."""
-        # fmt: off
-        query = (
-            "SELECT name "
-            "FROM mysql.plugin "
-            "WHERE name LIKE {name_pattern}"
-        )
-        # fmt: on
-
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-        )
+        query = self._queries.build_plugins_search_query(name_pattern)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -460,16 +833,10 @@ class MySQLInstanceClient:
         else:
             return [row["name"] for row in rows]
 
+    @cached
     def search_instance_roles(self, name_pattern: str) -> list[Role]:
         """Searches the instance roles by name pattern."""
-        query = (
-            "SELECT user, host "
-            "FROM mysql.user "
-            "WHERE user LIKE {name_pattern} AND authentication_string=''"
-        )
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-        )
+        query = self._queries.build_roles_search_query(name_pattern)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -479,27 +846,10 @@ class MySQLInstanceClient:
         else:
             return [Role.from_row(row["user"], row["host"]) for row in rows]
 
+    @cached
     def search_instance_users(self, name_pattern: str, attrs: _Attrs = None) -> list[User]:
         """Searches the instance users by name pattern and attributes."""
-        attr_filter = "attribute LIKE {string}"
-        attr_substr = '%"{key}": "{val}"%'
-
-        if not attrs:
-            strings = ["%"]
-            filters = [attr_filter.format(string=self._quoter.quote_value(s)) for s in strings]
-        else:
-            strings = [attr_substr.format(key=key, val=val) for key, val in attrs.items()]
-            filters = [attr_filter.format(string=self._quoter.quote_value(s)) for s in strings]
-
-        query = (
-            "SELECT user, host, attribute "
-            "FROM information_schema.user_attributes "
-            "WHERE user LIKE {name_pattern} AND {attr_filters}"
-        )
-        query = query.format(
-            name_pattern=self._quoter.quote_value(name_pattern),
-            attr_filters=" AND ".join(filters),
-        )
+        query = self._queries.build_users_search_query(name_pattern, attrs)
 
         try:
             rows = self._executor.execute_sql(query)
@@ -509,6 +859,7 @@ class MySQLInstanceClient:
         else:
             return [User.from_row(row["USER"], row["HOST"], row["ATTRIBUTE"]) for row in rows]
 
+    @invalidating
     def start_instance_replication(self) -> None:
         """Starts instance group replication."""
         query = "START GROUP_REPLICATION"
@@ -519,6 +870,7 @@ class MySQLInstanceClient:
             logger.error("Failed to start instance replication")
             raise
 
+    @invalidating
     def stop_instance_replication(self) -> None:
         """Stops instance group replication."""
         query = "STOP GROUP_REPLICATION"
@@ -529,14 +881,13 @@ class MySQLInstanceClient:
             logger.error("Failed to stop instance replication")
             raise
 
+    @invalidating
     def stop_instance_processes(self, process_ids: Sequence[int]) -> None:
         """Kills the instances processes by ID."""
         if not process_ids:
             return
 
-        query = "KILL CONNECTION {id}"
-        queries = [query.format(id=self._quoter.quote_value(pid)) for pid in process_ids]
-        queries = ";".join(queries)
+        queries = self._queries.build_processes_kill_query(process_ids)
 
         try:
             self._executor.execute_sql(queries)
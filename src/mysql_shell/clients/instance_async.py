@@ -0,0 +1,480 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+from typing import Any, Mapping, Sequence
+
+from ..builders import StringQueryQuoter
+from ..executors import AsyncBaseExecutor
+from ..executors.errors import ExecutionError
+from ..executors.metrics import instrumented
+from ..models.account import Role, User, UserReconciliation
+from ..models.instance import InstanceHealth, InstanceRole, InstanceState, RecoveryProgress
+from ..models.statement import LogType, VariableScope
+from .cache import ResultCache, cached, invalidating
+from .instance import (
+    _CLUSTER_LABELS_QUERY,
+    _INSTANCE_LABEL_QUERY,
+    _MEMBER_ROLE_QUERY,
+    _MEMBER_STATE_QUERY,
+    _RECOVERY_PROGRESS_QUERIES,
+    _build_instance_health,
+    _build_recovery_progress,
+    _check_desired_users,
+    _InstanceQueryBuilder,
+    _is_session_scope,
+    _is_work_ongoing,
+)
+
+logger = logging.getLogger()
+
+_Attrs = Mapping[str, str] | None
+
+
+@instrumented
+class AsyncMySQLInstanceClient:
+    """Class to encapsulate all asynchronous instance operations using MySQL Shell."""
+
+    def __init__(
+        self,
+        executor: AsyncBaseExecutor,
+        quoter: StringQueryQuoter,
+        cache: ResultCache | None = None,
+    ):
+        """Initialize the class.
+
+        Arguments:
+            executor: Executor to run the scripts with
+            quoter: Quoter of the query values and identifiers
+            cache: Optional cache of the read results, invalidated by every write
+        """
+        self._executor = executor
+        self._quoter = quoter
+        self._queries = _InstanceQueryBuilder(quoter)
+        self._cache = cache
+
+    async def check_work_ongoing(self, name_pattern: str) -> bool:
+        """Checks whether an instance work is ongoing."""
+        query = self._queries.build_work_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to check work for events with {name_pattern=}")
+            raise
+        else:
+            return _is_work_ongoing(rows)
+
+    @invalidating
+    async def create_instance_role(self, role: Role, roles: list[str] = None) -> None:
+        """Creates a new instance role."""
+        queries = self._queries.build_role_creation_query(role, roles)
+
+        try:
+            await self._executor.execute_sql(queries)
+        except ExecutionError:
+            logger.error(f"Failed to create instance role {role.rolename}.{role.hostname}")
+            raise
+
+    @invalidating
+    async def create_instance_user(
+        self, user: User, password: str, roles: list[str] = None
+    ) -> None:
+        """Creates an instance user with the provided attributes."""
+        queries = self._queries.build_user_creation_query(user, password, roles)
+
+        try:
+            await self._executor.execute_sql(queries)
+        except ExecutionError:
+            logger.error(f"Failed to create instance user {user.username}.{user.hostname}")
+            raise
+
+    @invalidating
+    async def delete_instance_user(self, user: User) -> None:
+        """Deletes an instance user if it exists."""
+        query = self._queries.build_user_deletion_query(user)
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to delete instance user {user.username}.{user.hostname}")
+            raise
+
+    @invalidating
+    async def delete_instance_users(self, users: list[User]) -> None:
+        """Deletes the instance users provided."""
+        queries = ";".join(self._queries.build_user_deletion_query(user) for user in users)
+
+        try:
+            await self._executor.execute_sql(queries)
+        except ExecutionError:
+            logger.error("Failed to delete instance users")
+            raise
+
+    @invalidating
+    async def update_instance_user(
+        self, user: User, password: str = None, attrs: _Attrs = None
+    ) -> None:
+        """Updates an instance user with the provided password and / or attributes."""
+        if not password and not attrs:
+            raise ValueError("Either password or attrs must be provided")
+
+        query = self._queries.build_user_update_query(user, password, attrs)
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to update instance user {user.username}.{user.hostname}")
+            raise
+
+    @invalidating
+    async def flush_instance_logs(self, logs: list[LogType]) -> None:
+        """Flushes the instance logs."""
+        if not logs:
+            return
+
+        bin_logging = await self.get_instance_variable(VariableScope.SESSION, "sql_log_bin")
+
+        try:
+            await self.set_instance_variable(VariableScope.SESSION, "sql_log_bin", "OFF")
+            await self._executor.execute_sql(self._queries.build_logs_flushing_query(logs))
+        except ExecutionError:
+            logger.error("Failed to flush instance logs")
+            raise
+        finally:
+            await self.set_instance_variable(VariableScope.SESSION, "sql_log_bin", bin_logging)
+
+    @cached
+    async def get_cluster_instance_label(self) -> str | None:
+        """Gets the instance label within the cluster."""
+        try:
+            rows = await self._executor.execute_sql(_INSTANCE_LABEL_QUERY)
+        except ExecutionError:
+            logger.error("Failed to get cluster instance label")
+            raise
+
+        if not rows:
+            return None
+
+        return rows[0]["instance_name"]
+
+    @cached
+    async def get_cluster_instance_labels(self, cluster_name: str) -> list[str]:
+        """Gets the instance labels within the cluster."""
+        query = self._queries.build_cluster_instance_labels_query(cluster_name)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to get cluster instance labels with {cluster_name=}")
+            raise
+        else:
+            return [row["instance_name"] for row in rows]
+
+    @cached
+    async def get_cluster_labels(self) -> list[str]:
+        """Gets the cluster labels."""
+        try:
+            rows = await self._executor.execute_sql(_CLUSTER_LABELS_QUERY)
+        except ExecutionError:
+            logger.error("Failed to get cluster labels")
+            raise
+        else:
+            return [row["cluster_name"] for row in rows]
+
+    async def get_instance_health(self, work_pattern: str | None = None) -> InstanceHealth:
+        """Gets an instance health snapshot, using a single MySQL Shell call."""
+        queries = self._queries.build_health_queries(work_pattern)
+
+        try:
+            results = await self._executor.execute_sql_batch(queries, force=True)
+            if not results[0].ok:
+                raise ExecutionError(results[0].error)
+        except ExecutionError:
+            logger.error("Failed to get instance health")
+            raise
+
+        return _build_instance_health(results, work_pattern)
+
+    async def get_instance_recovery_progress(self) -> RecoveryProgress:
+        """Gets the instance recovery progress (distributed recovery and clone)."""
+        queries = list(_RECOVERY_PROGRESS_QUERIES)
+
+        try:
+            results = await self._executor.execute_sql_batch(queries, force=True)
+            if not results[0].ok:
+                raise ExecutionError(results[0].error)
+        except ExecutionError:
+            logger.error("Failed to get instance recovery progress")
+            raise
+
+        return _build_recovery_progress(results)
+
+    async def get_instance_replication_state(self) -> InstanceState | None:
+        """Gets the instance replication state."""
+        try:
+            rows = await self._executor.execute_sql(_MEMBER_STATE_QUERY)
+        except ExecutionError:
+            logger.error("Failed to get instance replication state")
+            raise
+
+        if not rows:
+            return None
+
+        state = rows[0]["member_state"]
+        state = InstanceState(state) if state else None
+        return state
+
+    async def get_instance_replication_role(self) -> InstanceRole | None:
+        """Gets the instance replication role."""
+        try:
+            rows = await self._executor.execute_sql(_MEMBER_ROLE_QUERY)
+        except ExecutionError:
+            logger.error("Failed to get instance replication role")
+            raise
+
+        if not rows:
+            return None
+
+        role = rows[0]["member_role"]
+        role = InstanceRole(role) if role else None
+        return role
+
+    @cached(skip=_is_session_scope)
+    async def get_instance_variable(self, scope: VariableScope, name: str) -> Any | None:
+        """Gets an instance variable by scope and name."""
+        query = self._queries.build_variable_query(scope, name)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to get instance variable {scope}.{name}")
+            raise
+
+        if not rows:
+            return None
+
+        return rows[0][name]
+
+    @invalidating
+    async def set_instance_variable(self, scope: VariableScope, name: str, value: Any) -> None:
+        """Sets an instance variable by scope and name."""
+        query = self._queries.build_variable_update_query(scope, name, value)
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to set instance variable {scope}.{name}")
+            raise
+
+    @cached
+    async def get_instance_version(self) -> str | None:
+        """Gets the instance version value."""
+        version = await self.get_instance_variable(VariableScope.GLOBAL, "version")
+        if not version:
+            return None
+
+        return version.split("-")[0]
+
+    @invalidating
+    async def install_instance_plugin(self, name: str, path: str) -> None:
+        """Installs an instance plugin by name and path."""
+        query = self._queries.build_plugin_installation_query(name, path)
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to install instance plugin with {name=} and {path=}")
+            raise
+
+    @invalidating
+    async def uninstall_instance_plugin(self, name: str) -> None:
+        """Uninstalls an instance plugin by name."""
+        query = self._queries.build_plugin_uninstallation_query(name)
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to uninstall instance plugin with {name=}")
+            raise
+
+    @invalidating
+    async def reconcile_instance_users(
+        self,
+        desired: Sequence[User],
+        name_pattern: str,
+        passwords: Mapping[str, str] | None = None,
+        dry_run: bool = False,
+        batch_size: int = 500,
+    ) -> UserReconciliation:
+        """Reconciles the instance users matching a name pattern with a desired set of users.
+
+        Missing users are created, users with different attributes are updated,
+        and users not desired are deleted. Only the changes are applied,
+        using one MySQL Shell call per batch of statements.
+
+        Arguments:
+            desired: Users that must exist, with their attributes
+            name_pattern: SQL LIKE pattern of the user names under reconciliation
+            passwords: Passwords of the users to create, by user name
+            dry_run: Whether to only compute the changes, without applying them
+            batch_size: Maximum number of statements applied per call
+
+        Returns:
+            Users created, updated and deleted
+        """
+        _check_desired_users(desired, name_pattern)
+
+        # Users without attributes are not returned by search_instance_users,
+        # and the search results may be cached, so the users are fetched directly
+        query = self._queries.build_user_attributes_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to fetch instance users with {name_pattern=}")
+            raise
+
+        result, queries = self._queries.build_user_reconciliation(desired, rows, passwords or {})
+
+        if dry_run:
+            return result
+
+        for i in range(0, len(queries), batch_size):
+            try:
+                results = await self._executor.execute_sql_batch(queries[i : i + batch_size])
+                failed = next((r for r in results if r.error), None)
+                if failed:
+                    raise ExecutionError(failed.error)
+            except ExecutionError:
+                logger.error(f"Failed to reconcile instance users with {name_pattern=}")
+                raise
+
+        return result
+
+    @invalidating
+    async def reload_instance_certs(self) -> None:
+        """Reloads TLS certificates."""
+        query = "ALTER INSTANCE RELOAD TLS"
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error("Failed to reload instance TLS certificates")
+            raise
+
+    async def search_instance_replication_members(
+        self,
+        roles: Sequence[InstanceRole] | None = None,
+        states: Sequence[InstanceState] | None = None,
+    ) -> list[str]:
+        """Searches the instance replication member IDs by role and/or state."""
+        query = self._queries.build_members_search_query(roles, states)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error("Failed to search instance replication members")
+            raise
+        else:
+            return [row["member_id"] for row in rows]
+
+    async def search_instance_connection_processes(self, name_pattern: str) -> list[int]:
+        """Searches the instance connection process IDs by name pattern."""
+        query = self._queries.build_processes_search_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to search instance connections with {name_pattern=}")
+            raise
+        else:
+            return [row["processlist_id"] for row in rows]
+
+    @cached
+    async def search_instance_databases(self, name_pattern: str) -> list[str]:
+        """Searches the instance databases by name pattern."""
+        query = self._queries.build_databases_search_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to search instance databases with {name_pattern=}")
+            raise
+        else:
+            return [row["SCHEMA_NAME"] for row in rows]
+
+    @cached
+    async def search_instance_plugins(self, name_pattern: str) -> list[str]:
+        """Searches the instance plugins by name pattern."""
+        query = self._queries.build_plugins_search_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to search instance plugins with {name_pattern=}")
+            raise
+        else:
+            return [row["name"] for row in rows]
+
+    @cached
+    async def search_instance_roles(self, name_pattern: str) -> list[Role]:
+        """Searches the instance roles by name pattern."""
+        query = self._queries.build_roles_search_query(name_pattern)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to search instance roles with {name_pattern=}")
+            raise
+        else:
+            return [Role.from_row(row["user"], row["host"]) for row in rows]
+
+    @cached
+    async def search_instance_users(self, name_pattern: str, attrs: _Attrs = None) -> list[User]:
+        """Searches the instance users by name pattern and attributes."""
+        query = self._queries.build_users_search_query(name_pattern, attrs)
+
+        try:
+            rows = await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to search instance users with {name_pattern=}")
+            raise
+        else:
+            return [User.from_row(row["USER"], row["HOST"], row["ATTRIBUTE"]) for row in rows]
+
+    @invalidating
+    async def start_instance_replication(self) -> None:
+        """Starts instance group replication."""
+        query = "START GROUP_REPLICATION"
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error("Failed to start instance replication")
+            raise
+
+    @invalidating
+    async def stop_instance_replication(self) -> None:
+        """Stops instance group replication."""
+        query = "STOP GROUP_REPLICATION"
+
+        try:
+            await self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error("Failed to stop instance replication")
+            raise
+
+    @invalidating
+    async def stop_instance_processes(self, process_ids: Sequence[int]) -> None:
+        """Kills the instances processes by ID."""
+        if not process_ids:
+            return
+
+        queries = self._queries.build_processes_kill_query(process_ids)
+
+        try:
+            await self._executor.execute_sql(queries)
+        except ExecutionError:
+            logger.error("Failed to kill instance processes")
+            raise
@@ -0,0 +1,138 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import math
+from contextlib import contextmanager
+from typing import Iterator
+
+from ..builders.locking import NamedLockingQueryBuilder
+from ..executors import BaseExecutor, NativeExecutor, PersistentExecutor
+from ..executors.errors import ExecutionError
+from ..executors.metrics import instrumented
+
+logger = logging.getLogger()
+
+# Extra seconds granted to the executor, on top of the server-side lock wait
+_EXECUTION_MARGIN = 5
+
+
+@instrumented
+class NamedLockManager:
+    """Class to acquire and release MySQL user-level locks.
+
+    Lock waits happen server-side, within a single GET_LOCK call, instead of
+    polling a locking table from the client. The locks are held by the executor
+    server session, so it must be kept open for as long as the locks are needed.
+
+    Executors re-open their session after a failure, or a timeout, of any call,
+    silently releasing every lock it held. The session is checked before releasing
+    a lock, so that a lost lock is reported instead of being released by a newer session.
+    """
+
+    def __init__(self, executor: BaseExecutor, builder: NamedLockingQueryBuilder):
+        """Initialize the class.
+
+        Arguments:
+            executor: Executor reusing the same server session across calls
+            builder: Named locking query builder
+        """
+        if not isinstance(executor, (PersistentExecutor, NativeExecutor)):
+            raise ValueError("Named locks require a session persistent executor")
+
+        self._executor = executor
+        self._builder = builder
+        self._sessions = {}
+
+    def acquire(self, task: str, instance: str, timeout: float | None = 0) -> bool:
+        """Acquires a task lock, waiting up to the timeout seconds (forever if None).
+
+        Returns:
+            Whether the lock got acquired
+        """
+        query = self._builder.build_acquire_query(task, instance, timeout)
+        execution_timeout = None if timeout is None else math.ceil(timeout) + _EXECUTION_MARGIN
+
+        try:
+            logger.debug(f"Acquiring lock {task} for instance {instance}")
+            rows = self._executor.execute_sql(query, timeout=execution_timeout)
+        except ExecutionError:
+            logger.error(f"Failed to acquire lock {task} for instance {instance}")
+            raise
+
+        acquired = rows[0]["acquired"] if rows else None
+        if acquired is None:
+            logger.error(f"Failed to acquire lock {task} for instance {instance}")
+            raise ExecutionError()
+
+        if acquired == 1:
+            self._sessions[(task, instance)] = self._executor.session_id
+
+        return acquired == 1
+
+    def release(self, task: str, instance: str) -> bool:
+        """Releases a task lock.
+
+        Returns:
+            Whether the lock got released, being held by the executor session
+        """
+        session_id = self._sessions.pop((task, instance), None)
+        if session_id is not None and session_id != self._executor.session_id:
+            logger.warning(f"Lock {task} for instance {instance} lost with its session")
+            return False
+
+        query = self._builder.build_release_query(task, instance)
+
+        try:
+            logger.debug(f"Releasing lock {task} for instance {instance}")
+            rows = self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to release lock {task} for instance {instance}")
+            raise
+
+        return bool(rows and rows[0]["released"] == 1)
+
+    def is_held(self, task: str, instance: str) -> bool:
+        """Checks whether a task lock is still held by the executor session."""
+        query = self._builder.build_held_query(task, instance)
+
+        try:
+            rows = self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to check lock {task} for instance {instance}")
+            raise
+
+        return bool(rows and rows[0]["held"] == 1)
+
+    def get_holder(self, task: str) -> str | None:
+        """Gets the instance holding a task lock, if any."""
+        query = self._builder.build_fetch_acquired_query(task)
+
+        try:
+            rows = self._executor.execute_sql(query)
+        except ExecutionError:
+            logger.error(f"Failed to fetch lock {task} holder")
+            raise
+
+        return rows[0]["executor"] if rows else None
+
+    @contextmanager
+    def hold(self, task: str, instance: str, timeout: float | None = 0) -> Iterator[None]:
+        """Holds a task lock for the duration of the context.
+
+        Raises:
+            TimeoutError: if the lock is not acquired within the timeout seconds
+            ExecutionError: if the lock is no longer held once acquired
+        """
+        if not self.acquire(task, instance, timeout):
+            raise TimeoutError(f"Lock {task} not acquired within {timeout} seconds")
+
+        if not self.is_held(task, instance):
+            self._sessions.pop((task, instance), None)
+            logger.error(f"Lock {task} for instance {instance} lost once acquired")
+            raise ExecutionError()
+
+        try:
+            yield
+        finally:
+            self.release(task, instance)
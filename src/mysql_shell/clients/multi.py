@@ -0,0 +1,149 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from ..builders import StringQueryQuoter
+from ..executors import BaseExecutor, LocalExecutor
+from ..executors.errors import ExecutionError
+from ..models import ConnectionDetails
+from .instance import MySQLInstanceClient
+
+logger = logging.getLogger()
+
+
+@dataclass
+class InstanceCallResult:
+    """Result of a client method call on a single instance."""
+
+    address: str
+    value: Any = None
+    error: Exception | None = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the call succeeded."""
+        return self.error is None
+
+
+class MultiInstanceClient:
+    """Class to run instance operations on several instances concurrently.
+
+    It holds one MySQLInstanceClient per instance, and runs any of its methods
+    on all of them at once, using a bounded pool of threads. Every call returns
+    the result, or the error, of each instance, keyed by instance address.
+    """
+
+    def __init__(
+        self,
+        conn_details: Sequence[ConnectionDetails],
+        shell_path: str,
+        quoter: StringQueryQuoter,
+        max_workers: int = 8,
+        executor_factory: Callable[[ConnectionDetails], BaseExecutor] | None = None,
+    ):
+        """Initialize the class.
+
+        Arguments:
+            conn_details: Connection details of every instance
+            shell_path: Path to the MySQL Shell binary
+            quoter: Quoter of the query values and identifiers
+            max_workers: Maximum number of instances called at once
+            executor_factory: Optional function to build the executor of each instance
+        """
+        if max_workers < 1:
+            raise ValueError("Max workers must be positive")
+        if not executor_factory:
+            executor_factory = lambda conn: LocalExecutor(conn, shell_path)
+
+        self._executors = {self._address(conn): executor_factory(conn) for conn in conn_details}
+        self._clients = {
+            address: MySQLInstanceClient(executor, quoter)
+            for address, executor in self._executors.items()
+        }
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="mysql-shell-multi")
+
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the client context."""
+        self.close()
+
+    @staticmethod
+    def _address(conn_details: ConnectionDetails) -> str:
+        """Return the address of an instance."""
+        if conn_details.socket:
+            return conn_details.socket
+
+        return f"{conn_details.host}:{conn_details.port}"
+
+    @property
+    def addresses(self) -> list[str]:
+        """Return the address of every instance."""
+        return list(self._clients)
+
+    def close(self) -> None:
+        """Close every instance executor, without waiting for calls past their deadline."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+        for executor in self._executors.values():
+            executor.close()
+
+    def run(
+        self,
+        method: str,
+        *args,
+        timeout: float | None = None,
+        **kwargs,
+    ) -> dict[str, InstanceCallResult]:
+        """Run an instance client method on every instance concurrently.
+
+        Arguments:
+            method: Name of the MySQLInstanceClient method to run
+            args: Positional arguments of the method
+            timeout: Optional seconds to wait for all the instances, as a whole
+            kwargs: Keyword arguments of the method
+
+        Returns:
+            Dictionary of call results, by instance address.
+            Calls not finished within the timeout get an empty ExecutionError,
+            and are left to finish in the background
+        """
+        if method.startswith("_") or not callable(getattr(MySQLInstanceClient, method, None)):
+            raise ValueError(f"Invalid instance client method {method}")
+
+        def call(address: str) -> InstanceCallResult:
+            start = time.perf_counter()
+            result = InstanceCallResult(address=address)
+
+            try:
+                result.value = getattr(self._clients[address], method)(*args, **kwargs)
+            except Exception as e:
+                result.error = e
+            finally:
+                result.seconds = time.perf_counter() - start
+
+            return result
+
+        futures = {address: self._pool.submit(call, address) for address in self._clients}
+        wait_futures(futures.values(), timeout)
+
+        results = {}
+        for address, future in futures.items():
+            if future.done():
+                results[address] = future.result()
+                continue
+
+            logger.error(f"Failed to run {method} on instance {address} within {timeout=}")
+            future.cancel()
+            results[address] = InstanceCallResult(address, error=ExecutionError(), seconds=timeout)
+
+        return results
@@ -0,0 +1,172 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import logging
+import time
+
+from ..executors import BackgroundExecution
+from ..executors.errors import ExecutionCancelledError, ExecutionError
+from ..models.instance import RecoveryProgress
+from .instance import MySQLInstanceClient
+from .instance_async import AsyncMySQLInstanceClient
+
+logger = logging.getLogger()
+
+
+class ClusterOperation:
+    """Handle of a long-running cluster operation, run in the background.
+
+    The operation keeps running within its own MySQL Shell process,
+    while the caller polls it, waits for it, or cancels it.
+    Its progress is reported by the instance being recovered, if a client to it is provided.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        execution: BackgroundExecution,
+        progress_client: MySQLInstanceClient | None = None,
+    ):
+        """Initialize the handle.
+
+        Arguments:
+            name: Description of the operation, used for logging
+            execution: Handle of the MySQL Shell script running the operation
+            progress_client: Optional client to the instance whose recovery is reported
+        """
+        self._name = name
+        self._execution = execution
+        self._progress_client = progress_client
+
+    @property
+    def name(self) -> str:
+        """Return the operation description."""
+        return self._name
+
+    @property
+    def seconds(self) -> float:
+        """Return the seconds since the operation was started."""
+        return self._execution.seconds
+
+    def poll(self) -> bool:
+        """Return whether the operation has finished, either succeeding or failing."""
+        return self._execution.poll()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for the operation to finish.
+
+        Arguments:
+            timeout: Optional seconds to wait, the operation keeps running once they expire
+
+        Raises:
+            TimeoutError: if the operation has not finished within the timeout
+            ExecutionCancelledError: if the operation was cancelled
+            ExecutionError: if the operation failed
+        """
+        try:
+            self._execution.wait(timeout)
+        except ExecutionError:
+            logger.error(f"Failed to {self._name}")
+            raise
+
+    def cancel(self) -> None:
+        """Cancel the operation, stopping its MySQL Shell process.
+
+        Server-side work already started (i.e. a clone) is not rolled back.
+        """
+        logger.warning(f"Cancelling operation to {self._name}")
+        self._execution.cancel()
+
+    def progress(self) -> RecoveryProgress:
+        """Get the recovery progress of the instance the operation is working on.
+
+        The instance may be unreachable while it restarts, after being cloned.
+        """
+        if not self._progress_client:
+            raise ValueError("Operation progress not available without an instance client")
+
+        return self._progress_client.get_instance_recovery_progress()
+
+
+class AsyncClusterOperation:
+    """Handle of a long-running cluster operation, run in the background by an event loop task.
+
+    The operation keeps running within its own MySQL Shell process,
+    while the caller polls it, waits for it, or cancels it.
+    Its progress is reported by the instance being recovered, if a client to it is provided.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        task: asyncio.Task,
+        progress_client: AsyncMySQLInstanceClient | None = None,
+    ):
+        """Initialize the handle.
+
+        Arguments:
+            name: Description of the operation, used for logging
+            task: Task awaiting the MySQL Shell script running the operation
+            progress_client: Optional client to the instance whose recovery is reported
+        """
+        self._name = name
+        self._task = task
+        self._progress_client = progress_client
+        self._start = time.perf_counter()
+
+    @property
+    def name(self) -> str:
+        """Return the operation description."""
+        return self._name
+
+    @property
+    def seconds(self) -> float:
+        """Return the seconds since the operation was started."""
+        return time.perf_counter() - self._start
+
+    def poll(self) -> bool:
+        """Return whether the operation has finished, either succeeding or failing."""
+        return self._task.done()
+
+    async def wait(self, timeout: float | None = None) -> None:
+        """Wait for the operation to finish.
+
+        Arguments:
+            timeout: Optional seconds to wait, the operation keeps running once they expire
+
+        Raises:
+            TimeoutError: if the operation has not finished within the timeout
+            ExecutionCancelledError: if the operation was cancelled
+            ExecutionError: if the operation failed
+        """
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError()
+        except asyncio.CancelledError:
+            if not self._task.cancelled():
+                raise
+            logger.error(f"Failed to {self._name}")
+            raise ExecutionCancelledError()
+        except ExecutionError:
+            logger.error(f"Failed to {self._name}")
+            raise
+
+    def cancel(self) -> None:
+        """Cancel the operation, stopping its MySQL Shell process.
+
+        Server-side work already started (i.e. a clone) is not rolled back.
+        """
+        logger.warning(f"Cancelling operation to {self._name}")
+        self._task.cancel()
+
+    async def progress(self) -> RecoveryProgress:
+        """Get the recovery progress of the instance the operation is working on.
+
+        The instance may be unreachable while it restarts, after being cloned.
+        """
+        if not self._progress_client:
+            raise ValueError("Operation progress not available without an instance client")
+
+        return await self._progress_client.get_instance_recovery_progress()
@@ -0,0 +1,159 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import threading
+from typing import Iterator
+
+from ..executors.errors import ExecutionError
+from ..models.event import (
+    ClusterEvent,
+    ClusterStatusChanged,
+    MemberStateChanged,
+    PrimaryChanged,
+    RouterAdded,
+    RouterRemoved,
+)
+from ..models.topology import ClusterTopology
+from .cluster import MySQLClusterClient
+
+logger = logging.getLogger()
+
+
+class ClusterStatusWatcher:
+    """Class to watch an InnoDB cluster, reporting only its changes.
+
+    Every poll fetches the cluster status (and its routers), and compares it against
+    the previous poll one, emitting one typed event per change. The poll interval is
+    reset to its minimum as soon as a change is detected, and multiplied by the backoff
+    factor after every poll without changes (or failed), up to its maximum.
+
+    The cluster client is best built on top of a PersistentExecutor,
+    so that every poll reuses the same MySQL Shell process.
+    """
+
+    def __init__(
+        self,
+        client: MySQLClusterClient,
+        cluster_name: str,
+        min_interval: float = 1,
+        max_interval: float = 30,
+        backoff: float = 2,
+        watch_routers: bool = True,
+    ):
+        """Initialize the class.
+
+        Arguments:
+            client: Cluster client to poll the status with
+            cluster_name: Name of the cluster to watch
+            min_interval: Seconds between polls while the cluster is changing
+            max_interval: Seconds between polls while the cluster is stable
+            backoff: Factor the interval is multiplied by after every poll without changes
+            watch_routers: Whether to report routers being added or removed
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Poll intervals must be positive, and sorted")
+        if backoff < 1:
+            raise ValueError("Poll backoff factor must be at least 1")
+
+        self._client = client
+        self._cluster_name = cluster_name
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._watch_routers = watch_routers
+        self._interval = min_interval
+        self._topology = None
+        self._routers = None
+
+    @property
+    def interval(self) -> float:
+        """Return the seconds to wait before the next poll."""
+        return self._interval
+
+    @property
+    def topology(self) -> ClusterTopology | None:
+        """Return the topology fetched by the last successful poll."""
+        return self._topology
+
+    def _diff_topology(self, old: ClusterTopology, new: ClusterTopology) -> list[ClusterEvent]:
+        """Compute the events between two topologies."""
+        name = self._cluster_name
+        events = []
+
+        if old.status != new.status:
+            events.append(ClusterStatusChanged(name, old.status, new.status))
+
+        old_primary = old.primary_member.address if old.primary_member else None
+        new_primary = new.primary_member.address if new.primary_member else None
+        if old_primary != new_primary:
+            events.append(PrimaryChanged(name, old_primary, new_primary))
+
+        addresses = [m.address for m in old.members]
+        addresses += [m.address for m in new.members if not old.get_member(m.address)]
+
+        for address in addresses:
+            old_member = old.get_member(address)
+            new_member = new.get_member(address)
+            old_state = old_member.state if old_member else None
+            new_state = new_member.state if new_member else None
+
+            if old_member and new_member and old_state == new_state:
+                continue
+
+            label = (new_member or old_member).label
+            events.append(MemberStateChanged(name, address, label, old_state, new_state))
+
+        return events
+
+    def _diff_routers(self, old: set[str], new: set[str]) -> list[ClusterEvent]:
+        """Compute the events between two sets of routers."""
+        name = self._cluster_name
+        events = [RouterAdded(name, router) for router in sorted(new - old)]
+        events += [RouterRemoved(name, router) for router in sorted(old - new)]
+        return events
+
+    def poll(self) -> list[ClusterEvent]:
+        """Poll the cluster once, returning the events since the previous poll.
+
+        The first poll only records the cluster state, returning no events.
+        Failed polls are logged, and return no events either.
+        """
+        try:
+            topology = self._client.fetch_cluster_topology(self._cluster_name)
+            routers = None
+            if self._watch_routers:
+                routers = self._client.list_cluster_routers(self._cluster_name)
+                routers = set(routers.get("routers", {}))
+        except ExecutionError:
+            logger.warning(f"Failed to poll cluster {self._cluster_name}")
+            self._interval = min(self._interval * self._backoff, self._max_interval)
+            return []
+
+        events = []
+        if self._topology is not None:
+            events += self._diff_topology(self._topology, topology)
+        if self._routers is not None and routers is not None:
+            events += self._diff_routers(self._routers, routers)
+
+        self._topology = topology
+        self._routers = routers
+
+        if events:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * self._backoff, self._max_interval)
+
+        return events
+
+    def watch(self, stop: threading.Event | None = None) -> Iterator[ClusterEvent]:
+        """Poll the cluster until stopped, yielding every event as detected.
+
+        Arguments:
+            stop: Optional event to set in order to stop watching
+        """
+        stop = stop or threading.Event()
+
+        while not stop.is_set():
+            yield from self.poll()
+            stop.wait(self._interval)
@@ -1,5 +1,14 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from .base import BaseExecutor
-from .local import LocalExecutor
+from .background import BackgroundExecution
+from .base import AsyncBaseExecutor, BaseExecutor
+from .cancellation import CancellationToken
+from .coalescing import CoalescingExecutor, CoalescingExecutorStats
+from .local import LocalExecutor, ScriptTransport
+from .local_async import AsyncLocalExecutor
+from .metrics import ChainedHooks, ExecutorHooks, MetricsRegistry
+from .native import NativeExecutor
+from .persistent import PersistentExecutor
+from .pool import ExecutorPool, ExecutorPoolStats
+from .recording import RecordingExecutor, ReplayExecutor
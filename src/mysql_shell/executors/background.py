@@ -0,0 +1,115 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import subprocess
+import threading
+import time
+from typing import Callable
+
+from .errors import ExecutionCancelledError, ExecutionError
+from .metrics import ExecutorHooks, current_operation
+
+
+class BackgroundExecution:
+    """Handle of a MySQL Shell script running in the background.
+
+    The process output is collected by a dedicated thread, so that the process
+    never blocks on a full pipe, while the caller keeps doing other work.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        stdin: str,
+        parse_output: Callable[[str], str],
+        parse_error: Callable[[str], dict],
+        hooks: ExecutorHooks,
+        cleanup: Callable[[], None] | None = None,
+    ):
+        """Initialize the handle.
+
+        Arguments:
+            process: MySQL Shell process, already spawned
+            stdin: Standard input contents of the process
+            parse_output: Function to parse the process output once succeeded
+            parse_error: Function to parse the process output once failed
+            hooks: Instrumentation hooks of the spawning executor
+            cleanup: Optional function to release the script resources, once finished
+        """
+        self._process = process
+        self._parse_output = parse_output
+        self._parse_error = parse_error
+        self._hooks = hooks
+        self._cleanup = cleanup
+        self._operation = current_operation() or "start_py"
+        self._start = time.perf_counter()
+        self._output = ""
+        self._cancelled = False
+        self._thread = threading.Thread(
+            target=self._communicate,
+            args=(stdin,),
+            name="mysql-shell-background",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _communicate(self, stdin: str) -> None:
+        """Feed the process input, and collect its output until it exits."""
+        try:
+            output, _ = self._process.communicate(stdin)
+            self._output = output or ""
+        finally:
+            if self._cleanup:
+                self._cleanup()
+
+        self._hooks.on_phase(self._operation, "run", time.perf_counter() - self._start)
+        self._hooks.on_output(self._operation, self._output)
+
+    @property
+    def seconds(self) -> float:
+        """Return the seconds since the script was started."""
+        return time.perf_counter() - self._start
+
+    def poll(self) -> bool:
+        """Return whether the script has finished, either succeeding or failing."""
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> str:
+        """Wait for the script to finish, returning its output.
+
+        Arguments:
+            timeout: Optional seconds to wait, the script keeps running once they expire
+
+        Raises:
+            TimeoutError: if the script has not finished within the timeout
+            ExecutionCancelledError: if the script was cancelled
+            ExecutionError: if the script failed
+        """
+        self._thread.join(timeout)
+
+        if self._thread.is_alive():
+            raise TimeoutError()
+        if self._cancelled:
+            raise ExecutionCancelledError()
+        if self._process.returncode:
+            raise ExecutionError(self._parse_error(self._output))
+
+        return self._parse_output(self._output)
+
+    def cancel(self, grace: float = 5) -> None:
+        """Stop the script, killing its process if still running after the grace seconds.
+
+        Server-side work already started by the script (i.e. a clone) is not rolled back.
+        """
+        if self.poll():
+            return
+
+        self._cancelled = True
+        self._process.terminate()
+
+        try:
+            self._process.wait(grace)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+        self._thread.join()
@@ -1,36 +1,217 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import time
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Iterator, Sequence
 
-from ..models import ConnectionDetails
+from ..models import ConnectionDetails, StatementResult
+from .background import BackgroundExecution
+from .cancellation import CancellationToken
+from .errors import ExecutionCancelledError, ExecutionError
+from .metrics import ExecutorHooks, chain_hooks, unchain_hooks
+
+
+def cancel_kwargs(cancel: CancellationToken | None) -> dict:
+    """Return the cancellation keyword argument, only if a token is provided.
+
+    Wrapping executors pass it this way, so that wrapped executors predating
+    cancellation tokens keep working, as long as no token is used.
+    """
+    return {} if cancel is None else {"cancel": cancel}
 
 
 class BaseExecutor(ABC):
-    """Base class for all MySQL Shell executors."""
+    """Base class for all MySQL Shell executors.
+
+    Executions accept an optional cancellation token,
+    which executors unable to cancel their executions ignore.
+    """
 
-    def __init__(self, conn_details: ConnectionDetails, shell_path: str):
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        hooks: ExecutorHooks | None = None,
+    ):
         """Initialize the executor."""
         self._conn_details = conn_details
         self._shell_path = shell_path
+        self._hooks = hooks or ExecutorHooks()
 
     @property
     def connection_details(self) -> ConnectionDetails:
         """Return the connection details."""
         return self._conn_details
 
+    @property
+    def hooks(self) -> ExecutorHooks:
+        """Return the instrumentation hooks."""
+        return self._hooks
+
+    def add_hooks(self, hooks: ExecutorHooks) -> None:
+        """Add instrumentation hooks, invoked after the existing ones."""
+        self._hooks = chain_hooks(self._hooks, hooks)
+
+    def remove_hooks(self, hooks: ExecutorHooks) -> None:
+        """Remove previously added instrumentation hooks."""
+        self._hooks = unchain_hooks(self._hooks, hooks)
+
+    def close(self) -> None:
+        """Close any resource held by the executor."""
+        pass
+
     @abstractmethod
     def check_connection(self) -> None:
         """Check the connection."""
         raise NotImplementedError()
 
     @abstractmethod
-    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
         """Execute a Python script."""
         raise NotImplementedError()
 
     @abstractmethod
-    def execute_sql(self, script: str, *, timeout: int | None = None) -> Sequence[dict]:
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> Sequence[dict]:
         """Execute a SQL script."""
         raise NotImplementedError()
+
+    def start_py(self, script: str) -> BackgroundExecution:
+        """Start a Python script in the background, returning its handle.
+
+        Executors able to run scripts in the background should override this method.
+        """
+        raise NotImplementedError()
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows.
+
+        Executors able to stream the rows should override this method,
+        by default, the whole list of rows is fetched first.
+        """
+        yield from self.execute_sql(script, timeout=timeout)
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, returning one result per statement.
+
+        Executors able to run the whole batch at once should override this method,
+        by default, the statements are executed one by one, within the batch timeout.
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        results = [StatementResult(statement=s, executed=False) for s in statements]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        for result in results:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            result.executed = True
+
+            try:
+                rows = self.execute_sql(
+                    result.statement, timeout=remaining, **cancel_kwargs(cancel)
+                )
+                result.rows = list(rows)
+            except ExecutionCancelledError:
+                raise
+            except ExecutionError as e:
+                result.error = {"message": str(e)}
+                if not force:
+                    break
+
+        return results
+
+
+class AsyncBaseExecutor(ABC):
+    """Base class for all asynchronous MySQL Shell executors."""
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        hooks: ExecutorHooks | None = None,
+    ):
+        """Initialize the executor."""
+        self._conn_details = conn_details
+        self._shell_path = shell_path
+        self._hooks = hooks or ExecutorHooks()
+
+    @property
+    def connection_details(self) -> ConnectionDetails:
+        """Return the connection details."""
+        return self._conn_details
+
+    @property
+    def hooks(self) -> ExecutorHooks:
+        """Return the instrumentation hooks."""
+        return self._hooks
+
+    def add_hooks(self, hooks: ExecutorHooks) -> None:
+        """Add instrumentation hooks, invoked after the existing ones."""
+        self._hooks = chain_hooks(self._hooks, hooks)
+
+    def remove_hooks(self, hooks: ExecutorHooks) -> None:
+        """Remove previously added instrumentation hooks."""
+        self._hooks = unchain_hooks(self._hooks, hooks)
+
+    @abstractmethod
+    async def check_connection(self) -> None:
+        """Check the connection."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def execute_sql(self, script: str, *, timeout: int | None = None) -> Sequence[dict]:
+        """Execute a SQL script."""
+        raise NotImplementedError()
+
+    async def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, returning one result per statement.
+
+        Executors able to run the whole batch at once should override this method,
+        by default, the statements are executed one by one, within the batch timeout.
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        results = [StatementResult(statement=s, executed=False) for s in statements]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        for result in results:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            result.executed = True
+
+            try:
+                rows = await self.execute_sql(result.statement, timeout=remaining)
+                result.rows = list(rows)
+            except ExecutionError as e:
+                result.error = {"message": str(e)}
+                if not force:
+                    break
+
+        return results
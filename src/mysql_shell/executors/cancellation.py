@@ -0,0 +1,56 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import threading
+from typing import Callable
+
+
+class CancellationToken:
+    """Token to cancel in-flight executions cooperatively, from any thread.
+
+    Executions register a callback while running, which is called as soon as
+    the token is cancelled (or right away, if it was cancelled before).
+    """
+
+    def __init__(self):
+        """Initialize the token."""
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Return whether the token has been cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel every execution using the token."""
+        with self._lock:
+            if self._cancelled:
+                return
+
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            callback()
+
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback to be called upon cancellation.
+
+        Returns:
+            Function to unregister the callback, once the execution is over
+        """
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return lambda: self._unregister(callback)
+
+        callback()
+        return lambda: None
+
+    def _unregister(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
@@ -0,0 +1,259 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import copy
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence
+
+from ..models import StatementResult
+from .background import BackgroundExecution
+from .base import BaseExecutor, cancel_kwargs
+from .cancellation import CancellationToken
+from .errors import ExecutionError
+from .metrics import current_operation, instrument, timed
+
+# Leading keywords of the statements that do not modify any data
+_READ_ONLY_SQL_KEYWORDS = ("SELECT", "SHOW", "DESCRIBE", "DESC", "EXPLAIN", "WITH", "TABLE")
+
+# Clauses and functions with side effects, or whose result is specific to each caller
+_UNSHAREABLE_SQL = re.compile(
+    r"\bFOR\s+(UPDATE|SHARE)\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|\bINTO\b|(?<!@)@(?!@)"
+    r"|\b(GET_LOCK|RELEASE_LOCK|RELEASE_ALL_LOCKS|SLEEP|CONNECTION_ID|LAST_INSERT_ID"
+    r"|FOUND_ROWS|ROW_COUNT|RAND|UUID|UUID_SHORT)\s*\(",
+    re.IGNORECASE,
+)
+
+_SQL_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`")
+
+# AdminAPI methods that do not modify the cluster, nor the instances
+_READ_ONLY_PY_METHODS = (
+    "get_cluster",
+    "get_cluster_set",
+    "get_replica_set",
+    "status",
+    "describe",
+    "options",
+    "list_routers",
+    "check_instance_configuration",
+)
+
+_PY_CALL = re.compile(r"^(?:\w+\s*=\s*)?(?:\w+\.)*(?P<method>\w+)\([^()]*\)$")
+_PY_PRINT = re.compile(r"^print\(\w+\)$")
+
+
+def _is_read_only_sql(script: str) -> bool:
+    """Return whether every statement of a SQL script is read-only, and safe to share."""
+    script = _SQL_LITERAL.sub("''", script)
+    statements = [s.strip() for s in script.split(";") if s.strip()]
+
+    if not statements or _UNSHAREABLE_SQL.search(script):
+        return False
+
+    return all(s.split()[0].upper() in _READ_ONLY_SQL_KEYWORDS for s in statements)
+
+
+def _is_read_only_py(script: str) -> bool:
+    """Return whether every line of a Python script is a read-only AdminAPI call, or a print."""
+    lines = [line.strip() for line in script.splitlines() if line.strip()]
+
+    if not lines:
+        return False
+
+    for line in lines:
+        if _PY_PRINT.match(line):
+            continue
+        match = _PY_CALL.match(line)
+        if not match or match.group("method") not in _READ_ONLY_PY_METHODS:
+            return False
+
+    return True
+
+
+@dataclass
+class CoalescingExecutorStats:
+    """Coalescing executor usage statistics."""
+
+    executions: int
+    coalesced: int
+    in_flight: int
+
+    @property
+    def coalesce_ratio(self) -> float:
+        """Return the ratio of shareable calls served by another caller execution."""
+        calls = self.executions + self.coalesced
+        return self.coalesced / calls if calls else 0.0
+
+
+class _Flight:
+    """Execution shared by every concurrent caller of the same call."""
+
+    def __init__(self):
+        """Initialize the flight."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class CoalescingExecutor(BaseExecutor):
+    """Executor sharing a single execution across concurrent identical read-only calls.
+
+    The first caller of a read-only script runs it through the wrapped executor,
+    while any other caller of the same script (and method) waits for that execution to finish,
+    getting a copy of its result, or the same error. The first caller timeout applies
+    to the shared execution, the rest of the callers only bound their wait with theirs.
+
+    Only SQL scripts made of read-only statements, and Python scripts made of
+    read-only AdminAPI calls, are shared. Any other script runs on its own,
+    and so do calls with a cancellation token, as they must not cancel other callers.
+    """
+
+    def __init__(self, executor: BaseExecutor):
+        """Initialize the executor.
+
+        Arguments:
+            executor: Executor to run the scripts with
+        """
+        super().__init__(executor.connection_details, "", executor.hooks)
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._executions = 0
+        self._coalesced = 0
+
+    def __enter__(self):
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the executor context."""
+        self.close()
+
+    def _coalesce(self, method: str, key: tuple, timeout: int | None, call: Callable) -> Any:
+        """Run a call, or wait for the identical call already in flight."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if leader:
+            try:
+                result = call()
+                flight.result = copy.deepcopy(result)
+                return result
+            except Exception as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        with instrument(self._hooks, method, False):
+            with timed(self._hooks, "coalesce"):
+                finished = flight.done.wait(timeout)
+
+            if not finished:
+                error = ExecutionError()
+                self._hooks.on_error(current_operation(), error)
+                raise error
+
+        if isinstance(flight.error, ExecutionError):
+            raise ExecutionError(flight.error.args[0]) from flight.error
+        if flight.error is not None:
+            raise flight.error
+
+        return copy.deepcopy(flight.result)
+
+    def stats(self) -> CoalescingExecutorStats:
+        """Return the executor usage statistics."""
+        with self._lock:
+            return CoalescingExecutorStats(
+                executions=self._executions,
+                coalesced=self._coalesced,
+                in_flight=len(self._flights),
+            )
+
+    def close(self) -> None:
+        """Close the wrapped executor."""
+        self._executor.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        self._coalesce(
+            "check_connection",
+            ("check_connection",),
+            None,
+            lambda: self._executor.check_connection(),
+        )
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script, sharing its execution if read-only."""
+        if cancel is not None or not _is_read_only_py(script):
+            return self._executor.execute_py(script, timeout=timeout, **cancel_kwargs(cancel))
+
+        return self._coalesce(
+            "execute_py",
+            ("execute_py", script),
+            timeout,
+            lambda: self._executor.execute_py(script, timeout=timeout),
+        )
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script, sharing its execution if read-only."""
+        if cancel is not None or not _is_read_only_sql(script):
+            return self._executor.execute_sql(script, timeout=timeout, **cancel_kwargs(cancel))
+
+        return self._coalesce(
+            "execute_sql",
+            ("execute_sql", script),
+            timeout,
+            lambda: self._executor.execute_sql(script, timeout=timeout),
+        )
+
+    def start_py(self, script: str) -> BackgroundExecution:
+        """Start a Python script in the background, without sharing it."""
+        return self._executor.start_py(script)
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows without sharing them."""
+        yield from self._executor.iter_sql(script, timeout=timeout)
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, sharing its execution if read-only."""
+        statements = list(statements)
+        if cancel is not None or not all(_is_read_only_sql(s) for s in statements):
+            return self._executor.execute_sql_batch(
+                statements, timeout=timeout, force=force, **cancel_kwargs(cancel)
+            )
+
+        return self._coalesce(
+            "execute_sql_batch",
+            ("execute_sql_batch", tuple(statements), force),
+            timeout,
+            lambda: self._executor.execute_sql_batch(statements, timeout=timeout, force=force),
+        )
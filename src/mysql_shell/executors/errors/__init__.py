@@ -1,4 +1,4 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from .runtime import ExecutionError
+from .runtime import ExecutionCancelledError, ExecutionError
@@ -13,3 +13,7 @@ class ExecutionError(RuntimeError):
             message = message.get("message")
 
         super().__init__(message)
+
+
+class ExecutionCancelledError(ExecutionError):
+    """MySQL shell execution cancelled through its cancellation token."""
@@ -1,22 +1,63 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import codecs
 import json
+import logging
+import os
 import re
+import select
 import subprocess
-from typing import Generator
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager, suppress
+from enum import Enum
+from typing import Generator, Iterator, Sequence
 
-from ..models import ConnectionDetails
+from ..models import ConnectionDetails, StatementResult
+from .background import BackgroundExecution
 from .base import BaseExecutor
-from .errors import ExecutionError
+from .cancellation import CancellationToken
+from .errors import ExecutionCancelledError, ExecutionError
+from .metrics import ExecutorHooks, current_operation, instrument, operation, timed
+from .streaming import ShellOutputStream
 
+logger = logging.getLogger()
 
-class LocalExecutor(BaseExecutor):
-    """Local executor for the MySQL Shell."""
+# Name under which the scripts report their server connection ID, before running
+_CONNECTION_ID_KEY = "mysql_shell_connection_id"
+_CONNECTION_ID_SCRIPTS = {
+    "sql": f"SELECT CONNECTION_ID() AS {_CONNECTION_ID_KEY};\n",
+    "py": (
+        f"print('{{\"{_CONNECTION_ID_KEY}\": %d}}' % "
+        f"session.run_sql('SELECT CONNECTION_ID()').fetch_one()[0])\n"
+    ),
+}
+
+# Seconds to wait for a server connection to be killed
+_KILL_TIMEOUT = 10
+
+
+class ScriptTransport(str, Enum):
+    """Ways of passing the scripts into the MySQL Shell process.
+
+    ARGV: as a command line argument, limited in size and visible in the process list.
+    STDIN: through the standard input, right after the password.
+    FILE: through a temporary file, only readable by the current user.
+    """
+
+    ARGV = "argv"
+    STDIN = "stdin"
+    FILE = "file"
 
-    def __init__(self, conn_details: ConnectionDetails, shell_path: str):
-        """Initialize the executor."""
-        super().__init__(conn_details, shell_path)
+
+class LocalShellMixin:
+    """Mixin with the argument building and output parsing of local MySQL Shell executors."""
+
+    _conn_details: ConnectionDetails
+    _shell_path: str
+    _transport: ScriptTransport = ScriptTransport.ARGV
 
     def _common_args(self) -> list[str]:
         """Return the list of common arguments."""
@@ -41,9 +82,51 @@ class LocalExecutor(BaseExecutor):
                 f"--user={self._conn_details.username}",
             ]
 
+    @staticmethod
+    def _terminate_script(lang: str, script: str) -> str:
+        """Terminate the last SQL statement of a script not passed as an argument.
+
+        Those scripts are read in batch mode, where statements only run once delimited.
+        """
+        if lang == "sql" and not script.rstrip().endswith(";"):
+            return script + ";"
+
+        return script
+
+    @contextmanager
+    def _script_args(self, lang: str, script: str) -> Generator[list[str], None, None]:
+        """Yield the list of arguments passing the script, according to the transport."""
+        if self._transport == ScriptTransport.STDIN:
+            yield [f"--{lang}"]
+        elif self._transport == ScriptTransport.FILE:
+            with tempfile.NamedTemporaryFile("w", prefix="mysqlsh-", suffix=f".{lang}") as file:
+                file.write(self._terminate_script(lang, script))
+                file.flush()
+                yield [f"--{lang}", "--file", file.name]
+        else:
+            yield [f"--{lang}", "--execute", script]
+
+    def _stdin_input(self, lang: str | None = None, script: str | None = None) -> str:
+        """Return the standard input contents, according to the transport."""
+        if self._transport != ScriptTransport.STDIN or script is None:
+            return self._conn_details.password
+
+        # Python scripts are read line by line from stdin, as in interactive mode,
+        # so they are wrapped into a single statement to preserve their block structure
+        if lang == "py":
+            script = f"exec({script!r})"
+
+        script = self._terminate_script(lang, script)
+        return f"{self._conn_details.password}\n{script}\n"
+
     def _parse_error(self, output: str) -> dict:
         """Parse the execution error."""
-        error = next(self._iter_output(output, "error"), None)
+        try:
+            error = next(self._iter_output(output, "error"), None)
+        except json.JSONDecodeError:
+            # The process may have crashed half-way through printing a document
+            error = None
+
         if not error:
             error = {}
 
@@ -65,6 +148,51 @@ class LocalExecutor(BaseExecutor):
 
         return result
 
+    @staticmethod
+    def _parse_output_batch(output: str, statements: Sequence[str]) -> list[StatementResult]:
+        """Parse the SQL batch execution output, in order.
+
+        The output is expected to contain one result or error document per executed statement,
+        preceded by the document of a sentinel statement, used to detect connection errors.
+        """
+        docs = []
+
+        for log in output.split("\n"):
+            if not log:
+                continue
+
+            log = json.loads(log)
+            if "error" in log or "hasData" in log:
+                docs.append(log)
+
+        if not docs or "error" in docs[0]:
+            raise ExecutionError(docs[0]["error"] if docs else None)
+
+        results = [StatementResult(statement=s, executed=False) for s in statements]
+
+        for result, doc in zip(results, docs[1:]):
+            result.executed = True
+            result.error = doc.get("error")
+            result.rows = doc.get("rows") or []
+            result.warnings = doc.get("warnings") or []
+            result.affected_rows = doc.get("affectedItemsCount", doc.get("affectedRowCount", 0))
+
+        return results
+
+    @staticmethod
+    def _parse_connection_id(log: str) -> int | None:
+        """Parse the server connection ID out of an output line, if reported by it."""
+        if _CONNECTION_ID_KEY not in log:
+            return None
+
+        try:
+            doc = json.loads(log)
+            if doc.get("rows"):
+                return int(doc["rows"][0][_CONNECTION_ID_KEY])
+            return int(json.loads(doc["info"])[_CONNECTION_ID_KEY])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+
     @staticmethod
     def _iter_output(output: str, key: str) -> Generator:
         """Iterates over the log lines in reversed order."""
@@ -95,6 +223,189 @@ class LocalExecutor(BaseExecutor):
 
         return error
 
+
+class LocalExecutor(LocalShellMixin, BaseExecutor):
+    """Local executor for the MySQL Shell."""
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        hooks: ExecutorHooks | None = None,
+        transport: ScriptTransport = ScriptTransport.ARGV,
+        kill_on_timeout: bool = False,
+    ):
+        """Initialize the executor.
+
+        Arguments:
+            conn_details: Connection details
+            shell_path: Path to the MySQL Shell binary
+            hooks: Optional instrumentation hooks
+            transport: Way of passing the scripts into the MySQL Shell process
+            kill_on_timeout: Whether to kill the server connection of the calls timing out
+        """
+        super().__init__(conn_details, shell_path, hooks)
+        self._transport = transport
+        self._kill_on_timeout = kill_on_timeout
+
+    def _run(
+        self, command: list[str], timeout: int | None = None, stdin: str | None = None
+    ) -> str:
+        """Run a MySQL Shell command, mimicking the subprocess.check_output behavior.
+
+        The spawn phase only covers the process creation,
+        the server authentication is part of the run phase.
+        """
+        with timed(self._hooks, "spawn"):
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+
+        start = time.perf_counter()
+
+        try:
+            output, _ = process.communicate(stdin or self._stdin_input(), timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+            raise subprocess.TimeoutExpired(command, timeout)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+
+        self._hooks.on_phase(current_operation(), "run", time.perf_counter() - start)
+        self._hooks.on_output(current_operation(), output)
+
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, output)
+
+        return output
+
+    def _run_killable(
+        self,
+        command: list[str],
+        timeout: int | None,
+        stdin: str,
+        cancel: CancellationToken | None,
+    ) -> str:
+        """Run a MySQL Shell command whose script reports its server connection ID first.
+
+        The connection is killed, freeing the work still running server-side,
+        whenever the command times out or gets cancelled.
+        """
+        with timed(self._hooks, "spawn"):
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+
+        start = time.perf_counter()
+        lines = []
+        connection_ids = []
+
+        def read() -> None:
+            for line in process.stdout:
+                connection_id = self._parse_connection_id(line)
+                if connection_id is None:
+                    lines.append(line)
+                else:
+                    connection_ids.append(connection_id)
+
+        # The input is written concurrently, as large scripts could fill the pipes otherwise
+        reader = threading.Thread(target=read, daemon=True)
+        writer = threading.Thread(target=self._write_stdin, args=(process, stdin), daemon=True)
+        reader.start()
+        writer.start()
+        unregister = cancel.register(process.kill) if cancel else lambda: None
+        timed_out = False
+
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            process.kill()
+            process.wait()
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            unregister()
+            reader.join()
+            process.stdout.close()
+
+        cancelled = cancel is not None and cancel.cancelled and process.returncode < 0
+
+        if timed_out or cancelled:
+            self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+            self._kill_connection(connection_ids[0] if connection_ids else None)
+        if timed_out:
+            raise subprocess.TimeoutExpired(command, timeout)
+        if cancelled:
+            raise ExecutionCancelledError()
+
+        output = "".join(lines)
+        self._hooks.on_phase(current_operation(), "run", time.perf_counter() - start)
+        self._hooks.on_output(current_operation(), output)
+
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, output)
+
+        return output
+
+    def _kill_connection(self, connection_id: int | None) -> None:
+        """Kill a server connection, and the statement it runs. Failures are only logged."""
+        if connection_id is None:
+            return
+
+        command = [
+            *self._common_args(),
+            *self._connection_args(),
+            "--sql",
+            "--execute",
+            f"KILL CONNECTION {int(connection_id)}",
+        ]
+
+        try:
+            with operation("kill_connection"):
+                self._run(command, _KILL_TIMEOUT, self._conn_details.password)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            logger.warning(f"Failed to kill server connection {connection_id}")
+
+    def _run_script(
+        self,
+        lang: str,
+        script: str,
+        extra_args: Sequence[str],
+        timeout: int | None,
+        cancel: CancellationToken | None,
+    ) -> str:
+        """Run a script, reporting its server connection ID first if it may need to be killed."""
+        killable = cancel is not None or self._kill_on_timeout
+        if killable:
+            script = _CONNECTION_ID_SCRIPTS[lang] + script
+
+        with self._script_args(lang, script) as args:
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *extra_args,
+                *args,
+            ]
+            stdin = self._stdin_input(lang, script)
+
+            if killable:
+                return self._run_killable(command, timeout, stdin, cancel)
+
+            return self._run(command, timeout, stdin)
+
     def check_connection(self) -> None:
         """Check the connection."""
         command = [
@@ -102,24 +413,28 @@ class LocalExecutor(BaseExecutor):
             *self._connection_args(),
         ]
 
-        try:
-            subprocess.check_output(
-                command,
-                input=self._conn_details.password,
-                text=True,
-            )
-        except subprocess.CalledProcessError as exc:
-            err = self._parse_error(exc.output)
-            raise ExecutionError(err)
-        except subprocess.TimeoutExpired:
-            raise ExecutionError()
+        with instrument(self._hooks, "check_connection"):
+            try:
+                self._run(command)
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                raise ExecutionError(err)
+            except subprocess.TimeoutExpired:
+                raise ExecutionError()
 
-    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
         """Execute a Python script.
 
         Arguments:
             script: Python script to execute
             timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
 
         Returns:
             String with the output of the MySQL Shell command.
@@ -129,60 +444,227 @@ class LocalExecutor(BaseExecutor):
         # Cannot be set on command line as it conflicts with --passwords-from-stdin.
         script = "shell.options.set('useWizards', False)\n" + script
 
-        command = [
-            *self._common_args(),
-            *self._connection_args(),
-            "--py",
-            "--execute",
-            script,
-        ]
+        with instrument(self._hooks, "execute_py"):
+            try:
+                output = self._run_script("py", script, [], timeout, cancel)
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                raise ExecutionError(err)
+            except subprocess.TimeoutExpired:
+                raise ExecutionError()
 
-        try:
-            output = subprocess.check_output(
-                command,
-                timeout=timeout,
-                input=self._conn_details.password,
-                text=True,
+            with timed(self._hooks, "parse"):
+                return self._parse_output_py(output)
+
+    def start_py(self, script: str) -> BackgroundExecution:
+        """Start a Python script in the background.
+
+        Arguments:
+            script: Python script to execute
+
+        Returns:
+            Handle of the running script, whose output is parsed as in execute_py
+        """
+        script = "shell.options.set('useWizards', False)\n" + script
+
+        # The script resources (i.e. the temporary file) must outlive this call
+        with ExitStack() as stack:
+            args = stack.enter_context(self._script_args("py", script))
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *args,
+            ]
+
+            with instrument(self._hooks, "start_py"), timed(self._hooks, "spawn"):
+                process = subprocess.Popen(
+                    command,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+
+            return BackgroundExecution(
+                process=process,
+                stdin=self._stdin_input("py", script),
+                parse_output=self._parse_output_py,
+                parse_error=self._parse_error,
+                hooks=self._hooks,
+                cleanup=stack.pop_all().close,
             )
-        except subprocess.CalledProcessError as exc:
-            err = self._parse_error(exc.output)
-            raise ExecutionError(err)
-        except subprocess.TimeoutExpired:
-            raise ExecutionError()
-        else:
-            return self._parse_output_py(output)
 
-    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
         """Execute a SQL script.
 
         Arguments:
             script: SQL script to execute
             timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
 
         Returns:
             List of dictionaries, one per returned row
         """
-        command = [
-            *self._common_args(),
-            *self._connection_args(),
-            "--sql",
-            "--execute",
-            script,
-        ]
+        with instrument(self._hooks, "execute_sql"):
+            try:
+                output = self._run_script("sql", script, [], timeout, cancel)
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                exc = self._strip_password(exc)
+                raise ExecutionError(err) from exc
+            except subprocess.TimeoutExpired as exc:
+                exc = self._strip_password(exc)
+                raise ExecutionError() from exc
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_sql(output)
+
+    @staticmethod
+    def _iter_stream(process: subprocess.Popen, deadline: float | None) -> Iterator[tuple]:
+        """Iterate over the events decoded from the process output, as it is read."""
+        stream = ShellOutputStream()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        fd = process.stdout.fileno()
+
+        while True:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                raise TimeoutError()
+
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                continue
+
+            chunk = os.read(fd, 65536)
+            text = decoder.decode(chunk, final=not chunk)
+            yield from stream.feed(text, eof=not chunk)
+
+            if not chunk:
+                return
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows as they are decoded.
+
+        The MySQL Shell process is killed if the iteration is stopped before its end.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            Iterator of dictionaries, one per returned row, across all the result sets
+        """
+        # Generators run in their consumer context, so the operation is captured up front
+        operation = current_operation() or "iter_sql"
+
+        with self._script_args("sql", script) as args:
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *args,
+            ]
+
+            yield from self._iter_command(command, operation, timeout, script)
+
+    @staticmethod
+    def _write_stdin(process: subprocess.Popen, data: bytes) -> None:
+        """Write the standard input contents, closing it afterwards."""
+        with suppress(BrokenPipeError):
+            process.stdin.write(data)
+            process.stdin.close()
+
+    def _iter_command(
+        self,
+        command: list[str],
+        operation: str,
+        timeout: int | None,
+        script: str,
+    ) -> Iterator[dict]:
+        """Run a MySQL Shell command, iterating over the returned rows as they are decoded."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = time.perf_counter()
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        error = None
+
+        # The input is written concurrently, as large scripts could fill the pipes otherwise
+        stdin = self._stdin_input("sql", script).encode()
+        writer = threading.Thread(target=self._write_stdin, args=(process, stdin), daemon=True)
+        writer.start()
 
         try:
-            output = subprocess.check_output(
-                command,
-                timeout=timeout,
-                input=self._conn_details.password,
-                text=True,
-            )
-        except subprocess.CalledProcessError as exc:
-            err = self._parse_error(exc.output)
-            exc = self._strip_password(exc)
-            raise ExecutionError(err) from exc
-        except subprocess.TimeoutExpired as exc:
+            for kind, value in self._iter_stream(process, deadline):
+                if kind == "row":
+                    yield value
+                elif "error" in value:
+                    error = value["error"]
+
+            self._hooks.on_phase(operation, "run", time.perf_counter() - start)
+
+            if process.wait() != 0:
+                exc = subprocess.CalledProcessError(process.returncode, command)
+                exc = self._strip_password(exc)
+                error = ExecutionError(error)
+                self._hooks.on_error(operation, error)
+                raise error from exc
+        except TimeoutError:
+            self._hooks.on_phase(operation, "timeout", time.perf_counter() - start)
+            exc = subprocess.TimeoutExpired(command, timeout)
             exc = self._strip_password(exc)
-            raise ExecutionError() from exc
-        else:
-            return self._parse_output_sql(output)
+            error = ExecutionError()
+            self._hooks.on_error(operation, error)
+            raise error from exc
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            writer.join()
+            process.stdout.close()
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements within a single MySQL Shell invocation.
+
+        Arguments:
+            statements: SQL statements to execute, in order
+            timeout: Optional timeout seconds
+            force: Whether to keep executing statements after an error
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            List of statement results, one per provided statement
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        if not statements:
+            return []
+
+        script = ";".join(("DO 0", *statements))
+
+        extra_args = ["--force"] if force else []
+
+        with instrument(self._hooks, "execute_sql_batch"):
+            try:
+                output = self._run_script("sql", script, extra_args, timeout, cancel)
+            except subprocess.CalledProcessError as exc:
+                output = exc.output
+                exc = self._strip_password(exc)
+                try:
+                    return self._parse_output_batch(output, statements)
+                except ExecutionError as err:
+                    raise err from exc
+            except subprocess.TimeoutExpired as exc:
+                exc = self._strip_password(exc)
+                raise ExecutionError() from exc
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_batch(output, statements)
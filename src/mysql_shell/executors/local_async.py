@@ -0,0 +1,201 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import subprocess
+import time
+from typing import Sequence
+
+from ..models import ConnectionDetails, StatementResult
+from .base import AsyncBaseExecutor
+from .errors import ExecutionError
+from .local import LocalShellMixin, ScriptTransport
+from .metrics import ExecutorHooks, current_operation, instrument, timed
+
+
+class AsyncLocalExecutor(LocalShellMixin, AsyncBaseExecutor):
+    """Asynchronous local executor for the MySQL Shell."""
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        hooks: ExecutorHooks | None = None,
+        transport: ScriptTransport = ScriptTransport.ARGV,
+    ):
+        """Initialize the executor.
+
+        Arguments:
+            conn_details: Connection details
+            shell_path: Path to the MySQL Shell binary
+            hooks: Optional instrumentation hooks
+            transport: Way of passing the scripts into the MySQL Shell process
+        """
+        super().__init__(conn_details, shell_path, hooks)
+        self._transport = transport
+
+    async def _run(
+        self, command: list[str], timeout: int | None = None, stdin: str | None = None
+    ) -> str:
+        """Run a MySQL Shell command, mimicking the subprocess.check_output behavior."""
+        with timed(self._hooks, "spawn"):
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+            )
+
+        start = time.perf_counter()
+
+        try:
+            data = (stdin or self._stdin_input()).encode()
+            stdout, _ = await asyncio.wait_for(process.communicate(data), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+            raise subprocess.TimeoutExpired(command, timeout)
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+        output = stdout.decode()
+        self._hooks.on_phase(current_operation(), "run", time.perf_counter() - start)
+        self._hooks.on_output(current_operation(), output)
+
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, command, output)
+
+        return output
+
+    async def check_connection(self) -> None:
+        """Check the connection."""
+        command = [
+            *self._common_args(),
+            *self._connection_args(),
+        ]
+
+        with instrument(self._hooks, "check_connection"):
+            try:
+                await self._run(command)
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                raise ExecutionError(err)
+            except subprocess.TimeoutExpired:
+                raise ExecutionError()
+
+    async def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script.
+
+        Arguments:
+            script: Python script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            String with the output of the MySQL Shell command.
+            The output cannot be parsed to JSON, as the output depends on the script
+        """
+        # Prepend every Python command with useWizards=False, to disable interactive mode.
+        # Cannot be set on command line as it conflicts with --passwords-from-stdin.
+        script = "shell.options.set('useWizards', False)\n" + script
+
+        with instrument(self._hooks, "execute_py"), self._script_args("py", script) as args:
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *args,
+            ]
+
+            try:
+                output = await self._run(command, timeout, self._stdin_input("py", script))
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                raise ExecutionError(err)
+            except subprocess.TimeoutExpired:
+                raise ExecutionError()
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_py(output)
+
+    async def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            List of dictionaries, one per returned row
+        """
+        with instrument(self._hooks, "execute_sql"), self._script_args("sql", script) as args:
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *args,
+            ]
+
+            try:
+                output = await self._run(command, timeout, self._stdin_input("sql", script))
+            except subprocess.CalledProcessError as exc:
+                err = self._parse_error(exc.output)
+                exc = self._strip_password(exc)
+                raise ExecutionError(err) from exc
+            except subprocess.TimeoutExpired as exc:
+                exc = self._strip_password(exc)
+                raise ExecutionError() from exc
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_sql(output)
+
+    async def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements within a single MySQL Shell invocation.
+
+        Arguments:
+            statements: SQL statements to execute, in order
+            timeout: Optional timeout seconds
+            force: Whether to keep executing statements after an error
+
+        Returns:
+            List of statement results, one per provided statement
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        if not statements:
+            return []
+
+        script = ";".join(("DO 0", *statements))
+
+        extra_args = ["--force"] if force else []
+
+        with (
+            instrument(self._hooks, "execute_sql_batch"),
+            self._script_args("sql", script) as args,
+        ):
+            command = [
+                *self._common_args(),
+                *self._connection_args(),
+                *extra_args,
+                *args,
+            ]
+
+            try:
+                output = await self._run(command, timeout, self._stdin_input("sql", script))
+            except subprocess.CalledProcessError as exc:
+                output = exc.output
+                exc = self._strip_password(exc)
+                try:
+                    return self._parse_output_batch(output, statements)
+                except ExecutionError as err:
+                    raise err from exc
+            except subprocess.TimeoutExpired as exc:
+                exc = self._strip_password(exc)
+                raise ExecutionError() from exc
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_batch(output, statements)
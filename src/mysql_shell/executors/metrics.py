@@ -0,0 +1,345 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import bisect
+import functools
+import inspect
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Sequence
+
+from .errors import ExecutionError
+
+_operation = ContextVar("mysql_shell_operation", default=None)
+
+UNKNOWN_OPERATION = "unknown"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def current_operation() -> str | None:
+    """Return the name of the operation being run, if any."""
+    return _operation.get()
+
+
+@contextmanager
+def operation(name: str) -> Generator[None, None, None]:
+    """Label every executor phase run within the context with the provided operation name."""
+    token = _operation.set(name)
+
+    try:
+        yield
+    finally:
+        _operation.reset(token)
+
+
+class ExecutorHooks:
+    """Instrumentation callbacks invoked by the executors.
+
+    The base class ignores every event, subclasses may override any of the callbacks.
+    They are invoked synchronously by the executors, so they must be cheap.
+    """
+
+    def on_phase(self, operation: str, phase: str, seconds: float) -> None:
+        """Called once an execution phase finishes.
+
+        Arguments:
+            operation: Name of the client method, or executor method, being run
+            phase: Phase name (spawn, connect, checkout, coalesce, run, timeout, parse or call)
+            seconds: Duration of the phase
+        """
+
+    def on_error(self, operation: str, error: ExecutionError) -> None:
+        """Called once an execution error is raised.
+
+        Arguments:
+            operation: Name of the client method, or executor method, being run
+            error: Execution error being raised
+        """
+
+    def on_output(self, operation: str, output: str) -> None:
+        """Called once the raw MySQL Shell output is read, before being parsed.
+
+        Arguments:
+            operation: Name of the client method, or executor method, being run
+            output: Raw MySQL Shell output
+        """
+
+
+class ChainedHooks(ExecutorHooks):
+    """Executor hooks delegating every event into a sequence of hooks, in order."""
+
+    def __init__(self, *hooks: ExecutorHooks):
+        """Initialize the hooks.
+
+        Arguments:
+            hooks: Hooks to delegate the events into
+        """
+        self._hooks = hooks
+
+    @property
+    def hooks(self) -> tuple[ExecutorHooks, ...]:
+        """Return the hooks the events are delegated into."""
+        return self._hooks
+
+    def on_phase(self, operation: str, phase: str, seconds: float) -> None:
+        """Delegate the phase event."""
+        for hooks in self._hooks:
+            hooks.on_phase(operation, phase, seconds)
+
+    def on_error(self, operation: str, error: ExecutionError) -> None:
+        """Delegate the error event."""
+        for hooks in self._hooks:
+            hooks.on_error(operation, error)
+
+    def on_output(self, operation: str, output: str) -> None:
+        """Delegate the output event."""
+        for hooks in self._hooks:
+            hooks.on_output(operation, output)
+
+
+def chain_hooks(current: ExecutorHooks, hooks: ExecutorHooks) -> ExecutorHooks:
+    """Return the current hooks followed by the provided ones."""
+    if isinstance(current, ChainedHooks):
+        return ChainedHooks(*current.hooks, hooks)
+
+    return ChainedHooks(current, hooks)
+
+
+def unchain_hooks(current: ExecutorHooks, hooks: ExecutorHooks) -> ExecutorHooks:
+    """Return the current hooks without the provided ones."""
+    if not isinstance(current, ChainedHooks):
+        return ExecutorHooks() if current is hooks else current
+
+    remaining = [item for item in current.hooks if item is not hooks]
+    if not remaining:
+        return ExecutorHooks()
+
+    return remaining[0] if len(remaining) == 1 else ChainedHooks(*remaining)
+
+
+@contextmanager
+def instrument(
+    hooks: ExecutorHooks,
+    method: str,
+    report_errors: bool = True,
+) -> Generator[None, None, None]:
+    """Label the phases run within the context, and report the execution errors.
+
+    The executor method name is only used when not running within a client operation.
+    Executors delegating into other executors should not report errors, to avoid duplicates.
+    """
+    token = _operation.set(_operation.get() or method)
+
+    try:
+        yield
+    except ExecutionError as e:
+        if report_errors:
+            hooks.on_error(_operation.get(), e)
+        raise
+    finally:
+        _operation.reset(token)
+
+
+@contextmanager
+def timed(hooks: ExecutorHooks, phase: str) -> Generator[None, None, None]:
+    """Report the duration of the phase run within the context."""
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        hooks.on_phase(_operation.get(), phase, time.perf_counter() - start)
+
+
+def instrumented(cls: type) -> type:
+    """Class decorator labelling every public client method as an operation.
+
+    The duration of every call is reported as the "call" phase,
+    using the hooks of the executor held by the client.
+    """
+    for name, func in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(func):
+            continue
+
+        setattr(cls, name, _instrument_method(func))
+
+    return cls
+
+
+def _instrument_method(func):
+    """Wrap a client method, labelling it as an operation."""
+    name = func.__name__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            with operation(name), timed(self._executor.hooks, "call"):
+                return await func(self, *args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            with operation(name), timed(self._executor.hooks, "call"):
+                return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _Histogram:
+    """Cumulative latency histogram."""
+
+    def __init__(self, buckets: Sequence[float]):
+        """Initialize the histogram."""
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, buckets: Sequence[float], value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect.bisect_left(buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsRegistry(ExecutorHooks):
+    """Executor hooks aggregating the reported events into metrics.
+
+    It keeps a latency histogram per operation and phase, a counter of errors
+    per operation and message, and a counter of output bytes per operation.
+    Events reported outside any operation are labelled as the unknown operation.
+    The metrics can be exported using the OpenMetrics text format.
+    """
+
+    def __init__(self, namespace: str = "mysql_shell", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize the registry.
+
+        Arguments:
+            namespace: Prefix of every exported metric name
+            buckets: Upper bounds of the latency histogram buckets, in seconds
+        """
+        self._namespace = namespace
+        self._buckets = sorted(buckets)
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._errors = Counter()
+        self._output_bytes = Counter()
+
+    def on_phase(self, operation: str, phase: str, seconds: float) -> None:
+        """Record the phase duration into its histogram."""
+        with self._lock:
+            key = (operation or UNKNOWN_OPERATION, phase)
+            if key not in self._histograms:
+                self._histograms[key] = _Histogram(self._buckets)
+
+            self._histograms[key].observe(self._buckets, seconds)
+
+    def on_error(self, operation: str, error: ExecutionError) -> None:
+        """Count the error by its message."""
+        message = error.args[0] if error.args and error.args[0] is not None else ""
+
+        with self._lock:
+            self._errors[(operation or UNKNOWN_OPERATION, str(message))] += 1
+
+    def on_output(self, operation: str, output: str) -> None:
+        """Count the output bytes."""
+        size = len(output.encode())
+
+        with self._lock:
+            self._output_bytes[operation or UNKNOWN_OPERATION] += size
+
+    def phase_count(self, operation: str, phase: str) -> int:
+        """Return the number of recorded durations of an operation phase."""
+        with self._lock:
+            histogram = self._histograms.get((operation, phase))
+            return histogram.count if histogram else 0
+
+    def phase_seconds(self, operation: str, phase: str) -> float:
+        """Return the total recorded duration of an operation phase."""
+        with self._lock:
+            histogram = self._histograms.get((operation, phase))
+            return histogram.sum if histogram else 0.0
+
+    def error_count(self, operation: str, message: str) -> int:
+        """Return the number of errors of an operation with the provided message."""
+        with self._lock:
+            return self._errors[(operation, message)]
+
+    def output_bytes(self, operation: str) -> int:
+        """Return the number of output bytes parsed for an operation."""
+        with self._lock:
+            return self._output_bytes[operation]
+
+    def reset(self) -> None:
+        """Reset every metric."""
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._output_bytes.clear()
+
+    @staticmethod
+    def _sort_key(item: tuple) -> tuple:
+        """Sort the metrics by their labels, regardless of their types."""
+        labels = item[0] if isinstance(item[0], tuple) else (item[0],)
+        return tuple(str(label) for label in labels)
+
+    @staticmethod
+    def _labels(**labels: str) -> str:
+        """Format a set of labels, escaping their values."""
+        escaped = {
+            key: str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            for key, value in labels.items()
+        }
+        return ",".join(f'{key}="{value}"' for key, value in escaped.items())
+
+    def export(self) -> str:
+        """Export every metric using the OpenMetrics text format."""
+        phases = f"{self._namespace}_phase_seconds"
+        errors = f"{self._namespace}_errors"
+        output = f"{self._namespace}_output_bytes"
+
+        with self._lock:
+            histograms = sorted(self._histograms.items(), key=self._sort_key)
+            error_counts = sorted(self._errors.items(), key=self._sort_key)
+            output_counts = sorted(self._output_bytes.items(), key=self._sort_key)
+
+        lines = [
+            f"# TYPE {phases} histogram",
+            f"# UNIT {phases} seconds",
+            f"# HELP {phases} Duration of the executor phases.",
+        ]
+        for (op, phase), histogram in histograms:
+            cumulative = 0
+            bounds = [*(repr(float(b)) for b in self._buckets), "+Inf"]
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                labels = self._labels(operation=op, phase=phase, le=bound)
+                lines.append(f"{phases}_bucket{{{labels}}} {cumulative}")
+
+            labels = self._labels(operation=op, phase=phase)
+            lines.append(f"{phases}_count{{{labels}}} {histogram.count}")
+            lines.append(f"{phases}_sum{{{labels}}} {histogram.sum}")
+
+        lines += [
+            f"# TYPE {errors} counter",
+            f"# HELP {errors} Execution errors, by message.",
+        ]
+        for (op, message), count in error_counts:
+            labels = self._labels(operation=op, message=message)
+            lines.append(f"{errors}_total{{{labels}}} {count}")
+
+        lines += [
+            f"# TYPE {output} counter",
+            f"# UNIT {output} bytes",
+            f"# HELP {output} MySQL Shell output parsed.",
+        ]
+        for op, count in output_counts:
+            labels = self._labels(operation=op)
+            lines.append(f"{output}_total{{{labels}}} {count}")
+
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,269 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import threading
+import time
+from typing import Sequence
+
+from ..models import ConnectionDetails, StatementResult
+from .background import BackgroundExecution
+from .base import BaseExecutor, cancel_kwargs
+from .cancellation import CancellationToken
+from .errors import ExecutionCancelledError, ExecutionError
+from .local import LocalExecutor
+from .metrics import ExecutorHooks, current_operation, instrument, operation, timed
+from .protocol import MySQLConnection, ProtocolError
+
+logger = logging.getLogger()
+
+_KILL_TIMEOUT = 10
+
+
+class NativeExecutor(BaseExecutor):
+    """Native executor, speaking the MySQL classic protocol directly.
+
+    SQL scripts are run over a single server connection, reused across calls,
+    without spawning any MySQL Shell process. The connection is transparently re-opened
+    whenever it is lost, or after a call times out.
+
+    Python scripts still need the MySQL Shell, so they are delegated to a fallback executor.
+    Cancelled calls get their connection shut down, and killed server-side.
+    """
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        connect_timeout: float | None = 10,
+        probe_interval: float = 30,
+        fallback: BaseExecutor | None = None,
+        hooks: ExecutorHooks | None = None,
+    ):
+        """Initialize the executor.
+
+        Arguments:
+            conn_details: Connection details
+            shell_path: Path to the MySQL Shell binary, used by the fallback executor
+            connect_timeout: Optional seconds to wait for the connection to be established
+            probe_interval: Seconds after which an idle connection is pinged before reuse
+            fallback: Optional executor to run the Python scripts with
+            hooks: Optional instrumentation hooks, shared with the default fallback executor
+        """
+        super().__init__(conn_details, shell_path, hooks)
+        self._connect_timeout = connect_timeout
+        self._probe_interval = probe_interval
+        self._fallback = fallback or LocalExecutor(conn_details, shell_path, hooks)
+        self._lock = threading.Lock()
+        self._conn = MySQLConnection(conn_details, connect_timeout)
+        self._last_used = 0.0
+
+    def __enter__(self):
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the executor context."""
+        self.close()
+
+    @property
+    def session_id(self) -> int | None:
+        """Return the server connection ID of the current session, if any.
+
+        It changes whenever the connection is re-opened, releasing its server-side state.
+        """
+        return self._conn.thread_id if self._conn.is_open else None
+
+    def _connect(self) -> MySQLConnection:
+        """Return the server connection, opening it if needed. Lock must be held."""
+        if self._conn.is_open and time.monotonic() - self._last_used >= self._probe_interval:
+            try:
+                self._conn.set_timeout(self._connect_timeout)
+                self._conn.ping()
+            except (OSError, ProtocolError):
+                self._conn.abort()
+
+        if not self._conn.is_open:
+            with timed(self._hooks, "connect"):
+                self._conn.connect()
+
+        return self._conn
+
+    def _query(
+        self,
+        sql: str,
+        timeout: int | None,
+        cancel: CancellationToken | None = None,
+    ) -> list:
+        """Run a SQL query, returning the results of each of its statements."""
+        if cancel is not None and cancel.cancelled:
+            raise ExecutionCancelledError()
+
+        with self._lock:
+            start = time.perf_counter()
+            unregister = lambda: None
+            thread_id = None
+
+            try:
+                conn = self._connect()
+                thread_id = conn.thread_id
+                start = time.perf_counter()
+                conn.set_timeout(timeout)
+                if cancel is not None:
+                    unregister = cancel.register(conn.interrupt)
+                results = conn.query(sql)
+            except ProtocolError as e:
+                # Server errors leave the connection in a usable state
+                if e.code is None:
+                    self._conn.abort()
+                raise ExecutionError(e.to_dict())
+            except TimeoutError:
+                self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+                self._conn.abort()
+                self._kill_connection(thread_id)
+                raise ExecutionError()
+            except OSError as e:
+                self._conn.abort()
+                if cancel is not None and cancel.cancelled:
+                    self._hooks.on_phase(
+                        current_operation(), "timeout", time.perf_counter() - start
+                    )
+                    self._kill_connection(thread_id)
+                    raise ExecutionCancelledError()
+                raise ExecutionError(str(e))
+            finally:
+                unregister()
+                self._last_used = time.monotonic()
+
+            # The connection may have been shut down right after the query completed
+            if cancel is not None and cancel.cancelled:
+                self._conn.abort()
+
+            self._hooks.on_phase(current_operation(), "run", time.perf_counter() - start)
+            return results
+
+    def _kill_connection(self, thread_id: int | None) -> None:
+        """Kill a server connection, and the statement it runs. Failures are only logged."""
+        if thread_id is None:
+            return
+
+        conn = MySQLConnection(self._conn_details, _KILL_TIMEOUT)
+
+        try:
+            with operation("kill_connection"):
+                conn.connect()
+                conn.set_timeout(_KILL_TIMEOUT)
+                conn.query(f"KILL CONNECTION {int(thread_id)}")
+        except (OSError, ProtocolError):
+            logger.warning(f"Failed to kill server connection {thread_id}")
+        finally:
+            conn.abort()
+
+    def close(self) -> None:
+        """Close the server connection, and the fallback executor."""
+        with self._lock:
+            self._conn.close()
+
+        self._fallback.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        with instrument(self._hooks, "check_connection"):
+            self._query("DO 0", timeout=None)
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script, using the fallback executor.
+
+        Arguments:
+            script: Python script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            String with the output of the MySQL Shell command.
+            The output cannot be parsed to JSON, as the output depends on the script
+        """
+        return self._fallback.execute_py(script, timeout=timeout, **cancel_kwargs(cancel))
+
+    def start_py(self, script: str) -> BackgroundExecution:
+        """Start a Python script in the background, using the fallback executor."""
+        return self._fallback.start_py(script)
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            List of dictionaries, one per returned row
+        """
+        with instrument(self._hooks, "execute_sql"):
+            results = self._query(script, timeout, cancel)
+
+        return results[-1].rows
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, one at a time over the same connection.
+
+        Arguments:
+            statements: SQL statements to execute, in order
+            timeout: Optional timeout seconds
+            force: Whether to keep executing statements after an error
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            List of statement results, one per provided statement
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        results = [StatementResult(statement=s, executed=False) for s in statements]
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with instrument(self._hooks, "execute_sql_batch"):
+            for result in results:
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                result.executed = True
+
+                try:
+                    output = self._query(result.statement, remaining, cancel)[-1]
+                    result.rows = output.rows
+                    result.affected_rows = output.affected_rows
+
+                    if output.warning_count:
+                        remaining = (
+                            None if deadline is None else max(deadline - time.monotonic(), 0)
+                        )
+                        warnings = self._query("SHOW WARNINGS", remaining, cancel)[-1].rows
+                        result.warnings = [
+                            {"level": w["Level"], "code": w["Code"], "message": w["Message"]}
+                            for w in warnings
+                        ]
+                except ExecutionError as e:
+                    if isinstance(e, ExecutionCancelledError) or not self._conn.is_open:
+                        raise
+                    result.error = {"message": str(e)}
+                    if not force:
+                        break
+
+        return results
@@ -0,0 +1,517 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import os
+import select
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Sequence
+
+from ..models import ConnectionDetails, StatementResult
+from .cancellation import CancellationToken
+from .errors import ExecutionCancelledError, ExecutionError
+from .local import LocalExecutor
+from .metrics import ExecutorHooks, current_operation, instrument, timed
+
+# Python loop run by the long-lived MySQL Shell process.
+# It reads one JSON request per line from the requests pipe,
+# and writes one JSON response per line into the responses pipe.
+_SESSION_SCRIPT = r"""
+import json
+import os
+import sys
+
+shell.options.set('useWizards', False)
+
+_SESSION = shell.get_session()
+_GLOBALS = dict(globals())
+
+try:
+    _CONNECTION_ID = _SESSION.run_sql("SELECT CONNECTION_ID()").fetch_one()[0]
+except Exception:
+    _CONNECTION_ID = None
+
+
+class _Writer:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        if text.strip():
+            self.chunks.append(text)
+
+    def flush(self):
+        pass
+
+
+def _is_dash_comment(script, index):
+    return script.startswith("--", index) and script[index + 2 : index + 3] in " \t\r\n"
+
+
+def _split_sql(script):
+    statements = []
+    current = []
+    has_code = False
+    quote = None
+    comment = None
+    escaped = False
+    index = 0
+
+    while index < len(script):
+        char = script[index]
+        step = 1
+
+        if comment == "line":
+            comment = None if char == "\n" else comment
+        elif comment == "block":
+            if script.startswith("*/", index):
+                comment = None
+                step = 2
+        elif escaped:
+            escaped = False
+        elif quote and char == "\\":
+            escaped = True
+        elif quote and char == quote:
+            quote = None
+        elif quote:
+            pass
+        elif char in "'\"`":
+            quote = char
+            has_code = True
+        elif char == "#" or _is_dash_comment(script, index):
+            comment = "line"
+        elif script.startswith("/*", index):
+            comment = "block"
+            has_code = has_code or script[index + 2 : index + 3] in ("!", "+")
+            step = 2
+        elif char == ";":
+            if has_code:
+                statements.append("".join(current))
+            current = []
+            has_code = False
+            index += 1
+            continue
+        elif not char.isspace():
+            has_code = True
+
+        current.append(script[index : index + step])
+        index += step
+
+    if has_code:
+        statements.append("".join(current))
+
+    return [s.strip() for s in statements]
+
+
+def _error(exc):
+    return {"message": getattr(exc, "msg", None) or str(exc)}
+
+
+def _run_statement(statement):
+    result = _SESSION.run_sql(statement)
+    rows = []
+
+    if result.has_data():
+        columns = result.get_column_names()
+        rows = [
+            {col: row[index] for index, col in enumerate(columns)}
+            for row in result.fetch_all()
+        ]
+
+    warnings = [
+        {"level": warning[0], "code": warning[1], "message": warning[2]}
+        for warning in result.get_warnings()
+    ]
+
+    return {
+        "rows": rows,
+        "affected_rows": result.get_affected_items_count(),
+        "warnings": warnings,
+    }
+
+
+def _run_sql(script):
+    rows = []
+    for statement in _split_sql(script):
+        rows = _run_statement(statement)["rows"]
+
+    return {"rows": rows}
+
+
+def _run_batch(statements, force):
+    results = []
+    for statement in statements:
+        try:
+            results.append(_run_statement(statement))
+        except Exception as e:
+            results.append({"error": _error(e)})
+            if not force:
+                break
+
+    return {"results": results}
+
+
+def _run_py(script):
+    writer = _Writer()
+    stdout = sys.stdout
+    sys.stdout = writer
+
+    try:
+        exec(script, dict(_GLOBALS))
+    finally:
+        sys.stdout = stdout
+        if shell.get_session() is not _SESSION and _SESSION.is_open():
+            shell.set_session(_SESSION)
+
+    return {"output": writer.chunks[-1] if writer.chunks else "{}"}
+
+
+def _run(request):
+    if request["lang"] == "sql":
+        return _run_sql(request["script"])
+    if request["lang"] == "py":
+        return _run_py(request["script"])
+    if request["lang"] == "batch":
+        return _run_batch(request["statements"], request["force"])
+
+    _SESSION.run_sql("SELECT 1")
+    return {}
+
+
+_requests = os.fdopen(_REQUESTS_FD, "r")
+_responses = os.fdopen(_RESPONSES_FD, "w")
+_responses.write(json.dumps({"ready": True, "connection_id": _CONNECTION_ID}) + "\n")
+_responses.flush()
+
+for _line in _requests:
+    try:
+        _response = _run(json.loads(_line))
+    except Exception as e:
+        _response = {"error": _error(e)}
+
+    _response["alive"] = _SESSION.is_open()
+    _responses.write(json.dumps(_response, default=str) + "\n")
+    _responses.flush()
+"""
+
+
+class PersistentExecutor(LocalExecutor):
+    """Persistent executor for the MySQL Shell.
+
+    It keeps a single MySQL Shell process (and its server connection) alive across calls,
+    exchanging JSON-framed requests and responses through a pair of dedicated pipes.
+    The process is transparently re-spawned whenever it crashes or a call times out.
+    Calls timing out, or cancelled, also get their server connection killed,
+    so that the statement they were running does not keep running server-side.
+
+    Streamed SQL scripts (see iter_sql) are run by a dedicated process instead,
+    as the session protocol buffers every response in memory.
+    """
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        hooks: ExecutorHooks | None = None,
+    ):
+        """Initialize the executor."""
+        super().__init__(conn_details, shell_path, hooks)
+        self._lock = threading.Lock()
+        self._process = None
+        self._output = None
+        self._requests_fd = -1
+        self._responses_fd = -1
+        self._connection_id = None
+        self._buffer = bytearray()
+
+    def __enter__(self):
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the executor context."""
+        self.close()
+
+    @property
+    def session_id(self) -> int | None:
+        """Return the server connection ID of the current session, if any.
+
+        It changes whenever the session is re-spawned, releasing its server-side state.
+        """
+        return self._connection_id
+
+    def _is_alive(self) -> bool:
+        """Check whether the MySQL Shell process is still running."""
+        return self._process is not None and self._process.poll() is None
+
+    def _spawn(self, deadline: float | None) -> None:
+        """Spawn the MySQL Shell process, and wait for it to be ready."""
+        requests_read, requests_write = os.pipe()
+        responses_read, responses_write = os.pipe()
+
+        script = "\n".join((
+            f"_REQUESTS_FD = {requests_read}",
+            f"_RESPONSES_FD = {responses_write}",
+            _SESSION_SCRIPT,
+        ))
+        command = [
+            *self._common_args(),
+            *self._connection_args(),
+            "--py",
+            "--execute",
+            script,
+        ]
+
+        self._output = tempfile.TemporaryFile(mode="w+")
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=self._output,
+            pass_fds=(requests_read, responses_write),
+            text=True,
+        )
+
+        os.close(requests_read)
+        os.close(responses_write)
+        self._requests_fd = requests_write
+        self._responses_fd = responses_read
+        self._buffer = bytearray()
+
+        self._process.stdin.write(self._conn_details.password)
+        self._process.stdin.close()
+
+        ready = self._read_frame(deadline)
+        if ready is None:
+            self._process.wait()
+            err = self._parse_error(self._read_output())
+            self._terminate()
+            raise ExecutionError(err)
+
+        self._connection_id = ready.get("connection_id")
+
+    def _terminate(self) -> None:
+        """Terminate the MySQL Shell process, and release its resources."""
+        if self._requests_fd >= 0:
+            os.close(self._requests_fd)
+        if self._responses_fd >= 0:
+            os.close(self._responses_fd)
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        if self._output is not None:
+            self._output.close()
+
+        self._process = None
+        self._output = None
+        self._requests_fd = -1
+        self._responses_fd = -1
+        self._connection_id = None
+
+    def _read_output(self) -> str:
+        """Read the output printed by the MySQL Shell process itself."""
+        self._output.seek(0)
+        return self._output.read()
+
+    def _read_frame(self, deadline: float | None) -> dict | None:
+        """Read a single response frame, returning None if the process is gone."""
+        offset = 0
+
+        while (index := self._buffer.find(b"\n", offset)) < 0:
+            offset = len(self._buffer)
+            timeout = None if deadline is None else deadline - time.monotonic()
+
+            if timeout is not None and timeout <= 0:
+                raise TimeoutError()
+
+            ready, _, _ = select.select([self._responses_fd], [], [], timeout)
+            if not ready:
+                continue
+
+            chunk = os.read(self._responses_fd, 65536)
+            if not chunk:
+                return None
+
+            self._buffer += chunk
+
+        frame = bytes(self._buffer[:index])
+        del self._buffer[: index + 1]
+        return json.loads(frame)
+
+    def _write_frame(self, request: dict) -> None:
+        """Write a single request frame."""
+        data = (json.dumps(request) + "\n").encode()
+
+        while data:
+            written = os.write(self._requests_fd, data)
+            data = data[written:]
+
+    def _respawn(self, deadline: float | None) -> None:
+        """Re-spawn the MySQL Shell process."""
+        self._terminate()
+
+        with timed(self._hooks, "spawn"):
+            self._spawn(deadline)
+
+    def _send(self, request: dict, deadline: float | None) -> None:
+        """Send a request, re-spawning the process if the pipe is broken."""
+        try:
+            self._write_frame(request)
+        except BrokenPipeError:
+            self._respawn(deadline)
+            self._write_frame(request)
+
+    def _abort(self) -> None:
+        """Terminate the MySQL Shell process, killing its server connection too."""
+        connection_id = self._connection_id
+        self._terminate()
+
+        if connection_id is not None:
+            self._kill_connection(connection_id)
+
+    def _request(
+        self,
+        request: dict,
+        timeout: int | None,
+        cancel: CancellationToken | None = None,
+    ) -> dict:
+        """Send a request to the MySQL Shell process, and wait for its response."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        if cancel is not None and cancel.cancelled:
+            raise ExecutionCancelledError()
+
+        with self._lock:
+            start = time.perf_counter()
+            unregister = lambda: None
+
+            try:
+                if not self._is_alive():
+                    self._respawn(deadline)
+                    start = time.perf_counter()
+                if cancel is not None:
+                    unregister = cancel.register(self._process.kill)
+
+                self._send(request, deadline)
+                response = self._read_frame(deadline)
+            except TimeoutError:
+                self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+                self._abort()
+                raise ExecutionError()
+            finally:
+                unregister()
+
+            if response is None and cancel is not None and cancel.cancelled:
+                self._hooks.on_phase(current_operation(), "timeout", time.perf_counter() - start)
+                self._abort()
+                raise ExecutionCancelledError()
+
+            self._hooks.on_phase(current_operation(), "run", time.perf_counter() - start)
+
+            if response is None:
+                self._process.wait()
+                err = self._parse_error(self._read_output())
+                self._terminate()
+                raise ExecutionError(err)
+            if not response.pop("alive", False):
+                self._terminate()
+
+        if "error" in response:
+            raise ExecutionError(response["error"])
+
+        return response
+
+    def close(self) -> None:
+        """Close the MySQL Shell process."""
+        with self._lock:
+            self._terminate()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        with instrument(self._hooks, "check_connection"):
+            self._request({"lang": "ping"}, timeout=None)
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script.
+
+        Arguments:
+            script: Python script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            String with the output of the MySQL Shell command.
+            The output cannot be parsed to JSON, as the output depends on the script
+        """
+        with instrument(self._hooks, "execute_py"):
+            response = self._request({"lang": "py", "script": script}, timeout, cancel)
+
+        return response["output"]
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            List of dictionaries, one per returned row
+        """
+        with instrument(self._hooks, "execute_sql"):
+            response = self._request({"lang": "sql", "script": script}, timeout, cancel)
+
+        return response["rows"]
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements within a single request.
+
+        Arguments:
+            statements: SQL statements to execute, in order
+            timeout: Optional timeout seconds
+            force: Whether to keep executing statements after an error
+            cancel: Optional token to cancel the execution, killing its server connection
+
+        Returns:
+            List of statement results, one per provided statement
+        """
+        statements = [statement.strip().rstrip(";") for statement in statements]
+        if not statements:
+            return []
+
+        request = {"lang": "batch", "statements": statements, "force": force}
+        with instrument(self._hooks, "execute_sql_batch"):
+            response = self._request(request, timeout, cancel)
+
+        results = [StatementResult(statement=s, executed=False) for s in statements]
+
+        for result, doc in zip(results, response["results"]):
+            result.executed = True
+            result.error = doc.get("error")
+            result.rows = doc.get("rows", [])
+            result.warnings = doc.get("warnings", [])
+            result.affected_rows = doc.get("affected_rows", 0)
+
+        return results
@@ -0,0 +1,360 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Generator, Iterator, Sequence
+
+from ..models import ConnectionDetails, StatementResult
+from .base import BaseExecutor, cancel_kwargs
+from .cancellation import CancellationToken
+from .errors import ExecutionError
+from .metrics import ExecutorHooks, current_operation, instrument, timed
+from .persistent import PersistentExecutor
+
+logger = logging.getLogger()
+
+
+@dataclass
+class ExecutorPoolStats:
+    """Executor pool usage statistics."""
+
+    max_size: int
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    evictions: int
+    probe_failures: int
+
+    @property
+    def saturation(self) -> float:
+        """Return the ratio of sessions in use over the maximum pool size."""
+        return self.in_use / self.max_size
+
+
+class ExecutorPool(BaseExecutor):
+    """Bounded pool of warm MySQL Shell sessions.
+
+    Every call checks out a session (creating one if the pool is not full yet),
+    runs on it, and returns it to the pool. Sessions idle for longer than the probe interval
+    are checked for liveness before being reused, and those idle for longer than the idle
+    timeout are closed on every checkout and return, so that the number of server-side
+    connections stays bounded.
+    """
+
+    def __init__(
+        self,
+        conn_details: ConnectionDetails,
+        shell_path: str,
+        max_size: int = 4,
+        checkout_timeout: float | None = None,
+        idle_timeout: float | None = 300,
+        probe_interval: float = 30,
+        session_factory: Callable[[], BaseExecutor] | None = None,
+        hooks: ExecutorHooks | None = None,
+    ):
+        """Initialize the executor.
+
+        Arguments:
+            conn_details: Connection details used by every session
+            shell_path: Path to the MySQL Shell binary
+            max_size: Maximum number of sessions in the pool
+            checkout_timeout: Optional seconds to wait for a session to be available
+            idle_timeout: Optional seconds after which an idle session is closed
+            probe_interval: Seconds after which an idle session is probed before reuse
+            session_factory: Optional function to build new sessions
+            hooks: Optional instrumentation hooks, shared with the default sessions
+        """
+        super().__init__(conn_details, shell_path, hooks)
+
+        if max_size < 1:
+            raise ValueError("Pool max size must be positive")
+        if not session_factory:
+            session_factory = lambda: PersistentExecutor(conn_details, shell_path, hooks)
+
+        self._max_size = max_size
+        self._checkout_timeout = checkout_timeout
+        self._idle_timeout = idle_timeout
+        self._probe_interval = probe_interval
+        self._session_factory = session_factory
+
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._size = 0
+        self._waiting = 0
+        self._closed = False
+
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._evictions = 0
+        self._probe_failures = 0
+
+    def __enter__(self):
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the executor context."""
+        self.close()
+
+    def _evict_idle(self) -> list[BaseExecutor]:
+        """Remove the sessions that have been idle for too long. Lock must be held."""
+        if self._idle_timeout is None:
+            return []
+
+        evicted = []
+        threshold = time.monotonic() - self._idle_timeout
+
+        # Sessions are returned to the right, so the oldest ones sit on the left
+        while self._idle and self._idle[0][1] < threshold:
+            session, _ = self._idle.popleft()
+            evicted.append(session)
+
+        self._size -= len(evicted)
+        self._evictions += len(evicted)
+        return evicted
+
+    def _wait_turn(self, deadline: float | None) -> None:
+        """Wait until a session is returned to the pool. Lock must be held."""
+        timeout = None if deadline is None else deadline - time.monotonic()
+
+        if timeout is not None and timeout <= 0:
+            self._timeouts += 1
+            error = ExecutionError("Timed out waiting for an executor pool session")
+            self._hooks.on_error(current_operation(), error)
+            raise error
+
+        self._waits += 1
+        self._waiting += 1
+
+        try:
+            self._cond.wait(timeout)
+        finally:
+            self._waiting -= 1
+
+    def _acquire(self, deadline: float | None) -> tuple[BaseExecutor | None, float]:
+        """Acquire an idle session, or a slot to create a new one."""
+        evicted = []
+
+        # Closing a session may wait for its process to exit, so it is done without the lock
+        try:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise ExecutionError("Executor pool is closed")
+
+                    evicted.extend(self._evict_idle())
+
+                    if self._idle:
+                        session, last_used = self._idle.pop()
+                        return session, last_used
+                    if self._size < self._max_size:
+                        self._size += 1
+                        return None, time.monotonic()
+
+                    self._wait_turn(deadline)
+        finally:
+            for session in evicted:
+                session.close()
+
+    def _discard(self, session: BaseExecutor | None) -> None:
+        """Discard a checked-out session, freeing its slot."""
+        if session is not None:
+            session.close()
+
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _checkout(self) -> BaseExecutor:
+        """Check out a live session from the pool."""
+        with timed(self._hooks, "checkout"):
+            return self._checkout_session()
+
+    def _checkout_session(self) -> BaseExecutor:
+        """Check out a live session from the pool, probing it if it was idle for long."""
+        timeout = self._checkout_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            session, last_used = self._acquire(deadline)
+
+            if session is None:
+                try:
+                    session = self._session_factory()
+                except Exception:
+                    self._discard(None)
+                    raise
+                break
+
+            if time.monotonic() - last_used < self._probe_interval:
+                break
+
+            try:
+                session.check_connection()
+            except Exception:
+                logger.warning("Discarding executor pool session after failed probe")
+                with self._cond:
+                    self._probe_failures += 1
+                self._discard(session)
+                continue
+
+            break
+
+        with self._cond:
+            self._checkouts += 1
+
+        return session
+
+    def _checkin(self, session: BaseExecutor) -> None:
+        """Return a session into the pool, evicting those idle for too long."""
+        evicted = []
+
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                evicted.append(session)
+            else:
+                evicted.extend(self._evict_idle())
+                self._idle.append((session, time.monotonic()))
+                self._cond.notify()
+
+        for session in evicted:
+            session.close()
+
+    @contextmanager
+    def session(self) -> Generator[BaseExecutor, None, None]:
+        """Check out a session for the duration of the context."""
+        session = self._checkout()
+
+        try:
+            yield session
+        finally:
+            self._checkin(session)
+
+    def stats(self) -> ExecutorPoolStats:
+        """Return the pool usage statistics."""
+        with self._cond:
+            return ExecutorPoolStats(
+                max_size=self._max_size,
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                waiting=self._waiting,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                evictions=self._evictions,
+                probe_failures=self._probe_failures,
+            )
+
+    def close(self) -> None:
+        """Close every idle session, and those in use once returned."""
+        with self._cond:
+            self._closed = True
+            sessions = [session for session, _ in self._idle]
+            self._size -= len(self._idle)
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for session in sessions:
+            session.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        with instrument(self._hooks, "check_connection", False), self.session() as session:
+            session.check_connection()
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script.
+
+        Arguments:
+            script: Python script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution
+
+        Returns:
+            String with the output of the MySQL Shell command.
+            The output cannot be parsed to JSON, as the output depends on the script
+        """
+        with instrument(self._hooks, "execute_py", False), self.session() as session:
+            return session.execute_py(script, timeout=timeout, **cancel_kwargs(cancel))
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+            cancel: Optional token to cancel the execution
+
+        Returns:
+            List of dictionaries, one per returned row
+        """
+        with instrument(self._hooks, "execute_sql", False), self.session() as session:
+            return session.execute_sql(script, timeout=timeout, **cancel_kwargs(cancel))
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows.
+
+        The session is kept checked out until the iteration ends.
+
+        Arguments:
+            script: SQL script to execute
+            timeout: Optional timeout seconds
+
+        Returns:
+            Iterator of dictionaries, one per returned row
+        """
+        with instrument(self._hooks, "iter_sql", False):
+            session = self._checkout()
+
+        try:
+            yield from session.iter_sql(script, timeout=timeout)
+        finally:
+            self._checkin(session)
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, returning one result per statement.
+
+        Arguments:
+            statements: SQL statements to execute, in order
+            timeout: Optional timeout seconds
+            force: Whether to keep executing statements after an error
+            cancel: Optional token to cancel the execution
+
+        Returns:
+            List of statement results, one per provided statement
+        """
+        with instrument(self._hooks, "execute_sql_batch", False), self.session() as session:
+            return session.execute_sql_batch(
+                statements, timeout=timeout, force=force, **cancel_kwargs(cancel)
+            )
@@ -0,0 +1,533 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import hashlib
+import socket
+import ssl
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..models import ConnectionDetails
+
+# https://dev.mysql.com/doc/dev/mysql-server/latest/group__group__cs__capabilities__flags.html
+CLIENT_LONG_PASSWORD = 0x00000001
+CLIENT_LONG_FLAG = 0x00000004
+CLIENT_PROTOCOL_41 = 0x00000200
+CLIENT_SSL = 0x00000800
+CLIENT_TRANSACTIONS = 0x00002000
+CLIENT_SECURE_CONNECTION = 0x00008000
+CLIENT_MULTI_STATEMENTS = 0x00010000
+CLIENT_MULTI_RESULTS = 0x00020000
+CLIENT_PLUGIN_AUTH = 0x00080000
+CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA = 0x00200000
+
+CLIENT_CAPABILITIES = (
+    CLIENT_LONG_PASSWORD
+    | CLIENT_LONG_FLAG
+    | CLIENT_PROTOCOL_41
+    | CLIENT_TRANSACTIONS
+    | CLIENT_SECURE_CONNECTION
+    | CLIENT_MULTI_STATEMENTS
+    | CLIENT_MULTI_RESULTS
+    | CLIENT_PLUGIN_AUTH
+    | CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA
+)
+
+SERVER_MORE_RESULTS_EXISTS = 0x0008
+
+COM_QUIT = 0x01
+COM_QUERY = 0x03
+COM_PING = 0x0E
+
+UTF8MB4_GENERAL_CI = 45
+BINARY_CHARSET = 63
+MAX_PACKET_SIZE = 0xFFFFFF
+
+# https://dev.mysql.com/doc/dev/mysql-server/latest/field__types_8h.html
+_INTEGER_TYPES = {0x01, 0x02, 0x03, 0x08, 0x09, 0x0D}
+_FLOAT_TYPES = {0x04, 0x05}
+_DECIMAL_TYPES = {0x00, 0xF6}
+_BIT_TYPE = 0x10
+
+
+class ProtocolError(Exception):
+    """MySQL protocol error, raised for both server errors and malformed packets."""
+
+    def __init__(self, message: str, code: int | None = None):
+        """Initialize the error."""
+        super().__init__(message)
+        self.message = message
+        self.code = code
+
+    def to_dict(self) -> dict:
+        """Return the error in the same shape as the MySQL Shell JSON errors."""
+        return {"message": self.message, "code": self.code}
+
+
+@dataclass
+class Column:
+    """MySQL result set column definition."""
+
+    name: str
+    type: int
+    charset: int
+    decimals: int
+
+
+@dataclass
+class Result:
+    """MySQL statement result, as sent by the server."""
+
+    columns: list[Column] = field(default_factory=list)
+    rows: list[dict] = field(default_factory=list)
+    affected_rows: int = 0
+    warning_count: int = 0
+    status: int = 0
+
+
+class PacketReader:
+    """Reader of the MySQL protocol basic data types, within a packet payload."""
+
+    def __init__(self, payload: bytes):
+        """Initialize the reader."""
+        self._payload = payload
+        self._pos = 0
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of bytes still to be read."""
+        return len(self._payload) - self._pos
+
+    def read(self, size: int) -> bytes:
+        """Read a fixed number of bytes."""
+        data = self._payload[self._pos : self._pos + size]
+        self._pos += size
+        return data
+
+    def read_int(self, size: int) -> int:
+        """Read a fixed-length little-endian integer."""
+        return int.from_bytes(self.read(size), "little")
+
+    def read_lenenc_int(self) -> int | None:
+        """Read a length-encoded integer, returning None for the NULL marker."""
+        first = self.read_int(1)
+
+        if first < 0xFB:
+            return first
+        if first == 0xFB:
+            return None
+        if first == 0xFC:
+            return self.read_int(2)
+        if first == 0xFD:
+            return self.read_int(3)
+
+        return self.read_int(8)
+
+    def read_lenenc_bytes(self) -> bytes | None:
+        """Read a length-encoded string, returning None for the NULL marker."""
+        size = self.read_lenenc_int()
+        return None if size is None else self.read(size)
+
+    def read_nul_bytes(self) -> bytes:
+        """Read a NUL-terminated string."""
+        end = self._payload.index(b"\0", self._pos)
+        data = self._payload[self._pos : end]
+        self._pos = end + 1
+        return data
+
+    def read_rest(self) -> bytes:
+        """Read the rest of the payload."""
+        return self.read(self.remaining)
+
+
+def lenenc_int(value: int) -> bytes:
+    """Encode a length-encoded integer."""
+    if value < 0xFB:
+        return struct.pack("<B", value)
+    if value < 2**16:
+        return b"\xfc" + struct.pack("<H", value)
+    if value < 2**24:
+        return b"\xfd" + struct.pack("<I", value)[:3]
+
+    return b"\xfe" + struct.pack("<Q", value)
+
+
+def scramble_native_password(password: bytes, nonce: bytes) -> bytes:
+    """Scramble the password using the mysql_native_password algorithm."""
+    if not password:
+        return b""
+
+    stage_1 = hashlib.sha1(password).digest()
+    stage_2 = hashlib.sha1(stage_1).digest()
+    stage_3 = hashlib.sha1(nonce + stage_2).digest()
+    return bytes(a ^ b for a, b in zip(stage_1, stage_3))
+
+
+def scramble_caching_sha2(password: bytes, nonce: bytes) -> bytes:
+    """Scramble the password using the caching_sha2_password algorithm."""
+    if not password:
+        return b""
+
+    stage_1 = hashlib.sha256(password).digest()
+    stage_2 = hashlib.sha256(stage_1).digest()
+    stage_3 = hashlib.sha256(stage_2 + nonce).digest()
+    return bytes(a ^ b for a, b in zip(stage_1, stage_3))
+
+
+_SCRAMBLERS = {
+    "mysql_native_password": scramble_native_password,
+    "caching_sha2_password": scramble_caching_sha2,
+}
+
+
+class MySQLConnection:
+    """Classic protocol connection to a MySQL server, using the text protocol.
+
+    https://dev.mysql.com/doc/dev/mysql-server/latest/PAGE_PROTOCOL.html
+    """
+
+    def __init__(self, conn_details: ConnectionDetails, connect_timeout: float | None = 10):
+        """Initialize the connection."""
+        self._conn_details = conn_details
+        self._connect_timeout = connect_timeout
+        self._sock = None
+        self._seq = 0
+        self._deadline = None
+        self._secure = False
+        self.thread_id = None
+        self.server_version = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the connection is open."""
+        return self._sock is not None
+
+    def set_timeout(self, timeout: float | None) -> None:
+        """Set the timeout seconds for the following operations."""
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def _apply_deadline(self) -> None:
+        """Set the socket timeout to the time left until the deadline, blocking if none."""
+        if self._deadline is None:
+            self._sock.settimeout(None)
+            return
+
+        timeout = self._deadline - time.monotonic()
+        if timeout <= 0:
+            raise TimeoutError()
+
+        self._sock.settimeout(timeout)
+
+    def _recv_exact(self, size: int) -> bytes:
+        """Receive a fixed number of bytes, honoring the operation deadline."""
+        chunks = []
+
+        while size > 0:
+            self._apply_deadline()
+
+            chunk = self._sock.recv(min(size, 65536))
+            if not chunk:
+                raise ConnectionError("Connection closed by the server")
+
+            chunks.append(chunk)
+            size -= len(chunk)
+
+        return b"".join(chunks)
+
+    def _read_packet(self) -> bytes:
+        """Read a packet payload, joining those split across several packets."""
+        payload = b""
+
+        while True:
+            header = self._recv_exact(4)
+            size = int.from_bytes(header[:3], "little")
+            self._seq = (header[3] + 1) % 256
+            payload += self._recv_exact(size)
+
+            if size < MAX_PACKET_SIZE:
+                return payload
+
+    def _write_packet(self, payload: bytes) -> None:
+        """Write a packet payload, splitting it across several packets if needed."""
+        self._apply_deadline()
+
+        while True:
+            chunk, payload = payload[:MAX_PACKET_SIZE], payload[MAX_PACKET_SIZE:]
+            header = struct.pack("<I", len(chunk))[:3] + bytes([self._seq])
+            self._sock.sendall(header + chunk)
+            self._seq = (self._seq + 1) % 256
+
+            if len(chunk) < MAX_PACKET_SIZE:
+                return
+
+    @staticmethod
+    def _raise_error(payload: bytes) -> None:
+        """Raise the error contained in an ERR packet."""
+        reader = PacketReader(payload[1:])
+        code = reader.read_int(2)
+        if reader.read(1) == b"#":
+            reader.read(5)
+        else:
+            reader = PacketReader(payload[3:])
+
+        raise ProtocolError(reader.read_rest().decode(errors="replace"), code)
+
+    def _open_socket(self) -> socket.socket:
+        """Open the underlying socket, either a UNIX or a TCP one."""
+        if self._conn_details.socket:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self._connect_timeout)
+            sock.connect(self._conn_details.socket)
+            return sock
+
+        address = (self._conn_details.host, int(self._conn_details.port))
+        sock = socket.create_connection(address, timeout=self._connect_timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def connect(self) -> None:
+        """Connect and authenticate against the server."""
+        self._sock = self._open_socket()
+        self._seq = 0
+        self._secure = bool(self._conn_details.socket)
+
+        try:
+            self.set_timeout(self._connect_timeout)
+            self._handshake()
+        except BaseException:
+            self._sock.close()
+            self._sock = None
+            raise
+        finally:
+            self.set_timeout(None)
+
+        self._sock.settimeout(None)
+
+    def _handshake(self) -> None:
+        """Perform the initial handshake, and the authentication exchange."""
+        payload = self._read_packet()
+        if payload[0] == 0xFF:
+            self._raise_error(payload)
+
+        reader = PacketReader(payload)
+        reader.read_int(1)
+        self.server_version = reader.read_nul_bytes().decode()
+        self.thread_id = reader.read_int(4)
+        nonce = reader.read(8)
+        reader.read(1)
+        capabilities = reader.read_int(2)
+        reader.read(3)
+        capabilities |= reader.read_int(2) << 16
+        nonce_size = reader.read_int(1)
+        reader.read(10)
+        nonce += reader.read(max(13, nonce_size - 8))[:-1]
+        plugin = reader.read_nul_bytes().decode() if reader.remaining else ""
+
+        client_capabilities = CLIENT_CAPABILITIES & capabilities | CLIENT_PROTOCOL_41
+        if not self._secure and capabilities & CLIENT_SSL:
+            client_capabilities |= CLIENT_SSL
+            self._start_tls(client_capabilities)
+
+        self._send_handshake_response(client_capabilities, plugin, nonce)
+        self._authenticate(plugin, nonce)
+
+    def _start_tls(self, capabilities: int) -> None:
+        """Upgrade the connection to TLS, without verifying the server certificate."""
+        request = struct.pack("<IIB", capabilities, MAX_PACKET_SIZE, UTF8MB4_GENERAL_CI)
+        self._write_packet(request + bytes(23))
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+
+        self._sock = context.wrap_socket(self._sock)
+        self._secure = True
+
+    def _send_handshake_response(self, capabilities: int, plugin: str, nonce: bytes) -> None:
+        """Send the handshake response, with the initial authentication data."""
+        scrambler = _SCRAMBLERS.get(plugin, scramble_native_password)
+        auth_data = scrambler(self._conn_details.password.encode(), nonce)
+
+        response = b"".join((
+            struct.pack("<IIB", capabilities, MAX_PACKET_SIZE, UTF8MB4_GENERAL_CI),
+            bytes(23),
+            self._conn_details.username.encode() + b"\0",
+            lenenc_int(len(auth_data)) + auth_data,
+            plugin.encode() + b"\0",
+        ))
+
+        self._write_packet(response)
+
+    def _authenticate(self, plugin: str, nonce: bytes) -> None:
+        """Process the server authentication responses, until an OK one is received."""
+        password = self._conn_details.password.encode()
+
+        while True:
+            payload = self._read_packet()
+
+            if payload[0] == 0x00:
+                return
+            if payload[0] == 0xFF:
+                self._raise_error(payload)
+
+            if payload[0] == 0xFE:
+                reader = PacketReader(payload[1:])
+                plugin = reader.read_nul_bytes().decode()
+                nonce = reader.read_rest().rstrip(b"\0")
+                if plugin not in _SCRAMBLERS:
+                    raise ProtocolError(f"Authentication plugin {plugin} not supported")
+                self._write_packet(_SCRAMBLERS[plugin](password, nonce))
+            elif payload[0] == 0x01:
+                self._authenticate_more(plugin, payload[1:])
+            else:
+                raise ProtocolError("Unexpected authentication packet")
+
+    def _authenticate_more(self, plugin: str, data: bytes) -> None:
+        """Process the extra authentication data sent by the server."""
+        # Fast authentication succeeded, an OK packet follows
+        if plugin == "caching_sha2_password" and data == b"\x03":
+            return
+        # Full authentication requested, which needs a secure channel
+        if plugin == "caching_sha2_password" and data == b"\x04":
+            if not self._secure:
+                raise ProtocolError("Full caching_sha2_password authentication requires TLS")
+            self._write_packet(self._conn_details.password.encode() + b"\0")
+            return
+
+        raise ProtocolError("Unexpected authentication data")
+
+    def close(self) -> None:
+        """Close the connection, notifying the server."""
+        if self._sock is None:
+            return
+
+        try:
+            self._seq = 0
+            self.set_timeout(1)
+            self._write_packet(bytes([COM_QUIT]))
+        except OSError:
+            pass
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    def abort(self) -> None:
+        """Close the connection, without notifying the server."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def interrupt(self) -> None:
+        """Shut the connection down from any thread, waking up any blocked operation."""
+        sock = self._sock
+        if sock is None:
+            return
+
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def ping(self) -> None:
+        """Check the connection liveness."""
+        self._seq = 0
+        self._write_packet(bytes([COM_PING]))
+
+        payload = self._read_packet()
+        if payload[0] == 0xFF:
+            self._raise_error(payload)
+
+    def query(self, sql: str) -> list[Result]:
+        """Run a SQL query, returning the results of each of its statements.
+
+        If one of the statements fails, the error is raised and the following ones are skipped,
+        as the server stops processing the query.
+        """
+        self._seq = 0
+        self._write_packet(bytes([COM_QUERY]) + sql.encode())
+
+        results = [self._read_result()]
+        while results[-1].status & SERVER_MORE_RESULTS_EXISTS:
+            results.append(self._read_result())
+
+        return results
+
+    def _read_result(self) -> Result:
+        """Read a single statement result."""
+        payload = self._read_packet()
+
+        if payload[0] == 0xFF:
+            self._raise_error(payload)
+        if payload[0] == 0x00:
+            reader = PacketReader(payload[1:])
+            affected_rows = reader.read_lenenc_int()
+            reader.read_lenenc_int()
+            status = reader.read_int(2)
+            warnings = reader.read_int(2)
+            return Result(affected_rows=affected_rows, warning_count=warnings, status=status)
+        if payload[0] == 0xFB:
+            raise ProtocolError("LOCAL INFILE requests are not supported")
+
+        count = PacketReader(payload).read_lenenc_int()
+        columns = [self._read_column() for _ in range(count)]
+        self._read_packet()
+
+        result = Result(columns=columns)
+        self._read_rows(result)
+        return result
+
+    def _read_column(self) -> Column:
+        """Read a column definition."""
+        reader = PacketReader(self._read_packet())
+
+        for _ in range(4):
+            reader.read_lenenc_bytes()
+
+        name = reader.read_lenenc_bytes().decode()
+        reader.read_lenenc_bytes()
+        reader.read_lenenc_int()
+        charset = reader.read_int(2)
+        reader.read_int(4)
+        column_type = reader.read_int(1)
+        reader.read_int(2)
+        decimals = reader.read_int(1)
+
+        return Column(name=name, type=column_type, charset=charset, decimals=decimals)
+
+    def _read_rows(self, result: Result) -> None:
+        """Read the text protocol rows, until the closing EOF packet."""
+        while True:
+            payload = self._read_packet()
+
+            if payload[0] == 0xFF:
+                self._raise_error(payload)
+            if payload[0] == 0xFE and len(payload) < 9:
+                reader = PacketReader(payload[1:])
+                result.warning_count = reader.read_int(2)
+                result.status = reader.read_int(2)
+                return
+
+            reader = PacketReader(payload)
+            values = [reader.read_lenenc_bytes() for _ in result.columns]
+            result.rows.append({
+                column.name: self._convert(column, value)
+                for column, value in zip(result.columns, values)
+            })
+
+    @staticmethod
+    def _convert(column: Column, value: bytes | None) -> Any:
+        """Convert a text protocol value into its Python counterpart."""
+        if value is None:
+            return None
+        if column.type in _INTEGER_TYPES:
+            return int(value)
+        if column.type in _FLOAT_TYPES:
+            return float(value)
+        if column.type in _DECIMAL_TYPES:
+            return float(value) if column.decimals else int(value)
+        if column.type == _BIT_TYPE:
+            return int.from_bytes(value, "big")
+
+        return value.decode(errors="replace")
@@ -0,0 +1,382 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import gzip
+import json
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import IO, Iterator, Sequence
+
+from ..models import ConnectionDetails, StatementResult
+from .base import BaseExecutor, cancel_kwargs
+from .cancellation import CancellationToken
+from .errors import ExecutionError
+from .local import LocalShellMixin
+from .metrics import ExecutorHooks, current_operation, instrument, timed
+from .streaming import ShellOutputStream
+
+CASSETTE_VERSION = 1
+
+_PASSWORD_PATTERNS = (
+    (re.compile(r"(?<=IDENTIFIED BY )'(?:[^'\\]|\\.|'')*'", re.IGNORECASE), "'*****'"),
+    (
+        re.compile(r"""(?<=['"]password['"]: )(['"])(?:(?!\1)[^\\]|\\.)*\1""", re.IGNORECASE),
+        "'*****'",
+    ),
+    (re.compile(r"(?<=--password=)[^\s'\"]+"), "*****"),
+    (re.compile(r"(?<=://)([^:/@\s'\"]+):[^@\s'\"]*(?=@)"), r"\1:*****"),
+)
+
+
+def _open_cassette(path: str, mode: str) -> IO[str]:
+    """Open a cassette file, compressed with gzip if its name ends with .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+
+    return open(path, mode, encoding="utf-8")
+
+
+def _scrub(value, username: str = ""):
+    """Scrub the passwords from a script, a list of scripts or an output.
+
+    Only the password fields are scrubbed: SQL credentials, password keys,
+    password arguments and connection URIs (with or without scheme, when the username is known).
+    """
+    if isinstance(value, list):
+        return [_scrub(item, username) for item in value]
+    if not isinstance(value, str):
+        return value
+
+    for pattern, replace in _PASSWORD_PATTERNS:
+        value = pattern.sub(replace, value)
+    if username:
+        uri_pattern = rf"(?<![\w.%+-]){re.escape(username)}:[^@\s'\"]*(?=@)"
+        value = re.sub(uri_pattern, lambda _: f"{username}:*****", value)
+
+    return value
+
+
+def _entry_key(method: str, args: dict, username: str = "") -> str:
+    """Build the key used to match a call against the recorded ones, ignoring timeouts."""
+    args = {key: _scrub(value, username) for key, value in args.items() if key != "timeout"}
+    return json.dumps([method, args], sort_keys=True)
+
+
+class _CaptureHooks(ExecutorHooks):
+    """Hooks capturing the raw output of the current thread."""
+
+    def __init__(self):
+        """Initialize the hooks."""
+        self.local = threading.local()
+
+    def on_output(self, operation: str, output: str) -> None:
+        """Capture the output."""
+        self.local.output = output
+
+
+class RecordingExecutor(BaseExecutor):
+    """Executor recording every call of a wrapped executor into a cassette file.
+
+    Each call is appended as a JSON line, holding the executor method, its arguments,
+    its latency, its status and the raw MySQL Shell output. Executors not exposing
+    their raw output (see ExecutorHooks.on_output) get an equivalent one synthesized
+    from their results. Passwords are scrubbed from both the scripts and the outputs.
+    """
+
+    def __init__(self, executor: BaseExecutor, path: str):
+        """Initialize the executor.
+
+        Arguments:
+            executor: Executor to record the calls of
+            path: Path of the cassette file, compressed with gzip if ending with .gz
+        """
+        super().__init__(executor.connection_details, "", executor.hooks)
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._capture = _CaptureHooks()
+        self._file = _open_cassette(path, "w")
+
+        # The wrapped executor reports its raw output into the capturing hooks too
+        executor.add_hooks(self._capture)
+
+        header = {
+            "cassette": CASSETTE_VERSION,
+            "username": self._conn_details.username,
+            "host": self._conn_details.host,
+            "port": self._conn_details.port,
+            "socket": self._conn_details.socket,
+        }
+        self._write(header)
+
+    def __enter__(self):
+        """Enter the executor context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the executor context."""
+        self.close()
+
+    def _write(self, entry: dict) -> None:
+        """Append an entry to the cassette."""
+        with self._lock:
+            self._file.write(json.dumps(entry, default=str) + "\n")
+            self._file.flush()
+
+    def _record(self, method: str, args: dict, call, synthesize):
+        """Run and record a call, synthesizing its output if not captured."""
+        self._capture.local.output = None
+        start = time.perf_counter()
+        status = "ok"
+
+        try:
+            result = call()
+        except ExecutionError as e:
+            status = "timeout" if e.args[0] is None else "error"
+            output = json.dumps({"error": {"message": e.args[0]}})
+            raise
+        else:
+            output = synthesize(result)
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            captured = self._capture.local.output
+            username = self._conn_details.username
+
+            self._write({
+                "method": method,
+                "args": {key: _scrub(value, username) for key, value in args.items()},
+                "seconds": round(seconds, 6),
+                "status": status,
+                "output": _scrub(captured if captured is not None else output, username),
+            })
+
+    def close(self) -> None:
+        """Close the cassette file, and the wrapped executor."""
+        with self._lock:
+            self._file.close()
+
+        self._executor.remove_hooks(self._capture)
+        self._executor.close()
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        self._record(
+            "check_connection",
+            {},
+            lambda: self._executor.check_connection(),
+            lambda _: "",
+        )
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script."""
+        return self._record(
+            "execute_py",
+            {"script": script, "timeout": timeout},
+            lambda: self._executor.execute_py(script, timeout=timeout, **cancel_kwargs(cancel)),
+            lambda output: json.dumps({"info": output}),
+        )
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script."""
+        return self._record(
+            "execute_sql",
+            {"script": script, "timeout": timeout},
+            lambda: self._executor.execute_sql(script, timeout=timeout, **cancel_kwargs(cancel)),
+            lambda rows: json.dumps({"hasData": True, "rows": rows}, default=str),
+        )
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows.
+
+        The rows are fetched in full before being yielded, in order to be recorded.
+        """
+        yield from self._record(
+            "iter_sql",
+            {"script": script, "timeout": timeout},
+            lambda: list(self._executor.iter_sql(script, timeout=timeout)),
+            lambda rows: json.dumps({"hasData": True, "rows": rows}, default=str),
+        )
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, returning one result per statement."""
+
+        def synthesize(results: list[StatementResult]) -> str:
+            docs = [{"hasData": False, "rows": []}]
+            for result in results:
+                if not result.executed:
+                    break
+                if result.error:
+                    docs.append({"error": result.error})
+                    continue
+                docs.append({
+                    "hasData": bool(result.rows),
+                    "rows": result.rows,
+                    "warnings": result.warnings,
+                    "affectedItemsCount": result.affected_rows,
+                })
+            return "\n".join(json.dumps(doc, default=str) for doc in docs)
+
+        return self._record(
+            "execute_sql_batch",
+            {"statements": list(statements), "force": force, "timeout": timeout},
+            lambda: self._executor.execute_sql_batch(
+                statements, timeout=timeout, force=force, **cancel_kwargs(cancel)
+            ),
+            synthesize,
+        )
+
+
+class ReplayExecutor(LocalShellMixin, BaseExecutor):
+    """Executor serving the calls recorded into a cassette file.
+
+    Calls are matched by method and arguments (ignoring the timeout), and served in the
+    recorded order, cycling over them once exhausted. The recorded outputs go through the same
+    parsing as the local executor ones, so that both the parsing and the client logic
+    can be measured without a live server. By default, outputs are served as fast as possible,
+    use the realtime flag to reproduce the recorded latencies.
+    """
+
+    def __init__(self, path: str, realtime: bool = False, hooks: ExecutorHooks | None = None):
+        """Initialize the executor.
+
+        Arguments:
+            path: Path of the cassette file, compressed with gzip if ending with .gz
+            realtime: Whether to wait for the recorded latency before serving each call
+            hooks: Optional instrumentation hooks
+        """
+        with _open_cassette(path, "r") as file:
+            header = json.loads(file.readline())
+            entries = [json.loads(line) for line in file if line.strip()]
+
+        if header.get("cassette") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette file {path}")
+
+        conn_details = ConnectionDetails(
+            username=header["username"],
+            password="",
+            host=header["host"],
+            port=header["port"],
+            socket=header["socket"],
+        )
+
+        super().__init__(conn_details, "", hooks)
+        self._realtime = realtime
+        self._lock = threading.Lock()
+        self._entries = defaultdict(list)
+        self._positions = defaultdict(int)
+
+        for entry in entries:
+            key = _entry_key(entry["method"], entry["args"], conn_details.username)
+            self._entries[key].append(entry)
+
+    def _replay(self, method: str, args: dict) -> dict:
+        """Return the next recorded entry of a call, honoring its latency if needed."""
+        key = _entry_key(method, args, self._conn_details.username)
+
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ValueError(f"No recorded {method} call with {args}")
+
+            entry = entries[self._positions[key] % len(entries)]
+            self._positions[key] += 1
+
+        if self._realtime:
+            time.sleep(entry["seconds"])
+
+        operation = current_operation() or method
+        self._hooks.on_phase(operation, "run", entry["seconds"])
+        self._hooks.on_output(operation, entry["output"])
+
+        if entry["status"] == "timeout":
+            raise ExecutionError()
+
+        return entry
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        with instrument(self._hooks, "check_connection"):
+            entry = self._replay("check_connection", {})
+            if entry["status"] == "error":
+                raise ExecutionError(self._parse_error(entry["output"]))
+
+    def execute_py(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> str:
+        """Execute a Python script."""
+        with instrument(self._hooks, "execute_py"):
+            entry = self._replay("execute_py", {"script": script})
+            if entry["status"] == "error":
+                raise ExecutionError(self._parse_error(entry["output"]))
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_py(entry["output"])
+
+    def execute_sql(
+        self,
+        script: str,
+        *,
+        timeout: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict]:
+        """Execute a SQL script."""
+        with instrument(self._hooks, "execute_sql"):
+            entry = self._replay("execute_sql", {"script": script})
+            if entry["status"] == "error":
+                raise ExecutionError(self._parse_error(entry["output"]))
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_sql(entry["output"])
+
+    def iter_sql(self, script: str, *, timeout: int | None = None) -> Iterator[dict]:
+        """Execute a SQL script, iterating over the returned rows as they are decoded."""
+        entry = self._replay("iter_sql", {"script": script})
+        if entry["status"] == "error":
+            raise ExecutionError(self._parse_error(entry["output"]))
+
+        for kind, value in ShellOutputStream().feed(entry["output"], eof=True):
+            if kind == "row":
+                yield value
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements, returning one result per statement."""
+        args = {"statements": list(statements), "force": force}
+
+        with instrument(self._hooks, "execute_sql_batch"):
+            entry = self._replay("execute_sql_batch", args)
+            statements = [statement.strip().rstrip(";") for statement in statements]
+
+            with timed(self._hooks, "parse"):
+                return self._parse_output_batch(entry["output"], statements)
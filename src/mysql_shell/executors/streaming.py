@@ -0,0 +1,138 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import re
+from typing import Any, Iterator
+
+_INCOMPLETE = object()
+_WHITESPACE = re.compile(r"\s*")
+
+
+class ShellOutputStream:
+    """Incremental decoder of the MySQL Shell JSON output.
+
+    The output is decoded as it is fed, yielding the rows of every result document
+    one by one, followed by the rest of the document (without its rows) once completed.
+    This way, the memory usage is bounded by the size of a single row.
+    """
+
+    def __init__(self):
+        """Initialize the decoder."""
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._doc = {}
+        self._key = None
+        self._state = self._parse_doc_start
+
+    def feed(self, chunk: str, eof: bool = False) -> Iterator[tuple[str, Any]]:
+        """Feed a chunk of output, yielding the decoded ("row", row) and ("doc", doc) events.
+
+        Arguments:
+            chunk: Next chunk of output
+            eof: Whether this is the last chunk of output
+        """
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        self._eof = eof
+
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos >= len(self._buffer):
+                break
+
+            event = self._state()
+            if event is _INCOMPLETE:
+                break
+            if event is not None:
+                yield event
+
+        if eof and (self._pos < len(self._buffer) or self._state != self._parse_doc_start):
+            raise ValueError("Truncated MySQL Shell output")
+
+    def _decode(self) -> Any:
+        """Decode the next JSON value, if it has been completely fed."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            return _INCOMPLETE
+
+        # Numbers and literals could continue in the next chunk
+        if end == len(self._buffer) and not self._eof:
+            return _INCOMPLETE
+
+        self._pos = end
+        return value
+
+    def _consume(self, char: str) -> bool:
+        """Consume the next character if it matches the provided one."""
+        if self._buffer[self._pos] != char:
+            return False
+
+        self._pos += 1
+        return True
+
+    def _parse_doc_start(self) -> Any:
+        """Parse the start of a document."""
+        if not self._consume("{"):
+            raise ValueError("Invalid MySQL Shell output")
+
+        self._doc = {}
+        self._state = self._parse_key
+        return None
+
+    def _parse_key(self) -> Any:
+        """Parse a document key, or the end of the document."""
+        if self._consume(","):
+            return None
+        if self._consume("}"):
+            self._state = self._parse_doc_start
+            return "doc", self._doc
+
+        key = self._decode()
+        if key is _INCOMPLETE:
+            return key
+
+        self._key = key
+        self._state = self._parse_colon
+        return None
+
+    def _parse_colon(self) -> Any:
+        """Parse the key-value separator."""
+        if not self._consume(":"):
+            raise ValueError("Invalid MySQL Shell output")
+
+        self._state = self._parse_value
+        return None
+
+    def _parse_value(self) -> Any:
+        """Parse a document value, streaming the rows array."""
+        if self._key == "rows" and self._consume("["):
+            self._state = self._parse_row
+            return None
+
+        value = self._decode()
+        if value is _INCOMPLETE:
+            return value
+
+        self._doc[self._key] = value
+        self._state = self._parse_key
+        return None
+
+    def _parse_row(self) -> Any:
+        """Parse a row, or the end of the rows array."""
+        if self._consume(","):
+            return None
+        if self._consume("]"):
+            self._state = self._parse_key
+            return None
+
+        row = self._decode()
+        if row is _INCOMPLETE:
+            return row
+
+        return "row", row
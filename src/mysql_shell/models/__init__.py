@@ -4,5 +4,7 @@
 from .account import *
 from .cluster import *
 from .connection import *
+from .event import *
 from .instance import *
 from .statement import *
+from .topology import *
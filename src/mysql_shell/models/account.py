@@ -2,7 +2,7 @@
 # See LICENSE file for licensing details.
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -47,3 +47,17 @@ class User:
             return "{}"
 
         return json.dumps(self.attributes)
+
+
+@dataclass
+class UserReconciliation:
+    """MySQL user accounts changed to match a desired set of users."""
+
+    created: list[User] = field(default_factory=list)
+    updated: list[User] = field(default_factory=list)
+    deleted: list[User] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """Whether any user account was changed."""
+        return bool(self.created or self.updated or self.deleted)
@@ -1,6 +1,7 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -55,3 +56,21 @@ class ClusterStatus(str, Enum):
     ERROR = "ERROR"
     UNREACHABLE = "UNREACHABLE"
     UNKNOWN = "UNKNOWN"
+
+
+@dataclass
+class InstanceAttachment:
+    """Outcome of attaching an instance into a MySQL cluster.
+
+    Instances neither attached nor failed were skipped, after a previous failure.
+    """
+
+    address: str
+    attached: bool = False
+    error: str | None = None
+    seconds: float = 0.0
+
+    @property
+    def skipped(self) -> bool:
+        """Return whether the attachment was skipped."""
+        return not self.attached and self.error is None
@@ -0,0 +1,57 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from dataclasses import dataclass
+
+from .cluster import ClusterStatus
+from .instance import InstanceState
+
+
+@dataclass(frozen=True)
+class ClusterEvent:
+    """Base class for all MySQL cluster change events."""
+
+    cluster_name: str
+
+
+@dataclass(frozen=True)
+class ClusterStatusChanged(ClusterEvent):
+    """MySQL cluster status transition."""
+
+    old_status: ClusterStatus | None
+    new_status: ClusterStatus | None
+
+
+@dataclass(frozen=True)
+class MemberStateChanged(ClusterEvent):
+    """MySQL cluster member state change.
+
+    Members joining the cluster have no old state, and those leaving have no new state.
+    """
+
+    address: str
+    label: str
+    old_state: InstanceState | None
+    new_state: InstanceState | None
+
+
+@dataclass(frozen=True)
+class PrimaryChanged(ClusterEvent):
+    """MySQL cluster primary member change."""
+
+    old_primary: str | None
+    new_primary: str | None
+
+
+@dataclass(frozen=True)
+class RouterAdded(ClusterEvent):
+    """MySQL Router registered into the cluster."""
+
+    router: str
+
+
+@dataclass(frozen=True)
+class RouterRemoved(ClusterEvent):
+    """MySQL Router removed from the cluster."""
+
+    router: str
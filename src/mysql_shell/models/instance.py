@@ -1,6 +1,7 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -25,3 +26,45 @@ class InstanceState(str, Enum):
     OFFLINE = "OFFLINE"
     ERROR = "ERROR"
     UNREACHABLE = "UNREACHABLE"
+
+
+@dataclass(slots=True)
+class InstanceHealth:
+    """MySQL instance health snapshot.
+
+    Fields depending on the replication group, or on the cluster metadata,
+    are None when the instance is not part of any of them.
+    """
+
+    server_uuid: str
+    version: str
+    super_read_only: bool
+    gtid_executed: str
+    state: InstanceState | None = None
+    role: InstanceRole | None = None
+    label: str | None = None
+    work_ongoing: bool | None = None
+
+
+@dataclass(slots=True)
+class RecoveryProgress:
+    """MySQL instance recovery progress, as reported by the recovering instance.
+
+    Clone fields are None when the instance was never cloned,
+    or when the clone plugin is not installed.
+    """
+
+    state: InstanceState | None = None
+    channel_state: str | None = None
+    clone_state: str | None = None
+    clone_stage: str | None = None
+    clone_data: int | None = None
+    clone_estimate: int | None = None
+
+    @property
+    def clone_ratio(self) -> float | None:
+        """Return the ratio of the clone data already transferred."""
+        if self.clone_data is None or not self.clone_estimate:
+            return None
+
+        return min(self.clone_data / self.clone_estimate, 1.0)
@@ -1,6 +1,7 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -28,3 +29,20 @@ class VariableScope(str, Enum):
     SESSION = "SESSION"
     PERSIST = "PERSIST"
     PERSIST_ONLY = "PERSIST_ONLY"
+
+
+@dataclass
+class StatementResult:
+    """MySQL statement execution result."""
+
+    statement: str
+    rows: list[dict] = field(default_factory=list)
+    affected_rows: int = 0
+    warnings: list[dict] = field(default_factory=list)
+    error: dict | None = None
+    executed: bool = True
+
+    @property
+    def ok(self) -> bool:
+        """Whether the statement was executed without errors."""
+        return self.executed and self.error is None
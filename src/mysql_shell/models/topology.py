@@ -0,0 +1,178 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from .cluster import ClusterStatus
+from .instance import InstanceRole, InstanceState
+
+# Member status keys parsed eagerly, any other key belongs to the extended sections
+_MEMBER_KEYS = ("address", "memberRole", "status", "mode", "version", "replicationLag")
+
+
+def _parse_enum(enum: type, value: str | None):
+    """Parse an enum value, returning None if unknown (i.e. "(MISSING)" members)."""
+    try:
+        return enum(value)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class ClusterMember:
+    """MySQL cluster member, as reported by the cluster status.
+
+    The extended status sections are kept unparsed,
+    and only decoded when accessed through their properties.
+    """
+
+    label: str
+    address: str
+    role: InstanceRole | None
+    state: InstanceState | None
+    mode: str | None = None
+    version: str | None = None
+    replication_lag: str | None = None
+    _raw: Mapping[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_status(cls, label: str, status: Mapping[str, Any]):
+        """Create a cluster member from its cluster status entry."""
+        return ClusterMember(
+            label=label,
+            address=status.get("address", label),
+            role=_parse_enum(InstanceRole, status.get("memberRole")),
+            state=_parse_enum(InstanceState, status.get("status")),
+            mode=status.get("mode"),
+            version=status.get("version"),
+            replication_lag=status.get("replicationLag"),
+            _raw=status,
+        )
+
+    @property
+    def is_online(self) -> bool:
+        """Return whether the member is online."""
+        return self.state == InstanceState.ONLINE
+
+    @property
+    def instance_errors(self) -> list[str]:
+        """Return the diagnostic errors reported for the member."""
+        return list(self._raw.get("instanceErrors") or [])
+
+    @property
+    def member_id(self) -> str | None:
+        """Return the member server UUID, only reported by the extended status."""
+        return self._raw.get("memberId")
+
+    @property
+    def queue_sizes(self) -> dict[str, int]:
+        """Return the certifier and applier queue sizes, only reported by the fast status."""
+        return dict(self._raw.get("queueSizes") or {})
+
+    @property
+    def extended(self) -> dict[str, Any]:
+        """Return every extended status section of the member (transactions, fence vars...)."""
+        return {key: value for key, value in self._raw.items() if key not in _MEMBER_KEYS}
+
+
+@dataclass(slots=True)
+class ClusterTopology:
+    """MySQL cluster topology, indexed by member address, label, role and state.
+
+    Group Replication members that are online or recovering are part of the group,
+    and so are the unreachable ones, until expelled. The quorum requires a majority
+    of the group members to be reachable.
+    """
+
+    name: str
+    status: ClusterStatus | None
+    status_text: str = ""
+    primary: str | None = None
+    topology_mode: str | None = None
+    members: tuple[ClusterMember, ...] = ()
+    _by_address: dict = field(init=False, repr=False, compare=False)
+    _by_label: dict = field(init=False, repr=False, compare=False)
+    _by_role: dict = field(init=False, repr=False, compare=False)
+    _by_state: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the member indexes."""
+        self._by_address = {member.address: member for member in self.members}
+        self._by_label = {member.label: member for member in self.members}
+        self._by_role = {}
+        self._by_state = {}
+
+        for member in self.members:
+            self._by_role.setdefault(member.role, []).append(member)
+            self._by_state.setdefault(member.state, []).append(member)
+
+    @classmethod
+    def from_status(cls, status: Mapping[str, Any]):
+        """Create a cluster topology from the output of the cluster status."""
+        replica_set = status.get("defaultReplicaSet", {})
+        topology = replica_set.get("topology", {})
+
+        return ClusterTopology(
+            name=status.get("clusterName", ""),
+            status=_parse_enum(ClusterStatus, replica_set.get("status")),
+            status_text=replica_set.get("statusText", ""),
+            primary=replica_set.get("primary"),
+            topology_mode=replica_set.get("topologyMode"),
+            members=tuple(ClusterMember.from_status(k, v) for k, v in topology.items()),
+        )
+
+    def get_member(self, address: str) -> ClusterMember | None:
+        """Get a member by address."""
+        return self._by_address.get(address)
+
+    def get_member_by_label(self, label: str) -> ClusterMember | None:
+        """Get a member by label."""
+        return self._by_label.get(label)
+
+    def get_members_by_role(self, role: InstanceRole) -> list[ClusterMember]:
+        """Get the members with the provided role."""
+        return list(self._by_role.get(role, []))
+
+    def get_members_by_state(self, state: InstanceState) -> list[ClusterMember]:
+        """Get the members with the provided state."""
+        return list(self._by_state.get(state, []))
+
+    @property
+    def primary_member(self) -> ClusterMember | None:
+        """Return the primary member, if any."""
+        if self.primary and self.primary in self._by_address:
+            return self._by_address[self.primary]
+
+        primaries = self._by_role.get(InstanceRole.PRIMARY)
+        return primaries[0] if primaries else None
+
+    @property
+    def online_count(self) -> int:
+        """Return the number of online members."""
+        return len(self._by_state.get(InstanceState.ONLINE, []))
+
+    @property
+    def group_size(self) -> int:
+        """Return the number of members within the replication group."""
+        states = (InstanceState.ONLINE, InstanceState.RECOVERING, InstanceState.UNREACHABLE)
+        return sum(len(self._by_state.get(state, [])) for state in states)
+
+    @property
+    def reachable_count(self) -> int:
+        """Return the number of reachable members within the replication group."""
+        states = (InstanceState.ONLINE, InstanceState.RECOVERING)
+        return sum(len(self._by_state.get(state, [])) for state in states)
+
+    @property
+    def has_quorum(self) -> bool:
+        """Return whether a majority of the replication group members are reachable."""
+        return 2 * self.reachable_count > self.group_size
+
+    @property
+    def fault_tolerance(self) -> int:
+        """Return the number of member failures the cluster can tolerate, keeping the quorum."""
+        if not self.has_quorum:
+            return 0
+
+        return self.reachable_count - (self.group_size // 2 + 1)
@@ -0,0 +1,227 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable
+
+import pytest
+
+from ..helpers import FAKE_SHELL_PATH
+
+logger = logging.getLogger()
+
+
+def _read_peak_rss(pid: int | str) -> int:
+    """Read the peak RSS of a process in bytes, or 0 if it already exited."""
+    try:
+        with open(f"/proc/{pid}/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+
+    return 0
+
+
+def _reset_peak_rss(pid: int | str) -> None:
+    """Reset the peak RSS of a process to its current RSS, where supported."""
+    try:
+        with open(f"/proc/{pid}/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        pass
+
+
+def _list_children(pid: int) -> list[str]:
+    """List the PIDs of the processes spawned by the provided one."""
+    children = []
+
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as file:
+                stat = file.read()
+        except OSError:
+            continue
+
+        # The process name may contain spaces, so the fields are split after it
+        if int(stat.rsplit(")", 1)[1].split()[1]) == pid:
+            children.append(entry)
+
+    return children
+
+
+class ChildRSSSampler:
+    """Sampler of the peak RSS of the child processes, while running.
+
+    The peak RSS of every child is reported by the kernel until the child is reaped,
+    so short-lived children are sampled often, keeping the largest peak seen.
+    """
+
+    def __init__(self, interval: float = 0.002):
+        """Initialize the sampler."""
+        self.peak = 0
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        """Sample the children peak RSS, until stopped."""
+        pid = os.getpid()
+
+        while True:
+            for child in _list_children(pid):
+                self.peak = max(self.peak, _read_peak_rss(child))
+            if self._stop.wait(self._interval):
+                return
+
+    def __enter__(self):
+        """Start sampling, resetting the peak RSS of the already running children."""
+        for child in _list_children(os.getpid()):
+            _reset_peak_rss(child)
+
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+
+@dataclass
+class BenchmarkResult:
+    """Benchmark measurements."""
+
+    name: str
+    calls: int
+    calls_per_second: float
+    p50_seconds: float
+    p99_seconds: float
+    peak_memory_bytes: int
+    peak_rss_bytes: int
+    peak_child_rss_bytes: int
+
+
+class BenchmarkRecorder:
+    """Runner of benchmarks, keeping track of their results.
+
+    The memory usage is measured on a separate call, reporting the peak of the Python
+    allocations, the peak RSS of the process, and the largest peak RSS of its children
+    (i.e. MySQL Shell processes) alive during the call.
+
+    The results are dumped as JSON into the file pointed by BENCHMARK_OUTPUT, if set.
+    When BENCHMARK_BASELINE points to a previous output, every benchmark whose p50 latency
+    exceeds the baseline one by more than BENCHMARK_TOLERANCE (default: 0.25) fails.
+    """
+
+    def __init__(self):
+        """Initialize the recorder."""
+        self.results = {}
+        self.baseline = {}
+        self.tolerance = float(os.environ.get("BENCHMARK_TOLERANCE", "0.25"))
+
+        if baseline_path := os.environ.get("BENCHMARK_BASELINE"):
+            with open(baseline_path) as file:
+                self.baseline = {result["name"]: result for result in json.load(file)}
+
+    def run(self, name: str, func: Callable[[], object], calls: int) -> BenchmarkResult:
+        """Run a function several times, measuring its latency and memory usage."""
+        func()
+
+        latencies = []
+        start = time.perf_counter()
+
+        for _ in range(calls):
+            call_start = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - call_start)
+
+        elapsed = time.perf_counter() - start
+
+        # Memory tracing slows every allocation down, so it is done on a separate call
+        tracemalloc.start()
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        _reset_peak_rss("self")
+        with ChildRSSSampler() as sampler:
+            func()
+
+        peak_rss = _read_peak_rss("self")
+        quantiles = statistics.quantiles(latencies, n=100) if calls > 1 else latencies * 99
+
+        result = BenchmarkResult(
+            name=name,
+            calls=calls,
+            calls_per_second=calls / elapsed,
+            p50_seconds=quantiles[49],
+            p99_seconds=quantiles[98],
+            peak_memory_bytes=peak_memory,
+            peak_rss_bytes=peak_rss,
+            peak_child_rss_bytes=sampler.peak,
+        )
+
+        logger.info(
+            f"{name}: {result.calls_per_second:.1f} calls/s, "
+            f"p50 {result.p50_seconds * 1000:.2f} ms, p99 {result.p99_seconds * 1000:.2f} ms, "
+            f"peak memory {result.peak_memory_bytes / 2**20:.2f} MiB, "
+            f"peak child RSS {result.peak_child_rss_bytes / 2**20:.2f} MiB"
+        )
+
+        self.results[name] = result
+        self.check_regression(result)
+        return result
+
+    def check_regression(self, result: BenchmarkResult) -> None:
+        """Fail if the result p50 latency regressed over the baseline one."""
+        baseline = self.baseline.get(result.name)
+        if not baseline:
+            return
+
+        limit = baseline["p50_seconds"] * (1 + self.tolerance)
+        if result.p50_seconds > limit:
+            pytest.fail(
+                f"{result.name} p50 latency regressed: "
+                f"{result.p50_seconds:.6f}s > {limit:.6f}s (baseline {baseline['p50_seconds']}s)"
+            )
+
+    def dump(self) -> None:
+        """Dump the results into the output file, if any."""
+        output_path = os.environ.get("BENCHMARK_OUTPUT")
+        if not output_path:
+            return
+
+        with open(output_path, "w") as file:
+            json.dump([asdict(result) for result in self.results.values()], file, indent=2)
+
+
+@pytest.fixture(scope="session")
+def benchmark():
+    """Benchmark recorder fixture, shared by the whole session."""
+    recorder = BenchmarkRecorder()
+    yield recorder
+    recorder.dump()
+
+
+@pytest.fixture()
+def fake_shell(monkeypatch):
+    """Fake MySQL Shell fixture, returning a function to configure it."""
+
+    def configure(**settings) -> str:
+        for key, value in settings.items():
+            monkeypatch.setenv(f"FAKE_MYSQLSH_{key.upper()}", str(value))
+
+        return FAKE_SHELL_PATH
+
+    return configure
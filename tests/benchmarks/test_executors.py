@@ -0,0 +1,123 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+
+import pytest
+
+from mysql_shell.executors import LocalExecutor, PersistentExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from .conftest import BenchmarkRecorder
+
+ROW_COUNTS = [1, 1_000, 100_000]
+
+# Fewer calls are measured as the output size grows, to keep the suite fast
+CALLS = {1: 50, 1_000: 20, 100_000: 3}
+
+CONN_DETAILS = ConnectionDetails(username="root", password="root", host="localhost", port="3306")
+
+
+def _build_output(rows: int) -> str:
+    """Build a --json=raw SQL output, preceded by a prompt and a warning."""
+    docs = [
+        {"prompt": "Please provide the password for 'root@localhost:3306': "},
+        {"warning": "Using a password on the command line interface can be insecure."},
+        {
+            "hasData": True,
+            "rows": [{"id": i, "name": "x" * 16, "value": i / 2} for i in range(rows)],
+            "executionTime": "0.0001 sec",
+            "affectedItemsCount": 0,
+            "warningsCount": 0,
+            "warnings": [],
+            "info": "",
+        },
+    ]
+    return "\n".join(json.dumps(doc) for doc in docs) + "\n"
+
+
+@pytest.mark.benchmark
+class TestExecutorBenchmarks:
+    """Class to group all the executor hot path benchmarks."""
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_iter_output(self, benchmark: BenchmarkRecorder, rows: int):
+        """Benchmark the parsing of the MySQL Shell output."""
+        output = _build_output(rows)
+        result = benchmark.run(
+            f"iter_output[{rows}]",
+            lambda: next(LocalExecutor._iter_output(output, "rows")),
+            CALLS[rows] * 5,
+        )
+        assert result.calls_per_second > 0
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_local_execute_sql(self, benchmark: BenchmarkRecorder, fake_shell, rows: int):
+        """Benchmark the SQL execution of the local executor."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell(rows=rows))
+
+        benchmark.run(
+            f"local_execute_sql[{rows}]",
+            lambda: executor.execute_sql("SELECT * FROM t"),
+            CALLS[rows],
+        )
+        assert len(executor.execute_sql("SELECT * FROM t")) == rows
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_local_iter_sql(self, benchmark: BenchmarkRecorder, fake_shell, rows: int):
+        """Benchmark the SQL streaming of the local executor."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell(rows=rows))
+
+        benchmark.run(
+            f"local_iter_sql[{rows}]",
+            lambda: sum(1 for _ in executor.iter_sql("SELECT * FROM t")),
+            CALLS[rows],
+        )
+
+    @pytest.mark.parametrize("rows", ROW_COUNTS)
+    def test_persistent_execute_sql(self, benchmark: BenchmarkRecorder, fake_shell, rows: int):
+        """Benchmark the SQL execution of the persistent executor."""
+        with PersistentExecutor(CONN_DETAILS, fake_shell(rows=rows)) as executor:
+            benchmark.run(
+                f"persistent_execute_sql[{rows}]",
+                lambda: executor.execute_sql("SELECT * FROM t"),
+                CALLS[rows],
+            )
+            assert len(executor.execute_sql("SELECT * FROM t")) == rows
+
+    def test_local_execute_py(self, benchmark: BenchmarkRecorder, fake_shell):
+        """Benchmark the Python execution of the local executor."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell())
+        script = "print(dba.get_cluster('test-cluster').status())"
+
+        benchmark.run("local_execute_py", lambda: executor.execute_py(script), CALLS[1])
+
+    def test_local_startup_latency(self, benchmark: BenchmarkRecorder, fake_shell):
+        """Benchmark the local executor against a slow starting MySQL Shell."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell(latency=0.1))
+
+        result = benchmark.run(
+            "local_execute_sql_slow_startup",
+            lambda: executor.execute_sql("SELECT 1"),
+            10,
+        )
+        assert result.p50_seconds >= 0.1
+
+    @pytest.mark.parametrize("failure", ["auth", "query", "crash"])
+    def test_local_failures(self, benchmark: BenchmarkRecorder, fake_shell, failure: str):
+        """Benchmark the error handling of the local executor."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell(failure=failure))
+
+        def call():
+            with pytest.raises(ExecutionError):
+                executor.execute_sql("SELECT 1")
+
+        benchmark.run(f"local_execute_sql_failure[{failure}]", call, CALLS[1])
+
+    def test_local_timeout(self, fake_shell):
+        """Check the timeout handling against a hanging MySQL Shell."""
+        executor = LocalExecutor(CONN_DETAILS, fake_shell(failure="hang"))
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("SELECT 1", timeout=0.5)
@@ -8,6 +8,7 @@ import pytest
 from mysql_shell.builders import CharmAuthorizationQueryBuilder
 from mysql_shell.executors import LocalExecutor
 from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import StatementResult
 from mysql_shell.models.account import Role
 from mysql_shell.models.statement import VariableScope
 
@@ -17,6 +18,74 @@ from ...helpers import (
 )
 
 
+@pytest.mark.unit
+class TestCharmAuthorizationQueryBuilderDelta:
+    """Class to group all the CharmAuthorizationQueryBuilder delta tests."""
+
+    @pytest.fixture()
+    def builder(self):
+        """Query builder fixture."""
+        return CharmAuthorizationQueryBuilder(
+            role_admin="role_admin",
+            role_backup="role_backup",
+            role_ddl="role_ddl",
+            role_stats="role_stats",
+            role_reader="role_reader",
+            role_writer="role_writer",
+        )
+
+    @staticmethod
+    def _grants(rolename: str, *grants: str) -> StatementResult:
+        """Build the result of showing the grants of a role."""
+        header = f"Grants for {rolename}@%"
+        return StatementResult("", rows=[{header: grant} for grant in grants])
+
+    def test_missing_roles(self, builder: CharmAuthorizationQueryBuilder):
+        """Test the delta query when no role exists."""
+        queries = builder.build_instance_auth_roles_state_queries()
+        results = [StatementResult(q) for q in queries[:2]]
+        results += [StatementResult(q, error={"message": "No such grant"}) for q in queries[2:]]
+
+        query = builder.build_instance_auth_roles_delta_query(results)
+        full_query = builder.build_instance_auth_roles_query()
+
+        assert len(queries) == 8
+        assert query == full_query.replace("CREATE ROLE", "CREATE ROLE IF NOT EXISTS")
+
+    def test_partial_roles(self, builder: CharmAuthorizationQueryBuilder):
+        """Test the delta query when only some roles, parents and privileges exist."""
+        rolenames = ["role_reader", "role_writer", "role_stats", "role_ddl", "role_backup"]
+        results = [
+            StatementResult("", rows=[{"rolename": name} for name in rolenames]),
+            StatementResult("", rows=[{"rolename": "role_ddl", "parent": "role_writer"}]),
+            self._grants("role_reader", "GRANT USAGE ON *.* TO `role_reader`@`%`"),
+            self._grants("role_writer", "GRANT USAGE ON *.* TO `role_writer`@`%`"),
+            self._grants(
+                "role_stats",
+                "GRANT PROCESS, RELOAD, REPLICATION CLIENT ON *.* TO `role_stats`@`%`",
+                "GRANT SELECT ON `performance_schema`.* TO `role_stats`@`%`",
+            ),
+            self._grants("role_ddl", "GRANT ALL PRIVILEGES ON *.* TO `role_ddl`@`%`"),
+            self._grants(
+                "role_backup",
+                "GRANT EXECUTE, PROCESS, RELOAD ON *.* TO `role_backup`@`%`",
+                "GRANT BACKUP_ADMIN,CONNECTION_ADMIN ON *.* TO `role_backup`@`%`",
+            ),
+            StatementResult("", error={"message": "No such grant"}),
+        ]
+
+        query = builder.build_instance_auth_roles_delta_query(results)
+
+        assert query.split(";") == [
+            "GRANT 'role_stats' TO 'role_backup'",
+            "GRANT LOCK TABLES ON *.* TO 'role_backup'",
+            "CREATE ROLE IF NOT EXISTS 'role_admin'",
+            "GRANT 'role_backup', 'role_ddl', 'role_stats', 'role_writer' TO 'role_admin'",
+            "GRANT SELECT, INSERT, DELETE, UPDATE, EXECUTE, EVENT, SHUTDOWN, AUDIT_ADMIN, "
+            "CONNECTION_ADMIN, SYSTEM_VARIABLES_ADMIN ON *.* TO 'role_admin'",
+        ]
+
+
 @pytest.mark.integration
 class TestCharmAuthorizationQueryBuilder:
     """Class to group all the CharmAuthorizationQueryBuilder tests."""
@@ -129,6 +198,36 @@ class TestCharmAuthorizationQueryBuilder:
             self._delete_role(executor, Role("role_reader"))
             self._delete_role(executor, Role("role_writer"))
 
+    def test_instance_auth_roles_delta_query(self, executor: LocalExecutor):
+        """Test the idempotent creation of instance auth roles."""
+        builder = CharmAuthorizationQueryBuilder(
+            role_admin="role_admin",
+            role_backup="role_backup",
+            role_ddl="role_ddl",
+            role_stats="role_stats",
+            role_reader="role_reader",
+            role_writer="role_writer",
+        )
+
+        try:
+            executor.execute_sql("CREATE ROLE role_stats")
+
+            queries = builder.build_instance_auth_roles_state_queries()
+            results = executor.execute_sql_batch(queries, force=True)
+            query = builder.build_instance_auth_roles_delta_query(results)
+            assert "CREATE ROLE IF NOT EXISTS 'role_stats'" not in query
+            executor.execute_sql(query)
+
+            results = executor.execute_sql_batch(queries, force=True)
+            assert builder.build_instance_auth_roles_delta_query(results) == ""
+        finally:
+            self._delete_role(executor, Role("role_admin"))
+            self._delete_role(executor, Role("role_backup"))
+            self._delete_role(executor, Role("role_ddl"))
+            self._delete_role(executor, Role("role_stats"))
+            self._delete_role(executor, Role("role_reader"))
+            self._delete_role(executor, Role("role_writer"))
+
     def test_database_admin_role_query(self, executor: LocalExecutor):
         """Test the creation of a database admin role."""
         builder = CharmAuthorizationQueryBuilder(
@@ -2,6 +2,7 @@
 # See LICENSE file for licensing details.
 
 import os
+import time
 
 import pytest
 
@@ -11,6 +12,55 @@ from mysql_shell.executors import LocalExecutor
 from ...helpers import build_local_executor
 
 
+@pytest.mark.unit
+class TestCharmLockingQueryBuilderQueries:
+    """Class to group all the CharmLockingQueryBuilder query tests."""
+
+    def test_acquire_query(self):
+        """Test the building of the lock acquiring query, with and without leases."""
+        task = CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+        builder = CharmLockingQueryBuilder("mysql", "locking")
+        query = builder.build_acquire_query(task, "mysql-1")
+        assert "expires_at = NULL" in query
+        assert "expires_at <= UTC_TIMESTAMP(6)" in query
+
+        builder = CharmLockingQueryBuilder("mysql", "locking", lease_duration=30)
+        query = builder.build_acquire_query(task, "mysql-1")
+        assert "expires_at = UTC_TIMESTAMP(6) + INTERVAL 30 SECOND" in query
+
+    def test_renew_query(self):
+        """Test the building of the lock lease renewal query."""
+        task = CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+        builder = CharmLockingQueryBuilder("mysql", "locking")
+        with pytest.raises(ValueError):
+            builder.build_renew_query(task, "mysql-1")
+
+        builder = CharmLockingQueryBuilder("mysql", "locking", lease_duration=30)
+        query = builder.build_renew_query(task, "mysql-1")
+        assert query == (
+            "UPDATE `mysql`.`locking` "
+            "SET expires_at = UTC_TIMESTAMP(6) + INTERVAL 30 SECOND "
+            "WHERE task = 'unit-add' AND executor = 'mysql-1' AND status = 'in-progress'"
+        )
+
+    def test_custom_tasks(self):
+        """Test the configuration of the lockable tasks."""
+        builder = CharmLockingQueryBuilder("mysql", "locking", tasks=["backup"])
+
+        assert builder.tasks == ["backup"]
+        assert "VALUES ('backup'" in builder.build_table_creation_query()
+        assert builder.build_acquire_query("backup", "mysql-1")
+
+        with pytest.raises(ValueError):
+            builder.build_acquire_query(CharmLockingQueryBuilder.INSTANCE_ADDITION_TASK, "mysql-1")
+        with pytest.raises(ValueError):
+            CharmLockingQueryBuilder("mysql", "locking", tasks=["x" * 21])
+        with pytest.raises(ValueError):
+            CharmLockingQueryBuilder("mysql", "locking", lease_duration=0)
+
+
 @pytest.mark.integration
 class TestCharmLockingQueryBuilder:
     """Class to group all the CharmLockingQueryBuilder tests."""
@@ -97,3 +147,31 @@ class TestCharmLockingQueryBuilder:
         executor.execute_sql(release_query)
 
         assert self._fetch_lock_instance(executor, task) is None
+
+    def test_lease_expiry(self, executor: LocalExecutor):
+        """Test the taking over of an expired lock lease, and its renewal."""
+        builder = CharmLockingQueryBuilder("mysql", "locking", lease_duration=1)
+        task = CharmLockingQueryBuilder.INSTANCE_REMOVAL_TASK
+
+        executor.execute_sql(builder.build_table_creation_query())
+
+        try:
+            executor.execute_sql(builder.build_acquire_query(task, "mysql-1"))
+            executor.execute_sql(builder.build_acquire_query(task, "mysql-2"))
+            assert self._fetch_lock_instance(executor, task) == "mysql-1"
+
+            time.sleep(1.5)
+            executor.execute_sql(builder.build_renew_query(task, "mysql-1"))
+            executor.execute_sql(builder.build_acquire_query(task, "mysql-2"))
+            assert self._fetch_lock_instance(executor, task) == "mysql-1"
+
+            time.sleep(1.5)
+            executor.execute_sql(builder.build_acquire_query(task, "mysql-2"))
+            assert self._fetch_lock_instance(executor, task) == "mysql-2"
+
+            executor.execute_sql(builder.build_release_query(task, "mysql-1"))
+            assert self._fetch_lock_instance(executor, task) == "mysql-2"
+        finally:
+            executor.execute_sql(builder.build_release_query(task, "mysql-2"))
+
+        assert executor.execute_sql(builder.build_fetch_acquired_query(task)) == []
@@ -0,0 +1,113 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+
+import pytest
+
+from mysql_shell.builders import NamedLockingQueryBuilder
+from mysql_shell.executors import PersistentExecutor
+
+from ...helpers import build_persistent_executor
+
+
+@pytest.mark.unit
+class TestNamedLockingQueryBuilderQueries:
+    """Class to group all the NamedLockingQueryBuilder query tests."""
+
+    def test_acquire_query(self):
+        """Test the building of the lock acquiring query."""
+        builder = NamedLockingQueryBuilder("mysql")
+        task = NamedLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+        query = builder.build_acquire_query(task, "mysql-1", timeout=5)
+        assert query == (
+            "SELECT IF(GET_LOCK('mysql.unit-add', 5) = 1, "
+            "GET_LOCK('mysql.unit-add.mysql-1', 0), 0) AS acquired"
+        )
+
+        query = builder.build_acquire_query(task, "mysql-1", timeout=None)
+        assert "GET_LOCK('mysql.unit-add', -1)" in query
+
+    def test_release_query(self):
+        """Test the building of the lock releasing query."""
+        builder = NamedLockingQueryBuilder("mysql")
+        task = NamedLockingQueryBuilder.INSTANCE_REMOVAL_TASK
+
+        query = builder.build_release_query(task, "mysql-1")
+        assert query == (
+            "SELECT IF(RELEASE_LOCK('mysql.unit-teardown.mysql-1') = 1, "
+            "RELEASE_LOCK('mysql.unit-teardown'), 0) AS released"
+        )
+
+    def test_fetch_acquired_query(self):
+        """Test the building of the acquired lock fetch query, escaping the LIKE wildcards."""
+        builder = NamedLockingQueryBuilder("my_app")
+        task = NamedLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+        query = builder.build_fetch_acquired_query(task)
+        assert "SUBSTRING(object_name, 17)" in query
+        assert "LIKE 'my\\\\_app.unit-add.%'" in query
+
+    def test_invalid_names(self):
+        """Test the rejection of unknown tasks, and too long lock names."""
+        builder = NamedLockingQueryBuilder("mysql")
+        task = NamedLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+        with pytest.raises(ValueError):
+            builder.build_acquire_query("unknown", "mysql-1")
+        with pytest.raises(ValueError):
+            builder.build_acquire_query(task, "x" * 64)
+
+        builder = NamedLockingQueryBuilder("mysql", tasks=["backup"])
+        assert builder.build_acquire_query("backup", "mysql-1")
+        with pytest.raises(ValueError):
+            builder.build_acquire_query(task, "mysql-1")
+
+
+@pytest.mark.integration
+class TestNamedLockingQueryBuilder:
+    """Class to group all the NamedLockingQueryBuilder tests."""
+
+    @pytest.fixture(scope="class")
+    def executors(self):
+        """Pair of persistent executors fixture, holding independent sessions."""
+        executors = [
+            build_persistent_executor(
+                username=os.environ["MYSQL_USERNAME"],
+                password=os.environ["MYSQL_PASSWORD"],
+            )
+            for _ in range(2)
+        ]
+        yield executors
+
+        for executor in executors:
+            executor.close()
+
+    def test_acquire_release_queries(self, executors: list[PersistentExecutor]):
+        """Test the acquiring and releasing of a named lock across sessions."""
+        builder = NamedLockingQueryBuilder("mysql")
+        task = NamedLockingQueryBuilder.INSTANCE_ADDITION_TASK
+        first, second = executors
+
+        try:
+            rows = first.execute_sql(builder.build_acquire_query(task, "mysql-1"))
+            assert rows[0]["acquired"] == 1
+
+            rows = second.execute_sql(builder.build_acquire_query(task, "mysql-2", timeout=1))
+            assert rows[0]["acquired"] == 0
+
+            rows = second.execute_sql(builder.build_fetch_acquired_query(task))
+            assert [row["executor"] for row in rows] == ["mysql-1"]
+
+            rows = second.execute_sql(builder.build_held_query(task, "mysql-1"))
+            assert rows[0]["held"] == 0
+
+            rows = second.execute_sql(builder.build_release_query(task, "mysql-1"))
+            assert rows[0]["released"] != 1
+        finally:
+            rows = first.execute_sql(builder.build_release_query(task, "mysql-1"))
+            assert rows[0]["released"] == 1
+
+        rows = second.execute_sql(builder.build_fetch_acquired_query(task))
+        assert rows == []
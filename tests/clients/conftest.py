@@ -20,8 +20,11 @@ _GTID_MODES_ORDERED = (
 
 
 @pytest.fixture(scope="session", autouse=True)
-def initialize_cluster():
+def initialize_cluster(request):
     """Initializes InnoDB cluster in an idempotent way."""
+    if not any(item.get_closest_marker("integration") for item in request.session.items):
+        return
+
     executor = build_local_executor(
         username=os.environ["MYSQL_USERNAME"],
         password=os.environ["MYSQL_PASSWORD"],
@@ -0,0 +1,258 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import time
+
+import pytest
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import (
+    MetadataCache,
+    MySQLClusterClient,
+    MySQLInstanceClient,
+    ResultCache,
+)
+from mysql_shell.executors import LocalExecutor, MetricsRegistry
+from mysql_shell.models import ConnectionDetails
+from mysql_shell.models.statement import VariableScope
+
+from ..helpers import FAKE_SHELL_PATH
+
+RESULTS = {
+    "view_id": [{"view_id": "1:1"}],
+    "router_id": [{"routers": "1:1"}],
+    "`version`": [{"version": "8.0.40-log"}],
+    "cluster_name": [{"cluster_name": "c1"}],
+}
+
+
+def _write_results(path, **overrides) -> None:
+    """Write the fake MySQL Shell results file, with some statements overridden."""
+    path.write_text(json.dumps({**RESULTS, **overrides}))
+
+
+@pytest.mark.unit
+class TestResultCache:
+    """Class to group all the ResultCache tests."""
+
+    @pytest.fixture()
+    def executor(self, tmp_path, monkeypatch):
+        """Local executor fixture, running the fake MySQL Shell."""
+        results_path = tmp_path / "results.json"
+        _write_results(results_path)
+        monkeypatch.setenv("FAKE_MYSQLSH_RESULTS", str(results_path))
+
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH, MetricsRegistry())
+
+    def test_expiration(self):
+        """Test the expiration of entries by their TTL."""
+        cache = ResultCache(ttl=0.05, ttls={"slow": 60, "never": 0})
+        cache.put("a", [1], cache.ttl("fast"))
+        cache.put("b", [2], cache.ttl("slow"))
+        cache.put("c", [3], cache.ttl("never"))
+
+        assert cache.get("a") == (True, [1])
+        assert cache.get("c") == (False, None)
+        time.sleep(0.1)
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (True, [2])
+
+    def test_eviction(self):
+        """Test the eviction of the least recently used entries."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1, 60)
+        cache.put("b", 2, 60)
+        cache.get("a")
+        cache.put("c", 3, 60)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.stats().evictions == 1
+
+    def test_copies(self):
+        """Test that cached values are not shared with the callers."""
+        cache = ResultCache()
+        value = ["a"]
+        cache.put("key", value, 60)
+        value.append("b")
+
+        _, cached = cache.get("key")
+        cached.append("c")
+        assert cache.get("key") == (True, ["a"])
+
+    def test_client_reads(self, executor: LocalExecutor):
+        """Test the caching of the client read methods."""
+        registry = executor.hooks
+        cache = ResultCache()
+        client = MySQLInstanceClient(executor, StringQueryQuoter(), cache)
+
+        assert client.get_instance_version() == "8.0.40"
+        assert client.get_instance_version() == "8.0.40"
+        assert client.get_cluster_labels() == ["c1"]
+        assert client.get_cluster_labels() == ["c1"]
+        assert registry.phase_count("get_instance_variable", "run") == 1
+        assert registry.phase_count("get_cluster_labels", "run") == 1
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 3, 3)
+        assert stats.hit_ratio == 0.4
+
+    def test_client_version_reads(self, executor: LocalExecutor):
+        """Test the caching of the instance version, even with its variable uncached."""
+        cache = ResultCache(ttls={"get_instance_variable": 0})
+        client = MySQLInstanceClient(executor, StringQueryQuoter(), cache)
+
+        assert client.get_instance_version() == "8.0.40"
+        assert client.get_instance_version() == "8.0.40"
+        assert executor.hooks.phase_count("get_instance_variable", "run") == 1
+        assert cache.stats().hits == 1
+
+    def test_client_writes(self, executor: LocalExecutor):
+        """Test the invalidation of the cache by the client write methods."""
+        registry = executor.hooks
+        cache = ResultCache()
+        client = MySQLInstanceClient(executor, StringQueryQuoter(), cache)
+
+        client.get_cluster_labels()
+        client.set_instance_variable(VariableScope.GLOBAL, "max_connections", 100)
+        client.get_cluster_labels()
+
+        assert registry.phase_count("get_cluster_labels", "run") == 2
+        assert cache.stats().invalidations == 1
+
+    def test_client_session_reads(self, executor: LocalExecutor):
+        """Test that the session variable reads are never cached."""
+        cache = ResultCache()
+        client = MySQLInstanceClient(executor, StringQueryQuoter(), cache)
+
+        assert client.get_instance_variable(VariableScope.SESSION, "version") == "8.0.40-log"
+        assert client.get_instance_variable(VariableScope.SESSION, "version") == "8.0.40-log"
+        assert executor.hooks.phase_count("get_instance_variable", "run") == 2
+        assert cache.stats().entries == 0
+
+    def test_client_replication_writes(self, executor: LocalExecutor):
+        """Test the invalidation of the cache by the group replication changes."""
+        cache = ResultCache()
+        client = MySQLInstanceClient(executor, StringQueryQuoter(), cache)
+
+        client.get_instance_version()
+        client.stop_instance_replication()
+        client.start_instance_replication()
+
+        assert cache.stats().entries == 0
+        assert cache.stats().invalidations == 2
+
+
+@pytest.mark.unit
+class TestMetadataCache:
+    """Class to group all the MetadataCache tests."""
+
+    @pytest.fixture()
+    def results_path(self, tmp_path, monkeypatch):
+        """Fake MySQL Shell results file fixture, reporting the group view."""
+        results_path = tmp_path / "results.json"
+        _write_results(results_path)
+        monkeypatch.setenv("FAKE_MYSQLSH_RESULTS", str(results_path))
+        return results_path
+
+    @staticmethod
+    def _build_executor(socket: str = "/tmp/sock") -> LocalExecutor:
+        """Build a local executor, running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="test", password="test", socket=socket)
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH, MetricsRegistry())
+
+    @pytest.fixture()
+    def executor(self, results_path):
+        """Local executor fixture, running the fake MySQL Shell."""
+        return self._build_executor()
+
+    def test_validation(self):
+        """Test the validation of entries by their fingerprint."""
+        cache = MetadataCache()
+        fingerprint = cache.fingerprint([{"view_id": "1:1", "members": "a"}])
+        cache.put("a", [1], fingerprint)
+
+        assert cache.get("a", cache.fingerprint([{"members": "a", "view_id": "1:1"}])) == (
+            True,
+            [1],
+        )
+        assert cache.get("a", cache.fingerprint([{"view_id": "1:2", "members": "a"}])) == (
+            False,
+            None,
+        )
+        assert cache.get("a", fingerprint) == (False, None)
+
+    def test_eviction(self):
+        """Test the eviction of the least recently used entries."""
+        cache = MetadataCache(max_entries=1)
+        cache.put("a", 1, ())
+        cache.put("b", 2, ())
+
+        assert cache.get("a", ()) == (False, None)
+        assert cache.get("b", ()) == (True, 2)
+        assert cache.stats().evictions == 1
+
+    def test_probe_query(self):
+        """Test that only the router reads fingerprint the routers metadata."""
+        assert "view_id" in MetadataCache.build_probe_query()
+        assert "routers" not in MetadataCache.build_probe_query()
+        assert "routers" in MetadataCache.build_probe_query(routers=True)
+        assert "last_check_in" not in MetadataCache.build_probe_query(routers=True)
+
+    def test_client_reads(self, executor: LocalExecutor, results_path):
+        """Test the caching of the cluster status, until the group view changes."""
+        registry = executor.hooks
+        cache = MetadataCache()
+        client = MySQLClusterClient(executor, cache)
+
+        status = client.fetch_cluster_status("test-cluster")
+        assert client.fetch_cluster_status("test-cluster") == status
+        assert registry.phase_count("fetch_cluster_status", "run") == 3
+
+        _write_results(results_path, view_id=[{"view_id": "1:2"}])
+        assert client.fetch_cluster_topology("test-cluster").name == "test-cluster"
+        assert registry.phase_count("fetch_cluster_status", "run") == 5
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+
+    def test_client_routers_reads(self, executor: LocalExecutor, results_path):
+        """Test the caching of the cluster routers, until the routers metadata changes."""
+        registry = executor.hooks
+        cache = MetadataCache()
+        client = MySQLClusterClient(executor, cache)
+
+        routers = client.list_cluster_routers("test-cluster")
+        assert client.list_cluster_routers("test-cluster") == routers
+        _write_results(results_path, view_id=[{"view_id": "1:2"}])
+        assert client.list_cluster_routers("test-cluster") == routers
+        assert registry.phase_count("list_cluster_routers", "run") == 4
+
+        _write_results(results_path, router_id=[{"routers": "1:2"}])
+        assert client.list_cluster_routers("test-cluster") == routers
+        assert registry.phase_count("list_cluster_routers", "run") == 6
+
+    def test_client_instances(self, results_path):
+        """Test that clients sharing the cache never read entries of other instances."""
+        cache = MetadataCache()
+        client_a = MySQLClusterClient(self._build_executor("/tmp/sock-a"), cache)
+        client_b = MySQLClusterClient(self._build_executor("/tmp/sock-b"), cache)
+
+        client_a.fetch_cluster_status("test-cluster")
+        client_b.fetch_cluster_status("test-cluster")
+        client_a.fetch_cluster_status("test-cluster")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+    def test_client_probe_failure(self, executor: LocalExecutor, results_path):
+        """Test the uncached cluster status reads, when the probe query fails."""
+        _write_results(results_path, view_id=None)
+
+        cache = MetadataCache()
+        client = MySQLClusterClient(executor, cache)
+
+        assert client.fetch_cluster_status("test-cluster")["clusterName"] == "test-cluster"
+        assert cache.stats().entries == 0
@@ -1,19 +1,259 @@
 # Copyright 2025 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import contextlib
+import io
 import os
 
 import pytest
 
-from mysql_shell.clients import MySQLClusterClient
-from mysql_shell.executors import LocalExecutor
+from mysql_shell.clients import MetadataCache, MySQLClusterClient, MySQLInstanceClient
+from mysql_shell.executors import BaseExecutor, LocalExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+from mysql_shell.models.cluster import ClusterStatus
+from mysql_shell.models.instance import InstanceState, RecoveryProgress
 
 from ..helpers import (
+    FAKE_SHELL_PATH,
     TEST_CLUSTER_NAME,
     build_local_executor,
 )
 
 
+class _StubCluster:
+    """AdminAPI cluster handle, failing to add the provided addresses, for testing."""
+
+    def __init__(self, failing: set[str]):
+        """Initialize the cluster."""
+        self.failing = failing
+        self.added = []
+
+    def add_instance(self, address: str, options: dict | None) -> None:
+        """Adds an instance into the cluster."""
+        if address in self.failing:
+            raise RuntimeError(f"Cannot add {address}")
+        self.added.append((address, options))
+
+
+class _StubDba:
+    """AdminAPI global object, counting the cluster handle lookups, for testing."""
+
+    def __init__(self, cluster: _StubCluster):
+        """Initialize the object."""
+        self.cluster = cluster
+        self.lookups = 0
+
+    def get_cluster(self, name: str) -> _StubCluster:
+        """Gets the cluster handle."""
+        self.lookups += 1
+        return self.cluster
+
+
+class StubAdminExecutor(BaseExecutor):
+    """Executor running Python scripts against a stub AdminAPI, for testing."""
+
+    def __init__(self, dba: _StubDba | None = None, rows: list[dict] | None = None):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.dba = dba
+        self.rows = rows or []
+        self.calls = 0
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script, returning its last printed line."""
+        self.calls += 1
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exec(script, {"dba": self.dba})
+        return output.getvalue().splitlines()[-1]
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script, returning the canned rows."""
+        self.calls += 1
+        return self.rows
+
+
+@pytest.mark.unit
+class TestClusterClientAttachments:
+    """Class to group all the MySQLClusterClient batch attachment tests."""
+
+    INSTANCES = [("10.0.0.1", "3306"), ("10.0.0.2", "3306"), ("10.0.0.3", "3306")]
+
+    def test_attach_instances(self):
+        """Test the attachment of several instances, within a single session."""
+        dba = _StubDba(_StubCluster(failing={"10.0.0.2:3306"}))
+        executor = StubAdminExecutor(dba)
+        client = MySQLClusterClient(executor)
+
+        options = {"recoveryMethod": "clone"}
+        results = client.attach_instances_into_cluster("test", self.INSTANCES, options)
+
+        assert executor.calls == 1
+        assert dba.lookups == 1
+        assert dba.cluster.added == [("10.0.0.1:3306", options), ("10.0.0.3:3306", options)]
+        assert list(results) == ["10.0.0.1:3306", "10.0.0.2:3306", "10.0.0.3:3306"]
+        assert results["10.0.0.1:3306"].attached
+        assert not results["10.0.0.2:3306"].attached
+        assert results["10.0.0.2:3306"].error == "Cannot add 10.0.0.2:3306"
+        assert results["10.0.0.3:3306"].attached
+
+    def test_attach_instances_stop_on_error(self):
+        """Test the skipping of the remaining instances after a failure."""
+        dba = _StubDba(_StubCluster(failing={"10.0.0.2:3306"}))
+        client = MySQLClusterClient(StubAdminExecutor(dba))
+
+        results = client.attach_instances_into_cluster("test", self.INSTANCES, stop_on_error=True)
+
+        assert dba.cluster.added == [("10.0.0.1:3306", None)]
+        assert results["10.0.0.2:3306"].error
+        assert results["10.0.0.3:3306"].skipped
+
+
+def _build_fast_status_row(label: str, state: str | None, role: str | None, **kwargs) -> dict:
+    """Build a fast status row, as returned by the metadata query."""
+    row = {
+        "cluster_name": "test",
+        "primary_mode": "pm",
+        "label": label,
+        "address": f"{label}:3306",
+        "member_state": state,
+        "member_role": role,
+        "member_version": "8.0.41" if state else None,
+        "is_local": 0,
+        "certifier_queue": 0 if state else None,
+        "applier_queue": 0 if state else None,
+    }
+    row.update(kwargs)
+    return row
+
+
+@pytest.mark.unit
+class TestClusterClientFastStatus:
+    """Class to group all the MySQLClusterClient fast status tests."""
+
+    def test_fetch_cluster_fast_status(self):
+        """Test the fetching of the fast status, shaped as the AdminAPI one."""
+        rows = [
+            _build_fast_status_row("mysql-0", "ONLINE", "PRIMARY", is_local=1),
+            _build_fast_status_row("mysql-1", "ONLINE", "SECONDARY", applier_queue=7),
+            _build_fast_status_row("mysql-2", "ONLINE", "SECONDARY"),
+        ]
+        executor = StubAdminExecutor(rows=rows)
+        client = MySQLClusterClient(executor)
+
+        status = client.fetch_cluster_fast_status("test")
+        replica_set = status["defaultReplicaSet"]
+
+        assert executor.calls == 1
+        assert status["clusterName"] == "test"
+        assert replica_set["status"] == "OK"
+        assert replica_set["primary"] == "mysql-0:3306"
+        assert replica_set["topologyMode"] == "Single-Primary"
+        assert replica_set["topology"]["mysql-0"]["mode"] == "R/W"
+        assert replica_set["topology"]["mysql-1"]["mode"] == "R/O"
+        assert replica_set["topology"]["mysql-1"]["queueSizes"] == {"certifier": 0, "applier": 7}
+
+    def test_fetch_cluster_fast_topology(self):
+        """Test the fetching of the fast topology, with missing members."""
+        rows = [
+            _build_fast_status_row("mysql-0", "ONLINE", "PRIMARY", is_local=1),
+            _build_fast_status_row("mysql-1", "ONLINE", "SECONDARY"),
+            _build_fast_status_row("mysql-2", None, None),
+        ]
+        client = MySQLClusterClient(StubAdminExecutor(rows=rows))
+
+        topology = client.fetch_cluster_topology("test", fast=True)
+
+        assert topology.status == ClusterStatus.OK_NO_TOLERANCE_PARTIAL
+        assert topology.primary_member.label == "mysql-0"
+        assert topology.get_member_by_label("mysql-1").queue_sizes == {
+            "certifier": 0,
+            "applier": 0,
+        }
+        assert topology.get_member_by_label("mysql-2").state is None
+        assert topology.get_member_by_label("mysql-2").mode == "n/a"
+        assert topology.online_count == 2
+
+    def test_fetch_cluster_fast_status_no_quorum(self):
+        """Test the fetching of the fast status, from a member without quorum."""
+        rows = [
+            _build_fast_status_row("mysql-0", "ONLINE", "PRIMARY", is_local=1),
+            _build_fast_status_row("mysql-1", "UNREACHABLE", "SECONDARY"),
+            _build_fast_status_row("mysql-2", "UNREACHABLE", "SECONDARY"),
+        ]
+        client = MySQLClusterClient(StubAdminExecutor(rows=rows))
+
+        status = client.fetch_cluster_fast_status("test")
+        assert status["defaultReplicaSet"]["status"] == "NO_QUORUM"
+
+    def test_fetch_cluster_fast_status_unknown(self):
+        """Test the fetching of the fast status, from a member outside of the group."""
+        rows = [
+            _build_fast_status_row("mysql-0", None, None, is_local=None),
+            _build_fast_status_row("mysql-1", None, None),
+        ]
+        client = MySQLClusterClient(StubAdminExecutor(rows=rows))
+
+        status = client.fetch_cluster_fast_status("test")
+        assert status["defaultReplicaSet"]["status"] == "UNKNOWN"
+
+    def test_fetch_cluster_fast_status_not_found(self):
+        """Test the fetching of the fast status of an unknown cluster."""
+        client = MySQLClusterClient(StubAdminExecutor(rows=[]))
+
+        with pytest.raises(ExecutionError):
+            client.fetch_cluster_fast_status("unknown")
+
+
+class StubProgressClient(MySQLInstanceClient):
+    """Instance client reporting a fixed recovery progress, for testing."""
+
+    def __init__(self):
+        """Initialize the client."""
+
+    def get_instance_recovery_progress(self) -> RecoveryProgress:
+        """Gets the instance recovery progress."""
+        return RecoveryProgress(state=InstanceState.RECOVERING, clone_data=1, clone_estimate=4)
+
+
+@pytest.mark.unit
+class TestClusterClientOperations:
+    """Class to group all the MySQLClusterClient background operation tests."""
+
+    @pytest.fixture
+    def client(self):
+        """MySQL Cluster client fixture, running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="root", password="root", socket="/tmp/sock")
+        return MySQLClusterClient(LocalExecutor(conn_details, FAKE_SHELL_PATH))
+
+    def test_start_attach_instance(self, client: MySQLClusterClient):
+        """Test the attachment of an instance in the background, reporting its progress."""
+        operation = client.start_attach_instance_into_cluster(
+            cluster_name="test",
+            instance_host="10.0.0.1",
+            instance_port="3306",
+            progress_client=StubProgressClient(),
+        )
+
+        assert operation.name == "attach instance 10.0.0.1:3306 to cluster test"
+        assert operation.progress().clone_ratio == 0.25
+        operation.wait(timeout=10)
+        assert operation.poll()
+
+    def test_start_reboot_cluster(self, client: MySQLClusterClient):
+        """Test the rebooting of a cluster in the background, without progress reporting."""
+        operation = client.start_reboot_cluster("test")
+        operation.wait(timeout=10)
+
+        with pytest.raises(ValueError):
+            operation.progress()
+
+
 @pytest.mark.integration
 class TestClusterClient:
     """Class to group all the MySQLClusterClient tests."""
@@ -50,6 +290,44 @@ class TestClusterClient:
         assert status.get("defaultReplicaSet", {})
         assert status.get("defaultReplicaSet", {}).get("topology")
 
+    def test_fetch_cluster_topology(self, client: MySQLClusterClient):
+        """Test the fetching of the cluster topology."""
+        topology = client.fetch_cluster_topology(TEST_CLUSTER_NAME)
+        assert topology.name == TEST_CLUSTER_NAME
+        assert topology.primary_member
+        assert topology.has_quorum
+
+    def test_fetch_cluster_fast_status(self, client: MySQLClusterClient):
+        """Test the fetching of the fast status, matching the AdminAPI one."""
+        status = client.fetch_cluster_status(TEST_CLUSTER_NAME)
+        fast_status = client.fetch_cluster_fast_status(TEST_CLUSTER_NAME)
+
+        replica_set = status["defaultReplicaSet"]
+        fast_replica_set = fast_status["defaultReplicaSet"]
+        assert fast_replica_set["status"] == replica_set["status"]
+        assert fast_replica_set["primary"] == replica_set["primary"]
+        assert fast_replica_set["topology"].keys() == replica_set["topology"].keys()
+
+    def test_list_cluster_routers_cached(self, executor: LocalExecutor):
+        """Test the listing of the cluster routers, served from the metadata cache."""
+        cache = MetadataCache()
+        client = MySQLClusterClient(executor, cache)
+
+        routers = client.list_cluster_routers(TEST_CLUSTER_NAME)
+        assert client.list_cluster_routers(TEST_CLUSTER_NAME) == routers
+        assert cache.stats().hits == 1
+
+    def test_attach_instances_into_cluster(self, client: MySQLClusterClient):
+        """Test the attachment of unreachable instances, reported per instance."""
+        results = client.attach_instances_into_cluster(
+            cluster_name=TEST_CLUSTER_NAME,
+            instances=[("127.0.0.1", "3999")],
+            stop_on_error=True,
+        )
+
+        assert not results["127.0.0.1:3999"].attached
+        assert results["127.0.0.1:3999"].error
+
     def test_list_cluster_routers(self, client: MySQLClusterClient):
         """Test the listing of the cluster routers."""
         routers = client.list_cluster_routers(TEST_CLUSTER_NAME)
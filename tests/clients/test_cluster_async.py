@@ -0,0 +1,123 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import inspect
+import os
+
+import pytest
+
+from mysql_shell.clients import AsyncMySQLClusterClient, MySQLClusterClient
+from mysql_shell.executors import AsyncLocalExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import (
+    FAKE_SHELL_PATH,
+    TEST_CLUSTER_NAME,
+    build_async_local_executor,
+)
+
+
+@pytest.mark.unit
+class TestAsyncClusterClientOperations:
+    """Class to group all the AsyncMySQLClusterClient unit tests."""
+
+    @pytest.fixture
+    def client(self):
+        """Asynchronous MySQL Cluster client fixture, running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="root", password="root", socket="/tmp/sock")
+        return AsyncMySQLClusterClient(AsyncLocalExecutor(conn_details, FAKE_SHELL_PATH))
+
+    def test_parity(self):
+        """Test that every synchronous client method has an asynchronous counterpart."""
+        for name, func in vars(MySQLClusterClient).items():
+            if name.startswith("_") or not inspect.isfunction(func):
+                continue
+
+            async_func = getattr(AsyncMySQLClusterClient, name)
+            assert inspect.iscoroutinefunction(async_func), name
+            assert inspect.signature(async_func).parameters.keys() == (
+                inspect.signature(func).parameters.keys()
+            ), name
+
+    def test_start_attach_instance(self, client: AsyncMySQLClusterClient):
+        """Test the attachment of an instance in the background."""
+
+        async def run():
+            operation = await client.start_attach_instance_into_cluster(
+                cluster_name="test",
+                instance_host="10.0.0.1",
+                instance_port="3306",
+            )
+            assert operation.name == "attach instance 10.0.0.1:3306 to cluster test"
+            assert not operation.poll()
+
+            await operation.wait(timeout=10)
+            assert operation.poll()
+
+            with pytest.raises(ValueError):
+                await operation.progress()
+
+        asyncio.run(run())
+
+    def test_cancel_reboot_cluster(self, client: AsyncMySQLClusterClient, monkeypatch):
+        """Test the cancellation of a cluster reboot running in the background."""
+        monkeypatch.setenv("FAKE_MYSQLSH_LATENCY", "30")
+
+        async def run():
+            operation = await client.start_reboot_cluster("test")
+
+            with pytest.raises(TimeoutError):
+                await operation.wait(timeout=0.1)
+
+            operation.cancel()
+            with pytest.raises(ExecutionError):
+                await operation.wait(timeout=5)
+
+            assert operation.poll()
+            assert operation.seconds < 5
+
+        asyncio.run(run())
+
+
+@pytest.mark.integration
+class TestAsyncClusterClient:
+    """Class to group all the AsyncMySQLClusterClient tests."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def executor(self):
+        """Asynchronous local executor fixture."""
+        return build_async_local_executor(
+            username=os.environ["MYSQL_USERNAME"],
+            password=os.environ["MYSQL_PASSWORD"],
+        )
+
+    @pytest.fixture(scope="class", autouse=True)
+    def client(self, executor: AsyncLocalExecutor):
+        """Asynchronous MySQL Cluster client fixture."""
+        return AsyncMySQLClusterClient(executor)
+
+    def test_fetch_cluster_status(self, client: AsyncMySQLClusterClient):
+        """Test the fetching of the cluster status."""
+        status = asyncio.run(client.fetch_cluster_status(TEST_CLUSTER_NAME))
+        assert status.get("defaultReplicaSet", {})
+        assert status.get("defaultReplicaSet", {}).get("topology")
+
+    def test_fetch_cluster_topology(self, client: AsyncMySQLClusterClient):
+        """Test the fetching of the cluster topology."""
+        topology = asyncio.run(client.fetch_cluster_topology(TEST_CLUSTER_NAME))
+        assert topology.name == TEST_CLUSTER_NAME
+        assert topology.primary_member
+        assert topology.has_quorum
+
+    def test_list_cluster_routers(self, client: AsyncMySQLClusterClient):
+        """Test the listing of the cluster routers."""
+        routers = asyncio.run(client.list_cluster_routers(TEST_CLUSTER_NAME))
+        routers = routers["routers"]
+        assert len(routers) == 0
+
+    def test_check_instance_before_cluster(self, client: AsyncMySQLClusterClient):
+        """Test the checking of an instance config before joining a cluster."""
+        result = asyncio.run(client.check_instance_before_cluster())
+        assert result["status"] == "ok"
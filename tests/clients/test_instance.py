@@ -2,12 +2,15 @@
 # See LICENSE file for licensing details.
 
 import os
+from typing import Sequence
 
 import pytest
 
 from mysql_shell.builders import StringQueryQuoter
 from mysql_shell.clients import MySQLInstanceClient
-from mysql_shell.executors import LocalExecutor
+from mysql_shell.executors import BaseExecutor, LocalExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails, StatementResult
 from mysql_shell.models.account import Role, User
 from mysql_shell.models.instance import InstanceRole, InstanceState
 from mysql_shell.models.statement import LogType, VariableScope
@@ -19,6 +22,209 @@ from ..helpers import (
 )
 
 
+class StubBatchExecutor(BaseExecutor):
+    """Executor returning canned batch results, for testing."""
+
+    def __init__(self, results: list[StatementResult], rows: list[dict] | None = None):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.results = results
+        self.rows = rows or []
+        self.calls = []
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        raise NotImplementedError()
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script."""
+        return self.rows
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements."""
+        self.calls.append((statements, force))
+        return self.results[: len(statements)] or [StatementResult(s) for s in statements]
+
+
+@pytest.mark.unit
+class TestInstanceClientHealth:
+    """Class to group all the MySQLInstanceClient health tests."""
+
+    SERVER_ROW = {
+        "server_uuid": "uuid",
+        "version": "8.0.40-log",
+        "super_read_only": 1,
+        "gtid_executed": "uuid:1-10,\nother:1-5",
+    }
+
+    def test_cluster_member(self):
+        """Test the health snapshot of a cluster member, within a single call."""
+        executor = StubBatchExecutor([
+            StatementResult("", rows=[self.SERVER_ROW]),
+            StatementResult("", rows=[{"member_state": "ONLINE", "member_role": "SECONDARY"}]),
+            StatementResult("", rows=[{"instance_name": "mysql-1"}]),
+            StatementResult("", rows=[{"work_completed": 5, "work_estimated": 10}]),
+        ])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+        health = client.get_instance_health(work_pattern="%clone%")
+
+        assert len(executor.calls) == 1
+        assert executor.calls[0][1] is True
+        assert health.version == "8.0.40"
+        assert health.super_read_only is True
+        assert health.gtid_executed == "uuid:1-10,other:1-5"
+        assert health.state == InstanceState.ONLINE
+        assert health.role == InstanceRole.SECONDARY
+        assert health.label == "mysql-1"
+        assert health.work_ongoing is True
+
+    def test_standalone_instance(self):
+        """Test the health snapshot of an instance without cluster metadata."""
+        executor = StubBatchExecutor([
+            StatementResult("", rows=[self.SERVER_ROW]),
+            StatementResult("", rows=[]),
+            StatementResult("", error={"message": "Unknown database"}),
+        ])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+        health = client.get_instance_health()
+
+        assert len(executor.calls[0][0]) == 3
+        assert health.state is None
+        assert health.label is None
+        assert health.work_ongoing is None
+
+    def test_unreachable_instance(self):
+        """Test the failure of the health snapshot when the server cannot be queried."""
+        executor = StubBatchExecutor([StatementResult("", error={"message": "Access denied"})])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+
+        with pytest.raises(ExecutionError):
+            client.get_instance_health()
+
+
+@pytest.mark.unit
+class TestInstanceClientRecoveryProgress:
+    """Class to group all the MySQLInstanceClient recovery progress tests."""
+
+    def test_cloning_instance(self):
+        """Test the recovery progress of an instance being cloned, within a single call."""
+        executor = StubBatchExecutor([
+            StatementResult("", rows=[{"member_state": "RECOVERING"}]),
+            StatementResult("", rows=[{"service_state": "ON"}]),
+            StatementResult("", rows=[{"state": "In Progress"}]),
+            StatementResult(
+                "",
+                rows=[
+                    {"stage": "DROP DATA", "state": "Completed", "data": 0, "estimate": 0},
+                    {"stage": "FILE COPY", "state": "In Progress", "data": 25, "estimate": 100},
+                    {"stage": "PAGE COPY", "state": "Not Started", "data": None, "estimate": 0},
+                ],
+            ),
+        ])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+        progress = client.get_instance_recovery_progress()
+
+        assert len(executor.calls) == 1
+        assert progress.state == InstanceState.RECOVERING
+        assert progress.channel_state == "ON"
+        assert progress.clone_state == "In Progress"
+        assert progress.clone_stage == "FILE COPY"
+        assert progress.clone_ratio == 0.25
+
+    def test_without_clone_plugin(self):
+        """Test the recovery progress of an instance without the clone plugin."""
+        executor = StubBatchExecutor([
+            StatementResult("", rows=[{"member_state": "ONLINE"}]),
+            StatementResult("", rows=[{"service_state": "OFF"}]),
+            StatementResult("", error={"message": "Table doesn't exist"}),
+            StatementResult("", error={"message": "Table doesn't exist"}),
+        ])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+        progress = client.get_instance_recovery_progress()
+
+        assert progress.state == InstanceState.ONLINE
+        assert progress.clone_state is None
+        assert progress.clone_ratio is None
+
+
+@pytest.mark.unit
+class TestInstanceClientUserReconciliation:
+    """Class to group all the MySQLInstanceClient user reconciliation tests."""
+
+    ROWS = [
+        {"USER": "app-1", "HOST": "%", "ATTRIBUTE": '{"unit": "app/1"}'},
+        {"USER": "app-2", "HOST": "%", "ATTRIBUTE": '{"unit": "app/2", "old": "yes"}'},
+        {"USER": "app-3", "HOST": "%", "ATTRIBUTE": None},
+    ]
+
+    def test_delta(self):
+        """Test that only the changes are applied, within a single call."""
+        executor = StubBatchExecutor([], self.ROWS)
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+
+        result = client.reconcile_instance_users(
+            desired=[
+                User("app-1", "%", {"unit": "app/1"}),
+                User("app-2", "%", {"unit": "app/2"}),
+                User("app-4", "%", {"unit": "app/4"}),
+            ],
+            name_pattern="app-%",
+            passwords={"app-4": "secret"},
+        )
+
+        assert [user.username for user in result.created] == ["app-4"]
+        assert [user.username for user in result.updated] == ["app-2"]
+        assert [user.username for user in result.deleted] == ["app-3"]
+        statements, force = executor.calls[0]
+        assert len(executor.calls) == 1
+        assert not force
+        assert statements[0] == "DROP USER IF EXISTS 'app-3'@'%'"
+        assert statements[1].startswith("CREATE USER 'app-4'@'%' IDENTIFIED BY 'secret'")
+        assert statements[2].startswith("ALTER USER 'app-2'@'%' ATTRIBUTE")
+        assert '\\"old\\": null' in statements[2]
+
+    def test_batches(self):
+        """Test the splitting of the changes into batches."""
+        executor = StubBatchExecutor([])
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+        desired = [User(f"app-{i}", "%") for i in range(5)]
+        passwords = {user.username: "secret" for user in desired}
+
+        result = client.reconcile_instance_users(desired, "app-%", passwords, batch_size=2)
+
+        assert len(result.created) == 5
+        assert [len(statements) for statements, _ in executor.calls] == [2, 2, 1]
+
+    def test_dry_run(self):
+        """Test that no change is applied on dry runs."""
+        executor = StubBatchExecutor([], self.ROWS)
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+
+        result = client.reconcile_instance_users([], "app-%", dry_run=True)
+
+        assert len(result.deleted) == 3
+        assert not executor.calls
+
+    def test_invalid_users(self):
+        """Test the rejection of users outside the pattern, or without password."""
+        client = MySQLInstanceClient(StubBatchExecutor([]), StringQueryQuoter())
+
+        with pytest.raises(ValueError):
+            client.reconcile_instance_users([User("other")], "app-%")
+        with pytest.raises(ValueError):
+            client.reconcile_instance_users([User("app-1")], "app-%")
+
+
 @pytest.mark.integration
 class TestInstanceClient:
     """Class to group all the MySQLInstanceClient tests."""
@@ -210,6 +416,33 @@ class TestInstanceClient:
         finally:
             self._delete_user(client, instance_user)
 
+    def test_reconcile_instance_users(self, client: MySQLInstanceClient):
+        """Test the reconciliation of the instance users."""
+        user_1 = User("reconcile_user_1", "%", {"key": "val_1"})
+        user_2 = User("reconcile_user_2", "%", {"key": "val_2"})
+        passwords = {"reconcile_user_1": "password", "reconcile_user_2": "password"}
+
+        try:
+            result = client.reconcile_instance_users([user_1], "reconcile_user_%", passwords)
+            assert result.created == [user_1]
+
+            user_1.attributes = {"other": "val"}
+            result = client.reconcile_instance_users(
+                [user_1, user_2], "reconcile_user_%", passwords
+            )
+            assert result.created == [user_2]
+            assert result.updated == [user_1]
+
+            users = client.search_instance_users("reconcile_user_1")
+            assert users[0].attributes == {"other": "val"}
+
+            result = client.reconcile_instance_users([user_2], "reconcile_user_%")
+            assert result.deleted == [user_1]
+            assert not client.reconcile_instance_users([user_2], "reconcile_user_%").changed
+        finally:
+            self._delete_user(client, user_1)
+            self._delete_user(client, user_2)
+
     def test_flush_instance_logs(self, client: MySQLInstanceClient):
         """Test the flushing of a range of instance logs."""
         client.flush_instance_logs([])
@@ -229,6 +462,21 @@ class TestInstanceClient:
         """Test the fetching of all the cluster labels."""
         assert TEST_CLUSTER_NAME in client.get_cluster_labels()
 
+    def test_get_instance_health(self, client: MySQLInstanceClient):
+        """Test the fetching of the instance health snapshot."""
+        health = client.get_instance_health(work_pattern="%clone%")
+        assert health.server_uuid
+        assert health.version == client.get_instance_version()
+        assert health.state == InstanceState.ONLINE
+        assert health.role == InstanceRole.PRIMARY
+        assert health.label == client.get_cluster_instance_label()
+        assert health.work_ongoing is False
+
+    def test_get_instance_recovery_progress(self, client: MySQLInstanceClient):
+        """Test the fetching of the instance recovery progress."""
+        progress = client.get_instance_recovery_progress()
+        assert progress.state == InstanceState.ONLINE
+
     def test_get_instance_replication_state(self, client: MySQLInstanceClient):
         """Test the fetching of the instance replication state."""
         assert client.get_instance_replication_state() == InstanceState.ONLINE
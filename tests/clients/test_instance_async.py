@@ -0,0 +1,128 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import inspect
+import json
+import os
+
+import pytest
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import AsyncMySQLInstanceClient, MySQLInstanceClient
+from mysql_shell.executors import AsyncLocalExecutor, MetricsRegistry
+from mysql_shell.models import ConnectionDetails
+from mysql_shell.models.account import User
+from mysql_shell.models.instance import InstanceRole, InstanceState
+from mysql_shell.models.statement import LogType, VariableScope
+
+from ..helpers import (
+    FAKE_SHELL_PATH,
+    TEST_CLUSTER_NAME,
+    build_async_local_executor,
+)
+
+HEALTH_RESULTS = {
+    "@@server_uuid AS server_uuid": [
+        {
+            "server_uuid": "uuid",
+            "version": "8.0.40-log",
+            "super_read_only": 1,
+            "gtid_executed": "uuid:1-10",
+        }
+    ],
+    "member_state, member_role": [{"member_state": "ONLINE", "member_role": "SECONDARY"}],
+    "instance_name": [{"instance_name": "mysql-1"}],
+}
+
+
+@pytest.mark.unit
+class TestAsyncInstanceClientMethods:
+    """Class to group all the AsyncMySQLInstanceClient unit tests."""
+
+    def test_parity(self):
+        """Test that every synchronous client method has an asynchronous counterpart."""
+        for name, func in vars(MySQLInstanceClient).items():
+            if name.startswith("_") or not inspect.isfunction(func):
+                continue
+
+            async_func = getattr(AsyncMySQLInstanceClient, name)
+            assert inspect.iscoroutinefunction(async_func), name
+            assert inspect.signature(async_func).parameters.keys() == (
+                inspect.signature(func).parameters.keys()
+            ), name
+
+    def test_get_instance_health(self, tmp_path, monkeypatch):
+        """Test the health snapshot of a cluster member, within a single batch call."""
+        results_path = tmp_path / "results.json"
+        results_path.write_text(json.dumps(HEALTH_RESULTS))
+        monkeypatch.setenv("FAKE_MYSQLSH_RESULTS", str(results_path))
+
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        executor = AsyncLocalExecutor(conn_details, FAKE_SHELL_PATH, MetricsRegistry())
+        client = AsyncMySQLInstanceClient(executor, StringQueryQuoter())
+        health = asyncio.run(client.get_instance_health())
+
+        assert health.version == "8.0.40"
+        assert health.state == InstanceState.ONLINE
+        assert health.role == InstanceRole.SECONDARY
+        assert health.label == "mysql-1"
+        assert executor.hooks.phase_count("get_instance_health", "run") == 1
+
+
+@pytest.mark.integration
+class TestAsyncInstanceClient:
+    """Class to group all the AsyncMySQLInstanceClient tests."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def executor(self):
+        """Asynchronous local executor fixture."""
+        return build_async_local_executor(
+            username=os.environ["MYSQL_USERNAME"],
+            password=os.environ["MYSQL_PASSWORD"],
+        )
+
+    @pytest.fixture(scope="class", autouse=True)
+    def client(self, executor: AsyncLocalExecutor):
+        """Asynchronous MySQL Instance client fixture."""
+        return AsyncMySQLInstanceClient(executor, StringQueryQuoter())
+
+    def test_create_instance_user(self, client: AsyncMySQLInstanceClient):
+        """Test the creation of an instance user."""
+        user = User("instance_user_create_async", "%")
+
+        try:
+            asyncio.run(client.create_instance_user(user, "password"))
+            users = asyncio.run(client.search_instance_users(user.username))
+            assert len(users) > 0
+        finally:
+            asyncio.run(client.delete_instance_user(user))
+
+    def test_flush_instance_logs(self, client: AsyncMySQLInstanceClient):
+        """Test the flushing of a range of instance logs."""
+        asyncio.run(client.flush_instance_logs([]))
+        asyncio.run(client.flush_instance_logs([LogType.GENERAL, LogType.ERROR]))
+
+    def test_get_cluster_labels(self, client: AsyncMySQLInstanceClient):
+        """Test the fetching of all the cluster labels."""
+        assert TEST_CLUSTER_NAME in asyncio.run(client.get_cluster_labels())
+
+    def test_get_instance_variable(self, client: AsyncMySQLInstanceClient):
+        """Test the fetching of an instance variable."""
+        value = asyncio.run(client.get_instance_variable(VariableScope.GLOBAL, "super_read_only"))
+        assert value == 0
+
+    def test_get_instance_state_concurrently(self, client: AsyncMySQLInstanceClient):
+        """Test the concurrent fetching of several instance properties."""
+
+        async def run():
+            return await asyncio.gather(
+                client.get_instance_replication_state(),
+                client.get_instance_replication_role(),
+                client.get_instance_version(),
+            )
+
+        state, role, version = asyncio.run(run())
+        assert state == InstanceState.ONLINE
+        assert role == InstanceRole.PRIMARY
+        assert version
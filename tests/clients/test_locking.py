@@ -0,0 +1,117 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+
+from mysql_shell.builders import NamedLockingQueryBuilder
+from mysql_shell.clients import NamedLockManager
+from mysql_shell.executors import LocalExecutor, PersistentExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+TASK = NamedLockingQueryBuilder.INSTANCE_ADDITION_TASK
+
+
+class StubSessionExecutor(PersistentExecutor):
+    """Persistent executor returning canned rows, without spawning any process, for testing."""
+
+    def __init__(self, rows: list[list[dict]]):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.rows = list(rows)
+        self.calls = []
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script."""
+        self.calls.append((script, timeout))
+        return self.rows.pop(0)
+
+
+@pytest.mark.unit
+class TestNamedLockManager:
+    """Class to group all the NamedLockManager tests."""
+
+    @pytest.fixture
+    def builder(self):
+        """Named locking query builder fixture."""
+        return NamedLockingQueryBuilder("mysql")
+
+    def test_session_executor_required(self, builder):
+        """Test the rejection of executors opening a session per call."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+
+        with pytest.raises(ValueError):
+            NamedLockManager(LocalExecutor(conn_details, ""), builder)
+
+    def test_acquire(self, builder):
+        """Test the acquiring of a lock, waiting server-side."""
+        executor = StubSessionExecutor([[{"acquired": 1}], [{"acquired": 0}]])
+        manager = NamedLockManager(executor, builder)
+
+        assert manager.acquire(TASK, "mysql-1", timeout=2.5)
+        assert not manager.acquire(TASK, "mysql-1", timeout=None)
+
+        assert "GET_LOCK('mysql.unit-add', 2.5)" in executor.calls[0][0]
+        assert executor.calls[0][1] == 8
+        assert executor.calls[1][1] is None
+
+    def test_acquire_error(self, builder):
+        """Test the acquiring of a lock failing server-side."""
+        executor = StubSessionExecutor([[{"acquired": None}]])
+        manager = NamedLockManager(executor, builder)
+
+        with pytest.raises(ExecutionError):
+            manager.acquire(TASK, "mysql-1")
+
+    def test_hold(self, builder):
+        """Test the holding of a lock for the duration of a context."""
+        executor = StubSessionExecutor([[{"acquired": 1}], [{"held": 1}], [{"released": 1}]])
+        manager = NamedLockManager(executor, builder)
+
+        with manager.hold(TASK, "mysql-1", timeout=1):
+            assert len(executor.calls) == 2
+
+        assert "RELEASE_LOCK" in executor.calls[2][0]
+
+    def test_hold_lost(self, builder):
+        """Test the holding of a lock no longer held once acquired."""
+        executor = StubSessionExecutor([[{"acquired": 1}], [{"held": 0}]])
+        manager = NamedLockManager(executor, builder)
+
+        with pytest.raises(ExecutionError):
+            with manager.hold(TASK, "mysql-1", timeout=1):
+                pass
+
+        assert len(executor.calls) == 2
+
+    def test_release_lost(self, builder):
+        """Test the releasing of a lock lost with the session that acquired it."""
+        executor = StubSessionExecutor([[{"acquired": 1}]])
+        executor._connection_id = 10
+        manager = NamedLockManager(executor, builder)
+
+        assert manager.acquire(TASK, "mysql-1")
+        executor._connection_id = 11
+        assert not manager.release(TASK, "mysql-1")
+        assert len(executor.calls) == 1
+
+    def test_hold_timeout(self, builder):
+        """Test the holding of a lock not acquired within the timeout."""
+        executor = StubSessionExecutor([[{"acquired": 0}]])
+        manager = NamedLockManager(executor, builder)
+
+        with pytest.raises(TimeoutError):
+            with manager.hold(TASK, "mysql-1", timeout=1):
+                pass
+
+        assert len(executor.calls) == 1
+
+    def test_holder(self, builder):
+        """Test the fetching of the lock holder, and the session holding check."""
+        executor = StubSessionExecutor([[{"executor": "mysql-2"}], [], [{"held": 0}]])
+        manager = NamedLockManager(executor, builder)
+
+        assert manager.get_holder(TASK) == "mysql-2"
+        assert manager.get_holder(TASK) is None
+        assert not manager.is_held(TASK, "mysql-1")
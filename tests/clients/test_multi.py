@@ -0,0 +1,76 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import time
+
+import pytest
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import MultiInstanceClient
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import FAKE_SHELL_PATH
+
+RESULTS = {"`version`": [{"version": "8.0.40-log"}]}
+TARGETS = {"/tmp/sock-fail": {"failure": "auth"}, "/tmp/sock-slow": {"latency": 2}}
+
+
+@pytest.mark.unit
+class TestMultiInstanceClient:
+    """Class to group all the MultiInstanceClient tests."""
+
+    @pytest.fixture()
+    def shell_path(self, tmp_path, monkeypatch):
+        """Fake MySQL Shell fixture, failing or slow on some sockets."""
+        for name, config in (("results", RESULTS), ("targets", TARGETS)):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps(config))
+            monkeypatch.setenv(f"FAKE_MYSQLSH_{name.upper()}", str(path))
+
+        monkeypatch.setenv("FAKE_MYSQLSH_LATENCY", "0.2")
+        return FAKE_SHELL_PATH
+
+    @staticmethod
+    def _build_client(shell_path: str, sockets: list[str]) -> MultiInstanceClient:
+        """Build a multi-instance client, for every socket."""
+        conn_details = [
+            ConnectionDetails(username="test", password="test", socket=socket)
+            for socket in sockets
+        ]
+        return MultiInstanceClient(conn_details, shell_path, StringQueryQuoter())
+
+    def test_concurrency(self, shell_path: str):
+        """Test that every instance is called at once."""
+        sockets = [f"/tmp/sock-{i}" for i in range(6)]
+
+        with self._build_client(shell_path, sockets) as client:
+            start = time.monotonic()
+            results = client.run("get_instance_version")
+
+        assert time.monotonic() - start < 1
+        assert list(results) == sockets
+        assert all(result.value == "8.0.40" for result in results.values())
+
+    def test_errors(self, shell_path: str):
+        """Test the reporting of per-instance errors, and of calls past the deadline."""
+        sockets = ["/tmp/sock-ok", "/tmp/sock-fail", "/tmp/sock-slow"]
+
+        with self._build_client(shell_path, sockets) as client:
+            start = time.monotonic()
+            results = client.run("get_instance_version", timeout=1)
+
+        assert time.monotonic() - start < 1.5
+        assert results["/tmp/sock-ok"].ok
+        assert str(results["/tmp/sock-fail"].error).startswith("Access denied")
+        assert isinstance(results["/tmp/sock-slow"].error, ExecutionError)
+        assert results["/tmp/sock-slow"].error.args == (None,)
+
+    def test_invalid_method(self, shell_path: str):
+        """Test the rejection of unknown client methods."""
+        with self._build_client(shell_path, ["/tmp/sock"]) as client:
+            with pytest.raises(ValueError):
+                client.run("_executor")
+            with pytest.raises(ValueError):
+                client.run("drop_everything")
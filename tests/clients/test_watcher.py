@@ -0,0 +1,101 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+
+from mysql_shell.clients import ClusterStatusWatcher
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import (
+    ClusterStatus,
+    ClusterStatusChanged,
+    ClusterTopology,
+    InstanceState,
+    MemberStateChanged,
+    PrimaryChanged,
+    RouterAdded,
+    RouterRemoved,
+)
+
+
+def _build_status(status: str, members: dict[str, str], primary: str) -> dict:
+    """Build a cluster status, with the provided member states."""
+    return {
+        "clusterName": "test-cluster",
+        "defaultReplicaSet": {
+            "primary": primary,
+            "status": status,
+            "topology": {
+                address: {
+                    "address": address,
+                    "memberRole": "PRIMARY" if address == primary else "SECONDARY",
+                    "status": state,
+                }
+                for address, state in members.items()
+            },
+        },
+    }
+
+
+class StubClusterClient:
+    """Cluster client serving a sequence of statuses, for testing."""
+
+    def __init__(self, polls: list):
+        """Initialize the client."""
+        self.polls = list(polls)
+        self.routers = {}
+
+    def fetch_cluster_topology(self, cluster_name: str) -> ClusterTopology:
+        """Fetches the next cluster topology."""
+        poll = self.polls.pop(0)
+        if poll is None:
+            raise ExecutionError()
+        status, self.routers = poll
+        return ClusterTopology.from_status(status)
+
+    def list_cluster_routers(self, cluster_name: str) -> dict:
+        """Lists the cluster routers of the last poll."""
+        return {"clusterName": cluster_name, "routers": self.routers}
+
+
+@pytest.mark.unit
+class TestClusterStatusWatcher:
+    """Class to group all the ClusterStatusWatcher tests."""
+
+    def test_events(self):
+        """Test the reporting of every kind of change."""
+        stable = _build_status("OK", {"a:3306": "ONLINE", "b:3306": "ONLINE"}, "a:3306")
+        failed = _build_status("OK_NO_TOLERANCE", {"b:3306": "ONLINE"}, "b:3306")
+        router = {"host::system": {"version": "8.0.40"}}
+
+        client = StubClusterClient([(stable, {}), (stable, {}), (failed, router), (stable, {})])
+        watcher = ClusterStatusWatcher(client, "test-cluster")
+
+        assert watcher.poll() == []
+        assert watcher.poll() == []
+        assert watcher.poll() == [
+            ClusterStatusChanged("test-cluster", ClusterStatus.OK, ClusterStatus.OK_NO_TOLERANCE),
+            PrimaryChanged("test-cluster", "a:3306", "b:3306"),
+            MemberStateChanged("test-cluster", "a:3306", "a:3306", InstanceState.ONLINE, None),
+            RouterAdded("test-cluster", "host::system"),
+        ]
+        assert watcher.poll() == [
+            ClusterStatusChanged("test-cluster", ClusterStatus.OK_NO_TOLERANCE, ClusterStatus.OK),
+            PrimaryChanged("test-cluster", "b:3306", "a:3306"),
+            MemberStateChanged("test-cluster", "a:3306", "a:3306", None, InstanceState.ONLINE),
+            RouterRemoved("test-cluster", "host::system"),
+        ]
+
+    def test_adaptive_interval(self):
+        """Test the speed up of polls on changes, and their back off while stable."""
+        stable = _build_status("OK", {"a:3306": "ONLINE"}, "a:3306")
+        changed = _build_status("OK", {"a:3306": "RECOVERING"}, "a:3306")
+
+        client = StubClusterClient([(stable, {})] * 3 + [(changed, {}), None, (changed, {})])
+        watcher = ClusterStatusWatcher(client, "test-cluster", 1, 3, backoff=2)
+
+        intervals = []
+        for _ in range(6):
+            watcher.poll()
+            intervals.append(watcher.interval)
+
+        assert intervals == [2, 3, 3, 1, 2, 3]
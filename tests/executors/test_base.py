@@ -0,0 +1,108 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+
+import pytest
+
+from mysql_shell.executors import AsyncBaseExecutor, BaseExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+
+class StubSQLExecutor(BaseExecutor):
+    """Executor answering a single SQL statement, for testing."""
+
+    def __init__(self):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.scripts = []
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        raise NotImplementedError()
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script, failing unless it is the known one."""
+        self.scripts.append(script)
+        if script != "SELECT 1 AS a":
+            raise ExecutionError({"message": "Syntax error", "code": 1064})
+
+        return [{"a": 1}]
+
+
+class StubAsyncSQLExecutor(AsyncBaseExecutor):
+    """Asynchronous executor answering a single SQL statement, for testing."""
+
+    def __init__(self):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.scripts = []
+
+    async def check_connection(self) -> None:
+        """Check the connection."""
+
+    async def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        raise NotImplementedError()
+
+    async def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script, failing unless it is the known one."""
+        self.scripts.append(script)
+        if script != "SELECT 1 AS a":
+            raise ExecutionError({"message": "Syntax error", "code": 1064})
+
+        return [{"a": 1}]
+
+
+@pytest.mark.unit
+class TestBaseExecutor:
+    """Class to group all the BaseExecutor default method tests."""
+
+    def test_execute_sql_batch(self):
+        """Test the default batch execution, one statement at a time."""
+        executor = StubSQLExecutor()
+        results = executor.execute_sql_batch(["SELECT 1 AS a;", "SELECT", "SELECT 1 AS a"])
+
+        assert executor.scripts == ["SELECT 1 AS a", "SELECT"]
+        assert results[0].rows == [{"a": 1}]
+        assert results[1].error == {"message": "Syntax error"}
+        assert not results[2].executed
+
+    def test_execute_sql_batch_force(self):
+        """Test the default batch execution, going on after an error."""
+        executor = StubSQLExecutor()
+        results = executor.execute_sql_batch(["SELECT", "SELECT 1 AS a"], force=True)
+
+        assert not results[0].ok
+        assert results[1].ok
+        assert results[1].rows == [{"a": 1}]
+
+
+@pytest.mark.unit
+class TestAsyncBaseExecutor:
+    """Class to group all the AsyncBaseExecutor default method tests."""
+
+    def test_execute_sql_batch(self):
+        """Test the default batch execution, one statement at a time."""
+        executor = StubAsyncSQLExecutor()
+        statements = ["SELECT 1 AS a;", "SELECT", "SELECT 1 AS a"]
+        results = asyncio.run(executor.execute_sql_batch(statements))
+
+        assert executor.scripts == ["SELECT 1 AS a", "SELECT"]
+        assert results[0].rows == [{"a": 1}]
+        assert results[1].error == {"message": "Syntax error"}
+        assert not results[2].executed
+
+    def test_execute_sql_batch_force(self):
+        """Test the default batch execution, going on after an error."""
+        executor = StubAsyncSQLExecutor()
+        results = asyncio.run(executor.execute_sql_batch(["SELECT", "SELECT 1 AS a"], force=True))
+
+        assert not results[0].ok
+        assert results[1].ok
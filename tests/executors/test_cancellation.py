@@ -0,0 +1,131 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import threading
+
+import pytest
+
+from mysql_shell.executors import (
+    CancellationToken,
+    CoalescingExecutor,
+    LocalExecutor,
+    PersistentExecutor,
+)
+from mysql_shell.executors.errors import ExecutionCancelledError, ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import FAKE_SHELL_PATH
+
+
+@pytest.mark.unit
+class TestCancellationToken:
+    """Class to group all the CancellationToken tests."""
+
+    def test_register(self):
+        """Test the calling of the registered callbacks upon cancellation."""
+        token = CancellationToken()
+        calls = []
+
+        unregister = token.register(lambda: calls.append(1))
+        token.register(lambda: calls.append(2))
+        unregister()
+
+        token.cancel()
+        token.cancel()
+        assert token.cancelled
+        assert calls == [2]
+
+        token.register(lambda: calls.append(3))
+        assert calls == [2, 3]
+
+
+@pytest.mark.unit
+class TestExecutorCancellation:
+    """Class to group all the executor cancellation tests, using the fake MySQL Shell."""
+
+    @pytest.fixture
+    def statements_log(self, tmp_path, monkeypatch):
+        """Fake MySQL Shell statements log fixture."""
+        path = tmp_path / "statements.log"
+        path.touch()
+        monkeypatch.setenv("FAKE_MYSQLSH_LOG", str(path))
+        return path
+
+    @staticmethod
+    def _conn_details() -> ConnectionDetails:
+        """Build the fake connection details."""
+        return ConnectionDetails(username="root", password="root", socket="/tmp/sock")
+
+    @staticmethod
+    def _killed_connections(statements_log) -> list[str]:
+        """Return the connection IDs killed, according to the statements log."""
+        lines = statements_log.read_text().splitlines()
+        return [line.split()[-1] for line in lines if line.startswith("KILL CONNECTION")]
+
+    def test_local_completed(self, statements_log):
+        """Test that completed calls hide their connection ID, and kill nothing."""
+        executor = LocalExecutor(self._conn_details(), FAKE_SHELL_PATH)
+
+        assert executor.execute_sql("SELECT 1", cancel=CancellationToken()) == [
+            {"id": 0, "name": "x" * 16, "value": 0.0}
+        ]
+        assert executor.execute_py("print('done')", cancel=CancellationToken()) == "done"
+        assert self._killed_connections(statements_log) == []
+
+    def test_local_timeout(self, statements_log):
+        """Test that calls timing out get their server connection killed."""
+        executor = LocalExecutor(self._conn_details(), FAKE_SHELL_PATH, kill_on_timeout=True)
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("SELECT SLEEP(60)", timeout=1)
+
+        assert len(self._killed_connections(statements_log)) == 1
+
+    def test_local_cancel(self, statements_log):
+        """Test that cancelled calls get their server connection killed."""
+        executor = LocalExecutor(self._conn_details(), FAKE_SHELL_PATH)
+        token = CancellationToken()
+        threading.Timer(0.5, token.cancel).start()
+
+        with pytest.raises(ExecutionCancelledError):
+            executor.execute_py("session.run_sql('SELECT SLEEP(60)')", cancel=token)
+
+        assert len(self._killed_connections(statements_log)) == 1
+
+    def test_local_batch_cancel(self, statements_log):
+        """Test that cancelled batches get their server connection killed."""
+        executor = LocalExecutor(self._conn_details(), FAKE_SHELL_PATH)
+        token = CancellationToken()
+        threading.Timer(0.5, token.cancel).start()
+
+        with pytest.raises(ExecutionCancelledError):
+            executor.execute_sql_batch(["DO 0", "SELECT SLEEP(60)"], cancel=token)
+
+        assert len(self._killed_connections(statements_log)) == 1
+
+    def test_wrapped_cancel(self, statements_log):
+        """Test that wrapping executors pass the token through, without sharing the call."""
+        executor = CoalescingExecutor(LocalExecutor(self._conn_details(), FAKE_SHELL_PATH))
+        token = CancellationToken()
+        threading.Timer(0.5, token.cancel).start()
+
+        with pytest.raises(ExecutionCancelledError):
+            executor.execute_sql("SELECT SLEEP(60)", cancel=token)
+
+        assert len(self._killed_connections(statements_log)) == 1
+        assert executor.stats().executions == 0
+
+    def test_persistent_cancel(self, statements_log):
+        """Test that cancelled persistent calls get the session connection killed."""
+        with PersistentExecutor(self._conn_details(), FAKE_SHELL_PATH) as executor:
+            executor.execute_sql("DO 0")
+            token = CancellationToken()
+            threading.Timer(0.5, token.cancel).start()
+
+            with pytest.raises(ExecutionCancelledError):
+                executor.execute_sql("SELECT SLEEP(60)", cancel=token)
+            with pytest.raises(ExecutionError):
+                executor.execute_sql("SELECT SLEEP(60)", timeout=1)
+
+            assert len(self._killed_connections(statements_log)) == 2
+            assert executor.execute_sql("DO 0") == []
@@ -0,0 +1,141 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+
+import pytest
+
+from mysql_shell.executors import BaseExecutor, CoalescingExecutor
+from mysql_shell.executors.coalescing import _is_read_only_py, _is_read_only_sql
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails, StatementResult
+
+
+class StubExecutor(BaseExecutor):
+    """Executor counting its calls, returning once released, for testing."""
+
+    def __init__(self):
+        """Initialize the executor."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        super().__init__(conn_details, "")
+        self.calls = 0
+        self.release = threading.Event()
+
+    def _call(self, script: str) -> list[dict]:
+        """Count the call, and wait to be released."""
+        self.calls += 1
+        self.release.wait(5)
+        if "fail" in script:
+            raise ExecutionError("Query failed")
+        return [{"script": script}]
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        self._call("")
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        return self._call(script)[0]["script"]
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script."""
+        return self._call(script)
+
+    def execute_sql_batch(
+        self,
+        statements: Sequence[str],
+        *,
+        timeout: int | None = None,
+        force: bool = False,
+    ) -> list[StatementResult]:
+        """Execute a batch of SQL statements."""
+        self._call(";".join(statements))
+        return [StatementResult(statement=s) for s in statements]
+
+
+@pytest.mark.unit
+class TestCoalescingExecutor:
+    """Class to group all the CoalescingExecutor tests."""
+
+    @staticmethod
+    def _run_concurrently(executor: CoalescingExecutor, calls: list) -> list:
+        """Run every call in its own thread, releasing the wrapped executor once all started."""
+        with ThreadPoolExecutor(len(calls)) as pool:
+            futures = [pool.submit(call) for call in calls]
+            while executor.stats().coalesced + executor._executor.calls < len(calls):
+                time.sleep(0.01)
+            executor._executor.release.set()
+
+        return [future.exception() or future.result() for future in futures]
+
+    def test_read_only_detection(self):
+        """Test the detection of the shareable scripts."""
+        assert _is_read_only_sql("SELECT @@server_uuid; SHOW DATABASES")
+        assert _is_read_only_sql("SELECT 'DELETE FROM t; DROP TABLE t'")
+        assert not _is_read_only_sql("SELECT 1; DELETE FROM t")
+        assert not _is_read_only_sql("SELECT GET_LOCK('lock', 0)")
+        assert not _is_read_only_sql("SELECT * FROM t FOR UPDATE")
+        assert not _is_read_only_sql("SELECT @var")
+
+        assert _is_read_only_py(
+            "cluster = dba.get_cluster('test')\n"
+            "status = cluster.status({'extended': False})\n"
+            "print(status)"
+        )
+        assert not _is_read_only_py("cluster = dba.get_cluster('test')\ncluster.rescan()")
+        assert not _is_read_only_py("print(session.run_sql('DROP TABLE t'))")
+
+    def test_shared_results(self):
+        """Test the sharing of an execution across concurrent identical calls."""
+        executor = CoalescingExecutor(StubExecutor())
+        script = "SELECT member_id FROM performance_schema.replication_group_members"
+
+        results = self._run_concurrently(executor, [lambda: executor.execute_sql(script)] * 5)
+
+        assert results == [[{"script": script}]] * 5
+        assert executor._executor.calls == 1
+        assert executor.stats().coalesced == 4
+        assert executor.stats().in_flight == 0
+
+        results[0].append({})
+        assert executor.execute_sql(script) == [{"script": script}]
+
+    def test_shared_errors(self):
+        """Test the sharing of an execution error across concurrent identical calls."""
+        executor = CoalescingExecutor(StubExecutor())
+
+        results = self._run_concurrently(
+            executor, [lambda: executor.execute_sql("SELECT fail")] * 3
+        )
+
+        assert all(isinstance(result, ExecutionError) for result in results)
+        assert all(str(result) == "Query failed" for result in results)
+        assert executor._executor.calls == 1
+
+    def test_unshared_writes(self):
+        """Test that writes are never shared."""
+        executor = CoalescingExecutor(StubExecutor())
+        script = "cluster = dba.get_cluster('test')\ncluster.rescan()"
+
+        self._run_concurrently(executor, [lambda: executor.execute_py(script)] * 3)
+
+        assert executor._executor.calls == 3
+        assert executor.stats().coalesced == 0
+
+    def test_wait_timeout(self):
+        """Test that callers bound their wait with their own timeout."""
+        executor = CoalescingExecutor(StubExecutor())
+        leader = threading.Thread(target=executor.execute_sql, args=("SELECT 1",))
+        leader.start()
+
+        while not executor._executor.calls:
+            time.sleep(0.01)
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("SELECT 1", timeout=0.05)
+
+        executor._executor.release.set()
+        leader.join()
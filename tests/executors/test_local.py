@@ -3,13 +3,134 @@
 
 import json
 import os
+import tempfile
 
 import pytest
 
-from mysql_shell.executors import LocalExecutor
-from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.executors import LocalExecutor, ScriptTransport
+from mysql_shell.executors.errors import ExecutionCancelledError, ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import FAKE_SHELL_PATH, build_local_executor
+
+
+@pytest.mark.unit
+class TestLocalExecutorParsing:
+    """Class to group all the LocalExecutor output parsing tests."""
+
+    SENTINEL_DOC = '{"hasData": false, "rows": [], "affectedItemsCount": 0, "warnings": []}'
+
+    def test_parse_output_batch(self):
+        """Test the parsing of a SQL batch output."""
+        output = "\n".join((
+            '{"warning": "Using a password on the command line interface can be insecure."}',
+            self.SENTINEL_DOC,
+            '{"hasData": true, "rows": [{"1": 1}], "affectedItemsCount": 0, "warnings": []}',
+            '{"hasData": false, "rows": [], "affectedItemsCount": 2, "warnings": [{"code": 1}]}',
+            '{"error": {"message": "Table does not exist", "code": 1146}}',
+            "",
+        ))
+        statements = ["SELECT 1", "DELETE FROM t", "SELECT * FROM unknown", "SELECT 2"]
+
+        results = LocalExecutor._parse_output_batch(output, statements)
+        assert [result.statement for result in results] == statements
+        assert results[0].rows == [{"1": 1}]
+        assert results[1].affected_rows == 2
+        assert results[1].warnings == [{"code": 1}]
+        assert results[2].error["message"] == "Table does not exist"
+        assert not results[2].ok
+        assert not results[3].executed
 
-from ..helpers import build_local_executor
+    def test_parse_output_batch_error(self):
+        """Test the parsing of a SQL batch output when the connection fails."""
+        output = '{"error": {"message": "Access denied", "code": 1045}}\n'
+
+        with pytest.raises(ExecutionError) as exc:
+            LocalExecutor._parse_output_batch(output, ["SELECT 1"])
+
+        assert str(exc.value) == "Access denied"
+
+
+@pytest.mark.unit
+class TestLocalExecutorTransport:
+    """Class to group all the LocalExecutor script transport tests."""
+
+    @pytest.fixture(autouse=True)
+    def temp_dir(self, tmp_path, monkeypatch):
+        """Temporary directory fixture, where script files are created."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        return tmp_path
+
+    @staticmethod
+    def _build_executor(transport: ScriptTransport) -> LocalExecutor:
+        """Build a local executor running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="root", password="root", socket="/tmp/sock")
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH, transport=transport)
+
+    @pytest.mark.parametrize("transport", [ScriptTransport.STDIN, ScriptTransport.FILE])
+    def test_large_script(self, transport: ScriptTransport, temp_dir):
+        """Test the execution of scripts larger than the argument size limit."""
+        executor = self._build_executor(transport)
+        script = ";".join(["DO 0"] * 50_000 + ["SELECT 1"])
+
+        assert len(executor.execute_sql(script)) == 1
+        assert len(list(executor.iter_sql(script))) == 1
+        assert executor.execute_sql_batch(["DO 0"] * 50_000)[-1].ok
+        assert not list(temp_dir.iterdir())
+
+    @pytest.mark.parametrize("transport", list(ScriptTransport))
+    def test_python_blocks(self, transport: ScriptTransport):
+        """Test the execution of Python scripts with indented blocks."""
+        executor = self._build_executor(transport)
+        script = "for i in range(2):\n    x = i\nprint(x)"
+
+        assert executor.execute_py(script) == "1"
+
+
+@pytest.mark.unit
+class TestLocalExecutorBackground:
+    """Class to group all the LocalExecutor background execution tests."""
+
+    @staticmethod
+    def _build_executor(transport: ScriptTransport = ScriptTransport.ARGV) -> LocalExecutor:
+        """Build a local executor running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="root", password="root", socket="/tmp/sock")
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH, transport=transport)
+
+    @pytest.mark.parametrize("transport", list(ScriptTransport))
+    def test_start_py(self, transport: ScriptTransport, tmp_path, monkeypatch):
+        """Test the execution of a Python script in the background."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        executor = self._build_executor(transport)
+
+        execution = executor.start_py("import time\ntime.sleep(0.2)\nprint('done')")
+        assert not execution.poll()
+        assert execution.wait(timeout=10) == "done"
+        assert execution.poll()
+        assert not list(tmp_path.iterdir())
+
+    def test_start_py_error(self):
+        """Test the failure of a Python script run in the background."""
+        executor = self._build_executor()
+
+        execution = executor.start_py("raise RuntimeError('Cluster not found')")
+        with pytest.raises(ExecutionError) as exc:
+            execution.wait(timeout=10)
+
+        assert str(exc.value) == "Cluster not found"
+
+    def test_start_py_cancel(self):
+        """Test the waiting timeout, and the cancellation, of a background Python script."""
+        executor = self._build_executor()
+
+        execution = executor.start_py("import time\ntime.sleep(60)")
+        with pytest.raises(TimeoutError):
+            execution.wait(timeout=0.1)
+
+        execution.cancel()
+        assert execution.poll()
+        with pytest.raises(ExecutionCancelledError):
+            execution.wait()
 
 
 @pytest.mark.integration
@@ -78,6 +199,20 @@ class TestLocalExecutor:
         assert isinstance(rows, list)
         assert any(row["user"] == "root" for row in rows)
 
+    def test_iter_sql(self, executor: LocalExecutor):
+        """Test the streaming execution of SQL scripts."""
+        rows = executor.iter_sql("SELECT user FROM mysql.user")
+        assert any(row["user"] == "root" for row in rows)
+
+        rows = executor.iter_sql("SELECT * FROM performance_schema.threads")
+        assert next(rows)
+        rows.close()
+
+        with pytest.raises(ExecutionError):
+            list(executor.iter_sql("SELECT"))
+        with pytest.raises(ExecutionError):
+            list(executor.iter_sql("DO SLEEP(5)", timeout=1))
+
     def test_execute_sql_error(self, executor: LocalExecutor):
         """Test the execution of SQL scripts when there is an error."""
         try:
@@ -94,3 +229,21 @@ class TestLocalExecutor:
             executor.execute_sql("SELECT 1")
         except ExecutionError as e:
             assert str(e) == str(None)
+
+    def test_execute_sql_batch(self, executor: LocalExecutor):
+        """Test the execution of SQL batches."""
+        results = executor.execute_sql_batch([
+            "SET @a = 1",
+            "SELECT @a AS a",
+            "SELECT",
+            "SELECT 2 AS b",
+        ])
+        assert len(results) == 4
+        assert results[0].ok
+        assert results[1].rows == [{"a": 1}]
+        assert results[2].error
+        assert not results[3].executed
+
+        results = executor.execute_sql_batch(["SELECT", "SELECT 2 AS b"], force=True)
+        assert results[0].error
+        assert results[1].rows == [{"b": 2}]
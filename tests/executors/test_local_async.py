@@ -0,0 +1,86 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from mysql_shell.executors import AsyncLocalExecutor
+from mysql_shell.executors.errors import ExecutionError
+
+from ..helpers import build_async_local_executor
+
+
+@pytest.mark.integration
+class TestAsyncLocalExecutor:
+    """Class to group all the AsyncLocalExecutor tests."""
+
+    @pytest.fixture(scope="class")
+    def executor(self):
+        """Asynchronous local executor fixture."""
+        return build_async_local_executor(
+            username=os.environ["MYSQL_USERNAME"],
+            password=os.environ["MYSQL_PASSWORD"],
+        )
+
+    def test_check_connection(self, executor: AsyncLocalExecutor):
+        """Check the connection."""
+        asyncio.run(executor.check_connection())
+
+    def test_check_connection_error(self):
+        """Check the connection when there is an error."""
+        executor = build_async_local_executor(
+            username="wrong_username",
+            password="wrong_password",
+        )
+
+        with pytest.raises(ExecutionError):
+            asyncio.run(executor.check_connection())
+
+    def test_execute_py(self, executor: AsyncLocalExecutor):
+        """Test the execution of Python scripts."""
+        result = asyncio.run(executor.execute_py("print('hello world')"))
+        assert isinstance(result, str)
+        assert result == "hello world"
+
+        result = asyncio.run(executor.execute_py("a = 1"))
+        assert isinstance(result, str)
+        result = json.loads(result)
+        assert isinstance(result, dict)
+
+    def test_execute_py_error(self, executor: AsyncLocalExecutor):
+        """Test the execution of Python scripts when there is an error."""
+        with pytest.raises(ExecutionError) as exc:
+            asyncio.run(executor.execute_py("syntax"))
+
+        assert str(exc.value) == "name 'syntax' is not defined"
+
+    def test_execute_sql(self, executor: AsyncLocalExecutor):
+        """Test the execution of SQL scripts."""
+        rows = asyncio.run(executor.execute_sql("SELECT 1"))
+        assert isinstance(rows, list)
+        assert rows[0]["1"]
+
+    def test_execute_sql_error(self, executor: AsyncLocalExecutor):
+        """Test the execution of SQL scripts when there is an error."""
+        with pytest.raises(ExecutionError) as exc:
+            asyncio.run(executor.execute_sql("SELECT"))
+
+        assert str(exc.value).startswith("You have an error in your SQL syntax")
+
+    def test_execute_sql_timeout(self, executor: AsyncLocalExecutor):
+        """Test the execution of SQL scripts when there is a timeout."""
+        with pytest.raises(ExecutionError):
+            asyncio.run(executor.execute_sql("DO SLEEP(5)", timeout=1))
+
+    def test_execute_sql_concurrently(self, executor: AsyncLocalExecutor):
+        """Test the concurrent execution of SQL scripts within the same event loop."""
+
+        async def run():
+            queries = [f"SELECT {i} AS id" for i in range(10)]
+            return await asyncio.gather(*(executor.execute_sql(q) for q in queries))
+
+        results = asyncio.run(run())
+        assert [rows[0]["id"] for rows in results] == list(range(10))
@@ -0,0 +1,135 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+
+import pytest
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import MySQLInstanceClient
+from mysql_shell.executors import LocalExecutor, MetricsRegistry
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.executors.metrics import instrument, operation, timed
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import FAKE_SHELL_PATH
+
+RESULTS = {"fail": None, "`version`": [{"version": "8.0.40-log"}]}
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+    """Class to group all the MetricsRegistry tests."""
+
+    @pytest.fixture()
+    def executor(self, tmp_path, monkeypatch):
+        """Local executor fixture, running the fake MySQL Shell."""
+        results_path = tmp_path / "results.json"
+        results_path.write_text(json.dumps(RESULTS))
+        monkeypatch.setenv("FAKE_MYSQLSH_RESULTS", str(results_path))
+
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH, MetricsRegistry())
+
+    def test_phases(self):
+        """Test the recording of phase durations."""
+        registry = MetricsRegistry(buckets=[0.1, 1])
+
+        with instrument(registry, "execute_sql"):
+            with timed(registry, "run"):
+                pass
+
+        with operation("get_cluster_labels"), instrument(registry, "execute_sql"):
+            with timed(registry, "run"):
+                pass
+
+        assert registry.phase_count("execute_sql", "run") == 1
+        assert registry.phase_count("get_cluster_labels", "run") == 1
+        assert registry.phase_count("get_cluster_labels", "parse") == 0
+
+    def test_errors(self):
+        """Test the counting of errors by message."""
+        registry = MetricsRegistry()
+
+        for message in ("Access denied", "Access denied", None):
+            with pytest.raises(ExecutionError):
+                with instrument(registry, "execute_py"):
+                    raise ExecutionError({"message": message})
+
+        with pytest.raises(ExecutionError):
+            with instrument(registry, "execute_py", report_errors=False):
+                raise ExecutionError("Access denied")
+
+        assert registry.error_count("execute_py", "Access denied") == 2
+        assert registry.error_count("execute_py", "") == 1
+
+    def test_export(self):
+        """Test the OpenMetrics export."""
+        registry = MetricsRegistry(buckets=[0.1, 1])
+        registry.on_phase("execute_sql", "run", 0.5)
+        registry.on_phase("execute_sql", "run", 2)
+        registry.on_error("execute_sql", ExecutionError('Table "t" not found'))
+        registry.on_output("execute_sql", "ñ")
+
+        lines = registry.export().splitlines()
+        labels = 'operation="execute_sql",phase="run"'
+        assert f'mysql_shell_phase_seconds_bucket{{{labels},le="0.1"}} 0' in lines
+        assert f'mysql_shell_phase_seconds_bucket{{{labels},le="1.0"}} 1' in lines
+        assert f'mysql_shell_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f"mysql_shell_phase_seconds_count{{{labels}}} 2" in lines
+        assert f"mysql_shell_phase_seconds_sum{{{labels}}} 2.5" in lines
+        assert (
+            'mysql_shell_errors_total{operation="execute_sql",message="Table \\"t\\" not found"} 1'
+            in lines
+        )
+        assert 'mysql_shell_output_bytes_total{operation="execute_sql"} 2' in lines
+        assert lines[-1] == "# EOF"
+
+    def test_export_unknown_operation(self):
+        """Test the OpenMetrics export of events reported outside any operation."""
+        registry = MetricsRegistry(buckets=[0.1, 1])
+        registry.on_phase("execute_sql", "run", 0.5)
+        registry.on_phase(None, "run", 0.5)
+        registry.on_error(None, ExecutionError("Access denied"))
+        registry.on_output(None, "output")
+
+        lines = registry.export().splitlines()
+        assert registry.phase_count("unknown", "run") == 1
+        assert 'mysql_shell_phase_seconds_count{operation="unknown",phase="run"} 1' in lines
+        assert 'mysql_shell_errors_total{operation="unknown",message="Access denied"} 1' in lines
+        assert 'mysql_shell_output_bytes_total{operation="unknown"} 6' in lines
+
+    def test_local_executor(self, executor: LocalExecutor):
+        """Test the phases reported by the local executor."""
+        registry = executor.hooks
+        executor.execute_sql("SELECT 1")
+
+        for phase in ("spawn", "run", "parse"):
+            assert registry.phase_count("execute_sql", phase) == 1
+        assert registry.output_bytes("execute_sql") > 0
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("fail")
+
+        assert registry.error_count("execute_sql", "You have an error in your SQL syntax") == 1
+
+    def test_start_py(self, executor: LocalExecutor):
+        """Test the phases reported by a background Python script, and their export."""
+        registry = executor.hooks
+        execution = executor.start_py("print('done')")
+
+        assert execution.wait(timeout=10) == "done"
+        assert registry.phase_count("start_py", "spawn") == 1
+        assert registry.phase_count("start_py", "run") == 1
+        assert 'operation="start_py",phase="spawn"' in registry.export()
+
+    def test_client_operations(self, executor: LocalExecutor):
+        """Test the labelling of executor phases with the client method names."""
+        registry = executor.hooks
+        client = MySQLInstanceClient(executor, StringQueryQuoter())
+
+        assert client.get_instance_version() == "8.0.40"
+        assert registry.phase_count("get_instance_version", "call") == 1
+        assert registry.phase_count("get_instance_variable", "call") == 1
+        assert registry.phase_count("get_instance_variable", "run") == 1
+        assert registry.phase_count("execute_sql", "run") == 0
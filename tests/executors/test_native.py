@@ -0,0 +1,450 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from mysql_shell.builders.quoting import StringQueryQuoter
+from mysql_shell.clients import MySQLInstanceClient
+from mysql_shell.executors import BaseExecutor, CancellationToken, NativeExecutor
+from mysql_shell.executors.errors import ExecutionCancelledError, ExecutionError
+from mysql_shell.executors.protocol import (
+    PacketReader,
+    lenenc_int,
+    scramble_caching_sha2,
+    scramble_native_password,
+)
+from mysql_shell.models import ConnectionDetails, VariableScope
+
+from ..helpers import build_native_executor
+
+NONCE = b"0123456789abcdefghij"
+TYPE_LONGLONG = 0x08
+TYPE_DOUBLE = 0x05
+TYPE_VAR_STRING = 0xFD
+
+
+class StubShellExecutor(BaseExecutor):
+    """Executor returning the Python scripts it receives, for testing."""
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        return script
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script."""
+        raise NotImplementedError()
+
+
+class StubServer:
+    """Stand-in MySQL server, speaking just enough of the classic protocol for testing.
+
+    Queries are answered from a dictionary of canned results, where each statement
+    (separated by semicolons) maps to a ("rows", columns, rows), ("ok", affected, warnings)
+    or ("error", code, message) tuple, after an optional delay.
+    """
+
+    def __init__(self, path: str, plugin: str, password: str, results: dict):
+        """Initialize the server, listening on a UNIX socket."""
+        self.plugin = plugin
+        self.password = password
+        self.results = results
+        self.full_auth = False
+        self.connections = 0
+        self.queries = []
+        self.delay = 0.0
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(path)
+        self._sock.listen()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop listening."""
+        self._sock.close()
+
+    def _serve(self) -> None:
+        """Accept connections, one at a time."""
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+
+            self.connections += 1
+            with conn:
+                try:
+                    self._handle(conn)
+                except (ConnectionError, OSError):
+                    pass
+
+    @staticmethod
+    def _recv(conn: socket.socket) -> tuple[int, bytes]:
+        """Receive a packet."""
+        header = conn.recv(4, socket.MSG_WAITALL)
+        if len(header) < 4:
+            raise ConnectionError()
+
+        size = int.from_bytes(header[:3], "little")
+        return header[3], conn.recv(size, socket.MSG_WAITALL) if size else b""
+
+    @staticmethod
+    def _send(conn: socket.socket, seq: int, payload: bytes) -> int:
+        """Send a packet, returning the next sequence number."""
+        conn.sendall(struct.pack("<I", len(payload))[:3] + bytes([seq]) + payload)
+        return seq + 1
+
+    @staticmethod
+    def _ok(affected: int = 0, status: int = 0, warnings: int = 0) -> bytes:
+        """Build an OK packet."""
+        return b"\x00" + lenenc_int(affected) + b"\x00" + struct.pack("<HH", status, warnings)
+
+    @staticmethod
+    def _err(code: int, message: str) -> bytes:
+        """Build an ERR packet."""
+        return b"\xff" + struct.pack("<H", code) + b"#HY000" + message.encode()
+
+    @staticmethod
+    def _eof(status: int = 0) -> bytes:
+        """Build an EOF packet."""
+        return b"\xfe" + struct.pack("<HH", 0, status)
+
+    @staticmethod
+    def _column(name: str, column_type: int) -> bytes:
+        """Build a column definition packet."""
+        strings = [b"def", b"", b"", b"", name.encode(), name.encode()]
+        payload = b"".join(lenenc_int(len(s)) + s for s in strings)
+        return payload + b"\x0c" + struct.pack("<HIBHB", 45, 255, column_type, 0, 0) + bytes(2)
+
+    def _handle(self, conn: socket.socket) -> None:
+        """Handle a client connection."""
+        handshake = b"".join((
+            b"\x0a8.0.40-stub\x00",
+            struct.pack("<I", self.connections),
+            NONCE[:8] + b"\x00",
+            struct.pack("<HBHH", 0xFFFF & ~0x0800, 45, 0x0002, 0x00FF),
+            bytes([len(NONCE) + 1]) + bytes(10),
+            NONCE[8:] + b"\x00",
+            self.plugin.encode() + b"\x00",
+        ))
+        self._send(conn, 0, handshake)
+
+        seq, payload = self._recv(conn)
+        reader = PacketReader(payload)
+        reader.read(32)
+        reader.read_nul_bytes()
+        auth_data = reader.read_lenenc_bytes()
+
+        scrambler = {
+            "mysql_native_password": scramble_native_password,
+            "caching_sha2_password": scramble_caching_sha2,
+        }[self.plugin]
+        if auth_data != scrambler(self.password.encode(), NONCE):
+            self._send(conn, seq + 1, self._err(1045, "Access denied"))
+            return
+
+        seq += 1
+        if self.plugin == "caching_sha2_password" and self.full_auth:
+            self._send(conn, seq, b"\x01\x04")
+            seq, payload = self._recv(conn)
+            if payload != self.password.encode() + b"\x00":
+                self._send(conn, seq + 1, self._err(1045, "Access denied"))
+                return
+            seq += 1
+        elif self.plugin == "caching_sha2_password":
+            seq = self._send(conn, seq, b"\x01\x03")
+
+        self._send(conn, seq, self._ok())
+
+        while True:
+            _, payload = self._recv(conn)
+            if payload[0] == 0x01:
+                return
+            if payload[0] == 0x0E:
+                self._send(conn, 1, self._ok())
+                continue
+
+            query = payload[1:].decode()
+            self.queries.append(query)
+            time.sleep(self.delay)
+            self._answer(conn, [s.strip() for s in query.split(";") if s.strip()])
+
+    def _answer(self, conn: socket.socket, statements: list[str]) -> None:
+        """Answer a query, sending one result per statement."""
+        seq = 1
+
+        for index, statement in enumerate(statements):
+            more = 0x0008 if index < len(statements) - 1 else 0
+            kind, *args = self.results.get(statement, ("error", 1064, "Syntax error"))
+
+            if kind == "error":
+                self._send(conn, seq, self._err(*args))
+                return
+            if kind == "ok":
+                seq = self._send(conn, seq, self._ok(args[0], more, args[1]))
+                continue
+
+            columns, rows = args
+            seq = self._send(conn, seq, lenenc_int(len(columns)))
+            for name, column_type in columns:
+                seq = self._send(conn, seq, self._column(name, column_type))
+            seq = self._send(conn, seq, self._eof())
+
+            for row in rows:
+                values = [None if v is None else str(v).encode() for v in row]
+                values = [b"\xfb" if v is None else lenenc_int(len(v)) + v for v in values]
+                seq = self._send(conn, seq, b"".join(values))
+
+            seq = self._send(conn, seq, self._eof(more))
+
+
+RESULTS = {
+    "SELECT 1": ("rows", [("1", TYPE_LONGLONG)], [(1,)]),
+    "SELECT a, b, c FROM t": (
+        "rows",
+        [("a", TYPE_LONGLONG), ("b", TYPE_DOUBLE), ("c", TYPE_VAR_STRING)],
+        [(1, 1.5, "x;y"), (2, None, "ñ")],
+    ),
+    "SET @a = 1": ("ok", 0, 0),
+    "SELECT @a AS a": ("rows", [("a", TYPE_LONGLONG)], [(1,)]),
+    "DROP TABLE IF EXISTS t": ("ok", 0, 1),
+    "SHOW WARNINGS": (
+        "rows",
+        [("Level", TYPE_VAR_STRING), ("Code", TYPE_LONGLONG), ("Message", TYPE_VAR_STRING)],
+        [("Note", 1051, "Unknown table 't'")],
+    ),
+    "DO 0": ("ok", 0, 0),
+    "SELECT": ("error", 1064, "You have an error in your SQL syntax"),
+}
+
+
+@pytest.mark.unit
+class TestNativeExecutor:
+    """Class to group all the NativeExecutor unit tests."""
+
+    @pytest.fixture(params=["mysql_native_password", "caching_sha2_password"])
+    def server(self, request, tmp_path):
+        """Stand-in server fixture."""
+        server = StubServer(str(tmp_path / "mysqld.sock"), request.param, "secret", RESULTS)
+        yield server
+        server.close()
+
+    @staticmethod
+    def _build_executor(
+        server: StubServer,
+        password: str = "secret",
+        connect_timeout: float | None = 10,
+    ) -> NativeExecutor:
+        """Build a native executor connected to the stand-in server."""
+        conn_details = ConnectionDetails(
+            username="root",
+            password=password,
+            socket=server._sock.getsockname(),
+        )
+
+        return NativeExecutor(
+            conn_details,
+            "",
+            connect_timeout=connect_timeout,
+            fallback=StubShellExecutor(conn_details, ""),
+        )
+
+    def test_check_connection(self, server: StubServer):
+        """Check the connection."""
+        with self._build_executor(server) as executor:
+            executor.check_connection()
+
+    def test_check_connection_error(self, server: StubServer):
+        """Check the connection when the credentials are wrong."""
+        with self._build_executor(server, password="wrong") as executor:
+            with pytest.raises(ExecutionError) as exc:
+                executor.check_connection()
+
+        assert str(exc.value) == "Access denied"
+
+    def test_full_authentication(self, server: StubServer):
+        """Test the caching_sha2_password full authentication over the UNIX socket."""
+        server.full_auth = True
+
+        with self._build_executor(server) as executor:
+            executor.check_connection()
+
+    def test_execute_py(self, server: StubServer):
+        """Test the delegation of Python scripts into the fallback executor."""
+        with self._build_executor(server) as executor:
+            assert executor.execute_py("print('hello')") == "print('hello')"
+
+        assert server.connections == 0
+
+    def test_execute_sql(self, server: StubServer):
+        """Test the execution of SQL scripts."""
+        with self._build_executor(server) as executor:
+            assert executor.execute_sql("SELECT 1") == [{"1": 1}]
+            assert executor.execute_sql("SELECT a, b, c FROM t") == [
+                {"a": 1, "b": 1.5, "c": "x;y"},
+                {"a": 2, "b": None, "c": "ñ"},
+            ]
+            assert executor.execute_sql("SET @a = 1; SELECT @a AS a") == [{"a": 1}]
+            assert executor.execute_sql("SET @a = 1") == []
+
+        assert server.connections == 1
+
+    def test_execute_sql_error(self, server: StubServer):
+        """Test the execution of SQL scripts when there is an error."""
+        with self._build_executor(server) as executor:
+            with pytest.raises(ExecutionError) as exc:
+                executor.execute_sql("SELECT")
+
+            assert "You have an error in your SQL syntax" in str(exc.value)
+            assert executor.execute_sql("SELECT 1") == [{"1": 1}]
+
+        assert server.connections == 1
+
+    def test_execute_sql_batch(self, server: StubServer):
+        """Test the execution of SQL batches."""
+        with self._build_executor(server) as executor:
+            results = executor.execute_sql_batch([
+                "SET @a = 1",
+                "DROP TABLE IF EXISTS t;",
+                "SELECT @a AS a",
+                "SELECT",
+                "SELECT 1",
+            ])
+            assert results[0].ok
+            assert results[1].warnings == [
+                {"level": "Note", "code": 1051, "message": "Unknown table 't'"}
+            ]
+            assert results[2].rows == [{"a": 1}]
+            assert results[3].error
+            assert not results[4].executed
+
+            results = executor.execute_sql_batch(["SELECT", "SELECT 1"], force=True)
+            assert results[0].error
+            assert results[1].rows == [{"1": 1}]
+
+    def test_execute_sql_without_timeout(self, server: StubServer):
+        """Test the execution of slow SQL scripts, not bound by the connect timeout."""
+        with self._build_executor(server, connect_timeout=0.5) as executor:
+            server.delay = 1
+            assert executor.execute_sql("SELECT 1") == [{"1": 1}]
+
+            server.delay = 0
+            assert executor.execute_sql("SELECT 1", timeout=0.5) == [{"1": 1}]
+
+            server.delay = 1
+            assert executor.execute_sql("SELECT 1") == [{"1": 1}]
+            with pytest.raises(ExecutionError):
+                executor.execute_sql("SELECT 1", timeout=0.2)
+
+    def test_execute_sql_cancel(self, server: StubServer):
+        """Test the cancellation of SQL scripts, killing their server connection."""
+        server.results = {**RESULTS, "KILL CONNECTION 1": ("ok", 0, 0)}
+
+        with self._build_executor(server) as executor:
+            server.delay = 1
+            token = CancellationToken()
+            threading.Timer(0.2, token.cancel).start()
+
+            with pytest.raises(ExecutionCancelledError):
+                executor.execute_sql("SELECT 1", cancel=token)
+
+            server.delay = 0
+            assert executor.execute_sql("SELECT 1") == [{"1": 1}]
+
+        assert "KILL CONNECTION 1" in server.queries
+        assert server.connections == 3
+
+    def test_execute_sql_timeout(self, server: StubServer):
+        """Test the timeout of SQL scripts, killing their server connection."""
+        server.results = {**RESULTS, "KILL CONNECTION 1": ("ok", 0, 0)}
+
+        with self._build_executor(server) as executor:
+            server.delay = 1
+            with pytest.raises(ExecutionError):
+                executor.execute_sql("SELECT 1", timeout=0.2)
+
+        assert "KILL CONNECTION 1" in server.queries
+
+    def test_execute_sql_batch_cancel(self, server: StubServer):
+        """Test the cancellation of SQL batches while fetching their warnings."""
+        with self._build_executor(server) as executor:
+            server.delay = 1
+            token = CancellationToken()
+            threading.Timer(1.5, token.cancel).start()
+
+            with pytest.raises(ExecutionCancelledError):
+                executor.execute_sql_batch(["DROP TABLE IF EXISTS t"], cancel=token)
+
+        assert server.queries[-2:] == ["SHOW WARNINGS", "KILL CONNECTION 1"]
+
+    def test_reconnect(self, server: StubServer):
+        """Test the re-opening of the connection once lost."""
+        with self._build_executor(server) as executor:
+            executor.execute_sql("SELECT 1")
+            executor._conn.abort()
+            executor.execute_sql("SELECT 1")
+
+        assert server.connections == 2
+
+    def test_instance_client(self, server: StubServer):
+        """Test the usage of the executor by the instance client."""
+        server.results = {
+            "SELECT @@GLOBAL.`super_read_only` AS `super_read_only`": (
+                "rows",
+                [("super_read_only", TYPE_LONGLONG)],
+                [(0,)],
+            ),
+        }
+
+        with self._build_executor(server) as executor:
+            client = MySQLInstanceClient(executor, StringQueryQuoter())
+            assert client.get_instance_variable(VariableScope.GLOBAL, "super_read_only") == 0
+
+
+@pytest.mark.integration
+class TestNativeExecutorServer:
+    """Class to group all the NativeExecutor integration tests."""
+
+    @pytest.fixture(scope="class")
+    def executor(self):
+        """Native executor fixture."""
+        executor = build_native_executor(
+            username=os.environ["MYSQL_USERNAME"],
+            password=os.environ["MYSQL_PASSWORD"],
+        )
+
+        with executor:
+            yield executor
+
+    def test_execute_sql(self, executor: NativeExecutor):
+        """Test the execution of SQL scripts."""
+        rows = executor.execute_sql("SELECT user FROM mysql.user")
+        assert any(row["user"] == "root" for row in rows)
+
+        rows = executor.execute_sql("SET @a = 'a;b'; SELECT @a AS a")
+        assert rows[0]["a"] == "a;b"
+
+    def test_session_reuse(self, executor: NativeExecutor):
+        """Test the reuse of the same server connection across calls."""
+        rows_1 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+        rows_2 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+        assert rows_1[0]["id"] == rows_2[0]["id"]
+
+    def test_execute_sql_timeout(self, executor: NativeExecutor):
+        """Test the re-opening of the connection after a timeout."""
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("DO SLEEP(5)", timeout=1)
+
+        assert executor.execute_sql("SELECT 1")[0]["1"] == 1
+
+    def test_execute_py(self, executor: NativeExecutor):
+        """Test the execution of Python scripts."""
+        assert executor.execute_py("print('hello world')") == "hello world"
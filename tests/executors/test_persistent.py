@@ -0,0 +1,200 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import os
+
+import pytest
+
+from mysql_shell.clients import MySQLClusterClient
+from mysql_shell.executors import PersistentExecutor
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails
+
+from ..helpers import FAKE_SHELL_PATH, build_persistent_executor
+
+
+@pytest.mark.unit
+class TestPersistentExecutorSession:
+    """Class to group all the PersistentExecutor tests, run against the fake MySQL Shell."""
+
+    @pytest.fixture()
+    def log_path(self, tmp_path, monkeypatch):
+        """Fake MySQL Shell statements log fixture."""
+        log_path = tmp_path / "statements.log"
+        monkeypatch.setenv("FAKE_MYSQLSH_LOG", str(log_path))
+        return log_path
+
+    @pytest.fixture()
+    def executor(self, log_path):
+        """Persistent executor fixture, running the fake MySQL Shell."""
+        conn_details = ConnectionDetails(username="test", password="test", socket="/tmp/sock")
+
+        with PersistentExecutor(conn_details, FAKE_SHELL_PATH) as executor:
+            yield executor
+
+    @staticmethod
+    def _connection_id(executor: PersistentExecutor) -> int:
+        """Return the server connection ID of the executor session."""
+        return executor.execute_sql("SELECT CONNECTION_ID()")[0]["CONNECTION_ID()"]
+
+    def test_split(self, executor: PersistentExecutor, log_path):
+        """Test the splitting of SQL scripts, ignoring the separators within comments."""
+        executor.execute_sql(
+            "SELECT 'a;b' /* c; d */; -- e; f\n"
+            "SELECT /*+ MAX_EXECUTION_TIME(1) */ 1; # g; h\n"
+            "/* i; */;"
+        )
+
+        statements = log_path.read_text().split("\n")
+        assert statements[-4:] == [
+            "SELECT 'a;b' /* c; d */",
+            "-- e; f",
+            "SELECT /*+ MAX_EXECUTION_TIME(1) */ 1",
+            "",
+        ]
+
+    def test_respawn_on_crash(self, executor: PersistentExecutor, monkeypatch):
+        """Test the re-spawning of the session once crashed, forgetting its connection."""
+        connection_id = self._connection_id(executor)
+
+        with pytest.raises(ExecutionError):
+            executor.execute_py("import os\nos._exit(1)")
+
+        assert self._connection_id(executor) != connection_id
+
+        with pytest.raises(ExecutionError):
+            executor.execute_py("import os\nos._exit(1)")
+
+        monkeypatch.setenv("FAKE_MYSQLSH_FAILURE", "auth")
+        with pytest.raises(ExecutionError):
+            executor.check_connection()
+
+        assert executor._connection_id is None
+
+    def test_kill_on_timeout(self, executor: PersistentExecutor, log_path):
+        """Test the killing of the session connection once a call times out."""
+        connection_id = self._connection_id(executor)
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("SELECT SLEEP(5)", timeout=1)
+
+        assert f"KILL CONNECTION {connection_id}" in log_path.read_text().splitlines()
+        assert self._connection_id(executor) != connection_id
+
+
+@pytest.mark.integration
+class TestPersistentExecutor:
+    """Class to group all the PersistentExecutor tests."""
+
+    @pytest.fixture(scope="class")
+    def executor(self):
+        """Persistent executor fixture."""
+        executor = build_persistent_executor(
+            username=os.environ["MYSQL_USERNAME"],
+            password=os.environ["MYSQL_PASSWORD"],
+        )
+
+        with executor:
+            yield executor
+
+    def test_check_connection(self, executor: PersistentExecutor):
+        """Check the connection."""
+        executor.check_connection()
+
+    def test_check_connection_error(self):
+        """Check the connection when there is an error."""
+        executor = build_persistent_executor(
+            username="wrong_username",
+            password="wrong_password",
+        )
+
+        with pytest.raises(ExecutionError):
+            executor.check_connection()
+
+    def test_execute_py(self, executor: PersistentExecutor):
+        """Test the execution of Python scripts."""
+        result = executor.execute_py("print('hello world')")
+        assert isinstance(result, str)
+        assert result == "hello world"
+
+        result = executor.execute_py("a = 1")
+        assert isinstance(result, str)
+        result = json.loads(result)
+        assert isinstance(result, dict)
+
+    def test_execute_py_error(self, executor: PersistentExecutor):
+        """Test the execution of Python scripts when there is an error."""
+        with pytest.raises(ExecutionError) as exc:
+            executor.execute_py("syntax")
+
+        assert str(exc.value) == "name 'syntax' is not defined"
+
+    def test_execute_sql(self, executor: PersistentExecutor):
+        """Test the execution of SQL scripts."""
+        rows = executor.execute_sql("SELECT 1")
+        assert isinstance(rows, list)
+        assert rows[0]["1"]
+
+        rows = executor.execute_sql("SELECT user FROM mysql.user")
+        assert isinstance(rows, list)
+        assert any(row["user"] == "root" for row in rows)
+
+        rows = executor.execute_sql("SET @a = 'a;b'; SELECT @a AS a")
+        assert rows[0]["a"] == "a;b"
+
+    def test_execute_sql_error(self, executor: PersistentExecutor):
+        """Test the execution of SQL scripts when there is an error."""
+        with pytest.raises(ExecutionError) as exc:
+            executor.execute_sql("SELECT")
+
+        assert "You have an error in your SQL syntax" in str(exc.value)
+
+    def test_execute_sql_batch(self, executor: PersistentExecutor):
+        """Test the execution of SQL batches."""
+        results = executor.execute_sql_batch([
+            "SET @a = 1",
+            "SELECT @a AS a",
+            "SELECT",
+            "SELECT 2 AS b",
+        ])
+        assert len(results) == 4
+        assert results[0].ok
+        assert results[1].rows == [{"a": 1}]
+        assert results[2].error
+        assert not results[3].executed
+
+        results = executor.execute_sql_batch(["SELECT", "SELECT 2 AS b"], force=True)
+        assert results[0].error
+        assert results[1].rows == [{"b": 2}]
+
+    def test_session_reuse(self, executor: PersistentExecutor):
+        """Test the reuse of the same server connection across calls."""
+        rows_1 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+        rows_2 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+        assert rows_1[0]["id"] == rows_2[0]["id"]
+
+    def test_session_restart_on_timeout(self, executor: PersistentExecutor):
+        """Test the re-spawning of the process after a timeout."""
+        rows_1 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+
+        with pytest.raises(ExecutionError):
+            executor.execute_sql("DO SLEEP(5)", timeout=1)
+
+        rows_2 = executor.execute_sql("SELECT CONNECTION_ID() AS id")
+        assert rows_1[0]["id"] != rows_2[0]["id"]
+
+    def test_session_restart_on_crash(self, executor: PersistentExecutor):
+        """Test the re-spawning of the process after a crash."""
+        executor.check_connection()
+        executor._process.kill()
+        executor._process.wait()
+
+        rows = executor.execute_sql("SELECT 1")
+        assert rows[0]["1"]
+
+    def test_cluster_client(self, executor: PersistentExecutor):
+        """Test the usage of the executor by the cluster client."""
+        client = MySQLClusterClient(executor)
+        result = client.check_instance_before_cluster()
+        assert result["status"] == "ok"
@@ -0,0 +1,204 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import threading
+import time
+
+import pytest
+
+from mysql_shell.executors import BaseExecutor, ExecutorPool
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails, StatementResult
+
+
+class StubExecutor(BaseExecutor):
+    """Executor returning canned results, for testing."""
+
+    def __init__(self, conn_details: ConnectionDetails, delay: float = 0):
+        """Initialize the executor."""
+        super().__init__(conn_details, "")
+        self.alive = True
+        self.closed = False
+        self.delay = delay
+        self.close_delay = 0
+        self.failure = ExecutionError
+
+    def close(self) -> None:
+        """Close the executor."""
+        time.sleep(self.close_delay)
+        self.closed = True
+
+    def check_connection(self) -> None:
+        """Check the connection."""
+        if not self.alive:
+            raise self.failure()
+
+    def execute_py(self, script: str, *, timeout: int | None = None) -> str:
+        """Execute a Python script."""
+        time.sleep(self.delay)
+        return script
+
+    def execute_sql(self, script: str, *, timeout: int | None = None) -> list[dict]:
+        """Execute a SQL script."""
+        time.sleep(self.delay)
+        return [{"script": script}]
+
+    def execute_sql_batch(self, statements, *, timeout=None, force=False) -> list:
+        """Execute a batch of SQL statements."""
+        return [StatementResult(s, [{"script": s}]) for s in statements]
+
+
+@pytest.mark.unit
+class TestExecutorPool:
+    """Class to group all the ExecutorPool tests."""
+
+    @pytest.fixture()
+    def conn_details(self):
+        """Connection details fixture."""
+        return ConnectionDetails(username="test", password="test", host="localhost", port="3306")
+
+    @staticmethod
+    def _build_pool(conn_details: ConnectionDetails, sessions: list, **kwargs) -> ExecutorPool:
+        """Build a pool of stub executors, keeping track of the created sessions."""
+        delay = kwargs.pop("delay", 0)
+
+        def factory():
+            sessions.append(StubExecutor(conn_details, delay))
+            return sessions[-1]
+
+        return ExecutorPool(conn_details, "", session_factory=factory, **kwargs)
+
+    def test_session_reuse(self, conn_details: ConnectionDetails):
+        """Test the reuse of idle sessions."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions)
+
+        assert pool.execute_sql("SELECT 1") == [{"script": "SELECT 1"}]
+        assert pool.execute_py("print(1)") == "print(1)"
+        assert pool.execute_sql_batch(["SELECT 1"])[0].rows == [{"script": "SELECT 1"}]
+        assert len(sessions) == 1
+
+        stats = pool.stats()
+        assert stats.size == 1
+        assert stats.idle == 1
+        assert stats.in_use == 0
+        assert stats.checkouts == 3
+
+    def test_max_size(self, conn_details: ConnectionDetails):
+        """Test the bounding of sessions under concurrency."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, max_size=2, delay=0.1)
+
+        threads = [threading.Thread(target=pool.execute_sql, args=["SELECT 1"]) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats()
+        assert len(sessions) == 2
+        assert stats.size == 2
+        assert stats.waits > 0
+        assert stats.checkouts == 6
+
+    def test_checkout_timeout(self, conn_details: ConnectionDetails):
+        """Test the failure to check out a session on time."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, max_size=1, checkout_timeout=0.1)
+
+        with pool.session():
+            assert pool.stats().saturation == 1
+            with pytest.raises(ExecutionError):
+                pool.execute_sql("SELECT 1")
+
+        assert pool.stats().timeouts == 1
+
+    def test_liveness_probe(self, conn_details: ConnectionDetails):
+        """Test the discarding of dead sessions before reuse."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, probe_interval=0)
+
+        pool.execute_sql("SELECT 1")
+        sessions[0].alive = False
+        pool.execute_sql("SELECT 1")
+
+        assert len(sessions) == 2
+        assert sessions[0].closed
+        assert pool.stats().probe_failures == 1
+
+    def test_liveness_probe_unexpected_error(self, conn_details: ConnectionDetails):
+        """Test the discarding of sessions whose probe fails unexpectedly, freeing their slot."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, max_size=1, probe_interval=0)
+
+        pool.execute_sql("SELECT 1")
+        sessions[0].alive = False
+        sessions[0].failure = OSError
+        pool.execute_sql("SELECT 1")
+
+        assert len(sessions) == 2
+        assert pool.stats().size == 1
+        assert pool.stats().probe_failures == 1
+
+    def test_idle_eviction(self, conn_details: ConnectionDetails):
+        """Test the eviction of idle sessions."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, idle_timeout=0.1)
+
+        pool.execute_sql("SELECT 1")
+        time.sleep(0.2)
+        pool.execute_sql("SELECT 1")
+
+        assert len(sessions) == 2
+        assert sessions[0].closed
+        assert pool.stats().evictions == 1
+
+    def test_idle_eviction_on_release(self, conn_details: ConnectionDetails):
+        """Test the eviction of idle sessions once another session is returned."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, idle_timeout=0.1)
+
+        with pool.session():
+            with pool.session():
+                pass
+            time.sleep(0.2)
+
+        assert sessions[1].closed
+        assert not sessions[0].closed
+        assert pool.stats().evictions == 1
+        assert pool.stats().idle == 1
+
+    def test_idle_eviction_unlocked(self, conn_details: ConnectionDetails):
+        """Test that closing evicted sessions does not block the rest of the pool users."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions, idle_timeout=0.1)
+
+        pool.execute_sql("SELECT 1")
+        sessions[0].close_delay = 1
+        time.sleep(0.2)
+
+        thread = threading.Thread(target=pool.execute_sql, args=["SELECT 1"])
+        thread.start()
+        time.sleep(0.1)
+
+        start = time.monotonic()
+        pool.stats()
+        assert time.monotonic() - start < 0.5
+
+        thread.join()
+        assert sessions[0].closed
+
+    def test_close(self, conn_details: ConnectionDetails):
+        """Test the closing of the pool."""
+        sessions = []
+        pool = self._build_pool(conn_details, sessions)
+
+        with pool.session():
+            pool.execute_sql("SELECT 1")
+            pool.close()
+
+        assert all(session.closed for session in sessions)
+        assert pool.stats().size == 0
+
+        with pytest.raises(ExecutionError):
+            pool.execute_sql("SELECT 1")
@@ -0,0 +1,157 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import gzip
+import json
+import time
+
+import pytest
+
+from mysql_shell.builders import StringQueryQuoter
+from mysql_shell.clients import MySQLInstanceClient
+from mysql_shell.executors import (
+    LocalExecutor,
+    MetricsRegistry,
+    RecordingExecutor,
+    ReplayExecutor,
+)
+from mysql_shell.executors.errors import ExecutionError
+from mysql_shell.models import ConnectionDetails, StatementResult, User
+
+from ..helpers import FAKE_SHELL_PATH
+
+RESULTS = {"fail": None, "SELECT 1 AS a": [{"a": 1}]}
+
+
+@pytest.mark.unit
+class TestRecordingExecutor:
+    """Class to group all the RecordingExecutor and ReplayExecutor tests."""
+
+    @pytest.fixture()
+    def executor(self, tmp_path, monkeypatch):
+        """Local executor fixture, running the fake MySQL Shell."""
+        results_path = tmp_path / "results.json"
+        results_path.write_text(json.dumps(RESULTS))
+        monkeypatch.setenv("FAKE_MYSQLSH_RESULTS", str(results_path))
+        monkeypatch.setenv("FAKE_MYSQLSH_LATENCY", "0.2")
+
+        conn_details = ConnectionDetails(username="test", password="s3cr3t", host="h", port="1")
+        return LocalExecutor(conn_details, FAKE_SHELL_PATH)
+
+    @pytest.mark.parametrize("name", ["cassette.jsonl", "cassette.jsonl.gz"])
+    def test_record_replay(self, executor: LocalExecutor, tmp_path, name: str):
+        """Test the replay of the recorded calls."""
+        path = str(tmp_path / name)
+
+        with RecordingExecutor(executor, path) as recorder:
+            assert recorder.execute_sql("SELECT 1 AS a") == [{"a": 1}]
+            assert recorder.execute_py("print('hello')") == "hello"
+            assert recorder.execute_sql_batch(["SELECT 1 AS a"])[0].rows == [{"a": 1}]
+            with pytest.raises(ExecutionError):
+                recorder.execute_sql("fail")
+
+        registry = MetricsRegistry()
+        replayer = ReplayExecutor(path, hooks=registry)
+
+        start = time.monotonic()
+        for _ in range(2):
+            assert replayer.execute_sql("SELECT 1 AS a") == [{"a": 1}]
+            assert replayer.execute_py("print('hello')") == "hello"
+            assert replayer.execute_sql_batch(["SELECT 1 AS a"])[0].rows == [{"a": 1}]
+            with pytest.raises(ExecutionError) as exc:
+                replayer.execute_sql("fail")
+            assert str(exc.value) == "You have an error in your SQL syntax"
+
+        assert time.monotonic() - start < 0.2
+        assert replayer.connection_details.host == "h"
+        assert registry.phase_count("execute_sql", "parse") == 2
+
+        with pytest.raises(ValueError):
+            replayer.execute_sql("SELECT 2")
+
+    def test_replay_realtime(self, executor: LocalExecutor, tmp_path):
+        """Test the replay of the recorded calls at their recorded speed."""
+        path = str(tmp_path / "cassette.jsonl")
+
+        with RecordingExecutor(executor, path) as recorder:
+            recorder.execute_sql("SELECT 1 AS a")
+
+        replayer = ReplayExecutor(path, realtime=True)
+
+        start = time.monotonic()
+        replayer.execute_sql("SELECT 1 AS a")
+        assert time.monotonic() - start >= 0.2
+
+    def test_password_scrubbing(self, executor: LocalExecutor, tmp_path):
+        """Test the scrubbing of passwords from the cassette."""
+        path = str(tmp_path / "cassette.jsonl")
+
+        with RecordingExecutor(executor, path) as recorder:
+            client = MySQLInstanceClient(recorder, StringQueryQuoter())
+            client.create_instance_user(User("user", "%"), "p4ssw0rd")
+            recorder.execute_py("print({'password': 's3cr3t'})")
+            recorder.execute_py("shell.connect('test:s3cr3t@h:1')")
+            recorder.execute_py("shell.connect('mysql://other:an0ther@h:1')")
+            recorder.execute_py("print('s3cr3t_table')")
+
+        with open(path) as file:
+            cassette = file.read()
+
+        assert "p4ssw0rd" not in cassette
+        assert "'s3cr3t'" not in cassette
+        assert "s3cr3t@" not in cassette
+        assert "an0ther" not in cassette
+        assert "s3cr3t_table" in cassette
+
+        replayer = ReplayExecutor(path)
+        client = MySQLInstanceClient(replayer, StringQueryQuoter())
+        client.create_instance_user(User("user", "%"), "an0ther")
+
+    def test_hooks(self, executor: LocalExecutor, tmp_path):
+        """Test the recording of the raw output, keeping the wrapped executor hooks."""
+        path = str(tmp_path / "cassette.jsonl")
+        registry = MetricsRegistry()
+        executor.add_hooks(registry)
+
+        with RecordingExecutor(executor, path) as recorder:
+            recorder.execute_sql("SELECT 1 AS a")
+
+        assert executor.hooks.hooks[-1] is registry
+        assert registry.phase_count("execute_sql", "run") == 1
+        assert registry.output_bytes("execute_sql") > 0
+
+        with open(path) as file:
+            assert "warningCount" in json.loads(file.readlines()[1])["output"]
+
+    def test_synthesized_output(self, executor: LocalExecutor, tmp_path):
+        """Test the recording of executors not exposing their raw output."""
+        path = str(tmp_path / "cassette.jsonl.gz")
+        results = [
+            StatementResult("SELECT 1 AS a", rows=[{"a": 1}]),
+            StatementResult("SELECT", error={"message": "Syntax error"}),
+            StatementResult("SELECT 2 AS b", executed=False),
+        ]
+
+        class StubExecutor(LocalExecutor):
+            def execute_sql(self, script, *, timeout=None):
+                return [{"a": 1}]
+
+            def iter_sql(self, script, *, timeout=None):
+                yield {"a": 1}
+
+            def execute_sql_batch(self, statements, *, timeout=None, force=False):
+                return results
+
+        stub = StubExecutor(executor.connection_details, "")
+        with RecordingExecutor(stub, path) as recorder:
+            recorder.execute_sql("SELECT 1 AS a")
+            assert list(recorder.iter_sql("SELECT 1 AS a")) == [{"a": 1}]
+            recorder.execute_sql_batch([result.statement for result in results])
+
+        with gzip.open(path, "rt") as file:
+            assert len(file.readlines()) == 4
+
+        replayer = ReplayExecutor(path)
+        assert replayer.execute_sql("SELECT 1 AS a") == [{"a": 1}]
+        assert replayer.execute_sql_batch([r.statement for r in results]) == results
+        assert list(replayer.iter_sql("SELECT 1 AS a")) == [{"a": 1}]
@@ -0,0 +1,56 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+
+import pytest
+
+from mysql_shell.executors.streaming import ShellOutputStream
+
+
+@pytest.mark.unit
+class TestShellOutputStream:
+    """Class to group all the ShellOutputStream tests."""
+
+    OUTPUT = "\n".join((
+        json.dumps({"warning": "Using a password on the command line interface can be insecure."}),
+        json.dumps({"hasData": True, "rows": [{"id": 1, "name": "a"}, {"id": 22, "name": "b"}]}),
+        json.dumps({"hasData": True, "rows": [], "executionTime": "0.0010 sec"}),
+        json.dumps({"hasData": True, "rows": [{"id": 333, "name": 'c " ] ,'}]}),
+        json.dumps({"error": {"message": "Unknown column", "code": 1054}}),
+        "",
+    ))
+
+    @staticmethod
+    def _feed(output: str, chunk_size: int) -> list:
+        """Feed the output in chunks of the given size, returning every event."""
+        stream = ShellOutputStream()
+        events = []
+
+        for index in range(0, len(output), chunk_size):
+            events.extend(stream.feed(output[index : index + chunk_size]))
+
+        events.extend(stream.feed("", eof=True))
+        return events
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100_000])
+    def test_feed(self, chunk_size: int):
+        """Test the decoding of the output, regardless of how it is chunked."""
+        events = self._feed(self.OUTPUT, chunk_size)
+
+        rows = [value for kind, value in events if kind == "row"]
+        docs = [value for kind, value in events if kind == "doc"]
+
+        assert rows == [
+            {"id": 1, "name": "a"},
+            {"id": 22, "name": "b"},
+            {"id": 333, "name": 'c " ] ,'},
+        ]
+        assert len(docs) == 5
+        assert docs[2] == {"hasData": True, "executionTime": "0.0010 sec"}
+        assert docs[4] == {"error": {"message": "Unknown column", "code": 1054}}
+
+    def test_feed_truncated(self):
+        """Test the decoding of a truncated output."""
+        with pytest.raises(ValueError):
+            self._feed('{"hasData": true, "rows": [{"id": 1}', 10)
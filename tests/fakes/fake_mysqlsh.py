@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Stand-in MySQL Shell binary, emitting realistic --json=raw output without any server.
+
+It accepts the same arguments as the executors pass to the real binary,
+and it is configured through the following environment variables:
+
+    FAKE_MYSQLSH_ROWS: Number of rows returned by every SELECT statement (default: 1)
+    FAKE_MYSQLSH_ROW_SIZE: Size in bytes of the text column of every row (default: 16)
+    FAKE_MYSQLSH_WARNINGS: Number of warnings printed before any result (default: 1)
+    FAKE_MYSQLSH_LATENCY: Seconds to wait before connecting (default: 0)
+    FAKE_MYSQLSH_FAILURE: Failure mode, one of: auth, query, crash or hang (default: none)
+    FAKE_MYSQLSH_FAILURE_RATE: Ratio of invocations failing with the failure mode (default: 1)
+    FAKE_MYSQLSH_LOG: Path of a file where every SQL statement is appended (default: none)
+    FAKE_MYSQLSH_RESULTS: Path of a JSON file mapping statement substrings to their rows,
+        or to null for failing statements, read on every statement (default: none)
+    FAKE_MYSQLSH_TARGETS: Path of a JSON file mapping connection targets (socket path
+        or host:port) to their own latency and failure mode settings (default: none)
+
+Statements calling SLEEP(n) wait for n seconds, and those calling CONNECTION_ID()
+return the process ID as the connection ID. Statements matching none of the results
+substrings, in file order, return generated rows when they are SELECT statements.
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+
+
+def _env(name: str, default: str) -> str:
+    """Return the value of a configuration variable."""
+    return os.environ.get(f"FAKE_MYSQLSH_{name}", default)
+
+
+ROWS = int(_env("ROWS", "1"))
+ROW_SIZE = int(_env("ROW_SIZE", "16"))
+WARNINGS = int(_env("WARNINGS", "1"))
+LATENCY = float(_env("LATENCY", "0"))
+FAILURE = _env("FAILURE", "")
+FAILURE_RATE = float(_env("FAILURE_RATE", "1"))
+LOG = _env("LOG", "")
+RESULTS = _env("RESULTS", "")
+TARGETS = _env("TARGETS", "")
+
+SLEEP_PATTERN = re.compile(r"SLEEP\((\d+(?:\.\d+)?)\)", re.IGNORECASE)
+CONNECTION_ID_PATTERN = re.compile(r"CONNECTION_ID\(\)(?:\s+AS\s+(\w+))?", re.IGNORECASE)
+
+
+def emit(doc: dict) -> None:
+    """Print a single output document, as soon as produced."""
+    sys.stdout.write(json.dumps(doc) + "\n")
+    sys.stdout.flush()
+
+
+def build_rows(count: int) -> list[dict]:
+    """Build a list of rows."""
+    text = "x" * ROW_SIZE
+    return [{"id": i, "name": text, "value": i / 2} for i in range(count)]
+
+
+class QueryError(RuntimeError):
+    """Error of a statement configured to fail."""
+
+
+def read_json(path: str) -> dict:
+    """Read a JSON configuration file."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def find_results(statement: str) -> tuple[bool, list[dict] | None]:
+    """Find the configured rows of a statement, returning whether any were found."""
+    if not RESULTS:
+        return False, None
+
+    for substring, rows in read_json(RESULTS).items():
+        if substring in statement:
+            return True, rows
+
+    return False, None
+
+
+def run_statement(statement: str) -> list[dict]:
+    """Emulate the side effects of a statement, returning its rows."""
+    if LOG:
+        with open(LOG, "a") as file:
+            file.write(statement + "\n")
+
+    found, rows = find_results(statement)
+    if found and rows is None:
+        raise QueryError("You have an error in your SQL syntax")
+    if found:
+        return rows
+
+    if match := SLEEP_PATTERN.search(statement):
+        time.sleep(float(match.group(1)))
+    if match := CONNECTION_ID_PATTERN.search(statement):
+        return [{match.group(1) or "CONNECTION_ID()": os.getpid()}]
+    if statement.upper().startswith("SELECT"):
+        return build_rows(ROWS)
+
+    return []
+
+
+def split_sql(script: str) -> list[str]:
+    """Split a SQL script into statements, honoring quotes."""
+    statements = []
+    current = []
+    quote = None
+
+    for char in script:
+        if quote and char == quote:
+            quote = None
+        elif not quote and char in "'\"`":
+            quote = char
+        elif not quote and char == ";":
+            statements.append("".join(current))
+            current = []
+            continue
+
+        current.append(char)
+
+    statements.append("".join(current))
+    return [s.strip() for s in statements if s.strip()]
+
+
+class StubResult:
+    """Result of a statement run through a stub session."""
+
+    def __init__(self, statement: str):
+        """Initialize the result."""
+        self._rows = run_statement(statement)
+
+    def has_data(self) -> bool:
+        """Return whether the result has rows."""
+        return bool(self._rows)
+
+    def get_column_names(self) -> list[str]:
+        """Return the column names."""
+        return list(self._rows[0]) if self._rows else []
+
+    def fetch_all(self) -> list[tuple]:
+        """Return every row, as tuples."""
+        return [tuple(row.values()) for row in self._rows]
+
+    def fetch_one(self) -> tuple | None:
+        """Return the first row, as a tuple."""
+        return tuple(self._rows[0].values()) if self._rows else None
+
+    def get_warnings(self) -> list:
+        """Return the statement warnings."""
+        return []
+
+    def get_affected_items_count(self) -> int:
+        """Return the number of affected items."""
+        return 0
+
+
+class StubSession:
+    """Stub of the MySQL Shell session object."""
+
+    def run_sql(self, statement: str) -> StubResult:
+        """Run a SQL statement."""
+        if FAILURE == "query":
+            raise RuntimeError("You have an error in your SQL syntax")
+
+        return StubResult(statement)
+
+    def is_open(self) -> bool:
+        """Return whether the session is open."""
+        return True
+
+
+class StubDict(dict):
+    """Stub of a MySQL Shell dictionary, printed as JSON."""
+
+    def __str__(self) -> str:
+        """Return the dictionary representation."""
+        return json.dumps(self)
+
+
+class StubObject:
+    """Stub of any other MySQL Shell object, accepting every method call."""
+
+    def __init__(self, name: str):
+        """Initialize the object."""
+        self._name = name
+
+    def __getattr__(self, name: str):
+        """Return a stub method."""
+        return lambda *args, **kwargs: StubObject(name)
+
+    def status(self, *args, **kwargs) -> StubDict:
+        """Return a cluster status."""
+        return StubDict({
+            "clusterName": "test-cluster",
+            "defaultReplicaSet": {
+                "status": "OK",
+                "topology": {
+                    f"instance-{i}:3306": {"status": "ONLINE", "memberRole": "SECONDARY"}
+                    for i in range(3)
+                },
+            },
+        })
+
+    def list_routers(self, *args, **kwargs) -> StubDict:
+        """Return a cluster routers."""
+        return StubDict({"clusterName": "test-cluster", "routers": {}})
+
+    def __str__(self) -> str:
+        """Return the object representation."""
+        return f"<{self._name}>"
+
+
+class StubShell(StubObject):
+    """Stub of the MySQL Shell global object."""
+
+    def __init__(self):
+        """Initialize the shell."""
+        super().__init__("Shell")
+        self.options = StubObject("Options")
+        self._session = StubSession()
+
+    def get_session(self) -> StubSession:
+        """Return the global session."""
+        return self._session
+
+    def set_session(self, session: StubSession) -> None:
+        """Set the global session."""
+        self._session = session
+
+
+def run_sql(script: str, force: bool) -> int:
+    """Print one result document per statement."""
+    for statement in split_sql(script):
+        if FAILURE == "query":
+            emit({"error": {"message": "You have an error in your SQL syntax", "code": 1064}})
+            if not force:
+                return 1
+            continue
+
+        try:
+            rows = run_statement(statement)
+        except QueryError as e:
+            emit({"error": {"message": str(e), "code": 1064}})
+            if not force:
+                return 1
+            continue
+
+        emit({
+            "hasData": bool(rows),
+            "rows": rows,
+            "executionTime": "0.0001 sec",
+            "affectedRowCount": 0,
+            "affectedItemsCount": 0,
+            "warningCount": 0,
+            "warningsCount": 0,
+            "warnings": [],
+            "info": "",
+            "autoIncrementValue": 0,
+        })
+
+    return 0
+
+
+class InfoWriter:
+    """Standard output replacement, printing every write as an info document."""
+
+    def __init__(self, stream):
+        """Initialize the writer."""
+        self._stream = stream
+
+    def write(self, text: str) -> None:
+        """Print the text as an info document, as soon as produced."""
+        self._stream.write(json.dumps({"info": text}) + "\n")
+        self._stream.flush()
+
+    def flush(self) -> None:
+        """Flush the underlying stream."""
+        self._stream.flush()
+
+
+def run_py(script: str) -> int:
+    """Run a Python script against stub objects, printing its output as info documents."""
+    stdout = sys.stdout
+    sys.stdout = InfoWriter(stdout)
+
+    namespace = {
+        "__name__": "__mysqlsh__",
+        "shell": StubShell(),
+        "dba": StubObject("Dba"),
+        "session": StubSession(),
+    }
+
+    try:
+        exec(script, namespace)
+    except Exception as e:
+        sys.stdout = stdout
+        emit({"error": {"message": str(e)}})
+        return 1
+    finally:
+        sys.stdout = stdout
+
+    return 0
+
+
+def find_target(args: list[str]) -> str:
+    """Return the connection target of the invocation, either a socket path or host:port."""
+    options = dict(arg[2:].partition("=")[::2] for arg in args if arg.startswith("--"))
+    if "socket" in options:
+        return options["socket"]
+
+    return f"{options.get('host')}:{options.get('port')}"
+
+
+def configure_target(args: list[str]) -> None:
+    """Apply the latency and failure mode settings of the invocation connection target."""
+    global FAILURE, LATENCY
+
+    settings = read_json(TARGETS).get(find_target(args), {}) if TARGETS else {}
+    LATENCY = float(settings.get("latency", LATENCY))
+    FAILURE = settings.get("failure", FAILURE)
+
+
+def main(args: list[str]) -> int:
+    """Emulate a MySQL Shell invocation."""
+    global FAILURE
+
+    configure_target(args)
+
+    _, _, stdin_script = sys.stdin.read().partition("\n")
+    time.sleep(LATENCY)
+
+    if random.random() >= FAILURE_RATE:
+        FAILURE = ""
+
+    if FAILURE == "auth":
+        emit({"error": {"message": "Access denied for user 'root'@'localhost'", "code": 1045}})
+        return 1
+    if FAILURE == "hang":
+        time.sleep(3600)
+
+    for _ in range(WARNINGS):
+        emit({"warning": "Using a password on the command line interface can be insecure."})
+
+    script = stdin_script if stdin_script.strip() else None
+    if "--execute" in args:
+        script = args[args.index("--execute") + 1]
+    if "--file" in args:
+        with open(args[args.index("--file") + 1]) as file:
+            script = file.read()
+
+    if script is None:
+        return 0
+    if FAILURE == "crash":
+        sys.stdout.write('{"hasData": true, "rows": [')
+        sys.stdout.flush()
+        os._exit(139)
+    if "--py" in args:
+        return run_py(script)
+
+    return run_sql(script, "--force" in args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
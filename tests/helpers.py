@@ -5,13 +5,21 @@ import os
 import threading
 import time
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any
 
-from mysql_shell.executors import LocalExecutor
+from mysql_shell.executors import (
+    AsyncLocalExecutor,
+    LocalExecutor,
+    NativeExecutor,
+    PersistentExecutor,
+)
 from mysql_shell.models import ConnectionDetails, VariableScope
 
 TEST_CLUSTER_NAME = "test-cluster"
 
+FAKE_SHELL_PATH = str(Path(__file__).parent / "fakes" / "fake_mysqlsh.py")
+
 
 def build_local_executor(username: str, password: str, host: str = "0.0.0.0", port: str = "3306"):
     """Build a local executor for testing."""
@@ -28,6 +36,66 @@ def build_local_executor(username: str, password: str, host: str = "0.0.0.0", po
     )
 
 
+def build_async_local_executor(
+    username: str,
+    password: str,
+    host: str = "0.0.0.0",
+    port: str = "3306",
+):
+    """Build an asynchronous local executor for testing."""
+    conn_details = ConnectionDetails(
+        username=username,
+        password=password,
+        host=host,
+        port=port,
+    )
+
+    return AsyncLocalExecutor(
+        conn_details=conn_details,
+        shell_path=os.environ["MYSQL_SHELL_PATH"],
+    )
+
+
+def build_persistent_executor(
+    username: str,
+    password: str,
+    host: str = "0.0.0.0",
+    port: str = "3306",
+):
+    """Build a persistent executor for testing."""
+    conn_details = ConnectionDetails(
+        username=username,
+        password=password,
+        host=host,
+        port=port,
+    )
+
+    return PersistentExecutor(
+        conn_details=conn_details,
+        shell_path=os.environ["MYSQL_SHELL_PATH"],
+    )
+
+
+def build_native_executor(
+    username: str,
+    password: str,
+    host: str = "0.0.0.0",
+    port: str = "3306",
+):
+    """Build a native executor for testing."""
+    conn_details = ConnectionDetails(
+        username=username,
+        password=password,
+        host=host,
+        port=port,
+    )
+
+    return NativeExecutor(
+        conn_details=conn_details,
+        shell_path=os.environ["MYSQL_SHELL_PATH"],
+    )
+
+
 @contextmanager
 def temp_process(query: str):
     """Context manager to run a piece of code with a background process."""
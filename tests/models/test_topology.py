@@ -0,0 +1,78 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+
+from mysql_shell.models import ClusterStatus, ClusterTopology, InstanceRole, InstanceState
+
+
+def _build_status(states: list[str]) -> dict:
+    """Build a cluster status, with one member per provided state."""
+    topology = {}
+    for i, state in enumerate(states):
+        topology[f"mysql-{i}"] = {
+            "address": f"10.0.0.{i}:3306",
+            "memberRole": "PRIMARY" if i == 0 else "SECONDARY",
+            "mode": "R/W" if i == 0 else "R/O",
+            "status": state,
+            "version": "8.0.40",
+            "instanceErrors": ["WARNING: instance is not replicating"] if i == 1 else None,
+            "transactions": {"currentlyApplying": {}},
+        }
+
+    return {
+        "clusterName": "test-cluster",
+        "defaultReplicaSet": {
+            "name": "default",
+            "primary": "10.0.0.0:3306",
+            "status": "OK",
+            "statusText": "Cluster is ONLINE and can tolerate up to ONE failure.",
+            "topology": topology,
+            "topologyMode": "Single-Primary",
+        },
+    }
+
+
+@pytest.mark.unit
+class TestClusterTopology:
+    """Class to group all the ClusterTopology tests."""
+
+    def test_indexes(self):
+        """Test the lookup of members by address, label, role and state."""
+        topology = ClusterTopology.from_status(_build_status(["ONLINE", "ONLINE", "(MISSING)"]))
+
+        assert topology.name == "test-cluster"
+        assert topology.status == ClusterStatus.OK
+        assert topology.primary_member.label == "mysql-0"
+        assert topology.get_member("10.0.0.1:3306").label == "mysql-1"
+        assert topology.get_member_by_label("mysql-2").state is None
+        assert topology.get_member("10.0.0.9:3306") is None
+        assert len(topology.get_members_by_role(InstanceRole.SECONDARY)) == 2
+        assert len(topology.get_members_by_state(InstanceState.ONLINE)) == 2
+
+    def test_extended_sections(self):
+        """Test the access to the extended member sections."""
+        topology = ClusterTopology.from_status(_build_status(["ONLINE", "ONLINE"]))
+
+        assert topology.get_member_by_label("mysql-0").instance_errors == []
+        assert topology.get_member_by_label("mysql-1").instance_errors
+        assert "transactions" in topology.get_member_by_label("mysql-1").extended
+        assert not hasattr(topology.get_member_by_label("mysql-1"), "__dict__")
+
+    @pytest.mark.parametrize(
+        "states, quorum, tolerance",
+        [
+            (["ONLINE", "ONLINE", "ONLINE"], True, 1),
+            (["ONLINE", "ONLINE", "OFFLINE"], True, 0),
+            (["ONLINE", "ONLINE", "UNREACHABLE"], True, 0),
+            (["ONLINE", "UNREACHABLE", "UNREACHABLE"], False, 0),
+            (["ONLINE", "ONLINE", "ONLINE", "ONLINE", "UNREACHABLE"], True, 1),
+            (["ONLINE", "RECOVERING", "ONLINE", "ONLINE", "ONLINE"], True, 2),
+        ],
+    )
+    def test_quorum(self, states: list[str], quorum: bool, tolerance: int):
+        """Test the computation of the quorum and the fault tolerance."""
+        topology = ClusterTopology.from_status(_build_status(states))
+
+        assert topology.has_quorum == quorum
+        assert topology.fault_tolerance == tolerance